@@ -58,8 +58,14 @@ case "$TOOL" in
 esac
 
 # Fire-and-forget POST to backend (background, ignore errors)
-# Port 8446 is the backend's /handle-mcp port
-curl -s -X POST "http://localhost:8446/report-activity" \
+# Port 8446 is the backend's /handle-mcp port; prefer its local Unix socket
+SOCK="/tmp/io-mcp-backend-8446.sock"
+if [ -S "$SOCK" ]; then
+  TARGET=(--unix-socket "$SOCK" "http://localhost/report-activity")
+else
+  TARGET=("http://localhost:8446/report-activity")
+fi
+curl -s -X POST "${TARGET[@]}" \
   -H "Content-Type: application/json" \
   -d "$(jq -n --arg sid "$SESSION_ID" --arg tool "$TOOL" --arg detail "$DETAIL" --arg kind "$KIND" \
     '{session_id: $sid, tool: $tool, detail: $detail, kind: $kind}')" \
@@ -1,14 +1,16 @@
 #!/usr/bin/env bash
 # Start hook: Register agent environment with io-mcp.
 #
-# Gathers tmux pane, session, IP, Tailscale hostname, and writes to
-# a registration file that the proxy reads on register_session().
+# Gathers tmux pane, session, IP, Tailscale hostname and the agent's PID,
+# and posts them to the MCP proxy, which fills them into register_session()
+# before routing it to whichever backend serves the session.
 # This removes the burden from agents to fill out their own metadata.
+# If the proxy isn't up yet, the registration is left in REG_DIR and
+# imported when it starts.
 
 set -euo pipefail
 
 REG_DIR="/tmp/io-mcp-registrations"
-mkdir -p "$REG_DIR"
 
 # Gather environment data
 PANE_ID="${TMUX_PANE:-}"
@@ -43,15 +45,14 @@ SYS_HOSTNAME=$(hostname 2>/dev/null || echo "unknown")
 # Current working directory
 CWD=$(pwd 2>/dev/null || echo "")
 
-# Write registration file keyed by pane ID (% stripped for filename safety)
-PANE_KEY=$(echo "$PANE_ID" | tr -d '%')
-jq -n \
+REGISTRATION=$(jq -n \
   --arg pane_id "$PANE_ID" \
   --arg tmux_session "$TMUX_SESS" \
   --arg ipv4 "$IPV4" \
   --arg tailscale_hostname "$TS_HOSTNAME" \
   --arg hostname "$SYS_HOSTNAME" \
   --arg cwd "$CWD" \
+  --argjson pid "$PPID" \
   --arg timestamp "$(date -u +%Y-%m-%dT%H:%M:%SZ)" \
   '{
     tmux_pane: $pane_id,
@@ -60,5 +61,17 @@ jq -n \
     tailscale_hostname: $tailscale_hostname,
     hostname: $hostname,
     cwd: $cwd,
+    pid: $pid,
     timestamp: $timestamp
-  }' > "$REG_DIR/pane-$PANE_KEY.json"
+  }')
+
+# Port 8444 is the MCP proxy's port
+if curl -sf --max-time 2 -X POST "http://localhost:8444/registrations" \
+    -H "Content-Type: application/json" -d "$REGISTRATION" >/dev/null 2>&1; then
+  exit 0
+fi
+
+# Proxy not reachable — keyed by pane ID (% stripped for filename safety)
+mkdir -p "$REG_DIR"
+PANE_KEY=$(echo "$PANE_ID" | tr -d '%')
+echo "$REGISTRATION" > "$REG_DIR/pane-$PANE_KEY.json"
@@ -22,6 +22,7 @@ from __future__ import annotations
 
 import argparse
 import atexit
+import importlib
 import json
 import logging
 import os
@@ -29,12 +30,15 @@ import signal
 import subprocess
 import sys
 import threading
+from typing import TYPE_CHECKING
 
-from .config import IoMcpConfig
-from .tui import IoMcpApp
-from .tts import TTSEngine
 from .logging import get_logger, log_context, TUI_ERROR_LOG, TOOL_ERROR_LOG
 
+if TYPE_CHECKING:
+    from .config import IoMcpConfig
+    from .tts import TTSEngine
+    from .tui import IoMcpApp
+
 log = logging.getLogger("io_mcp")
 _file_log = get_logger("io-mcp.main", TUI_ERROR_LOG)
 _tool_log = get_logger("io-mcp.tools", TOOL_ERROR_LOG)
@@ -46,6 +50,43 @@ DEFAULT_PROXY_PORT = 8444
 DEFAULT_BACKEND_PORT = 8446
 DEFAULT_API_PORT = 8445
 
+# Hooks and scripts run `io-mcp status` and friends constantly, so nothing
+# heavy is imported at module level: each command imports what it uses.
+# These classes load on first access (PEP 562) — use _lazy() in code.
+_LAZY_CLASSES = {
+    "IoMcpConfig": ".config",     # PyYAML
+    "TTSEngine": ".tts",
+    "IoMcpApp": ".tui",           # Textual
+}
+
+# Set in the child process by --profile-startup: stop once startup is done.
+_PROFILE_ENV = "IO_MCP_PROFILE_STARTUP"
+
+
+def __getattr__(name: str):
+    module = _LAZY_CLASSES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __package__), name)
+    globals()[name] = value
+    return value
+
+
+def _lazy(name: str):
+    """A heavy class by name: the module global once loaded (or patched)."""
+    return globals()[name] if name in globals() else __getattr__(name)
+
+
+def _startup_done() -> None:
+    """Mark the end of a command's startup (imports and argument parsing).
+
+    Under ``--profile-startup`` the profiled child exits here, before the
+    command does any real work.
+    """
+    if os.environ.get(_PROFILE_ENV):
+        sys.stdout.flush()
+        os._exit(0)
+
 
 def _write_pid_file() -> None:
     with open(PID_FILE, "w") as f:
@@ -377,6 +418,30 @@ def _detect_hostname() -> str:
 
 # ─── Backend tool dispatcher ──────────────────────────────────────────
 
+# Sync tools (run_command, request_*, the REST wrappers) hold a thread for
+# their whole run; they get this many workers of their own, apart from the
+# pool every _offload step shares
+_BLOCKING_TOOL_WORKERS = 16
+
+
+async def _offload(fn, *args):
+    """Run a blocking step (TUI calls, file I/O) on the loop's default executor.
+
+    Context variables (the call's idempotency key) follow it to the thread.
+    """
+    import asyncio
+    return await asyncio.to_thread(fn, *args)
+
+
+async def _call_async(app, name: str, *args):
+    """Await ``app.<name>_async`` if the app has one, else run ``app.<name>`` in a thread."""
+    import inspect
+    native = getattr(app, f"{name}_async", None)
+    if inspect.iscoroutinefunction(native):
+        return await native(*args)
+    return await _offload(getattr(app, name), *args)
+
+
 def _create_tool_dispatcher(app_ref: list, append_options: list[str],
                             append_silent_options: list[str]):
     """Create a function that dispatches tool calls to the app.
@@ -387,8 +452,19 @@ def _create_tool_dispatcher(app_ref: list, append_options: list[str],
         append_options: Extra options to append to present_choices.
         append_silent_options: Silent extra options.
 
-    Returns a callable(tool_name, args, session_id) -> str
+    Returns a callable(tool_name, args, session_id) -> str. Its
+    ``dispatch_async`` attribute is the coroutine version for the asyncio
+    backend: blocking tools (choices, blocking speech) await the inbox
+    item's event instead of holding a thread while the user decides.
+    Sync tools run on its ``blocking_executor``; when the sync callable
+    meets a coroutine tool it submits it to the loop given to
+    ``attach_loop`` (the backend's), or to a private loop thread.
     """
+    import asyncio
+    import contextvars
+    import inspect
+    from concurrent.futures import ThreadPoolExecutor
+
     # Adapt IoMcpApp to the Frontend protocol via mutable reference
     class _AppFrontend:
         @property
@@ -408,6 +484,12 @@ def _create_tool_dispatcher(app_ref: list, append_options: list[str],
             return self._app.present_choices(session, preamble, choices)
         def present_multi_select(self, session, preamble, choices):
             return self._app.present_multi_select(session, preamble, choices)
+        def present_choices_batch(self, session, questions):
+            return self._app.present_choices_batch(session, questions)
+        async def present_choices_async(self, session, preamble, choices):
+            return await _call_async(self._app, "present_choices", session, preamble, choices)
+        async def present_choices_batch_async(self, session, questions):
+            return await _call_async(self._app, "present_choices_batch", session, questions)
         def session_speak(self, session, text, block=True, priority=0, emotion=""):
             return self._app.session_speak(session, text, block, priority, emotion)
         def session_speak_async(self, session, text):
@@ -415,9 +497,9 @@ def _create_tool_dispatcher(app_ref: list, append_options: list[str],
         def on_session_created(self, session):
             return self._app.on_session_created(session)
         def update_tab_bar(self):
-            self._app.call_from_thread(self._app._update_tab_bar)
+            self._app._invalidate("tab_bar")
         def update_footer_status(self):
-            self._app.call_from_thread(self._app._update_footer_status)
+            self._app._invalidate("footer")
         def hot_reload(self):
             self._app.call_from_thread(self._app.action_hot_reload)
         def notify_inbox_update(self, session):
@@ -535,18 +617,55 @@ def _create_tool_dispatcher(app_ref: list, append_options: list[str],
         except Exception:
             pass  # Best-effort — don't break tool calls
 
-    # ─── Tool implementations ─────────────────────────────────
+    def _throttled(session, kind: str):
+        """Admission check against the session's ``kind`` rate limit.
 
-    def _tool_present_choices(args, session_id):
-        session = _get_session(session_id)
-        session.last_tool_name = "present_choices"
-        _touch_speech_timestamp(session)  # preamble is spoken aloud
-        preamble = args.get("preamble", "")
-        choices = args.get("choices", [])
-        timeout = args.get("timeout", None)  # Optional timeout in seconds
-        if not choices:
-            return json.dumps({"selected": "error", "summary": "No choices provided"})
+        Returns None when the call is admitted, else the seconds until the
+        session's next call of that kind would be.
+        """
+        cfg = frontend.config
+        limit = cfg.rate_limit(kind) if cfg else None
+        if limit is None or session.admit(kind, *limit):
+            return None
+        return session.retry_after(kind)
+
+    def _throttle_note(kind: str, action: str, retry_after: float) -> str:
+        return (f"\n\n[THROTTLED: {kind} rate limit exceeded — {action}. "
+                f"Next call admitted in {retry_after:.0f}s; batch updates into "
+                f"fewer, longer calls.]")
+
+    def _enqueue_speech(session, text: str, blocking: bool, priority: int):
+        """Enqueue speech under the session's speech rate limit.
+
+        Returns ``(item, note)``. Over the limit, normal speech is merged
+        into the session's queued utterance (``item`` is that item) while
+        it stays under rateLimits.maxMergedChars; anything else -- nothing
+        queued to merge into, the cap reached, or priority speech, which
+        never folds into a normal item -- is dropped (``item`` None).
+        ``note`` tells the agent what happened.
+        """
+        retry = _throttled(session, "speech")
+        if retry is not None:
+            if not priority:
+                max_chars = frontend.config.rate_limit_max_merged_chars
+                queued, merged = session.coalesce_speech(text, max_chars)
+                if merged:
+                    frontend.notify_inbox_update(session)
+                    return queued, _throttle_note("speech", "merged into your queued speech", retry)
+            return None, _throttle_note("speech", "dropped, not spoken", retry)
+        item = session.enqueue_speech(text, blocking=blocking, priority=priority)
+        frontend.notify_inbox_update(session)
+        return item, ""
+
+    def _speech_result(verb: str, text: str, item, session) -> str:
+        """The speech tools' reply; says so when throttling dropped the text."""
+        preview = text[:100] + ("..." if len(text) > 100 else "")
+        if item is None:
+            return _attach_messages(f"Not spoken (rate limited): {preview}", session)
+        return _attach_messages(f"{verb}: {preview}", session)
 
+    def _with_extras(choices: list[dict]) -> list[dict]:
+        """Append the configured extra options to an agent's choice list."""
         all_choices = list(choices)
         for opt in append_options:
             if "::" in opt:
@@ -571,6 +690,28 @@ def _create_tool_dispatcher(app_ref: list, append_options: list[str],
         for opt in _config_extras:
             if not any(c.get("label", "").lower() == opt["label"].lower() for c in all_choices):
                 all_choices.append(dict(opt))
+        return all_choices
+
+    # ─── Tool implementations ─────────────────────────────────
+
+    async def _tool_present_choices(args, session_id):
+        session = await _offload(_get_session, session_id)
+        session.last_tool_name = "present_choices"
+        _touch_speech_timestamp(session)  # preamble is spoken aloud
+        preamble = args.get("preamble", "")
+        choices = args.get("choices", [])
+        timeout = args.get("timeout", None)  # Optional timeout in seconds
+        if not choices:
+            return json.dumps({"selected": "error", "summary": "No choices provided"})
+        retry = _throttled(session, "choices")
+        if retry is not None:
+            return json.dumps({"selected": "error", "throttled": True,
+                               "retry_after": round(retry, 1),
+                               "summary": "Rate limited: too many choice prompts. "
+                                          f"Retry in {retry:.0f}s or combine questions "
+                                          "with present_choices_batch."})
+
+        all_choices = _with_extras(choices)
 
         restart_retries = 0
         max_restart_retries = 3  # Don't retry forever — proxy/agent may be gone
@@ -584,15 +725,12 @@ def _create_tool_dispatcher(app_ref: list, append_options: list[str],
 
             if timeout is not None and timeout > 0:
                 # Non-blocking: present choices and return after timeout
-                # Choices stay visible — user can still select later
-                import threading as _threading
-                result_box = [None]
-                def _present():
-                    result_box[0] = frontend.present_choices(session, preamble, all_choices)
-                t = _threading.Thread(target=_present, daemon=True)
-                t.start()
-                t.join(timeout=float(timeout))
-                if result_box[0] is None:
+                # Choices stay visible — user can still select later.
+                # The presentation keeps running as a task after we return.
+                task = asyncio.ensure_future(
+                    frontend.present_choices_async(session, preamble, all_choices))
+                done, _ = await asyncio.wait({task}, timeout=float(timeout))
+                if not done:
                     # Timed out — resolve the active inbox item cleanly
                     _file_log.info("_tool_present_choices: timeout fired", extra={"context": {
                         "timeout": timeout,
@@ -607,21 +745,21 @@ def _create_tool_dispatcher(app_ref: list, append_options: list[str],
                         session.drain_kick.set()
                     # Tell the TUI to show idle state
                     try:
-                        frontend._app._safe_call(
-                            lambda: frontend._app._show_waiting("(timed out)"))
+                        await _offload(frontend._app._safe_call,
+                                       lambda: frontend._app._show_waiting("(timed out)"))
                     except Exception:
                         pass
                     return _attach_messages(
                         json.dumps({"selected": "_timeout", "summary": f"No selection within {timeout}s — choices still visible"}),
                         session)
-                result = result_box[0]
+                result = task.result()
             else:
                 _file_log.info("_tool_present_choices: blocking present", extra={"context": {
                     "session": session.name,
                     "preamble": preamble[:80],
                     "n_choices": len(all_choices),
                 }})
-                result = frontend.present_choices(session, preamble, all_choices)
+                result = await frontend.present_choices_async(session, preamble, all_choices)
 
             if result.get("selected") == "_cancelled":
                 # MCP client cancelled the tool call — return immediately
@@ -639,8 +777,8 @@ def _create_tool_dispatcher(app_ref: list, append_options: list[str],
                     return json.dumps({"selected": "error", "summary": "Aborted after too many TUI restarts"})
                 # TUI is restarting — wait for the new app to be ready,
                 # then re-create session and re-present choices
-                _time.sleep(3.0)
-                session = _get_session(session_id)
+                await asyncio.sleep(3.0)
+                session = await _offload(_get_session, session_id)
                 session.last_tool_name = "present_choices"
                 continue
             if result.get("selected") == "error" and "App is not running" in result.get("summary", ""):
@@ -648,14 +786,77 @@ def _create_tool_dispatcher(app_ref: list, append_options: list[str],
                 if restart_retries > max_restart_retries:
                     return json.dumps({"selected": "error", "summary": "Aborted — TUI not running"})
                 # TUI crashed mid-presentation — treat as restart
-                _time.sleep(3.0)
-                session = _get_session(session_id)
+                await asyncio.sleep(3.0)
+                session = await _offload(_get_session, session_id)
                 session.last_tool_name = "present_choices"
                 continue
             break
 
         return _attach_messages(json.dumps(result), session) + _registration_reminder(session)
 
+    async def _tool_present_choices_batch(args, session_id):
+        """Present several independent choice sets in one round trip.
+
+        The user answers them back-to-back; one response carries every
+        selection, ``results[i]`` answering ``questions[i]``. Questions
+        without choices get an error entry in their slot. Questions
+        interrupted by a TUI restart are re-presented (only the unanswered
+        ones).
+        """
+        session = await _offload(_get_session, session_id)
+        session.last_tool_name = "present_choices_batch"
+        _touch_speech_timestamp(session)  # preambles are spoken aloud
+        questions = [
+            (q.get("preamble", ""),
+             _with_extras(q["choices"]) if q.get("choices") else [])
+            for q in args.get("questions", [])
+        ]
+        if not any(choices for _, choices in questions):
+            return json.dumps({"results": [], "error": "No questions with choices provided"})
+        retry = _throttled(session, "choices")
+        if retry is not None:
+            return json.dumps({"results": [], "throttled": True, "retry_after": round(retry, 1),
+                               "error": f"Rate limited: too many choice prompts. Retry in {retry:.0f}s."})
+
+        results: list = [
+            None if choices else {"selected": "error", "summary": "No choices provided"}
+            for _, choices in questions
+        ]
+        restart_retries = 0
+        while True:
+            todo = [i for i, r in enumerate(results) if r is None]
+            _file_log.info("_tool_present_choices_batch: blocking present", extra={"context": {
+                "session": session.name,
+                "n_questions": len(todo),
+            }})
+            batch = await frontend.present_choices_batch_async(
+                session, [questions[i] for i in todo])
+            restarted = False
+            for i, result in zip(todo, batch):
+                if result.get("selected") == "_restart":
+                    restarted = True
+                else:
+                    results[i] = result
+            if not restarted:
+                break
+            restart_retries += 1
+            if restart_retries > 3:
+                for i, r in enumerate(results):
+                    if r is None:
+                        results[i] = {"selected": "error", "summary": "Aborted after too many TUI restarts"}
+                break
+            # TUI is restarting — wait for the new app, then re-present the rest
+            await asyncio.sleep(3.0)
+            session = await _offload(_get_session, session_id)
+            session.last_tool_name = "present_choices_batch"
+
+        response = {
+            "results": [
+                {"preamble": q[0], **r} for q, r in zip(questions, results)
+            ],
+        }
+        return _attach_messages(json.dumps(response), session) + _registration_reminder(session)
+
     def _tool_present_multi_select(args, session_id):
         session = _get_session(session_id)
         session.last_tool_name = "present_multi_select"
@@ -663,6 +864,10 @@ def _create_tool_dispatcher(app_ref: list, append_options: list[str],
         choices = args.get("choices", [])
         if not choices:
             return json.dumps({"selected": []})
+        retry = _throttled(session, "choices")
+        if retry is not None:
+            return json.dumps({"selected": [], "throttled": True, "retry_after": round(retry, 1),
+                               "error": f"Rate limited: too many choice prompts. Retry in {retry:.0f}s."})
         restart_retries = 0
         while True:
             result = frontend.present_multi_select(session, preamble, list(choices))
@@ -678,17 +883,16 @@ def _create_tool_dispatcher(app_ref: list, append_options: list[str],
             break
         return _attach_messages(json.dumps({"selected": result}), session)
 
-    def _tool_speak(args, session_id):
-        session = _get_session(session_id)
+    async def _tool_speak(args, session_id):
+        session = await _offload(_get_session, session_id)
         session.last_tool_name = "speak"
         _touch_speech_timestamp(session)
         text = args.get("text", "")
         # Enqueue as inbox item — agent blocks until TTS finishes
-        item = session.enqueue_speech(text, blocking=True, priority=0)
-        frontend.notify_inbox_update(session)
-        item.event.wait(timeout=120)  # Don't block forever
-        preview = text[:100] + ("..." if len(text) > 100 else "")
-        return _attach_messages(f"Spoke: {preview}", session)
+        item, note = await _offload(_enqueue_speech, session, text, True, 0)
+        if item is not None:
+            await item.event.wait_async(timeout=120)  # Don't block forever
+        return _speech_result("Spoke", text, item, session) + note
 
     def _tool_speak_async(args, session_id):
         session = _get_session(session_id)
@@ -696,22 +900,19 @@ def _create_tool_dispatcher(app_ref: list, append_options: list[str],
         _touch_speech_timestamp(session)
         text = args.get("text", "")
         # Enqueue as inbox item — agent returns immediately
-        item = session.enqueue_speech(text, blocking=False, priority=0)
-        frontend.notify_inbox_update(session)
-        preview = text[:100] + ("..." if len(text) > 100 else "")
-        return _attach_messages(f"Spoke: {preview}", session)
+        item, note = _enqueue_speech(session, text, blocking=False, priority=0)
+        return _speech_result("Spoke", text, item, session) + note
 
-    def _tool_speak_urgent(args, session_id):
-        session = _get_session(session_id)
+    async def _tool_speak_urgent(args, session_id):
+        session = await _offload(_get_session, session_id)
         session.last_tool_name = "speak_urgent"
         _touch_speech_timestamp(session)
         text = args.get("text", "")
         # Enqueue at front of inbox with priority — agent blocks
-        item = session.enqueue_speech(text, blocking=True, priority=1)
-        frontend.notify_inbox_update(session)
-        item.event.wait(timeout=120)  # Don't block forever
-        preview = text[:100] + ("..." if len(text) > 100 else "")
-        return _attach_messages(f"Urgently spoke: {preview}", session)
+        item, note = await _offload(_enqueue_speech, session, text, True, 1)
+        if item is not None:
+            await item.event.wait_async(timeout=120)  # Don't block forever
+        return _speech_result("Urgently spoke", text, item, session) + note
 
     def _tool_set_speed(args, session_id):
         if frontend.config:
@@ -1053,6 +1254,17 @@ def _create_tool_dispatcher(app_ref: list, append_options: list[str],
         status = args.get("status", "")
         if not status:
             return json.dumps({"error": "No status provided"})
+        retry = _throttled(session, "status")
+        if retry is not None and session.supersede_status(status[:120]):
+            # Over the limit: the newest status replaces the previous line
+            try:
+                frontend.update_tab_bar()
+            except Exception:
+                pass
+            return _attach_messages(json.dumps({
+                "status": "superseded", "text": status[:120], "throttled": True,
+                "retry_after": round(retry, 1),
+            }), session)
         session.log_activity("report_status", status[:120], kind="status")
         # Update TUI to show the new activity
         try:
@@ -1092,10 +1304,23 @@ def _create_tool_dispatcher(app_ref: list, append_options: list[str],
         return _attach_messages(json.dumps(logs), session)
 
     def _tool_get_sessions(args, session_id):
-        """List all active agent sessions with their status and metadata."""
+        """List all active agent sessions with their status and metadata.
+
+        Pass ``since`` (the ``cursor`` from a previous call) to also get
+        every session's events recorded after that call, read from the
+        global event store instead of re-scanning each session.
+        """
         session = _get_session(session_id)
         session.last_tool_name = "get_sessions"
+        return _attach_messages(json.dumps(_session_listing(session_id, args.get("since"))),
+                                session)
+
+    def _session_listing(session_id: str, since=None) -> dict:
+        """The get_sessions payload, without touching the caller's session.
 
+        Also served on the backend's /sessions route, which a sharded proxy
+        reads from the backends that don't own the calling session.
+        """
         sessions = []
         for sid in frontend.manager.session_order:
             s = frontend.manager.sessions.get(sid)
@@ -1117,6 +1342,7 @@ def _create_tool_dispatcher(app_ref: list, append_options: list[str],
                 "registered": s.registered,
                 "active": s.active,
                 "health": s.health_status,
+                "pane_dead": s.pane_dead,
                 "hostname": s.hostname,
                 "cwd": s.cwd,
                 "tmux_pane": s.tmux_pane,
@@ -1127,6 +1353,8 @@ def _create_tool_dispatcher(app_ref: list, append_options: list[str],
                 "pending_messages": len(s.pending_messages),
                 "inbox_pending": sum(1 for item in s.inbox if not item.done),
                 "inbox_done": len(s.inbox_done),
+                "blocked_seconds": round(s.blocked_seconds_total(), 1),
+                "throttled_calls": s.throttled_calls,
                 "is_focused": sid == frontend.manager.active_session_id,
                 "is_self": sid == session_id,
             }
@@ -1138,31 +1366,53 @@ def _create_tool_dispatcher(app_ref: list, append_options: list[str],
             "sessions": sessions,
             "count": len(sessions),
             "focused_session": frontend.manager.active_session_id,
+            "agent_blocked_seconds": round(frontend.manager.blocked_seconds(), 1),
         }
-        return _attach_messages(json.dumps(result), session)
+        if since is not None:
+            store = frontend.manager.sync_events()
+            result["events"] = [ev.to_dict() for ev in store.since(int(since), limit=500)]
+        return result
 
     def _tool_get_speech_history(args, session_id):
-        """Get speech history for the calling session or all sessions."""
+        """Get speech history for the calling session or all sessions.
+
+        Reads slices from each session's timeline index. Pass ``since``
+        (the ``cursor`` returned by a previous call) to get only entries
+        recorded after that call, or ``page`` (1, 2, ...) to page back
+        ``lines`` entries at a time past the in-memory cap into the
+        session's on-disk archive.
+        """
         session = _get_session(session_id)
         session.last_tool_name = "get_speech_history"
 
         lines = int(args.get("lines", 30))
         target = args.get("session", "self")  # "self", "all", or a session_id
+        since = args.get("since")
+        page = int(args.get("page", 0) or 0)  # 0 = newest; N = N*lines entries back
+
+        def _slice(s, kind):
+            index = s.events
+            if since is not None:
+                return index.since(int(since), kinds=(kind,))[-lines:], index.cursor
+            return index.latest(lines, kinds=(kind,)), index.cursor
 
         result = {}
 
         if target == "all":
+            # Per-session slices of the global store's secondary index
+            store = frontend.manager.sync_events()
             for sid in frontend.manager.session_order:
                 s = frontend.manager.sessions.get(sid)
                 if not s:
                     continue
-                entries = []
-                for entry in s.speech_log[-lines:]:
-                    entries.append({
-                        "time": entry.timestamp,
-                        "text": entry.text[:300],
-                    })
-                result[s.name or sid] = entries
+                if since is not None:
+                    events = store.since(int(since), session_id=sid, kinds=("speech",))[-lines:]
+                else:
+                    events = store.latest(lines, session_id=sid, kinds=("speech",))
+                result[s.name or sid] = [
+                    {"time": ev.timestamp, "text": ev.ref.text[:300]}
+                    for ev in events
+                ]
         else:
             # Get speech log for the specified or calling session
             if target == "self":
@@ -1170,26 +1420,52 @@ def _create_tool_dispatcher(app_ref: list, append_options: list[str],
             else:
                 s = frontend.manager.sessions.get(target, session)
 
-            entries = []
-            for entry in s.speech_log[-lines:]:
-                entries.append({
-                    "time": entry.timestamp,
-                    "text": entry.text[:300],
-                })
+            if page > 0:
+                # Older pages read through the on-disk archive
+                speech_recs, speech_total = s.page_history("speech", skip=page * lines, limit=lines)
+                pick_recs, picks_total = s.page_history("history", skip=page * lines, limit=lines)
+                result = {
+                    "speech": [
+                        {"time": r.get("timestamp", 0), "text": r.get("text", "")[:300]}
+                        for r in speech_recs
+                    ],
+                    "selections": [
+                        {
+                            "time": r.get("timestamp", 0),
+                            "preamble": (r.get("preamble") or "")[:200],
+                            "selected": (r.get("label") or "")[:200],
+                        }
+                        for r in pick_recs
+                    ],
+                    "session": s.name or s.session_id,
+                    "page": page,
+                    "more": (page + 1) * lines < max(speech_total, picks_total),
+                }
+                return _attach_messages(json.dumps(result), session)
+
+            speech, cursor = _slice(s, "speech")
+            entries = [
+                {"time": ev.timestamp, "text": ev.ref.text[:300]}
+                for ev in speech
+            ]
 
             # Also include selections from history
-            selections = []
-            for entry in s.history[-lines:]:
-                selections.append({
-                    "time": entry.timestamp,
-                    "preamble": entry.preamble[:200] if entry.preamble else "",
-                    "selected": entry.label[:200] if entry.label else "",
-                })
+            picks, _ = _slice(s, "selection")
+            selections = [
+                {
+                    "time": ev.timestamp,
+                    "preamble": ev.ref.preamble[:200] if ev.ref.preamble else "",
+                    "selected": ev.ref.label[:200] if ev.ref.label else "",
+                }
+                for ev in picks
+            ]
 
             result = {
                 "speech": entries,
                 "selections": selections,
                 "session": s.name or s.session_id,
+                "cursor": cursor,
+                "more": (s.archive.count("speech") if s.archive else 0) + len(s.speech_log) > lines,
             }
 
         return _attach_messages(json.dumps(result), session)
@@ -1328,6 +1604,7 @@ def _create_tool_dispatcher(app_ref: list, append_options: list[str],
     TOOLS = {
         "present_choices": _tool_present_choices,
         "present_multi_select": _tool_present_multi_select,
+        "present_choices_batch": _tool_present_choices_batch,
         "speak": _tool_speak,
         "speak_async": _tool_speak_async,
         "speak_urgent": _tool_speak_urgent,
@@ -1356,106 +1633,163 @@ def _create_tool_dispatcher(app_ref: list, append_options: list[str],
 
     # Tools that should NOT get speech reminders (they ARE speech)
     _SPEECH_TOOLS = {"speak", "speak_async", "speak_urgent",
-                     "present_choices", "present_multi_select"}
+                     "present_choices", "present_multi_select",
+                     "present_choices_batch"}
 
     # Tools that are just metadata/status queries — don't clutter the activity log
     _QUIET_TOOLS = {"check_inbox", "get_logs", "get_sessions",
                     "get_speech_history", "get_current_choices", "get_tui_state",
                     "get_settings", "report_status"}
 
+    def _after_tool(tool_name: str, args: dict, session_id: str, result: str) -> str:
+        """Bookkeeping shared by both dispatch paths once a tool returns."""
+        # Increment tool_call_count for ALL tools — centralised here
+        # so individual handlers don't need to remember.
+        session = frontend.manager.get(session_id)
+        if session:
+            session.tool_call_count += 1
+
+        # Log activity (skip quiet/meta tools to keep the feed useful)
+        if tool_name not in _QUIET_TOOLS:
+            # session already fetched above
+            if session:
+                detail = ""
+                kind = "tool"
+                if tool_name in ("speak", "speak_async", "speak_urgent"):
+                    detail = args.get("text", "")[:80]
+                    kind = "speech"
+                elif tool_name == "present_choices":
+                    detail = args.get("preamble", "")[:80]
+                    kind = "choices"
+                elif tool_name == "present_multi_select":
+                    detail = args.get("preamble", "")[:80]
+                    kind = "choices"
+                elif tool_name == "present_choices_batch":
+                    qs = args.get("questions", [])
+                    detail = f"{len(qs)} questions"
+                    kind = "choices"
+                elif tool_name == "register_session":
+                    detail = args.get("name", args.get("cwd", ""))[:80]
+                    kind = "status"
+                elif tool_name == "rename_session":
+                    detail = args.get("name", "")[:80]
+                elif tool_name == "run_command":
+                    detail = args.get("command", "")[:80]
+                elif tool_name in ("set_speed", "set_voice", "set_emotion",
+                                   "set_tts_model", "set_stt_model"):
+                    # Extract the value being set
+                    for k, v in args.items():
+                        detail = str(v)[:40]
+                        break
+                    kind = "settings"
+                session.log_activity(tool_name, detail, kind)
+
+                # Check for achievements
+                new_achievements = session.check_achievements()
+                for ach in new_achievements:
+                    try:
+                        frontend.tts.play_chime("achievement")
+                        frontend.tts.speak_async(f"Achievement unlocked: {ach}")
+                    except Exception:
+                        _file_log.debug("Achievement chime/speech failed", exc_info=True)
+
+                # Update TUI waiting view to reflect new activity
+                try:
+                    frontend.update_tab_bar()
+                except Exception:
+                    _file_log.debug("Post-tool tab bar update failed", exc_info=True)
+
+        # Add speech reminder for non-speech tools
+        if tool_name not in _SPEECH_TOOLS and session:
+            result += _speech_reminder(session)
+        return result
+
+    def _tool_error(tool_name: str, e: Exception) -> str:
+        """Log a failed tool call and build the self-healing error response."""
+        log.error(f"Tool {tool_name} error: {e}")
+        _tool_log.error(
+            "Tool %s failed: %s", tool_name, e,
+            exc_info=e,
+            extra={"context": log_context(tool_name=tool_name)},
+        )
+        try:
+            frontend.tts.play_chime("error")
+            frontend.tts.speak_async(f"Tool error: {tool_name}. {str(e)[:80]}")
+        except Exception:
+            _file_log.debug("Failed to play error chime/speech", exc_info=True)
+        error_data = {
+            "error": f"{type(e).__name__}: {str(e)[:200]}",
+            "tool": tool_name,
+            "suggestion": "Retry the tool call, or call get_logs() to inspect recent errors.",
+        }
+        # Include crash log content so agents can self-heal
+        crash_log = ""
+        from .logging import read_log_tail, TOOL_ERROR_LOG as _tel
+        tail_lines = read_log_tail(_tel, 50)
+        if tail_lines:
+            tail = "\n".join(tail_lines)[-1500:]
+            crash_log = (
+                "\n\n[IO-MCP ERROR LOG]\n" + tail
+                + "\n\n[SELF-HEALING: If this is a code bug in io-mcp, "
+                "fix it and call pull_latest() to apply. Source: src/io_mcp/]"
+            )
+        return json.dumps(error_data) + crash_log
+
+    blocking_pool = ThreadPoolExecutor(max_workers=_BLOCKING_TOOL_WORKERS,
+                                       thread_name_prefix="io-mcp-tool")
+    # [backend loop, private fallback loop]
+    loops: list = [None, None]
+    loops_lock = threading.Lock()
+
+    def attach_loop(loop) -> None:
+        loops[0] = loop
+
+    def _tool_loop():
+        """The running loop coroutine tools are submitted to from a thread.
+
+        Never a throwaway loop: closing one would cancel the tasks a tool
+        left scheduled (present_choices' timeout among them).
+        """
+        loop = loops[0]
+        if loop is not None and loop.is_running():
+            return loop
+        with loops_lock:
+            if loops[1] is None:
+                loops[1] = asyncio.new_event_loop()
+                threading.Thread(target=loops[1].run_forever, daemon=True,
+                                 name="io-mcp-tool-loop").start()
+            return loops[1]
+
     def dispatch(tool_name: str, args: dict, session_id: str) -> str:
         handler = TOOLS.get(tool_name)
         if handler is None:
             return json.dumps({"error": f"Unknown tool: {tool_name}"})
         try:
             result = handler(args, session_id)
+            if inspect.iscoroutine(result):
+                # Blocking tool called from a plain thread (REST endpoint,
+                # tests); the task inherits this thread's context vars
+                result = asyncio.run_coroutine_threadsafe(result, _tool_loop()).result()
+            return _after_tool(tool_name, args, session_id, result)
+        except Exception as e:
+            return _tool_error(tool_name, e)
 
-            # Increment tool_call_count for ALL tools — centralised here
-            # so individual handlers don't need to remember.
-            session = frontend.manager.get(session_id)
-            if session:
-                session.tool_call_count += 1
-
-            # Log activity (skip quiet/meta tools to keep the feed useful)
-            if tool_name not in _QUIET_TOOLS:
-                # session already fetched above
-                if session:
-                    detail = ""
-                    kind = "tool"
-                    if tool_name in ("speak", "speak_async", "speak_urgent"):
-                        detail = args.get("text", "")[:80]
-                        kind = "speech"
-                    elif tool_name == "present_choices":
-                        detail = args.get("preamble", "")[:80]
-                        kind = "choices"
-                    elif tool_name == "present_multi_select":
-                        detail = args.get("preamble", "")[:80]
-                        kind = "choices"
-                    elif tool_name == "register_session":
-                        detail = args.get("name", args.get("cwd", ""))[:80]
-                        kind = "status"
-                    elif tool_name == "rename_session":
-                        detail = args.get("name", "")[:80]
-                    elif tool_name == "run_command":
-                        detail = args.get("command", "")[:80]
-                    elif tool_name in ("set_speed", "set_voice", "set_emotion",
-                                       "set_tts_model", "set_stt_model"):
-                        # Extract the value being set
-                        for k, v in args.items():
-                            detail = str(v)[:40]
-                            break
-                        kind = "settings"
-                    session.log_activity(tool_name, detail, kind)
-
-                    # Check for achievements
-                    new_achievements = session.check_achievements()
-                    for ach in new_achievements:
-                        try:
-                            frontend.tts.play_chime("achievement")
-                            frontend.tts.speak_async(f"Achievement unlocked: {ach}")
-                        except Exception:
-                            _file_log.debug("Achievement chime/speech failed", exc_info=True)
-
-                    # Update TUI waiting view to reflect new activity
-                    try:
-                        frontend.update_tab_bar()
-                    except Exception:
-                        _file_log.debug("Post-tool tab bar update failed", exc_info=True)
-
-            # Add speech reminder for non-speech tools
-            if tool_name not in _SPEECH_TOOLS and session:
-                result += _speech_reminder(session)
-            return result
+    async def dispatch_async(tool_name: str, args: dict, session_id: str) -> str:
+        handler = TOOLS.get(tool_name)
+        if not inspect.iscoroutinefunction(handler):
+            ctx = contextvars.copy_context()
+            return await asyncio.get_running_loop().run_in_executor(
+                blocking_pool, ctx.run, dispatch, tool_name, args, session_id)
+        try:
+            result = await handler(args, session_id)
+            return await _offload(_after_tool, tool_name, args, session_id, result)
         except Exception as e:
-            log.error(f"Tool {tool_name} error: {e}")
-            _tool_log.error(
-                "Tool %s failed: %s", tool_name, e,
-                exc_info=True,
-                extra={"context": log_context(tool_name=tool_name)},
-            )
-            try:
-                frontend.tts.play_chime("error")
-                frontend.tts.speak_async(f"Tool error: {tool_name}. {str(e)[:80]}")
-            except Exception:
-                _file_log.debug("Failed to play error chime/speech", exc_info=True)
-            error_data = {
-                "error": f"{type(e).__name__}: {str(e)[:200]}",
-                "tool": tool_name,
-                "suggestion": "Retry the tool call, or call get_logs() to inspect recent errors.",
-            }
-            # Include crash log content so agents can self-heal
-            crash_log = ""
-            from .logging import read_log_tail, TOOL_ERROR_LOG as _tel
-            tail_lines = read_log_tail(_tel, 50)
-            if tail_lines:
-                tail = "\n".join(tail_lines)[-1500:]
-                crash_log = (
-                    "\n\n[IO-MCP ERROR LOG]\n" + tail
-                    + "\n\n[SELF-HEALING: If this is a code bug in io-mcp, "
-                    "fix it and call pull_latest() to apply. Source: src/io_mcp/]"
-                )
-            return json.dumps(error_data) + crash_log
+            return await _offload(_tool_error, tool_name, e)
 
+    dispatch.dispatch_async = dispatch_async  # type: ignore[attr-defined]
+    dispatch.attach_loop = attach_loop  # type: ignore[attr-defined]
+    dispatch.blocking_executor = blocking_pool  # type: ignore[attr-defined]
+    dispatch.list_sessions = _session_listing  # type: ignore[attr-defined]
     return dispatch
 
 
@@ -1463,15 +1797,27 @@ def _create_tool_dispatcher(app_ref: list, append_options: list[str],
 
 def _run_server_command(args) -> None:
     """Run the MCP proxy server (io-mcp server)."""
-    from .proxy import run_proxy_server
+    from .proxy import _load_mcp, parse_backends, run_proxy_server
 
-    backend_url = f"http://{args.io_mcp_address}"
-    print(f"  io-mcp server: proxy on {args.host}:{args.port} → backend {backend_url}", flush=True)
+    _load_mcp()  # needed to serve anyway; load it inside the startup window
+    _startup_done()
+    backends = parse_backends(args.io_mcp_address)
+    if not backends:
+        print("  ERROR: --io-mcp-address names no backend", flush=True)
+        sys.exit(1)
+    backend_url = backends[0][1]
+    if len(backends) > 1:
+        shards = ", ".join(f"{name} ({url})" for name, url in backends)
+        print(f"  io-mcp server: proxy on {args.host}:{args.port} → {len(backends)} backends: "
+              f"{shards}", flush=True)
+    else:
+        print(f"  io-mcp server: proxy on {args.host}:{args.port} → backend {backend_url}", flush=True)
 
     run_proxy_server(
         host=args.host,
         port=args.port,
         backend_url=backend_url,
+        backends=backends if len(backends) > 1 else None,
         foreground=True,
     )
 
@@ -1484,6 +1830,7 @@ def _run_status_command() -> None:
     import urllib.error
     from .proxy import proxy_health
 
+    _startup_done()
     print("io-mcp status")
     print("─" * 50)
 
@@ -1499,6 +1846,19 @@ def _run_status_command() -> None:
         print(f"  Proxy:    ⚠ {proxy['details']}")
     else:
         print(f"  Proxy:    ✘ not running (port {DEFAULT_PROXY_PORT})")
+    shards = proxy.get("shards") or {}
+    for name, shard in (shards.get("backends") or {}).items():
+        state = "✔" if shard.get("healthy") else f"✘ down {shard.get('down_seconds')}s"
+        print(f"  Shard:    {name} {state}, {shard.get('sessions', 0)} sessions → {shard.get('url')}")
+    if shards.get("failovers"):
+        print(f"  Shard:    {shards['failovers']} session failovers")
+    for lane, pool in (proxy.get("backend_pool") or {}).items():
+        p50 = pool.get("latency_p50_ms")
+        p95 = pool.get("latency_p95_ms")
+        latency = f", p50 {p50}ms / p95 {p95}ms" if p50 is not None else ""
+        print(f"  Pool:     {lane}: {pool.get('in_use', 0)} busy, {pool.get('idle', 0)} idle, "
+              f"{pool.get('reused', 0)}/{pool.get('requests', 0)} reused over "
+              f"{pool.get('transport', 'tcp')}{latency}")
 
     # ── Check backend (PID + health endpoint) ──────────────
     backend_pid = None
@@ -1515,6 +1875,7 @@ def _run_status_command() -> None:
 
     backend_healthy = False
     backend_sessions = 0
+    backend_health: dict = {}
     if backend_alive:
         print(f"  Backend:  ✔ running (PID {backend_pid}, :{DEFAULT_BACKEND_PORT}, up {backend_uptime})")
         try:
@@ -1522,10 +1883,16 @@ def _run_status_command() -> None:
             req = urllib.request.Request(url, method="GET")
             with urllib.request.urlopen(req, timeout=2) as resp:
                 backend_healthy = resp.status == 200
+                backend_health = json.loads(resp.read())
         except Exception:
             pass
         if backend_healthy:
             print(f"  Health:   ✔ /health responding")
+            idem = backend_health.get("idempotency") if isinstance(backend_health, dict) else None
+            if idem:
+                print(f"  Retries:  {idem.get('retries_attached', 0)} attached, "
+                      f"{idem.get('retries_cached', 0)} served from cache, "
+                      f"{idem.get('pending', 0)} keyed calls pending")
         else:
             print(f"  Health:   ✘ /health not responding")
     else:
@@ -1677,6 +2044,7 @@ def _restart_proxy(proxy_address: str = f"localhost:{DEFAULT_PROXY_PORT}",
 
 def _restart_proxy_command() -> None:
     """CLI subcommand: io-mcp restart-proxy"""
+    _startup_done()
     print("io-mcp restart-proxy")
     print("─" * 40)
     success = _restart_proxy()
@@ -1762,6 +2130,9 @@ def _run_cache_warmup(verbose: bool = False, dry_run: bool = False) -> None:
     """Pre-generate TTS audio for all fixed UI strings."""
     from concurrent.futures import ThreadPoolExecutor, as_completed
 
+    IoMcpConfig, TTSEngine = _lazy("IoMcpConfig"), _lazy("TTSEngine")
+    _startup_done()
+
     config = IoMcpConfig.load()
     tts = TTSEngine(local=False, config=config)
 
@@ -1865,6 +2236,9 @@ def _run_cache_status(verbose: bool = False) -> None:
     from .tts import CACHE_DIR
     import datetime
 
+    IoMcpConfig, TTSEngine = _lazy("IoMcpConfig"), _lazy("TTSEngine")
+    _startup_done()
+
     config = IoMcpConfig.load()
     tts = TTSEngine(local=False, config=config)
 
@@ -1990,7 +2364,62 @@ def _run_cache_command() -> None:
 
 # ─── Main entry point ────────────────────────────────────────────
 
+def _parse_importtime(stderr: str) -> list[tuple[int, int, int, str]]:
+    """``-X importtime`` lines as ``(self_us, cumulative_us, depth, module)``."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # the header line
+        name = parts[2].rstrip()
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        rows.append((int(parts[0]), int(parts[1]), depth, name.strip()))
+    return rows
+
+
+def _profile_startup(argv: list[str], top: int = 12) -> int:
+    """``io-mcp --profile-startup [command ...]``: where startup time goes.
+
+    Re-runs the command in a child under ``python -X importtime``; the
+    child exits at the command's ``_startup_done()`` checkpoint, before it
+    does any work. Prints wall time, total import time and the heaviest
+    imports. Returns the child's exit status.
+    """
+    import time
+
+    env = dict(os.environ, **{_PROFILE_ENV: "1"})
+    started = time.perf_counter()
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-m", "io_mcp", *argv],
+                          env=env, capture_output=True, text=True, timeout=120)
+    wall_ms = (time.perf_counter() - started) * 1000
+    rows = _parse_importtime(proc.stderr)
+
+    print(f"io-mcp startup profile: io-mcp {' '.join(argv)}".rstrip())
+    print("─" * 50)
+    if proc.returncode != 0:
+        errors = [l for l in proc.stderr.splitlines() if not l.startswith("import time:")]
+        print(f"  ✘ command exited {proc.returncode} during startup")
+        for line in errors[-10:]:
+            print(f"    {line}")
+        return proc.returncode
+    print(f"  Wall:     {wall_ms:.0f} ms (interpreter, imports, argument parsing)")
+    print(f"  Imports:  {sum(r[0] for r in rows) / 1000:.0f} ms across {len(rows)} modules")
+    print("  Heaviest top-level imports (cumulative):")
+    for _, cumulative, _, name in sorted((r for r in rows if r[2] == 0),
+                                         key=lambda r: r[1], reverse=True)[:top]:
+        print(f"    {cumulative / 1000:7.1f} ms  {name}")
+    print("  Slowest modules (self):")
+    for own, _, _, name in sorted(rows, key=lambda r: r[0], reverse=True)[:top]:
+        print(f"    {own / 1000:7.1f} ms  {name}")
+    return 0
+
+
 def main() -> None:
+    if "--profile-startup" in sys.argv[1:]:
+        sys.exit(_profile_startup([a for a in sys.argv[1:] if a != "--profile-startup"]))
+
     # Check for subcommands first (before argparse to avoid conflicts)
     if len(sys.argv) > 1 and sys.argv[1] == "server":
         parser = argparse.ArgumentParser(prog="io-mcp server",
@@ -1998,7 +2427,9 @@ def main() -> None:
         parser.add_argument("server", help=argparse.SUPPRESS)  # consume 'server'
         parser.add_argument("--host", default="0.0.0.0")
         parser.add_argument("--port", type=int, default=DEFAULT_PROXY_PORT)
-        parser.add_argument("--io-mcp-address", default=f"localhost:{DEFAULT_BACKEND_PORT}")
+        parser.add_argument("--io-mcp-address", default=f"localhost:{DEFAULT_BACKEND_PORT}",
+                            help="Backend host:port; comma-separate several "
+                                 "([name=]host:port,...) to shard sessions across them")
         parser.add_argument("--foreground", action="store_true")
         args = parser.parse_args()
         _run_server_command(args)
@@ -2038,6 +2469,8 @@ def main() -> None:
     parser.add_argument("--host", default="0.0.0.0", help="Bind address")
     parser.add_argument("--proxy-address", default=f"localhost:{DEFAULT_PROXY_PORT}",
                         help=f"MCP proxy address (default: localhost:{DEFAULT_PROXY_PORT})")
+    parser.add_argument("--no-unix-socket", action="store_true",
+                        help="Serve backend and Frontend API on TCP only (no local Unix sockets)")
     parser.add_argument("--dwell", type=float, default=0.0, metavar="SECONDS")
     parser.add_argument("--scroll-debounce", type=float, default=None, metavar="SECONDS")
     parser.add_argument("--append-option", action="append", default=[], metavar="LABEL")
@@ -2059,6 +2492,11 @@ def main() -> None:
     parser.add_argument("--djent", action="store_true")
     args = parser.parse_args()
 
+    IoMcpConfig = _lazy("IoMcpConfig")
+    TTSEngine = _lazy("TTSEngine")
+    IoMcpApp = _lazy("IoMcpApp")
+    _startup_done()
+
     # No default append options — "More options" is handled by the TUI's
     # collapsed extras toggle and shouldn't appear as a numbered choice.
     # (Previously defaulted to ["More options"] which duplicated the TUI toggle.)
@@ -2170,8 +2608,7 @@ def main() -> None:
                     front.event.set()
                     session.drain_kick.set()
                     # Update UI
-                    _app.call_from_thread(_app._update_inbox_list)
-                    _app.call_from_thread(_app._update_tab_bar)
+                    _app._invalidate("inbox", "tab_bar")
             except Exception:
                 _file_log.debug("cancel_mcp handler failed", exc_info=True)
 
@@ -2192,14 +2629,19 @@ def main() -> None:
             except Exception:
                 _file_log.debug("report_activity failed", exc_info=True)
 
+        from .transport import api_socket, backend_socket
+        backend_sock = None if args.no_unix_socket else backend_socket(args.port)
         start_backend_server(dispatch, host="0.0.0.0", port=args.port,
                            cancel_dispatch=_cancel_dispatch,
-                           report_activity=_report_activity)
+                           report_activity=_report_activity,
+                           unix_socket=backend_sock)
         print(f"  Backend: /handle-mcp on 0.0.0.0:{args.port}", flush=True)
+        if backend_sock:
+            print(f"  Backend: local socket {backend_sock}", flush=True)
 
         # Start Android SSE API on :8445
         try:
-            from .api import start_api_server
+            from .api import emit_audio_ready, event_bus, start_api_server
             from .tui import EXTRA_OPTIONS
 
             class _ApiFrontend:
@@ -2209,6 +2651,14 @@ def main() -> None:
                 @property
                 def config(self):
                     return app_ref[0]._config
+                @property
+                def tts(self):
+                    return tts
+
+            # Remote audio: announce new clips, and let TTS skip local
+            # playback while a client plays them (tts.localPlayback)
+            tts.on_audio_cached = emit_audio_ready
+            tts.remote_audio = lambda: event_bus.audio_clients() > 0
 
             def _on_highlight(session_id: str, choice_index: int):
                 _app = app_ref[0]
@@ -2251,7 +2701,8 @@ def main() -> None:
                     pass
 
             start_api_server(_ApiFrontend(), port=DEFAULT_API_PORT, host=args.host,
-                           highlight_callback=_on_highlight, key_callback=_on_key)
+                           highlight_callback=_on_highlight, key_callback=_on_key,
+                           unix_socket=None if args.no_unix_socket else api_socket(DEFAULT_API_PORT))
             print(f"  Android API: SSE on {args.host}:{DEFAULT_API_PORT}", flush=True)
         except Exception as e:
             print(f"  Android API: failed — {e}", flush=True)
@@ -6,34 +6,69 @@ the same process.
 
 Endpoints:
   GET  /api/events          SSE stream of frontend events
+  GET  /api/ws              WebSocket: key/highlight/select up (acked), events down
   GET  /api/sessions        List active sessions
-  GET  /api/sessions/:id    Get session state
+  GET  /api/sessions/:id    Get session state (ETag; ?since=V for changed fields only)
   GET  /api/settings        Current settings
+  GET  /api/timeline?since=N&session=ID&limit=N
+                            All sessions' events after cursor N
+  GET  /api/audio/:key[.wav|.ogg|.mp3]
+                            Cached speech clip (Range, ETag; bare key negotiates via Accept)
   POST /api/sessions/:id/select   Send a selection
   POST /api/sessions/:id/message  Queue a user message
   POST /api/settings/speed        Set TTS speed
   POST /api/settings/voice        Set TTS voice
   POST /api/settings/emotion      Set TTS emotion
 
+Every SSE event has an ``id:``. Reconnect with a ``Last-Event-ID`` header
+(or ``?lastEventId=N``) to be sent the events missed since that id; if
+they have aged out of the replay ring a single ``resync`` event is sent
+instead and the client should refetch state over REST. ``?overflow=``
+picks what happens when a slow client's buffer fills: ``drop-oldest``
+(default), ``coalesce`` or ``disconnect`` (see OVERFLOW_POLICIES).
+``?audio=1`` (SSE or WebSocket) marks a client that fetches and plays
+speech clips itself; with ``config.tts.localPlayback: unless-remote``
+the server stops playing audio locally while one is attached.
+
+Local tools (``io-mcp-msg``) reach the same routes over the Unix socket
+``transport.API_SOCKET`` when the server was started with one.
+
 Events (SSE):
-  choices_presented  New choices for a session
-  speech_requested   TTS narration requested
+  choices_presented  New choices for a session (``audio`` has the readout clip keys)
+  speech_requested   TTS narration requested (``audio_key`` names the clip)
+  audio_ready        A speech clip was generated and can be fetched
   session_created    New session tab opened
   session_removed    Session tab closed
   settings_changed   Settings updated
+  resync             Missed events can't be replayed; refetch state
 """
 
 from __future__ import annotations
 
 import asyncio
+import base64
+import collections
+import hashlib
+import io
+import itertools
 import json
 import logging
+import os
 import queue
+import re
+import socket
+import struct
 import threading
 import time
+import urllib.parse
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Any, Optional
 
+from .transport import bind_unix_socket, unlink_socket
+from .tts import AUDIO_FORMATS
+
 log = logging.getLogger("io-mcp.api")
 
 
@@ -44,85 +79,420 @@ class FrontendEvent:
     data: dict[str, Any]
     session_id: Optional[str] = None
     timestamp: float = field(default_factory=time.time)
+    event_id: int = 0  # assigned by EventBus.publish (0 = never published)
+    sse: bytes = field(default=b"", repr=False, compare=False)  # encoded once by publish
+    ws: bytes = field(default=b"", repr=False, compare=False)   # cached by ws_frame()
 
     def to_sse(self) -> str:
-        """Format as Server-Sent Events message."""
-        payload = json.dumps({
+        """Format as Server-Sent Events message.
+
+        Published events carry an ``id:`` line so EventSource clients send
+        it back as ``Last-Event-ID`` when they reconnect.
+        """
+        body = {
             "type": self.event_type,
             "session_id": self.session_id,
             "data": self.data,
             "timestamp": self.timestamp,
-        })
-        return f"event: {self.event_type}\ndata: {payload}\n\n"
+        }
+        if not self.event_id:
+            return f"event: {self.event_type}\ndata: {json.dumps(body)}\n\n"
+        body["id"] = self.event_id
+        return f"event: {self.event_type}\ndata: {json.dumps(body)}\nid: {self.event_id}\n\n"
+
+    def encoded(self) -> bytes:
+        """SSE bytes — the buffer shared by all subscribers once published."""
+        return self.sse or self.to_sse().encode()
+
+    def ws_frame(self) -> bytes:
+        """WebSocket text frame ``{"type": "event", "event": <SSE data>}``.
+
+        Built on first use and cached, so it is also encoded only once
+        however many WebSocket clients are attached.
+        """
+        if not self.ws:
+            data = self.encoded().split(b"\n", 2)[1][len(b"data: "):]
+            self.ws = ws_frame(b'{"type": "event", "event": ' + data + b"}")
+        return self.ws
+
+
+# Subscriber overflow policies. When a subscriber's buffer is full:
+#   drop-oldest  discard the oldest queued event (default)
+#   coalesce     as drop-oldest, but a new event of a COALESCE_TYPES type
+#                first replaces the queued one for the same session
+#   disconnect   drop the subscriber; the client reconnects with
+#                Last-Event-ID and is replayed what it missed
+OVERFLOW_POLICIES = ("drop-oldest", "coalesce", "disconnect")
+
+# Event types where only the latest state matters
+COALESCE_TYPES = frozenset({"settings_changed", "recording_state"})
+
+
+class _Subscription:
+    """Overflow policy and lag bookkeeping shared by both subscriber kinds.
+
+    Subclasses own a deque buffer and call ``_offer`` with their own lock
+    (or loop) serialising access. A ``None`` in the buffer means the bus
+    disconnected the subscriber; readers stop when they see it.
+    """
+
+    _ids = itertools.count(1)
+
+    def _init_subscription(self, capacity: int, policy: str, name: str) -> None:
+        self.sub_id = next(_Subscription._ids)
+        self.name = name
+        self.policy = policy if policy in OVERFLOW_POLICIES else "drop-oldest"
+        self.capacity = max(1, capacity)
+        # Replay events still queued at the head of the buffer; they ride
+        # above ``capacity`` until read, then the configured bound applies
+        self.backlog = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.delivered_id = 0  # id of the last event handed to the reader
+        self.closed = False
+        self.transport: Any = None  # set by the asyncio server for write-buffer stats
+        self.audio = False  # client plays speech itself (``?audio=1``)
+
+    def _offer(self, buf: collections.deque, event: FrontendEvent) -> bool:
+        """Queue ``event`` in ``buf`` under the overflow policy.
+
+        Returns False when the policy disconnects the subscriber.
+        """
+        if self.closed:
+            return False
+        if self.policy == "coalesce" and event.event_type in COALESCE_TYPES:
+            for i, old in enumerate(buf):
+                if old.event_type == event.event_type and old.session_id == event.session_id:
+                    del buf[i]
+                    if i < self.backlog:
+                        self.backlog -= 1
+                    self.coalesced += 1
+                    break
+        if len(buf) >= self.capacity + self.backlog:
+            if self.policy == "disconnect":
+                self.closed = True
+                buf.clear()
+                buf.append(None)
+                return False
+            buf.popleft()
+            self._took()
+            self.dropped += 1
+        buf.append(event)
+        return True
+
+    def _took(self) -> None:
+        """The head of the buffer left it (read or dropped)."""
+        if self.backlog:
+            self.backlog -= 1
+
+    def _stats(self, buf: collections.deque, last_event_id: int, now: float) -> dict:
+        head = buf[0] if buf else None
+        stats = {
+            "id": self.sub_id,
+            "name": self.name,
+            "policy": self.policy,
+            "queued": len(buf),
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "lag_events": max(0, last_event_id - self.delivered_id) if self.delivered_id else len(buf),
+            "lag_seconds": round(now - head.timestamp, 3) if head is not None else 0.0,
+        }
+        if self.audio:
+            stats["audio"] = True
+        if self.transport is not None:
+            try:
+                stats["unsent_bytes"] = self.transport.get_write_buffer_size()
+            except Exception:
+                pass
+        return stats
+
+
+class SubscriberQueue(_Subscription, queue.Queue):
+    """Thread subscriber: a ``queue.Queue`` read with ``get()``.
+
+    ``get`` returns None once the bus has disconnected the subscriber.
+    """
+
+    def __init__(self, capacity: int, policy: str = "drop-oldest", name: str = ""):
+        queue.Queue.__init__(self, maxsize=capacity)
+        self._init_subscription(capacity, policy, name)
+
+    def offer(self, event: FrontendEvent) -> bool:
+        """Queue an event (never blocks). False means disconnect."""
+        with self.not_empty:
+            before = len(self.queue)
+            ok = self._offer(self.queue, event)
+            self.unfinished_tasks += len(self.queue) - before
+            self.not_empty.notify()
+        return ok
+
+    def _get(self) -> Optional[FrontendEvent]:
+        event = self.queue.popleft()
+        self._took()
+        if event is not None:
+            self.delivered_id = event.event_id
+        return event
+
+    def stats(self, last_event_id: int, now: float) -> dict:
+        with self.mutex:
+            return self._stats(self.queue, last_event_id, now)
+
+
+class AsyncSubscriber(_Subscription):
+    """EventBus subscriber that delivers onto an asyncio event loop.
+
+    ``publish`` runs on arbitrary threads; ``offer`` hands the event to the
+    loop with ``call_soon_threadsafe`` so a publisher never waits on a slow
+    client, and the overflow policy runs on the loop thread.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, capacity: int = 100,
+                 policy: str = "drop-oldest", name: str = ""):
+        self._init_subscription(capacity, policy, name)
+        self._loop = loop
+        self._events: collections.deque = collections.deque()
+        self._ready = asyncio.Event()
+
+    def offer(self, event: FrontendEvent) -> bool:
+        # Raises RuntimeError once the loop is closed; publish() drops us then
+        if self.closed:
+            return False
+        self._loop.call_soon_threadsafe(self._deliver, event)
+        return True
+
+    def _deliver(self, event: FrontendEvent) -> None:
+        self._offer(self._events, event)
+        self._ready.set()
+
+    async def get(self) -> Optional[FrontendEvent]:
+        """Wait for the next event (on the loop); None once disconnected."""
+        while not self._events:
+            self._ready.clear()
+            await self._ready.wait()
+        event = self._events.popleft()
+        self._took()
+        if event is not None:
+            self.delivered_id = event.event_id
+        return event
+
+    def stats(self, last_event_id: int, now: float) -> dict:
+        return self._stats(self._events, last_event_id, now)
 
 
 class EventBus:
     """Thread-safe event bus for pushing events to SSE subscribers.
 
     Multiple SSE clients can subscribe. Events are broadcast to all.
-    Subscribers get their own queue with a max size to prevent memory issues.
+    Each event is encoded to SSE bytes once, in ``publish``; subscribers
+    share that immutable buffer. Every subscriber has a bounded buffer
+    with its own overflow policy (``OVERFLOW_POLICIES``) and lag stats.
+
+    Every published event gets the next ``event_id`` and is kept in a
+    bounded replay ring, so a client that reconnects with the last id it
+    saw can be sent exactly what it missed (see ``subscribe``).
     """
 
-    def __init__(self, max_queue_size: int = 100):
-        self._subscribers: list[queue.Queue] = []
+    def __init__(self, max_queue_size: int = 100, replay_size: int = 1000,
+                 default_policy: str = "drop-oldest"):
+        self._subscribers: list = []
         self._lock = threading.Lock()
+        # Serialises publishers so every subscriber sees events in id order,
+        # without holding ``_lock`` (and so subscribe/stats) during fan-out
+        self._publish_lock = threading.Lock()
         self._max_queue_size = max_queue_size
+        self._replay: collections.deque[FrontendEvent] = collections.deque(maxlen=replay_size)
+        self._last_id = 0
+        self.default_policy = default_policy
+        self.disconnected = 0  # subscribers dropped by the disconnect policy or errors
+
+    @property
+    def last_event_id(self) -> int:
+        """Id of the most recently published event (0 before the first)."""
+        with self._lock:
+            return self._last_id
+
+    def _missed_locked(self, last_event_id: Optional[int]) -> Optional[list[FrontendEvent]]:
+        """Events after ``last_event_id`` from the replay ring (lock held).
 
-    def subscribe(self) -> queue.Queue:
-        """Create a new subscriber queue."""
-        q: queue.Queue = queue.Queue(maxsize=self._max_queue_size)
+        Returns [] for a fresh subscriber (None id) and None when the ring
+        no longer reaches back that far, or the id is from before a server
+        restart — the client must then resync from the REST endpoints.
+        """
+        if last_event_id is None:
+            return []
+        if last_event_id > self._last_id:
+            return None  # id from an earlier server run
+        oldest = self._replay[0].event_id if self._replay else self._last_id + 1
+        if last_event_id < oldest - 1:
+            return None
+        return [e for e in self._replay if e.event_id > last_event_id]
+
+    def _register_locked(self, sub: Any, last_event_id: Optional[int]) -> None:
+        """Seed ``sub`` with its replay backlog and add it (lock held).
+
+        Replay and registration happen under one lock, so nothing published
+        meanwhile is lost or duplicated. The backlog is queued above the
+        subscriber's capacity only until it has been read.
+        """
+        missed = self._missed_locked(last_event_id)
+        if missed is None:
+            missed = [FrontendEvent(event_type="resync", data={"last_event_id": self._last_id})]
+        sub.backlog = len(missed)
+        for event in missed:
+            sub.offer(event)
+        self._subscribers.append(sub)
+
+    def subscribe(self, last_event_id: Optional[int] = None, policy: Optional[str] = None,
+                  name: str = "") -> SubscriberQueue:
+        """Create a new subscriber queue.
+
+        With ``last_event_id`` the queue starts with every event published
+        after it, or with a single ``resync`` event if those are no longer
+        in the replay ring.
+        """
+        q = SubscriberQueue(self._max_queue_size, policy or self.default_policy, name)
         with self._lock:
-            self._subscribers.append(q)
+            self._register_locked(q, last_event_id)
         return q
 
-    def unsubscribe(self, q: queue.Queue) -> None:
+    def subscribe_async(self, loop: Optional[asyncio.AbstractEventLoop] = None,
+                        last_event_id: Optional[int] = None, policy: Optional[str] = None,
+                        name: str = "") -> AsyncSubscriber:
+        """Create a subscriber read with ``await sub.get()`` on ``loop``.
+
+        ``last_event_id`` replays missed events as in ``subscribe``. Must
+        be called on ``loop`` so the backlog is queued before the first get.
+        """
+        sub = AsyncSubscriber(loop or asyncio.get_running_loop(), self._max_queue_size,
+                              policy or self.default_policy, name)
+        with self._lock:
+            # Backlog offers are queued on the loop ahead of anything
+            # published later, so ordering holds.
+            self._register_locked(sub, last_event_id)
+        return sub
+
+    def unsubscribe(self, q: Any) -> None:
         """Remove a subscriber queue."""
         with self._lock:
             self._subscribers = [s for s in self._subscribers if s is not q]
 
     def publish(self, event: FrontendEvent) -> None:
-        """Publish an event to all subscribers."""
-        with self._lock:
+        """Number, encode and record the event, then offer it to every subscriber.
+
+        The subscriber list is snapshotted together with the replay append,
+        so a subscriber registering meanwhile gets the event exactly once
+        (from the replay); the offers themselves run outside ``_lock``.
+        """
+        with self._publish_lock:
+            with self._lock:
+                self._last_id += 1
+                event.event_id = self._last_id
+                event.sse = event.to_sse().encode()
+                self._replay.append(event)
+                subscribers = list(self._subscribers)
             dead = []
-            for q in self._subscribers:
+            for q in subscribers:
                 try:
-                    q.put_nowait(event)
-                except queue.Full:
-                    # Drop oldest event and retry
-                    try:
-                        q.get_nowait()
-                        q.put_nowait(event)
-                    except (queue.Empty, queue.Full):
-                        dead.append(q)
-            # Clean up dead subscribers
-            for q in dead:
-                self._subscribers.remove(q)
+                    ok = q.offer(event)
+                except Exception:
+                    ok = False  # broken subscriber, or its event loop has closed
+                if not ok:
+                    dead.append(q)
+        if dead:
+            with self._lock:
+                # Clean up dead subscribers (unless already unsubscribed)
+                live = [s for s in self._subscribers if s not in dead]
+                self.disconnected += len(self._subscribers) - len(live)
+                self._subscribers = live
 
     def subscriber_count(self) -> int:
         with self._lock:
             return len(self._subscribers)
 
+    def audio_clients(self) -> int:
+        """Attached subscribers that play speech clips themselves."""
+        with self._lock:
+            return sum(1 for s in self._subscribers if s.audio and not s.closed)
+
+    def subscriber_stats(self) -> list[dict]:
+        """Per-subscriber policy, queue depth, drops and lag, for /api/health."""
+        now = time.time()
+        with self._lock:
+            subs = list(self._subscribers)
+            last_id = self._last_id
+        return [sub.stats(last_id, now) for sub in subs]
+
+
+def parse_overflow_policy(query: str) -> Optional[str]:
+    """The ``?overflow=`` policy an SSE client asked for (None = bus default)."""
+    value = urllib.parse.parse_qs(query).get("overflow", [None])[0]
+    return value if value in OVERFLOW_POLICIES else None
+
+
+def parse_audio_flag(query: str) -> bool:
+    """Whether a client asked to play speech itself (``?audio=1``)."""
+    value = urllib.parse.parse_qs(query).get("audio", [""])[0]
+    return value.lower() in ("1", "true", "yes")
+
+
+def parse_last_event_id(header: Optional[str], query: str = "") -> Optional[int]:
+    """The resume point from a ``Last-Event-ID`` header or ``?lastEventId=``.
+
+    The query parameter is for clients that can't set headers on an
+    EventSource. Returns None when absent or not an integer.
+    """
+    value = header
+    if not value and query:
+        value = urllib.parse.parse_qs(query).get("lastEventId", [None])[0]
+    try:
+        return int(value) if value else None
+    except ValueError:
+        return None
+
 
 # Global event bus instance
 event_bus = EventBus()
 
 
-def emit_choices_presented(session_id: str, preamble: str, choices: list[dict]) -> None:
-    """Emit event when choices are presented to a session."""
+def emit_choices_presented(session_id: str, preamble: str, choices: list[dict],
+                           audio: Optional[dict[str, Any]] = None) -> None:
+    """Emit event when choices are presented to a session.
+
+    ``audio`` holds the clip keys of the readout — ``{"intro": key,
+    "choices": [key, ...]}`` — fetchable from ``/api/audio/<key>``.
+    """
+    data: dict[str, Any] = {"preamble": preamble, "choices": choices}
+    if audio:
+        data["audio"] = audio
     event_bus.publish(FrontendEvent(
         event_type="choices_presented",
         session_id=session_id,
-        data={"preamble": preamble, "choices": choices},
+        data=data,
     ))
 
 
 def emit_speech_requested(session_id: str, text: str, blocking: bool = False,
-                          priority: int = 0) -> None:
-    """Emit event when speech is requested for a session."""
+                          priority: int = 0, audio_key: Optional[str] = None) -> None:
+    """Emit event when speech is requested for a session.
+
+    ``audio_key`` names the clip at ``/api/audio/<key>``; an
+    ``audio_ready`` event follows once it has been generated.
+    """
+    data: dict[str, Any] = {"text": text, "blocking": blocking, "priority": priority}
+    if audio_key:
+        data["audio_key"] = audio_key
     event_bus.publish(FrontendEvent(
         event_type="speech_requested",
         session_id=session_id,
-        data={"text": text, "blocking": blocking, "priority": priority},
+        data=data,
+    ))
+
+
+def emit_audio_ready(key: str) -> None:
+    """Emit event when a speech clip has been generated and can be fetched."""
+    event_bus.publish(FrontendEvent(
+        event_type="audio_ready",
+        data={"key": key},
     ))
 
 
@@ -170,10 +540,208 @@ def emit_recording_state(session_id: str, recording: bool) -> None:
     ))
 
 
+# ─── Versioned session state ─────────────────────────────────────────────
+
+def session_state(session: Any) -> dict[str, Any]:
+    """The remote-visible state of a session, as compared between polls.
+
+    Only fields that change on real state transitions are included — no
+    timestamps or counters that tick while idle — so an unchanged session
+    keeps its version. Lists are copied so later in-place edits on the
+    session are seen as changes.
+    """
+    active = bool(session.active)
+    return {
+        "id": session.session_id,
+        "name": session.name,
+        "active": active,
+        "preamble": session.preamble if active else "",
+        "choices": [dict(c) for c in session.choices] if active else [],
+        "inbox_pending": session.inbox_choices_count(),
+        "pending_messages": len(session.pending_messages),
+        "health": session.health_status,
+        "recording": bool(session.voice_recording),
+        "last_tool": session.last_tool_name,
+    }
+
+
+@dataclass
+class _TrackedState:
+    session: Any
+    version: int
+    fields: dict[str, Any]
+    stamps: dict[str, int]  # field -> version at which it last changed
+
+
+class SessionStateTracker:
+    """Per-session state versions for conditional and delta GETs.
+
+    Sessions are mutated from many places without notification, so the
+    version is derived on read: each request snapshots ``session_state``
+    and, if any field differs from the previous snapshot, bumps the
+    session's version and stamps the changed fields with it. A client
+    then gets a 304 for an unchanged ETag, or only the fields stamped
+    after the version it already has.
+    """
+
+    def __init__(self) -> None:
+        # Distinguishes server runs in ETags (versions restart at 1)
+        self.instance = f"{os.getpid():x}.{int(time.time()):x}"
+        self._lock = threading.Lock()
+        self._entries: dict[str, _TrackedState] = {}
+
+    def observe(self, session: Any) -> tuple[int, dict[str, Any], dict[str, int]]:
+        """Snapshot ``session``; return ``(version, fields, stamps)``."""
+        snapshot = session_state(session)
+        with self._lock:
+            entry = self._entries.get(session.session_id)
+            if entry is None or entry.session is not session:
+                # New session, or an id reused by a different session object
+                entry = _TrackedState(session, 1, snapshot, dict.fromkeys(snapshot, 1))
+                self._entries[session.session_id] = entry
+            else:
+                changed = [k for k, v in snapshot.items() if entry.fields.get(k) != v]
+                if changed:
+                    entry.version += 1
+                    for k in changed:
+                        entry.fields[k] = snapshot[k]
+                        entry.stamps[k] = entry.version
+            return entry.version, dict(entry.fields), dict(entry.stamps)
+
+    def etag(self, version: int | str) -> str:
+        return f'"{self.instance}-{version}"'
+
+    def prune(self, live_ids: set[str]) -> None:
+        """Forget sessions that no longer exist."""
+        with self._lock:
+            for sid in [sid for sid in self._entries if sid not in live_ids]:
+                del self._entries[sid]
+
+
+state_tracker = SessionStateTracker()
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an ``If-None-Match`` header matches ``etag`` (weak compare)."""
+    if not if_none_match:
+        return False
+    tags = [t.strip().removeprefix("W/") for t in if_none_match.split(",")]
+    return "*" in tags or etag in tags
+
+
+# ─── Speech clips (/api/audio/<key>[.wav|.ogg|.mp3]) ─────────────────────
+
+_AUDIO_NAME_RE = re.compile(r"^(?P<key>[0-9a-f]{32})(?:\.(?P<fmt>[a-z0-9]+))?$")
+
+
+def parse_byte_range(header: Optional[str], size: int) -> Optional[tuple[int, int]]:
+    """``(first, last)`` byte positions of a single-range ``Range`` header.
+
+    Returns None when there is no header or it isn't a single ``bytes=``
+    range — the whole body is sent, as RFC 9110 allows. Raises ValueError
+    when the range lies outside the ``size``-byte body (416).
+    """
+    if not header or not header.startswith("bytes=") or "," in header:
+        return None
+    first, sep, last = header[len("bytes="):].strip().partition("-")
+    if not sep or not (first or last) or not all(p.isdigit() for p in (first, last) if p):
+        return None  # malformed: ignored
+    if not first:  # suffix range: the final N bytes
+        if int(last) == 0 or size == 0:
+            raise ValueError("range not satisfiable")
+        return max(0, size - int(last)), size - 1
+    start = int(first)
+    if last and int(last) < start:
+        return None  # malformed: ignored
+    if start >= size:
+        raise ValueError("range not satisfiable")
+    return start, min(int(last) if last else size - 1, size - 1)
+
+
+def negotiate_audio_format(accept: Optional[str]) -> str:
+    """Compressed format named in ``Accept`` (first match), else "wav"."""
+    accept = accept or ""
+    for fmt in ("ogg", "mp3"):
+        if AUDIO_FORMATS[fmt][0] in accept:
+            return fmt
+    return "wav"
+
+
+# ─── User actions (shared by the REST routes and the WebSocket) ──────────
+# Each returns ``(response, status)``.
+
+REMOTE_KEYS = ("j", "k", "enter", "space", "u", "h", "l", "s", "d", "n", "m", "i")
+
+
+def apply_select(server: Any, session_id: str, body: dict) -> tuple[dict, int]:
+    """Resolve a session's active choices with ``body["label"]``."""
+    frontend = getattr(server, 'frontend', None)
+    if not frontend:
+        return {"error": "no frontend"}, 500
+    session = frontend.manager.get(session_id)
+    if not session or not session.active:
+        return {"error": "session not found or inactive"}, 404
+    label = body.get("label", "")
+    summary = body.get("summary", "")
+    result = {"selected": label, "summary": summary}
+    # Resolve inbox item if present
+    item = getattr(session, '_active_inbox_item', None)
+    if item and not item.done:
+        item.result = result
+        item.done = True
+        item.event.set()
+    # Legacy path
+    session.selection = result
+    session.selection_event.set()
+    # Kick drain loop so next queued item presents immediately
+    session.drain_kick.set()
+    return {"status": "selected", "label": label}, 200
+
+
+def apply_highlight(server: Any, session_id: str, body: dict) -> tuple[dict, int]:
+    """Move the TUI highlight to ``body["index"]`` (1-based choice number)."""
+    frontend = getattr(server, 'frontend', None)
+    if not frontend:
+        return {"error": "no frontend"}, 500
+    session = frontend.manager.get(session_id)
+    if not session or not session.active:
+        return {"error": "session not found or inactive"}, 404
+
+    index = body.get("index", -1)  # 1-based choice index
+    if not isinstance(index, int) or isinstance(index, bool) or index < 1:
+        return {"error": "invalid index"}, 400
+
+    # Call the highlight callback if registered
+    highlight_fn = getattr(server, '_highlight_callback', None)
+    if highlight_fn:
+        try:
+            highlight_fn(session_id, index)
+        except Exception as e:
+            return {"error": str(e)}, 500
+    return {"status": "highlighted", "index": index}, 200
+
+
+def apply_key(server: Any, session_id: str, body: dict, repeat: int = 1) -> tuple[dict, int]:
+    """Forward ``body["key"]`` to the TUI ``repeat`` times."""
+    key_fn = getattr(server, '_key_callback', None)
+    if not key_fn:
+        return {"error": "no key handler"}, 500
+
+    key = body.get("key", "")
+    if key not in REMOTE_KEYS:
+        return {"error": f"unsupported key: {key}"}, 400
+
+    try:
+        for _ in range(repeat):
+            key_fn(session_id, key)
+    except Exception as e:
+        return {"error": str(e)}, 500
+    return {"status": "ok", "key": key}, 200
+
+
 # ─── HTTP Server for Frontend API ────────────────────────────────────────
 
 import http.server
-import urllib.parse
 
 
 class FrontendAPIHandler(http.server.BaseHTTPRequestHandler):
@@ -182,13 +750,23 @@ class FrontendAPIHandler(http.server.BaseHTTPRequestHandler):
     def log_message(self, format, *args):
         pass
 
-    def _send_json(self, data: Any, status: int = 200) -> None:
+    def _send_json(self, data: Any, status: int = 200,
+                   headers: Optional[dict[str, str]] = None) -> None:
         self.send_response(status)
         self.send_header("Content-Type", "application/json")
         self.send_header("Access-Control-Allow-Origin", "*")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
         self.end_headers()
         self.wfile.write(json.dumps(data).encode())
 
+    def _send_not_modified(self, etag: str) -> None:
+        self.send_response(304)
+        self.send_header("ETag", etag)
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Access-Control-Expose-Headers", "ETag")
+        self.end_headers()
+
     def _read_body(self) -> dict:
         length = int(self.headers.get("Content-Length", 0))
         if length == 0:
@@ -214,10 +792,17 @@ class FrontendAPIHandler(http.server.BaseHTTPRequestHandler):
             self._handle_sse()
         elif path == "/api/sessions":
             self._handle_list_sessions()
+        elif path.startswith("/api/sessions/") and path.count("/") == 3:
+            self._handle_get_session(path.split("/")[-1],
+                                     urllib.parse.parse_qs(parsed.query))
         elif path == "/api/settings":
             self._handle_get_settings()
         elif path == "/api/health":
             self._handle_health()
+        elif path == "/api/timeline":
+            self._handle_timeline(urllib.parse.parse_qs(parsed.query))
+        elif path.startswith("/api/audio/") and path.count("/") == 3:
+            self._handle_audio(path.split("/")[-1])
         else:
             self._send_json({"error": "not found"}, 404)
 
@@ -252,7 +837,11 @@ class FrontendAPIHandler(http.server.BaseHTTPRequestHandler):
         self.send_header("Access-Control-Allow-Origin", "*")
         self.end_headers()
 
-        sub = event_bus.subscribe()
+        query = urllib.parse.urlparse(self.path).query
+        sub = event_bus.subscribe(
+            parse_last_event_id(self.headers.get("Last-Event-ID"), query),
+            policy=parse_overflow_policy(query), name=self.address_string())
+        sub.audio = parse_audio_flag(query)
         try:
             self.wfile.write(b"event: connected\ndata: {}\n\n")
             self.wfile.flush()
@@ -260,7 +849,9 @@ class FrontendAPIHandler(http.server.BaseHTTPRequestHandler):
             while True:
                 try:
                     event = sub.get(timeout=30)
-                    self.wfile.write(event.to_sse().encode())
+                    if event is None:
+                        break  # disconnected by the overflow policy
+                    self.wfile.write(event.encoded())
                     self.wfile.flush()
                 except queue.Empty:
                     self.wfile.write(b": keepalive\n\n")
@@ -276,15 +867,91 @@ class FrontendAPIHandler(http.server.BaseHTTPRequestHandler):
             self._send_json({"error": "no frontend"}, 500)
             return
         sessions = []
+        versions = []
         for s in frontend.manager.all_sessions():
+            version, state, _ = state_tracker.observe(s)
+            versions.append(f"{s.session_id}:{version}")
             sessions.append({
                 "id": s.session_id,
                 "name": s.name,
                 "active": s.active,
-                "preamble": s.preamble if s.active else "",
-                "choices": s.choices if s.active else [],
+                "preamble": state["preamble"],
+                "choices": state["choices"],
+                "version": version,
             })
-        self._send_json({"sessions": sessions})
+        state_tracker.prune({s["id"] for s in sessions})
+        # The list changes when any session's version does, or one comes or goes
+        etag = state_tracker.etag("L%08x" % zlib.crc32(",".join(versions).encode()))
+        if etag_matches(self.headers.get("If-None-Match"), etag):
+            self._send_not_modified(etag)
+            return
+        self._send_json({"sessions": sessions}, headers=self._etag_headers(etag))
+
+    @staticmethod
+    def _etag_headers(etag: str) -> dict[str, str]:
+        return {"ETag": etag, "Cache-Control": "no-cache",
+                "Access-Control-Expose-Headers": "ETag"}
+
+    def _handle_get_session(self, session_id: str, query: dict) -> None:
+        """One session's state, versioned.
+
+        Responds 304 when ``If-None-Match`` carries the current ETag, or
+        when ``?since=`` is already the current version. Otherwise
+        ``{"version", "full", "state"}``: with a usable ``since``, ``state``
+        holds only the fields changed after it and ``full`` is false.
+        """
+        frontend = getattr(self.server, 'frontend', None)
+        if not frontend:
+            self._send_json({"error": "no frontend"}, 500)
+            return
+        session = frontend.manager.get(session_id)
+        if not session:
+            self._send_json({"error": "session not found"}, 404)
+            return
+        try:
+            since = int(query["since"][0]) if "since" in query else None
+        except ValueError:
+            self._send_json({"error": "since must be an integer"}, 400)
+            return
+
+        version, state, stamps = state_tracker.observe(session)
+        etag = state_tracker.etag(version)
+        if etag_matches(self.headers.get("If-None-Match"), etag) or since == version:
+            self._send_not_modified(etag)
+            return
+        full = since is None or since <= 0 or since > version
+        if not full:
+            state = {k: v for k, v in state.items() if stamps[k] > since}
+        self._send_json({"version": version, "full": full, "state": state},
+                        headers=self._etag_headers(etag))
+
+    def _handle_timeline(self, query: dict) -> None:
+        """Events from the global event store recorded after ``since``.
+
+        Clients keep the returned ``cursor`` and pass it back as ``since``
+        to page forward; ``more`` is true when ``limit`` cut the page short.
+        """
+        frontend = getattr(self.server, 'frontend', None)
+        if not frontend:
+            self._send_json({"error": "no frontend"}, 500)
+            return
+        try:
+            since = int(query.get("since", ["0"])[0])
+            limit = max(1, min(int(query.get("limit", ["200"])[0]), 1000))
+        except ValueError:
+            self._send_json({"error": "since and limit must be integers"}, 400)
+            return
+        session_id = query.get("session", [None])[0]
+        store = frontend.manager.sync_events()
+        events = store.since(since, session_id=session_id, limit=limit + 1)
+        more = len(events) > limit
+        events = events[:limit]
+        self._send_json({
+            "events": [ev.to_dict() for ev in events],
+            "cursor": events[-1].seq if more else store.cursor,
+            "more": more,
+            "epoch": store.epoch,
+        })
 
     def _handle_get_settings(self) -> None:
         frontend = getattr(self.server, 'frontend', None)
@@ -310,36 +977,94 @@ class FrontendAPIHandler(http.server.BaseHTTPRequestHandler):
     def _handle_health(self) -> None:
         frontend = getattr(self.server, 'frontend', None)
         session_count = frontend.manager.count() if frontend else 0
+        blocked = frontend.manager.blocked_seconds() if frontend else 0.0
         self._send_json({
             "status": "ok",
             "sessions": session_count,
+            "agent_blocked_seconds": round(blocked, 1),
             "sse_subscribers": event_bus.subscriber_count(),
+            "audio_clients": event_bus.audio_clients(),
+            "sse_last_event_id": event_bus.last_event_id,
+            "sse_disconnected": event_bus.disconnected,
+            "sse_lag": event_bus.subscriber_stats(),
         })
 
-    def _handle_select(self, session_id: str, body: dict) -> None:
-        frontend = getattr(self.server, 'frontend', None)
-        if not frontend:
-            self._send_json({"error": "no frontend"}, 500)
+    def _handle_audio(self, clip: str) -> None:
+        """Serve a cached speech clip by content key.
+
+        ``<key>.ogg``/``<key>.mp3`` are compressed variants (transcoded on
+        first request); a bare ``<key>`` picks one from ``Accept``. Clips
+        are immutable, so responses carry a long-lived ETag, and single
+        ``Range`` requests get 206 partial content for streaming players.
+        """
+        m = _AUDIO_NAME_RE.match(clip)
+        if not m:
+            self._send_json({"error": "invalid audio key"}, 404)
             return
-        session = frontend.manager.get(session_id)
-        if not session or not session.active:
-            self._send_json({"error": "session not found or inactive"}, 404)
+        key, fmt = m.group("key"), m.group("fmt")
+        if fmt is None:
+            fmt = negotiate_audio_format(self.headers.get("Accept"))
+        if fmt not in AUDIO_FORMATS:
+            self._send_json({"error": f"unknown audio format: {fmt}"}, 404)
             return
-        label = body.get("label", "")
-        summary = body.get("summary", "")
-        result = {"selected": label, "summary": summary}
-        # Resolve inbox item if present
-        item = getattr(session, '_active_inbox_item', None)
-        if item and not item.done:
-            item.result = result
-            item.done = True
-            item.event.set()
-        # Legacy path
-        session.selection = result
-        session.selection_event.set()
-        # Kick drain loop so next queued item presents immediately
-        session.drain_kick.set()
-        self._send_json({"status": "selected", "label": label})
+        tts = getattr(getattr(self.server, 'frontend', None), 'tts', None)
+        path = tts.cached_audio(key, fmt) if tts else None
+        if path is None and m.group("fmt") is None and fmt != "wav":
+            fmt = "wav"  # negotiated variant unavailable (no ffmpeg)
+            path = tts.cached_audio(key, fmt) if tts else None
+        if path is None:
+            if fmt != "wav" and tts and tts.cached_audio(key):
+                self._send_json({"error": f"{fmt} variant unavailable"}, 406)
+            else:
+                self._send_json({"error": "audio not generated"}, 404)
+            return
+
+        etag = f'"{key}.{fmt}"'
+        common = {
+            "ETag": etag,
+            "Cache-Control": "public, max-age=31536000, immutable",
+            "Accept-Ranges": "bytes",
+            "Access-Control-Allow-Origin": "*",
+            "Access-Control-Expose-Headers": "ETag, Content-Range, Content-Length",
+        }
+        if m.group("fmt") is None:
+            common["Vary"] = "Accept"
+        if etag_matches(self.headers.get("If-None-Match"), etag):
+            self._send_not_modified(etag)
+            return
+        try:
+            with open(path, "rb") as f:
+                body = f.read()
+        except OSError:
+            self._send_json({"error": "audio not generated"}, 404)
+            return
+
+        size = len(body)
+        try:
+            byte_range = parse_byte_range(self.headers.get("Range"), size)
+        except ValueError:
+            self.send_response(416)
+            self.send_header("Content-Range", f"bytes */{size}")
+            for name, value in common.items():
+                self.send_header(name, value)
+            self.end_headers()
+            return
+        if byte_range is None:
+            self.send_response(200)
+        else:
+            first, last = byte_range
+            body = body[first:last + 1]
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {first}-{last}/{size}")
+        self.send_header("Content-Type", AUDIO_FORMATS[fmt][0])
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in common.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _handle_select(self, session_id: str, body: dict) -> None:
+        self._send_json(*apply_select(self.server, session_id, body))
 
     def _handle_message(self, session_id: str, body: dict) -> None:
         frontend = getattr(self.server, 'frontend', None)
@@ -416,30 +1141,7 @@ class FrontendAPIHandler(http.server.BaseHTTPRequestHandler):
         Sets the TUI's ListView index to trigger TTS readout of the
         highlighted choice. The index is 1-based (matching choice numbers).
         """
-        frontend = getattr(self.server, 'frontend', None)
-        if not frontend:
-            self._send_json({"error": "no frontend"}, 500)
-            return
-        session = frontend.manager.get(session_id)
-        if not session or not session.active:
-            self._send_json({"error": "session not found or inactive"}, 404)
-            return
-
-        index = body.get("index", -1)  # 1-based choice index
-        if index < 1:
-            self._send_json({"error": "invalid index"}, 400)
-            return
-
-        # Call the highlight callback if registered
-        highlight_fn = getattr(self.server, '_highlight_callback', None)
-        if highlight_fn:
-            try:
-                highlight_fn(session_id, index)
-            except Exception as e:
-                self._send_json({"error": str(e)}, 500)
-                return
-
-        self._send_json({"status": "highlighted", "index": index})
+        self._send_json(*apply_highlight(self.server, session_id, body))
 
     def _handle_key(self, session_id: str, body: dict) -> None:
         """Handle a key event from a remote frontend.
@@ -448,34 +1150,485 @@ class FrontendAPIHandler(http.server.BaseHTTPRequestHandler):
         enter for select, space for voice input toggle.
         Works even without active choices (e.g., space for voice recording).
         """
-        key_fn = getattr(self.server, '_key_callback', None)
-        if not key_fn:
-            self._send_json({"error": "no key handler"}, 500)
-            return
+        self._send_json(*apply_key(self.server, session_id, body))
+
 
-        key = body.get("key", "")
-        if key not in ("j", "k", "enter", "space", "u", "h", "l", "s", "d", "n", "m", "i"):
-            self._send_json({"error": f"unsupported key: {key}"}, 400)
+# ─── WebSocket framing (RFC 6455, server side) ───────────────────────────
+
+_WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+WS_MAX_MESSAGE = 1 << 16
+
+
+def ws_accept(key: str) -> str:
+    """``Sec-WebSocket-Accept`` for a client's ``Sec-WebSocket-Key``."""
+    return base64.b64encode(hashlib.sha1((key + _WS_GUID).encode()).digest()).decode()
+
+
+def ws_frame(payload: bytes, opcode: int = 0x1) -> bytes:
+    """One unmasked, final server frame (text by default)."""
+    n = len(payload)
+    if n < 126:
+        header = struct.pack("!BB", 0x80 | opcode, n)
+    elif n < 1 << 16:
+        header = struct.pack("!BBH", 0x80 | opcode, 126, n)
+    else:
+        header = struct.pack("!BBQ", 0x80 | opcode, 127, n)
+    return header + payload
+
+
+class WSProtocolError(ValueError):
+    """A client frame the server must fail the connection for.
+
+    ``code`` is the close status to send (RFC 6455 §7.4.1).
+    """
+
+    def __init__(self, code: int, message: str) -> None:
+        super().__init__(message)
+        self.code = code
+
+
+async def ws_read_frame(reader: asyncio.StreamReader) -> tuple[bool, int, bytes]:
+    """Read one client frame: ``(fin, opcode, unmasked payload)``.
+
+    Raises WSProtocolError for unmasked frames (1002, RFC 6455 §5.1) and
+    frames over ``WS_MAX_MESSAGE`` (1009).
+    """
+    b1, b2 = await reader.readexactly(2)
+    if not b2 & 0x80:
+        raise WSProtocolError(1002, "WebSocket client frame not masked")
+    n = b2 & 0x7F
+    if n == 126:
+        (n,) = struct.unpack("!H", await reader.readexactly(2))
+    elif n == 127:
+        (n,) = struct.unpack("!Q", await reader.readexactly(8))
+    if n > WS_MAX_MESSAGE:
+        raise WSProtocolError(1009, f"WebSocket frame too large: {n}")
+    mask = await reader.readexactly(4)
+    data = await reader.readexactly(n)
+    if n:
+        key = (mask * (n // 4 + 1))[:n]
+        data = (int.from_bytes(data, "big") ^ int.from_bytes(key, "big")).to_bytes(n, "big")
+    return bool(b1 & 0x80), b1 & 0x0F, data
+
+
+def _is_scroll(msg: dict) -> bool:
+    return msg.get("type") == "highlight" or (
+        msg.get("type") == "key" and msg.get("key") in ("j", "k"))
+
+
+def coalesce_inputs(batch: list[dict]) -> list[tuple[Optional[dict], int, list[dict]]]:
+    """Collapse bursts of scroll input in a batch of upstream messages.
+
+    Returns ``(message, repeat, superseded)`` triples in order: run
+    ``message`` (``repeat`` times for keys) and ack ``superseded`` as
+    coalesced; ``message`` is None when a burst cancels out. Within a run
+    of consecutive scroll messages for one session, only the last
+    ``highlight`` (an absolute position) is kept, and the j/k presses
+    after it are netted into a single key repeated ``|j - k|`` times.
+    Anything else (select, enter, ...) ends a run and is never coalesced.
+    """
+    out: list[tuple[Optional[dict], int, list[dict]]] = []
+    i = 0
+    while i < len(batch):
+        msg = batch[i]
+        if not _is_scroll(msg):
+            out.append((msg, 1, []))
+            i += 1
+            continue
+        j = i
+        while (j < len(batch) and _is_scroll(batch[j])
+               and batch[j].get("session_id") == msg.get("session_id")):
+            j += 1
+        run, i = batch[i:j], j
+        last_hl = max((k for k, m in enumerate(run) if m.get("type") == "highlight"), default=-1)
+        tail = run[last_hl + 1:]
+        net = sum(1 if m.get("key") == "j" else -1 for m in tail)
+        kept: list[tuple[dict, int]] = []
+        if last_hl >= 0:
+            kept.append((run[last_hl], 1))
+        if net:
+            key = "j" if net > 0 else "k"
+            kept.append((next(m for m in reversed(tail) if m.get("key") == key), abs(net)))
+        kept_ids = {id(m) for m, _ in kept}
+        superseded = [m for m in run if id(m) not in kept_ids]
+        if not kept:
+            out.append((None, 0, superseded))
+            continue
+        out.append((kept[0][0], kept[0][1], superseded))
+        out.extend((m, n, []) for m, n in kept[1:])
+    return out
+
+
+class _BufferedAPIHandler(FrontendAPIHandler):
+    """FrontendAPIHandler run against an in-memory request.
+
+    ``request`` is the raw request bytes (head and body). The response is
+    collected in ``wfile`` instead of being written to a socket, so the
+    asyncio server can run the ordinary route code on a worker thread.
+    """
+
+    def setup(self) -> None:
+        self.rfile = io.BytesIO(self.request)
+        self.wfile = io.BytesIO()
+
+    def finish(self) -> None:
+        pass
+
+
+_SSE_HEADERS = (
+    b"HTTP/1.0 200 OK\r\n"
+    b"Content-Type: text/event-stream\r\n"
+    b"Cache-Control: no-cache\r\n"
+    b"Connection: keep-alive\r\n"
+    b"Access-Control-Allow-Origin: *\r\n"
+    b"\r\n"
+)
+
+_INTERNAL_ERROR = (
+    b"HTTP/1.0 500 Internal Server Error\r\n"
+    b"Content-Type: application/json\r\n"
+    b"Access-Control-Allow-Origin: *\r\n"
+    b"\r\n"
+    b'{"error": "internal error"}'
+)
+
+_TOO_LARGE = (
+    b"HTTP/1.0 413 Payload Too Large\r\n"
+    b"Content-Type: application/json\r\n"
+    b"Access-Control-Allow-Origin: *\r\n"
+    b"\r\n"
+    b'{"error": "body too large"}'
+)
+
+
+class FrontendAPIServer:
+    """Asyncio HTTP server for the frontend API.
+
+    SSE streams are coroutines on one event loop, so each subscriber costs
+    a socket and a small buffer rather than a thread. REST requests run
+    ``FrontendAPIHandler`` on a thread pool, so a slow callback (a key
+    press waiting on the TUI, say) only holds up its own request — never
+    the SSE streams or other REST calls.
+
+    Exposes the attributes the handler reads (``frontend``,
+    ``_highlight_callback``, ``_key_callback``) and a socketserver-style
+    ``serve_forever``/``shutdown``/``server_close``. Binds in the
+    constructor so a busy port fails in the caller's thread. With
+    ``unix_socket`` the same routes are also served on that path (skipped
+    if another live process owns it).
+    """
+
+    keepalive_interval: float = 30.0
+    header_timeout: float = 30.0
+    max_body: int = 1024 * 1024
+
+    def __init__(self, server_address: tuple[str, int], frontend: Any = None,
+                 workers: int = 8, unix_socket: Optional[str] = None) -> None:
+        self.socket = socket.create_server(server_address, backlog=128)
+        self.server_address = self.socket.getsockname()[:2]
+        self.unix_path = unix_socket
+        self.unix_socket = bind_unix_socket(unix_socket) if unix_socket else None
+        self.frontend = frontend
+        self._highlight_callback: Any = None
+        self._key_callback: Any = None
+        self._executor = ThreadPoolExecutor(max_workers=workers,
+                                            thread_name_prefix="io-mcp-api")
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stopped = threading.Event()
+
+    def serve_forever(self) -> None:
+        """Run the event loop until ``shutdown`` is called."""
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self._loop = loop
+        try:
+            servers = [loop.run_until_complete(
+                asyncio.start_server(self._handle_connection, sock=self.socket))]
+            if self.unix_socket is not None:
+                servers.append(loop.run_until_complete(
+                    asyncio.start_unix_server(self._handle_connection, sock=self.unix_socket)))
+            loop.run_forever()
+            for server in servers:
+                server.close()
+            tasks = asyncio.all_tasks(loop)
+            for task in tasks:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        finally:
+            loop.close()
+            self._stopped.set()
+
+    def shutdown(self) -> None:
+        """Stop ``serve_forever`` and wait for it to return."""
+        loop = self._loop
+        if loop is None:
             return
+        try:
+            loop.call_soon_threadsafe(loop.stop)
+        except RuntimeError:
+            pass  # loop already closed
+        self._stopped.wait(timeout=5)
+
+    def server_close(self) -> None:
+        """Release the listening sockets and worker threads."""
+        self.socket.close()
+        if self.unix_socket is not None:
+            self.unix_socket.close()
+            unlink_socket(self.unix_path)
+        self._executor.shutdown(wait=False)
+
+    async def _handle_connection(self, reader: asyncio.StreamReader,
+                                 writer: asyncio.StreamWriter) -> None:
+        """Read one request, route it, close (HTTP/1.0, like the handler)."""
+        try:
+            head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"),
+                                          timeout=self.header_timeout)
+            method, _, rest = head.partition(b" ")
+            target = rest.split(b" ", 1)[0].decode("latin-1")
+            headers: dict[str, str] = {}
+            for line in head.split(b"\r\n")[1:]:
+                name, _, value = line.partition(b":")
+                headers[name.strip().lower().decode("latin-1")] = value.strip().decode("latin-1")
+            try:
+                length = max(0, int(headers.get("content-length", 0)))
+            except ValueError:
+                length = 0
+            if length > self.max_body:
+                writer.write(_TOO_LARGE)
+                await writer.drain()
+                return
+            body = await reader.readexactly(length) if length else b""
+
+            parsed = urllib.parse.urlparse(target)
+            if method == b"GET" and parsed.path in ("/api/events", "/api/ws"):
+                last_event_id = parse_last_event_id(headers.get("last-event-id"), parsed.query)
+                policy = parse_overflow_policy(parsed.query)
+                audio = parse_audio_flag(parsed.query)
+                if parsed.path == "/api/events":
+                    await self._stream_events(reader, writer, last_event_id, policy, audio)
+                elif (headers.get("upgrade", "").lower() == "websocket"
+                      and headers.get("sec-websocket-key")):
+                    await self._websocket(reader, writer, headers["sec-websocket-key"],
+                                          last_event_id, policy, audio)
+                else:
+                    writer.write(b"HTTP/1.1 426 Upgrade Required\r\n"
+                                 b"Upgrade: websocket\r\nConnection: close\r\n\r\n")
+                    await writer.drain()
+                return
 
+            peer = writer.get_extra_info("peername") or ("", 0)
+            response = await asyncio.get_running_loop().run_in_executor(
+                self._executor, self._respond, head + body, peer)
+            writer.write(response)
+            await writer.drain()
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError,
+                TimeoutError, ConnectionError, OSError):
+            pass
+        finally:
+            writer.close()
+
+    def _respond(self, raw: bytes, peer: tuple) -> bytes:
+        """Run the route handler for one buffered request (worker thread)."""
         try:
-            key_fn(session_id, key)
-            self._send_json({"status": "ok", "key": key})
+            return _BufferedAPIHandler(raw, peer, self).wfile.getvalue()
+        except Exception:
+            log.exception("Frontend API handler failed")
+            return _INTERNAL_ERROR
+
+    async def _stream_events(self, reader: asyncio.StreamReader,
+                             writer: asyncio.StreamWriter,
+                             last_event_id: Optional[int] = None,
+                             policy: Optional[str] = None,
+                             audio: bool = False) -> None:
+        """SSE stream: events as they are published, keepalives when idle.
+
+        A reconnecting client's ``last_event_id`` first replays what it
+        missed. ``audio`` marks a client that plays speech clips itself.
+        Also watches the read side so a client that hangs up is dropped
+        straight away rather than at the next keepalive.
+        """
+        peer = writer.get_extra_info("peername")
+        sub = event_bus.subscribe_async(last_event_id=last_event_id, policy=policy,
+                                        name=peer[0] if peer else "")
+        sub.transport = writer.transport
+        sub.audio = audio
+        hangup = asyncio.ensure_future(reader.read(1))
+        pending: Optional[asyncio.Future] = None
+        try:
+            writer.write(_SSE_HEADERS + b"event: connected\ndata: {}\n\n")
+            await writer.drain()
+            while True:
+                if pending is None:
+                    pending = asyncio.ensure_future(sub.get())
+                done, _ = await asyncio.wait(
+                    {pending, hangup}, timeout=self.keepalive_interval,
+                    return_when=asyncio.FIRST_COMPLETED)
+                if hangup in done:
+                    if not hangup.result():
+                        break  # EOF: client went away
+                    hangup = asyncio.ensure_future(reader.read(1))  # stray byte
+                if pending in done:
+                    event = pending.result()
+                    pending = None
+                    if event is None:
+                        break  # disconnected by the overflow policy
+                    writer.write(event.encoded())
+                else:
+                    writer.write(b": keepalive\n\n")
+                await writer.drain()
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            event_bus.unsubscribe(sub)  # type: ignore[arg-type]
+            hangup.cancel()
+            if pending is not None:
+                pending.cancel()
+
+
+    # ── WebSocket channel ─────────────────────────────────────────
+
+    async def _websocket(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                         ws_key: str, last_event_id: Optional[int] = None,
+                         policy: Optional[str] = None, audio: bool = False) -> None:
+        """Persistent two-way channel: user input up, events down.
+
+        Upstream text messages are JSON ``{"id", "type", "session_id", ...}``
+        with ``type`` one of ``key``/``highlight``/``select`` and the same
+        fields as the REST bodies. Each is answered with
+        ``{"type": "ack", "id", "status", "result"}``; scroll input that
+        piles up while the TUI is busy is coalesced (``coalesce_inputs``)
+        and the superseded messages are acked with ``"coalesced": true``.
+        Downstream, every bus event arrives as ``{"type": "event",
+        "event": {...}}`` — the same payload as the SSE ``data:`` line.
+        """
+        writer.write(b"HTTP/1.1 101 Switching Protocols\r\n"
+                     b"Upgrade: websocket\r\nConnection: Upgrade\r\n"
+                     b"Sec-WebSocket-Accept: " + ws_accept(ws_key).encode() + b"\r\n\r\n"
+                     + ws_frame(b'{"type": "connected"}'))
+        await writer.drain()
+        peer = writer.get_extra_info("peername")
+        sub = event_bus.subscribe_async(last_event_id=last_event_id, policy=policy,
+                                        name=peer[0] if peer else "")
+        sub.transport = writer.transport
+        sub.audio = audio
+        inputs: asyncio.Queue = asyncio.Queue()
+        tasks = [asyncio.ensure_future(self._ws_send_events(sub, writer)),
+                 asyncio.ensure_future(self._ws_apply_inputs(inputs, writer))]
+        message = bytearray()
+        try:
+            while True:
+                fin, opcode, data = await ws_read_frame(reader)
+                if opcode == 0x8:  # close: echo the status code back
+                    writer.write(ws_frame(data[:2], 0x8))
+                    await writer.drain()
+                    break
+                if opcode == 0x9:  # ping
+                    writer.write(ws_frame(data, 0xA))
+                    continue
+                if opcode == 0xA:  # pong
+                    continue
+                message += data
+                if not fin:
+                    continue
+                try:
+                    msg = json.loads(bytes(message))
+                except ValueError:
+                    msg = None
+                message.clear()
+                if not isinstance(msg, dict):
+                    self._ws_send(writer, {"type": "ack", "id": None, "status": 400,
+                                           "result": {"error": "expected a JSON object"}})
+                    continue
+                inputs.put_nowait(msg)
+        except WSProtocolError as e:
+            log.warning(f"WebSocket closed: {e}")
+            try:
+                writer.write(ws_frame(struct.pack("!H", e.code), 0x8))
+                await writer.drain()
+            except (ConnectionError, OSError):
+                pass
+        except (asyncio.IncompleteReadError, ConnectionError, OSError):
+            pass
+        finally:
+            for task in tasks:
+                task.cancel()
+            event_bus.unsubscribe(sub)  # type: ignore[arg-type]
+
+    @staticmethod
+    def _ws_send(writer: asyncio.StreamWriter, message: dict) -> None:
+        writer.write(ws_frame(json.dumps(message).encode()))
+
+    async def _ws_send_events(self, sub: AsyncSubscriber, writer: asyncio.StreamWriter) -> None:
+        """Forward bus events to the socket; ping when idle."""
+        try:
+            while True:
+                try:
+                    event = await asyncio.wait_for(sub.get(), self.keepalive_interval)
+                except TimeoutError:
+                    writer.write(ws_frame(b"", 0x9))
+                else:
+                    if event is None:
+                        # Disconnected by the overflow policy (1008: policy violation)
+                        writer.write(ws_frame(struct.pack("!H", 1008), 0x8))
+                        await writer.drain()
+                        writer.close()
+                        return
+                    writer.write(event.ws_frame())
+                await writer.drain()
+        except (ConnectionError, OSError):
+            writer.close()
+
+    async def _ws_apply_inputs(self, inputs: asyncio.Queue, writer: asyncio.StreamWriter) -> None:
+        """Apply upstream input in order, one batch per round trip to the TUI.
+
+        Whatever arrived while the previous batch ran is taken as the next
+        batch, so a fast scroll costs one TUI call per batch rather than
+        one per tick.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await inputs.get()]
+            while not inputs.empty():
+                batch.append(inputs.get_nowait())
+            for msg, repeat, superseded in coalesce_inputs(batch):
+                for old in superseded:
+                    self._ws_send(writer, {"type": "ack", "id": old.get("id"),
+                                           "status": 200, "coalesced": True})
+                if msg is None:
+                    continue
+                result, status = await loop.run_in_executor(
+                    self._executor, self._apply_input, msg, repeat)
+                self._ws_send(writer, {"type": "ack", "id": msg.get("id"),
+                                       "status": status, "result": result})
+
+    def _apply_input(self, msg: dict, repeat: int = 1) -> tuple[dict, int]:
+        """Run one upstream message through the REST action code (worker thread)."""
+        kind = msg.get("type")
+        session_id = str(msg.get("session_id", ""))
+        try:
+            if kind == "key":
+                return apply_key(self, session_id, msg, repeat)
+            if kind == "highlight":
+                return apply_highlight(self, session_id, msg)
+            if kind == "select":
+                return apply_select(self, session_id, msg)
         except Exception as e:
-            self._send_json({"error": str(e)}, 500)
+            return {"error": str(e)}, 500
+        return {"error": f"unknown message type: {kind}"}, 400
 
 
 def start_api_server(frontend: Any, port: int = 8445, host: str = "0.0.0.0",
                      highlight_callback: Any = None,
-                     key_callback: Any = None) -> threading.Thread:
-    """Start the frontend API HTTP server in a background thread."""
-    server = http.server.HTTPServer((host, port), FrontendAPIHandler)
-    server.frontend = frontend  # type: ignore
+                     key_callback: Any = None,
+                     unix_socket: Optional[str] = None) -> threading.Thread:
+    """Start the frontend API server (asyncio) in a background thread."""
+    server = FrontendAPIServer((host, port), frontend, unix_socket=unix_socket)
     if highlight_callback:
-        server._highlight_callback = highlight_callback  # type: ignore
+        server._highlight_callback = highlight_callback
     if key_callback:
-        server._key_callback = key_callback  # type: ignore
-    thread = threading.Thread(target=server.serve_forever, daemon=True)
+        server._key_callback = key_callback
+    thread = threading.Thread(target=server.serve_forever, daemon=True,
+                              name="io-mcp-api")
     thread.start()
     print(f"  Frontend API: http://{host}:{port}/api/events (SSE)", flush=True)
     return thread
@@ -0,0 +1,203 @@
+"""On-disk archive for session history that overflows the in-memory caps.
+
+Sessions keep only the most recent speech, selections, resolved inbox
+items and activity in memory (see the ``_*_max`` caps on Session). When
+an entry is trimmed it is spilled here instead of being dropped, so
+history views can page back arbitrarily far while memory stays bounded.
+
+Layout under ``ARCHIVE_DIR/<session_id>.<instance>/`` (directories are
+created 0700 under a per-uid root), one set of files per stream
+("speech", "history", "done", "activity"):
+
+    speech.00000.jsonl   one JSON record per line
+    speech.00000.idx     little-endian uint64 byte offset of each line
+
+Segments roll over every ``segment_records`` records. Only the record
+count of each segment is held in memory; reads seek through the index,
+so fetching a page costs O(page) regardless of how much is archived.
+Every session gets a directory of its own (a reused session id starts a
+fresh one), and it is kept after the session is removed so its history
+can still be inspected. ``prune_archives`` deletes directories nobody has
+written to for ``ARCHIVE_RETENTION_SECS``; SessionManager runs it at most
+every ``ARCHIVE_PRUNE_INTERVAL``. Best effort throughout — disk errors are
+logged and never raised to callers (losing archived history must not
+break a tool call).
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import shutil
+import struct
+import tempfile
+import threading
+import time
+from typing import Iterable, Optional
+
+log = logging.getLogger("io-mcp.archive")
+
+# Per-user: archived speech and selections are private to whoever ran them
+ARCHIVE_DIR = os.path.join(tempfile.gettempdir(), f"io-mcp-archive-{os.getuid()}")
+ARCHIVE_RETENTION_SECS = 24 * 3600
+ARCHIVE_PRUNE_INTERVAL = 3600.0
+
+_OFFSET = struct.Struct("<Q")
+_SEGMENT_RE = re.compile(r"^(?P<stream>[a-z_]+)\.(?P<seg>\d{5})\.idx$")
+
+
+class SessionArchive:
+    """Append-only, segmented per-session history archive.
+
+    Records are plain dicts (JSON-serialisable). Record positions are
+    global per stream: 0 is the oldest record ever archived.
+    """
+
+    def __init__(self, path: str, segment_records: int = 1000) -> None:
+        self.path = path
+        self.segment_records = segment_records
+        # stream -> record count of each segment, in segment order
+        self._segments: dict[str, list[int]] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    @classmethod
+    def for_session(cls, session_id: str, root: Optional[str] = None,
+                    instance: str = "") -> "SessionArchive":
+        """Open (or create) the archive for a session id.
+
+        ``instance`` tells apart sessions that reuse an id.
+        """
+        safe = re.sub(r"[^A-Za-z0-9_.-]", "_", session_id) or "_"
+        if instance:
+            safe = f"{safe}.{instance}"
+        return cls(os.path.join(root or ARCHIVE_DIR, safe))
+
+    def _load(self) -> None:
+        """Recover segment counts from index files already on disk.
+
+        Session archives are always opened fresh (``for_session`` is given a
+        new instance), so this only finds data when a path is reopened
+        directly.
+        """
+        try:
+            names = sorted(os.listdir(self.path))
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            log.warning(f"Archive unreadable: {self.path}: {e}")
+            return
+        for name in names:
+            m = _SEGMENT_RE.match(name)
+            if not m:
+                continue
+            size = os.path.getsize(os.path.join(self.path, name))
+            self._segments.setdefault(m.group("stream"), []).append(size // _OFFSET.size)
+
+    def _files(self, stream: str, seg: int) -> tuple[str, str]:
+        base = os.path.join(self.path, f"{stream}.{seg:05d}")
+        return base + ".jsonl", base + ".idx"
+
+    def count(self, stream: str) -> int:
+        """Number of records archived in a stream."""
+        with self._lock:
+            return sum(self._segments.get(stream, ()))
+
+    def extend(self, stream: str, records: list[dict]) -> None:
+        """Append records (oldest first) to a stream."""
+        if not records:
+            return
+        with self._lock:
+            try:
+                # makedirs only applies mode to the leaf, so make the root first
+                os.makedirs(os.path.dirname(self.path), mode=0o700, exist_ok=True)
+                os.makedirs(self.path, mode=0o700, exist_ok=True)
+                segments = self._segments.setdefault(stream, [])
+                # Serialise up front so a bad record can't leave a half-written batch
+                pending = [json.dumps(r, separators=(",", ":"), default=str).encode() + b"\n"
+                           for r in records]
+                while pending:
+                    if not segments or segments[-1] >= self.segment_records:
+                        segments.append(0)
+                    seg = len(segments) - 1
+                    room = self.segment_records - segments[-1]
+                    batch, pending = pending[:room], pending[room:]
+                    data_path, idx_path = self._files(stream, seg)
+                    with open(data_path, "ab") as data, open(idx_path, "ab") as idx:
+                        offset = data.tell()
+                        for line in batch:
+                            idx.write(_OFFSET.pack(offset))
+                            data.write(line)
+                            offset += len(line)
+                    segments[-1] += len(batch)
+            except Exception as e:
+                log.warning(f"Archive write failed: {self.path}/{stream}: {e}")
+
+    def read(self, stream: str, start: int, stop: int) -> list[dict]:
+        """Records ``start`` (inclusive) to ``stop`` (exclusive), oldest first."""
+        out: list[dict] = []
+        with self._lock:
+            segments = list(self._segments.get(stream, ()))
+        base = 0
+        for seg, n in enumerate(segments):
+            lo, hi = max(start, base), min(stop, base + n)
+            if lo < hi:
+                out.extend(self._read_segment(stream, seg, lo - base, hi - base))
+            base += n
+            if base >= stop:
+                break
+        return out
+
+    def _read_segment(self, stream: str, seg: int, lo: int, hi: int) -> list[dict]:
+        data_path, idx_path = self._files(stream, seg)
+        try:
+            with open(idx_path, "rb") as idx:
+                idx.seek(lo * _OFFSET.size)
+                (offset,) = _OFFSET.unpack(idx.read(_OFFSET.size))
+            records = []
+            with open(data_path, "rb") as data:
+                data.seek(offset)
+                for _ in range(hi - lo):
+                    line = data.readline()
+                    if not line:
+                        break
+                    records.append(json.loads(line))
+            return records
+        except Exception as e:
+            log.warning(f"Archive read failed: {data_path}: {e}")
+            return []
+
+
+def prune_archives(root: Optional[str] = None, max_age: float = ARCHIVE_RETENTION_SECS,
+                   keep: Iterable[str] = ()) -> int:
+    """Delete session archives not written to for ``max_age`` seconds.
+
+    ``keep`` holds directory names to leave alone regardless (the archives
+    of live sessions). Returns how many archives were deleted.
+    """
+    root = root or ARCHIVE_DIR
+    keep = set(keep)
+    cutoff = time.time() - max_age
+    removed = 0
+    try:
+        entries = list(os.scandir(root))
+    except FileNotFoundError:
+        return 0
+    except OSError as e:
+        log.warning(f"Archive root unreadable: {root}: {e}")
+        return 0
+    for entry in entries:
+        if entry.name in keep or not entry.is_dir(follow_symlinks=False):
+            continue
+        try:
+            # Appends touch the files, not the directory
+            newest = max((f.stat().st_mtime for f in os.scandir(entry.path)),
+                         default=entry.stat().st_mtime)
+        except OSError:
+            continue
+        if newest < cutoff:
+            shutil.rmtree(entry.path, ignore_errors=True)
+            removed += 1
+    return removed
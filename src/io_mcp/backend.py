@@ -10,151 +10,311 @@ Also exposes simple REST endpoints for non-MCP callers:
   POST /choices        {"preamble": "...", "choices": [...], "session_id": "..."}
   POST /message        {"text": "...", "session_id": "..."}
   POST /inbox          {"session_id": "..."}
+  POST /sessions       {"session_id": "...", "since": N}  (read-only listing)
   GET  /health
 
 These thin wrappers auto-create sessions on first use — no registration needed.
+
+The server is a single asyncio event loop. Blocking tools (present_choices,
+speak) are awaited as futures through the dispatcher's ``dispatch_async``,
+so an agent waiting on the user costs a pending coroutine rather than a
+parked thread. Calls from the proxy carry an idempotency key; a retried
+call attaches to the original or gets its cached result
+(``idempotency.CallLedger``). Besides TCP, the same routes can be served
+on a Unix socket (``transport.BACKEND_SOCKET``) for co-located callers.
 """
 
 from __future__ import annotations
 
+import asyncio
+import contextvars
 import json
 import logging
+import socket
 import threading
-from http.server import HTTPServer, BaseHTTPRequestHandler
-from socketserver import ThreadingMixIn
-from typing import Any, Callable, Optional
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from typing import Awaitable, Callable, Optional
+
+from .idempotency import CallLedger, current_call_key
+from .transport import bind_unix_socket, unlink_socket
 
 log = logging.getLogger("io-mcp.backend")
 
+# Maps clean URL paths to MCP tool names + arg reshaping.
+# session_id defaults to "http-caller" if not provided.
+# Sessions are auto-created on first use — no registration needed.
+_SIMPLE_ENDPOINTS = {
+    "/speak":       ("speak",           lambda b: {"text": b.get("text", "")}),
+    "/speak-async": ("speak_async",     lambda b: {"text": b.get("text", "")}),
+    "/choices":     ("present_choices",  lambda b: {"preamble": b.get("preamble", ""), "choices": b.get("choices", [])}),
+    "/inbox":       ("check_inbox",      lambda b: {}),
+}
+
+_TEXT = "text/plain; charset=utf-8"
+_JSON = "application/json"
+
+
+def _json(status: int, data: dict) -> tuple[int, str, bytes]:
+    return status, _JSON, json.dumps(data).encode()
 
-class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
-    """HTTPServer that handles each request in a new thread.
 
-    Essential for io-mcp because present_choices blocks until the user
-    makes a selection. Without threading, all other tool calls from all
-    agents would be queued behind the blocking call.
+class BackendServer:
+    """Asyncio HTTP/1.1 server for the backend endpoints.
+
+    Connections are keep-alive coroutines on one event loop. Tool calls go
+    through ``async_dispatch`` when given: coroutine tools are awaited on
+    the loop and the rest hop onto the worker pool, which is installed as
+    the loop's default executor so the dispatcher's own offloads share
+    its bound. Calls that hold a thread for their whole run (the sync
+    ``tool_dispatch`` fallback, /sessions, /cancel-mcp) use a separate,
+    smaller ``blocking_executor`` -- by default the dispatcher's own -- so
+    a burst of them can't starve those offloads.
+
+    Binds in the constructor so a busy port fails in the caller's thread,
+    and offers a socketserver-style ``serve_forever``/``shutdown``/
+    ``server_close`` like ``api.FrontendAPIServer``.
     """
-    daemon_threads = True
 
+    # Idle keep-alive connections outlive the proxy pool's own idle timeout,
+    # so the proxy, not the backend, decides when to drop them.
+    keepalive_timeout: float = 120.0
+    max_body: int = 16 * 1024 * 1024
 
-class BackendHandler(BaseHTTPRequestHandler):
-    """HTTP handler for /handle-mcp endpoint."""
+    def __init__(self, server_address: tuple[str, int],
+                 tool_dispatch: Callable[[str, dict, str], str],
+                 cancel_dispatch: Optional[Callable[[str, str], None]] = None,
+                 report_activity: Optional[Callable[[str, str, str, str], None]] = None,
+                 async_dispatch: Optional[Callable[[str, dict, str], Awaitable[str]]] = None,
+                 list_sessions: Optional[Callable[[str, Optional[int]], dict]] = None,
+                 workers: int = 64, unix_socket: Optional[str] = None,
+                 blocking_executor: Optional[ThreadPoolExecutor] = None,
+                 blocking_workers: int = 16) -> None:
+        self.socket = socket.create_server(server_address, backlog=128)
+        self.server_address = self.socket.getsockname()[:2]
+        self.unix_path = unix_socket
+        self.unix_socket = bind_unix_socket(unix_socket) if unix_socket else None
+        self.tool_dispatch = tool_dispatch
+        self.cancel_dispatch = cancel_dispatch
+        self.report_activity = report_activity
+        self.async_dispatch = async_dispatch
+        self.list_sessions = list_sessions
+        self.ledger = CallLedger()
+        self._executor = ThreadPoolExecutor(max_workers=workers,
+                                            thread_name_prefix="io-mcp-backend")
+        self._owns_blocking = blocking_executor is None
+        self._blocking = blocking_executor or ThreadPoolExecutor(
+            max_workers=blocking_workers, thread_name_prefix="io-mcp-backend-blocking")
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stopped = threading.Event()
 
-    # Set by start_backend_server
-    tool_dispatch: Callable[[str, dict, str], str] = None  # type: ignore
+    def serve_forever(self) -> None:
+        """Run the event loop until ``shutdown`` is called."""
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        loop.set_default_executor(self._executor)
+        self._loop = loop
+        # Sync callers of the dispatcher submit coroutine tools to this loop
+        attach_loop = getattr(self.tool_dispatch, "attach_loop", None)
+        if attach_loop is not None:
+            attach_loop(loop)
+        try:
+            servers = [loop.run_until_complete(
+                asyncio.start_server(self._handle_connection, sock=self.socket))]
+            if self.unix_socket is not None:
+                servers.append(loop.run_until_complete(
+                    asyncio.start_unix_server(self._handle_connection, sock=self.unix_socket)))
+            loop.run_forever()
+            for server in servers:
+                server.close()
+            tasks = asyncio.all_tasks(loop)
+            for task in tasks:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        finally:
+            loop.close()
+            self._stopped.set()
 
-    def do_GET(self) -> None:
-        if self.path == "/health":
-            self._json_response(200, {"status": "ok"})
-        else:
-            self._json_response(404, {"error": "not found"})
+    def shutdown(self) -> None:
+        """Stop ``serve_forever`` and wait for it to return."""
+        loop = self._loop
+        if loop is None:
+            return
+        try:
+            loop.call_soon_threadsafe(loop.stop)
+        except RuntimeError:
+            pass  # loop already closed
+        self._stopped.wait(timeout=5)
 
-    # ─── Simple REST endpoint mapping ─────────────────────────────
-    # Maps clean URL paths to MCP tool names + arg reshaping.
-    # session_id defaults to "http-caller" if not provided.
-    # Sessions are auto-created on first use — no registration needed.
-    _SIMPLE_ENDPOINTS = {
-        "/speak":       ("speak",           lambda b: {"text": b.get("text", "")}),
-        "/speak-async": ("speak_async",     lambda b: {"text": b.get("text", "")}),
-        "/choices":     ("present_choices",  lambda b: {"preamble": b.get("preamble", ""), "choices": b.get("choices", [])}),
-        "/inbox":       ("check_inbox",      lambda b: {}),
-    }
+    def server_close(self) -> None:
+        """Release the listening sockets and worker threads."""
+        self.socket.close()
+        if self.unix_socket is not None:
+            self.unix_socket.close()
+            unlink_socket(self.unix_path)
+        self._executor.shutdown(wait=False)
+        if self._owns_blocking:
+            self._blocking.shutdown(wait=False)
+
+    async def _handle_connection(self, reader: asyncio.StreamReader,
+                                 writer: asyncio.StreamWriter) -> None:
+        """Serve requests on one connection until either side closes it."""
+        try:
+            while True:
+                head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"),
+                                              timeout=self.keepalive_timeout)
+                request_line, *lines = head[:-4].split(b"\r\n")
+                parts = request_line.decode("latin-1").split()
+                if len(parts) != 3:
+                    await self._write(writer, *_json(400, {"error": "bad request line"}), close=True)
+                    return
+                method, target, version = parts
+                headers: dict[str, str] = {}
+                for line in lines:
+                    name, _, value = line.partition(b":")
+                    headers[name.strip().lower().decode("latin-1")] = value.strip().decode("latin-1")
+                try:
+                    length = max(0, int(headers.get("content-length", 0)))
+                except ValueError:
+                    length = 0
+                if length > self.max_body:
+                    await self._write(writer, *_json(413, {"error": "body too large"}), close=True)
+                    return
+                body = await reader.readexactly(length) if length else b""
+
+                connection = headers.get("connection", "").lower()
+                close = connection == "close" or (version == "HTTP/1.0" and connection != "keep-alive")
+                status, content_type, payload = await self._route(method, target, body)
+                await self._write(writer, status, content_type, payload, close=close)
+                if close:
+                    return
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError,
+                TimeoutError, ConnectionError, OSError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _write(writer: asyncio.StreamWriter, status: int, content_type: str,
+                     payload: bytes, close: bool = False) -> None:
+        try:
+            reason = HTTPStatus(status).phrase
+        except ValueError:
+            reason = ""
+        head = (f"HTTP/1.1 {status} {reason}\r\n"
+                f"Content-Type: {content_type}\r\n"
+                f"Content-Length: {len(payload)}\r\n")
+        if close:
+            head += "Connection: close\r\n"
+        writer.write(head.encode("latin-1") + b"\r\n" + payload)
+        await writer.drain()
+
+    async def _dispatch(self, tool: str, args: dict, session_id: str) -> str:
+        if self.async_dispatch is not None:
+            return await self.async_dispatch(tool, args, session_id)
+        return await self._run_blocking(self.tool_dispatch, tool, args, session_id)
+
+    async def _run_blocking(self, fn: Callable, *args):
+        """Run ``fn`` on the blocking pool, carrying context (current_call_key) along."""
+        ctx = contextvars.copy_context()
+        return await asyncio.get_running_loop().run_in_executor(
+            self._blocking, ctx.run, fn, *args)
+
+    async def _dispatch_keyed(self, key: str, tool: str, args: dict, session_id: str) -> str:
+        """Dispatch once per idempotency key; retries share the first call's result."""
+        async def call() -> str:
+            token = current_call_key.set(key)
+            try:
+                return await self._dispatch(tool, args, session_id)
+            finally:
+                current_call_key.reset(token)
+        return await self.ledger.run(key, call)
+
+    async def _route(self, method: str, target: str, body: bytes) -> tuple[int, str, bytes]:
+        path = target.split("?", 1)[0]
+        if method == "GET":
+            if path == "/health":
+                return _json(200, {"status": "ok", "idempotency": self.ledger.stats()})
+            return _json(404, {"error": "not found"})
+        if method != "POST":
+            return _json(501, {"error": f"unsupported method {method}"})
 
-    def do_POST(self) -> None:
         # Parse body once for all endpoints
         try:
-            content_length = int(self.headers.get("Content-Length", 0))
-            body = self.rfile.read(content_length)
             request = json.loads(body) if body else {}
         except (json.JSONDecodeError, ValueError) as e:
-            self._json_response(400, {"error": f"Invalid JSON: {e}"})
-            return
+            return _json(400, {"error": f"Invalid JSON: {e}"})
+        if not isinstance(request, dict):
+            return _json(400, {"error": "JSON body must be an object"})
 
         # ── Simple REST endpoints (/speak, /choices, etc.) ────────
-        if self.path in self._SIMPLE_ENDPOINTS:
-            tool_name, arg_fn = self._SIMPLE_ENDPOINTS[self.path]
+        if path in _SIMPLE_ENDPOINTS:
+            tool_name, arg_fn = _SIMPLE_ENDPOINTS[path]
             session_id = request.get("session_id", "http-caller")
-            args = arg_fn(request)
             try:
-                result = self.tool_dispatch(tool_name, args, session_id)
-                self.send_response(200)
-                self.send_header("Content-Type", "text/plain; charset=utf-8")
-                response = result.encode("utf-8")
-                self.send_header("Content-Length", str(len(response)))
-                self.end_headers()
-                self.wfile.write(response)
+                result = await self._dispatch(tool_name, arg_fn(request), session_id)
+                return 200, _TEXT, result.encode("utf-8")
             except Exception as e:
-                log.error(f"Simple endpoint error: {self.path}: {e}")
-                self._json_response(500, {"error": str(e)[:200]})
-            return
+                log.error(f"Simple endpoint error: {path}: {e}")
+                return _json(500, {"error": str(e)[:200]})
 
-        # ── MCP proxy endpoint (/handle-mcp) ──────────────────────
-        if self.path == "/cancel-mcp":
+        if path == "/cancel-mcp":
             # Cancel a pending tool call (e.g. present_choices aborted by client)
             tool = request.get("tool", "")
             session_id = request.get("session_id", "")
             try:
-                cancel_fn = getattr(self, 'cancel_dispatch', None)
-                if cancel_fn:
-                    cancel_fn(tool, session_id)
-                self._json_response(200, {"status": "cancelled"})
+                if self.cancel_dispatch:
+                    await self._run_blocking(self.cancel_dispatch, tool, session_id)
+                return _json(200, {"status": "cancelled"})
             except Exception as e:
                 log.error(f"Cancel dispatch error: {tool}: {e}")
-                self._json_response(500, {"error": str(e)[:200]})
-            return
+                return _json(500, {"error": str(e)[:200]})
 
-        if self.path == "/report-activity":
+        if path == "/report-activity":
             # Lightweight activity report from hooks (fire-and-forget).
-            # No full MCP dispatch — just log directly to the session.
-            session_id = request.get("session_id", "")
-            tool = request.get("tool", "")
-            detail = request.get("detail", "")
-            kind = request.get("kind", "tool")
+            # No full MCP dispatch — just log directly to the session, off
+            # the loop since trimming the log may spill to the archive.
+            try:
+                if self.report_activity:
+                    await self._run_blocking(
+                        self.report_activity, request.get("session_id", ""),
+                        request.get("tool", ""), request.get("detail", ""),
+                        request.get("kind", "tool"))
+                return _json(200, {"status": "logged"})
+            except Exception:
+                return _json(200, {"status": "ok"})  # Don't fail hooks
+
+        if path == "/sessions":
+            # Session listing for a sharded proxy's aggregated get_sessions.
+            # Unlike the tool, it never creates a session for the caller.
+            if not self.list_sessions:
+                return _json(404, {"error": "not found"})
+            since = request.get("since")
             try:
-                activity_fn = getattr(self, 'report_activity', None)
-                if activity_fn:
-                    activity_fn(session_id, tool, detail, kind)
-                self._json_response(200, {"status": "logged"})
+                listing = await self._run_blocking(
+                    self.list_sessions, request.get("session_id", ""),
+                    None if since is None else int(since))
+                return _json(200, listing)
             except Exception as e:
-                self._json_response(200, {"status": "ok"})  # Don't fail hooks
-            return
+                log.error(f"Session listing error: {e}")
+                return _json(500, {"error": str(e)[:200]})
 
-        if self.path != "/handle-mcp":
-            self._json_response(404, {"error": "not found"})
-            return
+        # ── MCP proxy endpoint (/handle-mcp) ──────────────────────
+        if path != "/handle-mcp":
+            return _json(404, {"error": "not found"})
 
         tool = request.get("tool", "")
-        args = request.get("args", {})
-        session_id = request.get("session_id", "")
-
         if not tool:
-            self._json_response(400, {"error": "Missing 'tool' field"})
-            return
-
+            return _json(400, {"error": "Missing 'tool' field"})
         try:
-            result = self.tool_dispatch(tool, args, session_id)
+            result = await self._dispatch_keyed(str(request.get("idempotency_key") or ""),
+                                                tool, request.get("args", {}),
+                                                request.get("session_id", ""))
             # Return raw string result (the proxy sends it directly to the agent)
-            self.send_response(200)
-            self.send_header("Content-Type", "text/plain; charset=utf-8")
-            response = result.encode("utf-8")
-            self.send_header("Content-Length", str(len(response)))
-            self.end_headers()
-            self.wfile.write(response)
+            return 200, _TEXT, result.encode("utf-8")
         except Exception as e:
             log.error(f"Tool dispatch error: {tool}: {e}")
-            self._json_response(500, {"error": str(e)[:200]})
-
-    def _json_response(self, status: int, data: dict) -> None:
-        self.send_response(status)
-        self.send_header("Content-Type", "application/json")
-        body = json.dumps(data).encode()
-        self.send_header("Content-Length", str(len(body)))
-        self.end_headers()
-        self.wfile.write(body)
-
-    def log_message(self, format, *args):
-        """Suppress default HTTP logging (noisy, overwrites TUI)."""
-        pass
+            return _json(500, {"error": str(e)[:200]})
 
 
 def start_backend_server(
@@ -163,8 +323,11 @@ def start_backend_server(
     port: int = 8446,
     cancel_dispatch: Callable[[str, str], None] | None = None,
     report_activity: Callable[[str, str, str, str], None] | None = None,
-) -> None:
-    """Start the backend HTTP server in a daemon thread.
+    unix_socket: str | None = None,
+    async_dispatch: Callable[[str, dict, str], Awaitable[str]] | None = None,
+    list_sessions: Callable[[str, int | None], dict] | None = None,
+) -> BackendServer:
+    """Start the backend HTTP server (asyncio) in a daemon thread.
 
     Args:
         tool_dispatch: Function(tool_name, args, session_id) -> str
@@ -172,20 +335,26 @@ def start_backend_server(
         port: Port number
         cancel_dispatch: Function(tool_name, session_id) -> None for MCP cancellation
         report_activity: Function(session_id, tool, detail, kind) -> None for hook activity
+        unix_socket: Also serve on this Unix socket path (skipped if another
+            live process owns it)
+        async_dispatch: Coroutine form of ``tool_dispatch``; defaults to its
+            ``dispatch_async`` attribute when present
+        list_sessions: Function(session_id, since) -> dict for /sessions;
+            defaults to ``tool_dispatch.list_sessions`` when present
+
+    Returns:
+        The running server (``shutdown``/``server_close`` stop it).
     """
-    # Bind dispatch function to handler class
-    attrs = {"tool_dispatch": staticmethod(tool_dispatch)}
-    if cancel_dispatch:
-        attrs["cancel_dispatch"] = staticmethod(cancel_dispatch)
-    if report_activity:
-        attrs["report_activity"] = staticmethod(report_activity)
-    handler_class = type(
-        "BoundBackendHandler",
-        (BackendHandler,),
-        attrs,
-    )
-
-    server = ThreadingHTTPServer((host, port), handler_class)
-    thread = threading.Thread(target=server.serve_forever, daemon=True)
-    thread.start()
+    if async_dispatch is None:
+        async_dispatch = getattr(tool_dispatch, "dispatch_async", None)
+    if list_sessions is None:
+        list_sessions = getattr(tool_dispatch, "list_sessions", None)
+    server = BackendServer((host, port), tool_dispatch, cancel_dispatch=cancel_dispatch,
+                           report_activity=report_activity, async_dispatch=async_dispatch,
+                           list_sessions=list_sessions, unix_socket=unix_socket,
+                           blocking_executor=getattr(tool_dispatch, "blocking_executor", None))
+    threading.Thread(target=server.serve_forever, daemon=True, name="io-mcp-backend").start()
     log.info(f"Backend server started on {host}:{port}")
+    if server.unix_socket is not None:
+        log.info(f"Backend server listening on {unix_socket}")
+    return server
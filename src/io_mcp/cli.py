@@ -7,7 +7,8 @@ Usage:
     io-mcp-msg --list                                # list active sessions
     io-mcp-msg --host 192.168.1.5 "remote message"  # send to remote io-mcp
 
-Works by hitting the Frontend API (port 8445 by default). The message
+Works by hitting the Frontend API (port 8445 by default), over its local
+Unix socket when one is live and the host is this machine. The message
 will be picked up by the agent on its next MCP tool call via the
 pending_messages queue.
 """
@@ -20,9 +21,38 @@ import sys
 import urllib.request
 import urllib.error
 
+from .transport import UNIX_PREFIX, api_socket, local_base, unix_request
+
+
+def _print_http_error(code: int, body_text: str) -> None:
+    try:
+        err = json.loads(body_text)
+        print(f"Error: {err.get('error', body_text)}", file=sys.stderr)
+    except json.JSONDecodeError:
+        print(f"Error: {code} {body_text}", file=sys.stderr)
+
+
+def _unix_call(base: str, method: str, path: str, data: bytes | None, timeout: int) -> dict:
+    """Request over the Frontend API's Unix socket (``unix:`` base)."""
+    headers = {"Accept": "application/json"}
+    if data is not None:
+        headers["Content-Type"] = "application/json"
+    try:
+        status, raw = unix_request(base, path, method, data, headers, timeout)
+    except OSError as e:
+        print(f"Error: cannot connect to io-mcp at {base}", file=sys.stderr)
+        print(f"  {e}", file=sys.stderr)
+        sys.exit(1)
+    if status >= 400:
+        _print_http_error(status, raw.decode())
+        sys.exit(1)
+    return json.loads(raw)
+
 
 def _api_get(base: str, path: str) -> dict:
     """GET request to the Frontend API."""
+    if base.startswith(UNIX_PREFIX):
+        return _unix_call(base, "GET", path, None, timeout=5)
     url = f"{base}{path}"
     req = urllib.request.Request(url, headers={"Accept": "application/json"})
     try:
@@ -36,8 +66,10 @@ def _api_get(base: str, path: str) -> dict:
 
 def _api_post(base: str, path: str, body: dict) -> dict:
     """POST request to the Frontend API."""
-    url = f"{base}{path}"
     data = json.dumps(body).encode()
+    if base.startswith(UNIX_PREFIX):
+        return _unix_call(base, "POST", path, data, timeout=10)
+    url = f"{base}{path}"
     req = urllib.request.Request(
         url, data=data,
         headers={"Content-Type": "application/json", "Accept": "application/json"},
@@ -47,12 +79,7 @@ def _api_post(base: str, path: str, body: dict) -> dict:
         with urllib.request.urlopen(req, timeout=10) as resp:
             return json.loads(resp.read())
     except urllib.error.HTTPError as e:
-        body_text = e.read().decode()
-        try:
-            err = json.loads(body_text)
-            print(f"Error: {err.get('error', body_text)}", file=sys.stderr)
-        except json.JSONDecodeError:
-            print(f"Error: {e.code} {body_text}", file=sys.stderr)
+        _print_http_error(e.code, e.read().decode())
         sys.exit(1)
     except urllib.error.URLError as e:
         print(f"Error: cannot connect to io-mcp at {base}", file=sys.stderr)
@@ -77,6 +104,15 @@ def main() -> None:
         "--port", type=int, default=8445,
         help="Frontend API port (default: 8445)",
     )
+    parser.add_argument(
+        "--socket", default=None, metavar="PATH",
+        help="Frontend API Unix socket (default: /tmp/io-mcp-api-PORT.sock, "
+             "used when live and the host is local)",
+    )
+    parser.add_argument(
+        "--tcp", action="store_true",
+        help="Always use TCP, even when a local socket is available",
+    )
     parser.add_argument(
         "-s", "--session", default=None,
         help="Target specific session ID",
@@ -95,7 +131,8 @@ def main() -> None:
     )
     args = parser.parse_args()
 
-    base = f"http://{args.host}:{args.port}"
+    socket_path = None if args.tcp else (args.socket or api_socket(args.port))
+    base = local_base(args.host, args.port, socket_path)
 
     # Health check
     if args.health:
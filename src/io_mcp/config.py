@@ -27,6 +27,8 @@ from typing import Any, Optional
 
 import yaml
 
+from .schedule import SCHEDULE_POLICIES
+
 
 # ─── Djent integration constants ──────────────────────────────────────────
 
@@ -59,6 +61,12 @@ DEFAULT_CONFIG_DIR = os.path.join(
 )
 DEFAULT_CONFIG_FILE = os.path.join(DEFAULT_CONFIG_DIR, "config.yml")
 
+# Tool families with a per-session rate limit under config.rateLimits
+RATE_LIMIT_KINDS = ("speech", "choices", "status")
+
+# Values of config.tts.localPlayback (see IoMcpConfig.tts_local_playback)
+LOCAL_PLAYBACK_MODES = ("always", "unless-remote")
+
 # Full default config — written on first run, used as fallback for missing keys
 DEFAULT_CONFIG: dict[str, Any] = {
     "providers": {
@@ -138,6 +146,7 @@ DEFAULT_CONFIG: dict[str, Any] = {
             "styleDegree": 2,
             "localBackend": "espeak",  # "termux", "espeak", or "none"
             "pregenerateWorkers": 3,   # concurrent TTS processes for pregeneration (1-8)
+            "localPlayback": "always",  # "always", or "unless-remote" (skip paplay while an API audio client is attached)
             "voiceRotation": [
                 "noa", "teo",
             ],
@@ -153,6 +162,7 @@ DEFAULT_CONFIG: dict[str, Any] = {
         },
         "session": {
             "cleanupTimeoutSeconds": 300,
+            "inboxSchedule": "tabs",           # "tabs", "longest-blocked", "age-priority", "shortest-answer"
         },
         "ambient": {
             "enabled": False,
@@ -196,6 +206,16 @@ DEFAULT_CONFIG: dict[str, Any] = {
             "checkIntervalSecs": 30,           # how often to run the health check
             "checkTmuxPane": True,             # verify tmux pane is still alive
         },
+        "rateLimits": {
+            # Opt-in per-session token buckets on agent tool calls. Over the
+            # limit, speech is merged into the queued utterance (or dropped),
+            # status lines supersede the previous one and choices are refused.
+            "enabled": False,
+            "speech": {"perMinute": 30, "burst": 8},     # speak / speak_async / speak_urgent
+            "choices": {"perMinute": 12, "burst": 4},    # present_choices / _batch / multi_select
+            "status": {"perMinute": 20, "burst": 5},     # report_status
+            "maxMergedChars": 800,             # longest merged utterance; further speech is dropped
+        },
         "notifications": {
             "enabled": False,                  # opt-in: must configure channels
             "cooldownSecs": 60,                # min gap between identical notifications
@@ -473,7 +493,7 @@ class IoMcpConfig:
         known_config_keys = {
             "colorScheme", "tts", "stt", "realtime", "session",
             "ambient", "pulseAudio", "scroll", "scrollAcceleration",
-            "conversation", "dwell", "haptic", "chimes", "healthMonitor",
+            "conversation", "dwell", "haptic", "chimes", "healthMonitor", "rateLimits",
             "notifications", "agents", "keyBindings", "djent",
             "alwaysAllow", "ringReceiver",
         }
@@ -491,7 +511,7 @@ class IoMcpConfig:
         # ── Unknown keys inside config.tts ────────────────────────
         known_tts_keys = {
             "voice", "uiVoice", "speed", "speeds", "style", "emotion",
-            "styleDegree", "localBackend", "pregenerateWorkers",
+            "styleDegree", "localBackend", "pregenerateWorkers", "localPlayback",
             "voiceRotation", "randomRotation", "styleRotation",
             "emotionRotation",
         }
@@ -605,6 +625,13 @@ class IoMcpConfig:
                 f"expected one of: {', '.join(sorted(valid_backends))}"
             )
 
+        local_playback = self.runtime.get("tts", {}).get("localPlayback", "always")
+        if local_playback not in LOCAL_PLAYBACK_MODES:
+            warnings.append(
+                f"config.tts.localPlayback '{local_playback}' is not valid — "
+                f"expected one of: {', '.join(LOCAL_PLAYBACK_MODES)}"
+            )
+
         # ── colorScheme validation ────────────────────────────────
         color_scheme = self.runtime.get("colorScheme", "nord")
         valid_schemes = {"nord", "tokyo-night", "catppuccin", "dracula"}
@@ -614,6 +641,13 @@ class IoMcpConfig:
                 f"expected one of: {', '.join(sorted(valid_schemes))}"
             )
 
+        schedule = self.runtime.get("session", {}).get("inboxSchedule", "tabs")
+        if schedule not in SCHEDULE_POLICIES:
+            warnings.append(
+                f"config.session.inboxSchedule '{schedule}' is not valid — "
+                f"expected one of: {', '.join(SCHEDULE_POLICIES)}"
+            )
+
         # ── pregenerateWorkers range warning ──────────────────────
         pregen = self.runtime.get("tts", {}).get("pregenerateWorkers", 3)
         if isinstance(pregen, (int, float)):
@@ -666,6 +700,21 @@ class IoMcpConfig:
                     "consider >= 10 seconds to avoid excessive checking"
                 )
 
+        # ── Rate limit validation ─────────────────────────────────
+        rate_cfg = self.runtime.get("rateLimits", {})
+        if isinstance(rate_cfg, dict):
+            for kind in RATE_LIMIT_KINDS:
+                limit = rate_cfg.get(kind, {})
+                if not isinstance(limit, dict):
+                    warnings.append(f"config.rateLimits.{kind} must be a mapping with perMinute and burst")
+                    continue
+                for key in ("perMinute", "burst"):
+                    val = limit.get(key)
+                    if val is not None and (not isinstance(val, (int, float)) or val < 0):
+                        warnings.append(
+                            f"config.rateLimits.{kind}.{key} ({val}) must be a non-negative number"
+                        )
+
         # ── Notification channel validation ───────────────────────
         notif_cfg = self.runtime.get("notifications", {})
         if notif_cfg.get("enabled", False):
@@ -968,6 +1017,18 @@ class IoMcpConfig:
         """
         return self.runtime.get("tts", {}).get("localBackend", "termux")
 
+    @property
+    def tts_local_playback(self) -> str:
+        """Whether speech plays through local paplay.
+
+        "always" (default) — play locally even with remote listeners.
+        "unless-remote"    — skip local playback while a frontend API
+                             client with ``?audio=1`` is attached; it
+                             fetches the clips by key and plays them itself.
+        """
+        val = self.runtime.get("tts", {}).get("localPlayback", "always")
+        return val if val in LOCAL_PLAYBACK_MODES else "always"
+
     @property
     def tts_voice_options(self) -> list[str]:
         """Available voice preset names."""
@@ -1105,6 +1166,21 @@ class IoMcpConfig:
             .get("cleanupTimeoutSeconds", 300)
         )
 
+    @property
+    def inbox_schedule(self) -> str:
+        """Ordering of pending choices across sessions.
+
+        "tabs" (default) walks tabs in order; "longest-blocked",
+        "age-priority" and "shortest-answer" rank by agent idle time
+        (see session.schedule_pending). Unknown values fall back to "tabs".
+        """
+        val = str(
+            self.expanded.get("config", {})
+            .get("session", {})
+            .get("inboxSchedule", "tabs")
+        )
+        return val if val in SCHEDULE_POLICIES else "tabs"
+
     # ─── Ambient mode settings ────────────────────────────────────
 
     @property
@@ -1270,6 +1346,36 @@ class IoMcpConfig:
             .get("checkTmuxPane", True)
         )
 
+    # ─── Rate limits ─────────────────────────────────────────────
+
+    def rate_limit(self, kind: str) -> Optional[tuple[float, int]]:
+        """``(per_minute, burst)`` for a kind in RATE_LIMIT_KINDS.
+
+        None when rate limiting is disabled or the kind's perMinute is 0
+        (unlimited).
+        """
+        cfg = self.expanded.get("config", {}).get("rateLimits", {})
+        if not cfg.get("enabled", False):
+            return None
+        limit = cfg.get(kind, {})
+        try:
+            per_minute = float(limit.get("perMinute", 0))
+            burst = int(limit.get("burst", 1))
+        except (AttributeError, TypeError, ValueError):
+            return None
+        if per_minute <= 0:
+            return None
+        return per_minute, max(1, burst)
+
+    @property
+    def rate_limit_max_merged_chars(self) -> int:
+        """Longest utterance rate-limited speech may be merged into."""
+        return int(
+            self.expanded.get("config", {})
+            .get("rateLimits", {})
+            .get("maxMergedChars", 800)
+        )
+
     # ─── Notification settings ───────────────────────────────────
 
     @property
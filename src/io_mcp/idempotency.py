@@ -0,0 +1,100 @@
+"""Idempotency keys for tool calls forwarded by the MCP proxy.
+
+The proxy stamps every call it forwards with a fresh key and re-sends the
+same key when it retries (backend connection dropped, backend restarting).
+The backend's ``CallLedger`` recognises the retry: while the original call
+is still running the retry attaches to it, and once it has finished the
+retry gets the cached result. Either way the tool runs once — no second
+intro TTS, chime or inbox item.
+
+Keyed calls therefore don't need the content heuristic in
+``Session.dedup_and_enqueue``; ``current_call_key`` carries the key down
+to the inbox so identical questions asked twice on purpose stay separate.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Optional
+
+# Key of the tool call being dispatched ("" for unkeyed callers). Set by the
+# backend per request; read where inbox items are created.
+current_call_key: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "io_mcp_call_key", default="")
+
+# Longer than the proxy's whole retry window (~30 attempts, backoff capped at 10s).
+RESULT_TTL = 600.0
+MAX_RESULTS = 1024
+
+
+class CallLedger:
+    """Pending-call index and bounded result cache keyed on idempotency key.
+
+    Lives on the backend's event loop: ``run`` is only called from
+    coroutines on that loop, so no locking is needed.
+    """
+
+    def __init__(self, max_results: int = MAX_RESULTS, ttl: float = RESULT_TTL) -> None:
+        self.max_results = max_results
+        self.ttl = ttl
+        self._pending: dict[str, asyncio.Future] = {}
+        # key -> (finished_at, result), oldest first
+        self._results: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self.calls = 0
+        self.attached = 0
+        self.cached = 0
+
+    def _cached(self, key: str, now: float) -> Optional[str]:
+        while self._results:
+            oldest, (finished, _) = next(iter(self._results.items()))
+            if now - finished <= self.ttl:
+                break
+            del self._results[oldest]
+        entry = self._results.get(key)
+        return entry[1] if entry else None
+
+    async def run(self, key: str, call: Callable[[], Awaitable[str]]) -> str:
+        """Run ``call`` once per ``key``; retries share its result."""
+        if not key:
+            return await call()
+        result = self._cached(key, time.monotonic())
+        if result is not None:
+            self.cached += 1
+            return result
+        pending = self._pending.get(key)
+        if pending is not None:
+            self.attached += 1
+            return await asyncio.shield(pending)
+
+        self.calls += 1
+        future = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        try:
+            result = await call()
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                future.exception()  # retrieved: attached waiters re-raise it
+            raise
+        else:
+            self._results[key] = (time.monotonic(), result)
+            while len(self._results) > self.max_results:
+                self._results.popitem(last=False)
+            future.set_result(result)
+            return result
+        finally:
+            self._pending.pop(key, None)
+
+    def stats(self) -> dict:
+        return {
+            "pending": len(self._pending),
+            "cached_results": len(self._results),
+            "calls": self.calls,
+            "retries_attached": self.attached,
+            "retries_cached": self.cached,
+        }
@@ -12,20 +12,30 @@ Usage:
 
 from __future__ import annotations
 
-import asyncio
+import collections
 import errno
+import functools
+import hashlib
+import http.client
 import json
 import logging
 import os
 import socket
+import threading
 import time
+import urllib.parse
 import urllib.request
 import urllib.error
-from typing import Any
-
-from mcp.server.fastmcp import FastMCP, Context
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
 
 from .logging import get_logger, SERVER_LOG, TUI_ERROR_LOG, TOOL_ERROR_LOG, read_log_tail
+from .registrations import RegistrationRegistry, enrich_registration
+from .transport import LOCAL_HOSTS, UnixHTTPConnection, backend_socket
+
+if TYPE_CHECKING:
+    from mcp.server.fastmcp import Context, FastMCP
 
 log = logging.getLogger("io-mcp.proxy")
 _server_log = get_logger("io-mcp.proxy.server", SERVER_LOG, json_format=False)
@@ -37,6 +47,7 @@ DEFAULT_BACKEND = "http://localhost:8446"
 _BLOCKING_TOOLS = frozenset({
     "present_choices",
     "present_multi_select",
+    "present_choices_batch",
     "speak",           # blocks until speech finishes
     "speak_urgent",    # blocks until speech finishes
     "run_command",     # blocks waiting for user approval + command execution
@@ -88,6 +99,386 @@ def _is_connection_error(exc: Exception) -> bool:
     return False
 
 
+# Worker threads per executor lane. Blocking tools park a thread for as long
+# as the user takes to answer, so that lane is sized for many concurrent
+# agents; fast tools return in milliseconds and need only a handful. Each
+# lane's keep-alive pool holds at most one idle connection per worker.
+_BLOCKING_WORKERS = 64
+_FAST_WORKERS = 8
+
+# Idle pooled connections older than this are closed rather than reused —
+# the backend may have restarted underneath them.
+_POOL_IDLE_TIMEOUT = 60.0
+
+# Latency samples kept per lane for the p50/p95 in proxy_health.
+_LATENCY_SAMPLES = 256
+
+
+def _lane(tool_name: str) -> str:
+    """Executor/pool lane for a tool: "blocking" or "fast"."""
+    return "blocking" if tool_name in _BLOCKING_TOOLS else "fast"
+
+
+def _percentile(samples: list[float], pct: float) -> float | None:
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+class BackendPool:
+    """Bounded pools of keep-alive HTTP/1.1 connections to the backend.
+
+    Blocking and fast tools draw from separate lanes so a room full of
+    agents waiting on present_choices can never hold every connection a
+    quick speak_async needs. A connection is checked out for exactly one
+    request and returned afterwards unless the server asked to close it.
+
+    A reused connection may have been closed by the backend while idle
+    (restart, keep-alive expiry); such a request is retried once on a
+    fresh connection before the error is surfaced to the caller's retry
+    loop.
+
+    With ``unix_socket`` set, new connections go over that socket while it
+    accepts them and fall back to TCP otherwise (backend down or TCP-only).
+    """
+
+    _STALE_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError,
+                     BrokenPipeError, http.client.CannotSendRequest)
+
+    def __init__(self, backend_url: str,
+                 sizes: dict[str, int] | None = None,
+                 unix_socket: str | None = None) -> None:
+        parsed = urllib.parse.urlsplit(backend_url)
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or 80
+        self.unix_socket = unix_socket
+        self.transport = "tcp"
+        self.sizes = sizes or {"blocking": _BLOCKING_WORKERS, "fast": _FAST_WORKERS}
+        self._idle: dict[str, list[tuple[http.client.HTTPConnection, float]]] = {
+            lane: [] for lane in self.sizes
+        }
+        self._latency: dict[str, collections.deque] = {
+            lane: collections.deque(maxlen=_LATENCY_SAMPLES) for lane in self.sizes
+        }
+        self._counters: dict[str, dict[str, int]] = {
+            lane: {"created": 0, "reused": 0, "stale": 0, "in_use": 0, "requests": 0}
+            for lane in self.sizes
+        }
+        self._lock = threading.Lock()
+
+    def _checkout(self, lane: str, timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+        now = time.monotonic()
+        with self._lock:
+            counters = self._counters[lane]
+            idle = self._idle[lane]
+            while idle:
+                conn, since = idle.pop()
+                if now - since < _POOL_IDLE_TIMEOUT:
+                    counters["reused"] += 1
+                    counters["in_use"] += 1
+                    conn.timeout = timeout
+                    if conn.sock is not None:
+                        conn.sock.settimeout(timeout)
+                    return conn, True
+                conn.close()
+            counters["created"] += 1
+            counters["in_use"] += 1
+        return self._connect(timeout), False
+
+    def _connect(self, timeout: float) -> http.client.HTTPConnection:
+        if self.unix_socket:
+            conn = UnixHTTPConnection(self.unix_socket, timeout=timeout)
+            try:
+                conn.connect()
+                self.transport = "unix"
+                return conn
+            except OSError:
+                pass  # no live socket — TCP below
+        self.transport = "tcp"
+        return http.client.HTTPConnection(self.host, self.port, timeout=timeout)
+
+    def _checkin(self, lane: str, conn: http.client.HTTPConnection, keep: bool) -> None:
+        with self._lock:
+            self._counters[lane]["in_use"] -= 1
+            idle = self._idle[lane]
+            if keep and len(idle) < self.sizes[lane]:
+                idle.append((conn, time.monotonic()))
+                return
+        conn.close()
+
+    def post(self, path: str, payload: bytes, timeout: float,
+             lane: str = "fast") -> tuple[int, bytes]:
+        """POST a JSON payload and return ``(status, body)``.
+
+        Connection errors propagate to the caller (after the single
+        stale-connection retry); HTTP error statuses are returned, not raised.
+        """
+        start = time.monotonic()
+        for attempt in range(2):
+            conn, reused = self._checkout(lane, timeout)
+            keep = False
+            try:
+                conn.request("POST", path, body=payload,
+                             headers={"Content-Type": "application/json"})
+                resp = conn.getresponse()
+                body = resp.read()
+                keep = not resp.will_close
+            except self._STALE_ERRORS:
+                if reused and attempt == 0:
+                    with self._lock:
+                        self._counters[lane]["stale"] += 1
+                    continue
+                raise
+            finally:
+                self._checkin(lane, conn, keep)
+            with self._lock:
+                self._counters[lane]["requests"] += 1
+                self._latency[lane].append(time.monotonic() - start)
+            return resp.status, body
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    def close(self) -> None:
+        """Close every idle connection (in-flight ones close on check-in)."""
+        with self._lock:
+            idle = [conn for lane in self._idle.values() for conn, _ in lane]
+            for lane in self._idle.values():
+                lane.clear()
+        for conn in idle:
+            conn.close()
+
+    def stats(self) -> dict:
+        """Per-lane connection counters and request latency (milliseconds).
+
+        ``transport`` ("unix" or "tcp") is what the newest connection used.
+        """
+        with self._lock:
+            out = {}
+            for lane, counters in self._counters.items():
+                samples = list(self._latency[lane])
+                p50, p95 = _percentile(samples, 0.5), _percentile(samples, 0.95)
+                out[lane] = {
+                    **counters,
+                    "transport": self.transport,
+                    "idle": len(self._idle[lane]),
+                    "max_idle": self.sizes[lane],
+                    "latency_p50_ms": None if p50 is None else round(p50 * 1000, 1),
+                    "latency_p95_ms": None if p95 is None else round(p95 * 1000, 1),
+                }
+            return out
+
+
+_pools: dict[str, BackendPool] = {}
+_pools_lock = threading.Lock()
+
+
+def _backend_pool(backend_url: str) -> BackendPool:
+    """The shared connection pool for a backend URL (created on first use)."""
+    with _pools_lock:
+        pool = _pools.get(backend_url)
+        if pool is None:
+            parsed = urllib.parse.urlsplit(backend_url)
+            local = (parsed.hostname or "localhost") in LOCAL_HOSTS
+            unix_socket = backend_socket(parsed.port or 80) if local else None
+            pool = _pools[backend_url] = BackendPool(backend_url, unix_socket=unix_socket)
+        return pool
+
+
+# A shard must stay unreachable this long before its sessions move elsewhere,
+# so an ordinary backend restart is ridden out by the retry loop instead.
+_FAILOVER_AFTER = 20.0
+# How often a down shard is re-probed when a session could be placed on it.
+_PROBE_INTERVAL = 5.0
+# register_session metadata keys that pin a session to a named backend.
+_PIN_KEYS = ("backend", "group")
+
+
+def parse_backends(spec: str) -> list[tuple[str, str]]:
+    """Parse a backend address list into ``(name, url)`` pairs.
+
+    ``spec`` is comma-separated ``host:port`` or ``name=host:port``
+    entries (an ``http://`` prefix is optional). Unnamed entries are
+    named after their ``host:port``.
+    """
+    backends: list[tuple[str, str]] = []
+    for entry in spec.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        name, sep, address = entry.partition("=")
+        if not sep:
+            name, address = "", entry
+        url = address if "://" in address else f"http://{address}"
+        name = name.strip() or urllib.parse.urlsplit(url).netloc
+        backends.append((name, url))
+    return backends
+
+
+def _rendezvous(session_id: str, name: str) -> int:
+    digest = hashlib.blake2b(f"{name}\0{session_id}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+class BackendRouter:
+    """Sticky session-to-backend routing across backend shards.
+
+    A session is placed on a shard the first time it calls a tool —
+    by rendezvous hash over the reachable shards, or on the shard named
+    by its register_session metadata (``backend``/``group``) — and stays
+    there. Forwarding failures mark a shard down. Once a shard has been
+    down for ``failover_after`` seconds its sessions move to a reachable
+    one, and their last registration is replayed there. Down shards are
+    re-probed (TCP connect, as ``proxy_health`` does) at most every
+    ``probe_interval`` seconds.
+
+    With a single backend every call simply goes to it.
+    """
+
+    def __init__(self, backends: list[tuple[str, str]],
+                 failover_after: float = _FAILOVER_AFTER,
+                 probe_interval: float = _PROBE_INTERVAL) -> None:
+        if not backends:
+            raise ValueError("BackendRouter needs at least one backend")
+        self.backends = dict(backends)
+        self.failover_after = failover_after
+        self.probe_interval = probe_interval
+        self._affinity: dict[str, str] = {}     # session id -> backend name
+        self._down: dict[str, float] = {}       # backend name -> first failure
+        self._probed: dict[str, float] = {}     # backend name -> last probe
+        self._registrations: dict[str, dict] = {}
+        self._replay: set[str] = set()
+        self._lock = threading.Lock()
+        self.failovers = 0
+
+    @property
+    def sharded(self) -> bool:
+        return len(self.backends) > 1
+
+    @property
+    def primary(self) -> str:
+        return next(iter(self.backends))
+
+    def url(self, name: str) -> str:
+        return self.backends[name]
+
+    def home(self, session_id: str) -> str:
+        """The session's current backend, without placing or moving it."""
+        with self._lock:
+            return self._affinity.get(session_id, self.primary)
+
+    def mark_down(self, name: str) -> None:
+        with self._lock:
+            self._down.setdefault(name, time.monotonic())
+            self._probed[name] = time.monotonic()
+
+    def mark_up(self, name: str) -> None:
+        with self._lock:
+            self._down.pop(name, None)
+
+    def _reachable(self, name: str, now: float) -> bool:
+        with self._lock:
+            if name not in self._down:
+                return True
+            if now - self._probed.get(name, 0.0) < self.probe_interval:
+                return False
+            self._probed[name] = now
+        parsed = urllib.parse.urlsplit(self.backends[name])
+        if _check_port_open(parsed.hostname or "localhost", parsed.port or 80, timeout=0.5):
+            self.mark_up(name)
+            return True
+        return False
+
+    def route(self, session_id: str) -> str:
+        """Name of the backend this session's next call should go to."""
+        if not self.sharded:
+            return self.primary
+        now = time.monotonic()
+        with self._lock:
+            current = self._affinity.get(session_id)
+            down_since = self._down.get(current) if current else None
+            if current and (down_since is None or now - down_since < self.failover_after):
+                return current
+        reachable = [n for n in self.backends if self._reachable(n, now)]
+        if current and current in reachable:
+            return current
+        pool = reachable or list(self.backends)
+        choice = max(pool, key=lambda n: _rendezvous(session_id, n))
+        with self._lock:
+            if current and choice != current:
+                self.failovers += 1
+                if session_id in self._registrations:
+                    self._replay.add(session_id)
+                log.warning(f"Session {session_id} failed over: {current} → {choice}")
+            self._affinity[session_id] = choice
+        return choice
+
+    def pin(self, session_id: str, metadata: dict | None) -> None:
+        """Place a session on the backend its registration metadata names.
+
+        Only a session not yet placed is pinned: its state lives on its
+        current backend, so a re-registration naming another one is
+        ignored (only failover moves a session, replaying its registration).
+        """
+        for key in _PIN_KEYS:
+            name = (metadata or {}).get(key)
+            if isinstance(name, str) and name in self.backends:
+                with self._lock:
+                    current = self._affinity.setdefault(session_id, name)
+                if current != name:
+                    log.info(f"Session {session_id} stays on {current}; "
+                             f"ignoring pin to {name}")
+                return
+
+    def remember_registration(self, session_id: str, args: dict) -> None:
+        with self._lock:
+            self._registrations[session_id] = dict(args)
+            self._replay.discard(session_id)
+
+    def last_registration(self, session_id: str) -> dict | None:
+        """The session's last ``register_session`` args, if it registered."""
+        with self._lock:
+            return self._registrations.get(session_id)
+
+    def take_replay(self, session_id: str) -> dict | None:
+        """Registration to re-send after a failover moved the session (once)."""
+        with self._lock:
+            if session_id in self._replay:
+                self._replay.discard(session_id)
+                return self._registrations.get(session_id)
+        return None
+
+    def stats(self) -> dict:
+        """Per-backend health, session count and pool stats, plus failovers."""
+        with self._lock:
+            counts = collections.Counter(self._affinity.values())
+            down = dict(self._down)
+        now = time.monotonic()
+        return {
+            "failovers": self.failovers,
+            "backends": {
+                name: {
+                    "url": url,
+                    "healthy": name not in down,
+                    "down_seconds": round(now - down[name], 1) if name in down else None,
+                    "sessions": counts.get(name, 0),
+                    "pool": _backend_pool(url).stats(),
+                }
+                for name, url in self.backends.items()
+            },
+        }
+
+
+def _replay_registration(backend_url: str, args: dict, session_id: str) -> None:
+    """Re-register a failed-over session on its new backend (best effort)."""
+    payload = json.dumps({"tool": "register_session", "args": args,
+                          "session_id": session_id,
+                          "idempotency_key": uuid.uuid4().hex}).encode()
+    try:
+        _backend_pool(backend_url).post("/handle-mcp", payload, 10)
+    except Exception as e:
+        log.warning(f"Registration replay to {backend_url} failed for {session_id}: {e}")
+
+
 def _forward_to_backend(
     backend_url: str,
     tool_name: str,
@@ -96,6 +487,7 @@ def _forward_to_backend(
     max_retries: int = 30,
     initial_backoff: float = 0.5,
     max_backoff: float = 10.0,
+    router: BackendRouter | None = None,
 ) -> str:
     """Forward an MCP tool call to the io-mcp backend.
 
@@ -105,11 +497,20 @@ def _forward_to_backend(
 
     Blocking tools (present_choices, run_command, etc.) get a very long
     read timeout since they wait for user interaction. Non-blocking tools
-    get a shorter timeout.
+    get a shorter timeout. The two kinds draw keep-alive connections from
+    separate lanes of the shared BackendPool for ``backend_url``.
 
     Only connection-related errors are retried. Non-retriable errors
     (bad hostname, SSL errors, etc.) are returned immediately.
 
+    Every attempt carries the same idempotency key, so a retry of a call
+    the backend is still running (or has just finished) attaches to that
+    call instead of running the tool twice.
+
+    With a ``router`` each attempt goes to the session's current shard
+    (``backend_url`` is ignored), so a retry loop that outlasts a dead
+    shard's failover window continues on the shard the session moved to.
+
     Args:
         backend_url: Base URL of the backend (e.g. http://localhost:8446)
         tool_name: Name of the MCP tool to call
@@ -118,15 +519,16 @@ def _forward_to_backend(
         max_retries: Maximum number of retries before giving up
         initial_backoff: Initial retry delay in seconds
         max_backoff: Maximum retry delay in seconds
+        router: Session-affinity router for a sharded deployment
 
     Returns:
         JSON string result from the tool
     """
-    url = f"{backend_url}/handle-mcp"
     payload = json.dumps({
         "tool": tool_name,
         "args": args,
         "session_id": session_id,
+        "idempotency_key": uuid.uuid4().hex,
     }).encode()
 
     # Blocking tools wait for user interaction — use a very long timeout.
@@ -140,24 +542,27 @@ def _forward_to_backend(
     last_error = ""
 
     for attempt in range(max_retries):
+        shard = None
+        if router is not None:
+            shard = router.route(session_id)
+            backend_url = router.url(shard)
+            replay = router.take_replay(session_id)
+            if replay is not None and tool_name != "register_session":
+                _replay_registration(backend_url, replay, session_id)
         try:
-            req = urllib.request.Request(
-                url,
-                data=payload,
-                headers={"Content-Type": "application/json"},
-                method="POST",
-            )
-            with urllib.request.urlopen(req, timeout=read_timeout) as resp:
-                return resp.read().decode()
-        except urllib.error.HTTPError as e:
-            # Backend returned an HTTP error — don't retry, return it.
-            # The backend has its own error wrapping (_safe_tool), so an
-            # HTTP error here usually means a real problem in the dispatch layer.
-            try:
-                body = e.read().decode()
-                return body + _crash_log_hint()
-            except Exception:
-                return json.dumps({"error": f"Backend HTTP {e.code}"}) + _crash_log_hint()
+            status, body = _backend_pool(backend_url).post(
+                "/handle-mcp", payload, read_timeout, lane=_lane(tool_name))
+            if shard is not None:
+                router.mark_up(shard)
+            if status >= 400:
+                # Backend returned an HTTP error — don't retry, return it.
+                # The backend has its own error wrapping (_safe_tool), so an
+                # HTTP error here usually means a real problem in the dispatch layer.
+                try:
+                    return body.decode() + _crash_log_hint()
+                except Exception:
+                    return json.dumps({"error": f"Backend HTTP {status}"}) + _crash_log_hint()
+            return body.decode()
         except (urllib.error.URLError, ConnectionRefusedError, OSError) as e:
             # Only retry connection-related errors (backend down/restarting).
             # Non-retriable errors (bad hostname, SSL, etc.) fail fast.
@@ -168,6 +573,8 @@ def _forward_to_backend(
                 }) + _crash_log_hint()
 
             last_error = str(e)
+            if shard is not None:
+                router.mark_down(shard)
             if attempt < max_retries - 1:
                 log.debug(
                     f"Backend unavailable (attempt {attempt + 1}/{max_retries}), "
@@ -202,27 +609,110 @@ def _cancel_backend_tool(
 
     Best effort — errors are logged but not propagated.
     """
-    url = f"{backend_url}/cancel-mcp"
     payload = json.dumps({
         "tool": tool_name,
         "session_id": session_id,
     }).encode()
 
     try:
-        req = urllib.request.Request(
-            url,
-            data=payload,
-            headers={"Content-Type": "application/json"},
-            method="POST",
-        )
-        with urllib.request.urlopen(req, timeout=5) as resp:
-            resp.read()
+        _backend_pool(backend_url).post("/cancel-mcp", payload, 5)
     except Exception as e:
         # Best effort — log but don't propagate cancel errors.
         # The backend may be down (that's often WHY the cancel happened).
         log.debug(f"Cancel request failed for {tool_name} (session {session_id}): {e}")
 
 
+def _shard_cursors(since: Any, names) -> dict[str, int] | None:
+    """Per-backend event cursors from a get_sessions ``since`` value.
+
+    A sharded proxy hands out composite cursors (``name=seq,...``); a
+    plain integer applies to every backend.
+    """
+    if since is None:
+        return None
+    text = str(since).strip()
+    if text.lstrip("-").isdigit():
+        return {name: int(text) for name in names}
+    cursors = {name: 0 for name in names}
+    for part in text.split(","):
+        name, _, seq = part.rpartition("=")
+        if name in cursors:
+            try:
+                cursors[name] = int(seq)
+            except ValueError:
+                pass
+    return cursors
+
+
+def _merge_shard_listing(result: dict, listing: dict, name: str,
+                         cursors: dict[str, int] | None) -> None:
+    """Fold one backend's get_sessions payload into the aggregate."""
+    for info in listing.get("sessions", []):
+        info["backend"] = name
+    if listing is not result:
+        result.setdefault("sessions", []).extend(listing.get("sessions", []))
+        result["agent_blocked_seconds"] = round(
+            result.get("agent_blocked_seconds", 0) + listing.get("agent_blocked_seconds", 0), 1)
+    if cursors is None:
+        return
+    events = listing.get("events", [])
+    for event in events:
+        event["backend"] = name
+    if listing is not result:
+        result.setdefault("events", []).extend(events)
+    if events:
+        cursors[name] = max(cursors[name], max(e.get("seq", 0) for e in events))
+
+
+def _aggregate_sessions(router: BackendRouter, session_id: str, since: Any = None) -> str:
+    """get_sessions across every shard of a sharded deployment.
+
+    The calling session's own shard answers the tool call proper (queued
+    user messages and activity land there); the others are read through
+    their side-effect-free /sessions route. Each session and event is
+    tagged with its ``backend``; ``cursor`` is a composite of the
+    per-backend cursors, to be passed back as ``since``.
+    """
+    home = router.route(session_id)
+    cursors = _shard_cursors(since, router.backends)
+    raw = _forward_to_backend(router.url(home), "get_sessions",
+                              {} if cursors is None else {"since": cursors[home]},
+                              session_id, router=router)
+    try:
+        result, end = json.JSONDecoder().raw_decode(raw)
+    except ValueError:
+        return raw  # an error from the home backend — pass it through
+    if not isinstance(result, dict):
+        return raw
+    _merge_shard_listing(result, result, home, cursors)
+
+    unreachable = []
+    for name, url in router.backends.items():
+        if name == home:
+            continue
+        body = {"session_id": session_id}
+        if cursors is not None:
+            body["since"] = cursors[name]
+        try:
+            status, data = _backend_pool(url).post("/sessions", json.dumps(body).encode(), 5)
+            listing = json.loads(data) if status == 200 else None
+        except Exception as e:
+            log.debug(f"Session listing from {name} failed: {e}")
+            listing = None
+        if not isinstance(listing, dict):
+            unreachable.append(name)
+            continue
+        _merge_shard_listing(result, listing, name, cursors)
+
+    result["count"] = len(result.get("sessions", []))
+    if cursors is not None:
+        result.setdefault("events", []).sort(key=lambda e: e.get("time", 0))
+        result["cursor"] = ",".join(f"{name}={seq}" for name, seq in cursors.items())
+    if unreachable:
+        result["unreachable_backends"] = unreachable
+    return json.dumps(result) + raw[end:]
+
+
 def _crash_log_hint() -> str:
     """Read recent crash logs and return self-healing instructions.
 
@@ -254,52 +744,6 @@ def _crash_log_hint() -> str:
     )
 
 
-REG_DIR = "/tmp/io-mcp-registrations"
-
-
-def _load_registration(tmux_pane: str = "") -> dict | None:
-    """Load pre-registered agent data from the Start hook.
-
-    The Start hook writes environment data (tmux pane, IP, hostname)
-    to /tmp/io-mcp-registrations/pane-{id}.json before the agent
-    makes any MCP calls.
-
-    If tmux_pane is provided, loads that specific registration.
-    Otherwise, tries to find the most recent registration file.
-    """
-    try:
-        if not os.path.isdir(REG_DIR):
-            return None
-
-        if tmux_pane:
-            # Direct lookup by pane ID
-            pane_key = tmux_pane.replace("%", "")
-            path = os.path.join(REG_DIR, f"pane-{pane_key}.json")
-            if os.path.isfile(path):
-                with open(path) as f:
-                    return json.load(f)
-            return None
-
-        # No pane ID — find the most recent registration file
-        # (for cases where the agent doesn't know its pane)
-        files = []
-        for fname in os.listdir(REG_DIR):
-            if fname.startswith("pane-") and fname.endswith(".json"):
-                fpath = os.path.join(REG_DIR, fname)
-                files.append((os.path.getmtime(fpath), fpath))
-
-        if not files:
-            return None
-
-        # Return the most recently modified registration
-        files.sort(reverse=True)
-        with open(files[0][1]) as f:
-            return json.load(f)
-
-    except Exception:
-        return None
-
-
 def _get_session_id(ctx: Context) -> str:
     """Extract session ID from MCP context."""
     session = ctx.session
@@ -307,23 +751,81 @@ def _get_session_id(ctx: Context) -> str:
     return str(sid) if sid else str(id(session))
 
 
+def _load_mcp() -> None:
+    """Import the MCP SDK on first use — only the proxy server itself needs it.
+
+    Health checks (``io-mcp status`` → ``proxy_health``) import this module
+    too and must stay fast. Bound as module globals because FastMCP resolves
+    the tools' ``ctx: Context`` annotations against this module.
+    """
+    global Context, FastMCP
+    from mcp.server.fastmcp import Context, FastMCP
+
+
 def create_proxy_server(
     host: str = "0.0.0.0",
     port: int = 8444,
     backend_url: str = DEFAULT_BACKEND,
+    backends: list[tuple[str, str]] | None = None,
+    registrations: RegistrationRegistry | None = None,
 ) -> FastMCP:
     """Create the MCP proxy server with all tool definitions.
 
     Each tool is a thin wrapper that forwards the call to the backend.
     The tool signatures and docstrings match the real tools exactly
     so that agents see the same API.
+
+    ``backends`` (``(name, url)`` pairs, see ``parse_backends``) shards
+    sessions across several backends with a ``BackendRouter``; otherwise
+    everything goes to ``backend_url``.
+
+    ``registrations`` holds the Start hook records posted to
+    ``/registrations``; ``register_session`` is enriched from it here,
+    before routing, so every shard sees the same args.
     """
+    import asyncio
+
+    _load_mcp()
+    from starlette.responses import JSONResponse
+
     server = FastMCP("io-mcp", host=host, port=port)
+    router = BackendRouter(backends or [(urllib.parse.urlsplit(backend_url).netloc, backend_url)])
+    if registrations is None:
+        registrations = RegistrationRegistry()
+
+    # Dedicated executors instead of the loop's default one: a burst of
+    # blocking calls must not starve quick tools of worker threads.
+    executors = {
+        "blocking": ThreadPoolExecutor(max_workers=_BLOCKING_WORKERS,
+                                       thread_name_prefix="io-mcp-fwd-blocking"),
+        "fast": ThreadPoolExecutor(max_workers=_FAST_WORKERS,
+                                   thread_name_prefix="io-mcp-fwd-fast"),
+    }
+
+    @server.custom_route("/proxy-stats", methods=["GET"])
+    async def _proxy_stats(request):
+        """Connection-pool, latency and shard stats, read by proxy_health()."""
+        stats = router.stats()
+        primary = stats["backends"][router.primary]["pool"]
+        return JSONResponse({"backend_pool": primary,
+                             "shards": stats if router.sharded else None,
+                             "registrations": registrations.stats()})
+
+    @server.custom_route("/registrations", methods=["POST"])
+    async def _registrations(request):
+        """Agent environment posted by the Start hook (agents/start-register.sh)."""
+        try:
+            data = json.loads(await request.body())
+        except ValueError as e:
+            return JSONResponse({"error": f"Invalid JSON: {e}"}, status_code=400)
+        if not isinstance(data, dict):
+            return JSONResponse({"error": "JSON body must be an object"}, status_code=400)
+        return JSONResponse({"status": "registered", "registration": registrations.add(data)})
 
     async def _fwd(tool_name: str, args: dict, ctx: Context) -> str:
         """Forward a tool call to the backend without blocking the event loop.
 
-        Runs the synchronous HTTP request in a thread executor so the
+        Runs the synchronous HTTP request in the tool's executor lane so the
         asyncio event loop stays alive. This is critical for streamable-http:
         if the event loop blocks (e.g. during a long present_choices wait),
         the SSE stream to the MCP client goes silent, the client times out,
@@ -342,16 +844,27 @@ def create_proxy_server(
             log.warning(f"Failed to extract session ID for {tool_name}: {e}")
             sid = "unknown"
 
+        if tool_name == "register_session":
+            # Enrich before pinning and remembering: a failover replays
+            # exactly these args on the new shard
+            args = enrich_registration(registrations, args, router.last_registration(sid))
+            router.pin(sid, args.get("metadata"))
+            router.remember_registration(sid, args)
+
         loop = asyncio.get_event_loop()
         try:
+            if tool_name == "get_sessions" and router.sharded:
+                return await loop.run_in_executor(
+                    executors["fast"], _aggregate_sessions, router, sid, args.get("since"))
             return await loop.run_in_executor(
-                None, _forward_to_backend, backend_url, tool_name, args, sid
+                executors[_lane(tool_name)], functools.partial(
+                    _forward_to_backend, backend_url, tool_name, args, sid, router=router)
             )
         except asyncio.CancelledError:
             # MCP client cancelled the tool call — tell the backend to clean up
             log.info(f"Tool call cancelled by client: {tool_name} (session {sid})")
             try:
-                _cancel_backend_tool(backend_url, tool_name, sid)
+                _cancel_backend_tool(router.url(router.home(sid)), tool_name, sid)
             except Exception as e:
                 log.warning(f"Failed to cancel backend tool: {e}")
             raise
@@ -400,6 +913,34 @@ def create_proxy_server(
             args["timeout"] = timeout
         return await _fwd("present_choices", args, ctx)
 
+    @server.tool()
+    async def present_choices_batch(questions: list[dict], ctx: Context) -> str:
+        """Present several independent multi-choice questions in one call.
+
+        Use this instead of consecutive present_choices calls when you
+        have 2+ decisions that don't depend on each other. The user
+        answers them back-to-back (each appears as soon as the previous
+        one is answered) and all selections come back in one response,
+        saving a full round trip per question.
+
+        Parameters
+        ----------
+        questions:
+            List of question objects, each with:
+            - "preamble": Brief 1-sentence summary spoken aloud
+            - "choices": List of {"label", "summary"} objects, as for
+              present_choices
+
+        Returns
+        -------
+        str
+            JSON string: {"results": [{"preamble": "...", "selected": "label",
+            "summary": "..."}, ...]} in question order. If the user
+            dismisses or the call is cancelled part-way, the remaining
+            questions carry the same "_dismissed"/"error" result.
+        """
+        return await _fwd("present_choices_batch", {"questions": questions}, ctx)
+
     @server.tool()
     async def present_multi_select(preamble: str, choices: list[dict], ctx: Context) -> str:
         """Present choices where the user can select multiple items.
@@ -620,30 +1161,8 @@ def create_proxy_server(
         str
             JSON confirmation with assigned session info.
         """
-        # Enrich with pre-registered data from the Start hook.
-        # The hook writes environment data to /tmp/io-mcp-registrations/
-        # before the agent makes any MCP calls.
-        reg_data = _load_registration(tmux_pane)
-        if reg_data:
-            # Use pre-registered values as defaults (agent-provided values take priority)
-            if not tmux_pane and reg_data.get("tmux_pane"):
-                tmux_pane = reg_data["tmux_pane"]
-            if not tmux_session and reg_data.get("tmux_session"):
-                tmux_session = reg_data["tmux_session"]
-            if not hostname and reg_data.get("tailscale_hostname"):
-                hostname = reg_data["tailscale_hostname"]
-            elif not hostname and reg_data.get("hostname"):
-                hostname = reg_data["hostname"]
-            if not cwd and reg_data.get("cwd"):
-                cwd = reg_data["cwd"]
-            # Store enrichment data in metadata
-            enriched_meta = dict(metadata) if metadata else {}
-            if reg_data.get("ipv4"):
-                enriched_meta["ipv4"] = reg_data["ipv4"]
-            if reg_data.get("tailscale_hostname"):
-                enriched_meta["tailscale_hostname"] = reg_data["tailscale_hostname"]
-            metadata = enriched_meta
-
+        # _fwd fills blanks from the Start hook's registration
+        # (agents/start-register.sh → POST /registrations).
         return await _fwd("register_session", {
             "cwd": cwd, "hostname": hostname,
             "tmux_session": tmux_session, "tmux_pane": tmux_pane,
@@ -871,25 +1390,39 @@ def create_proxy_server(
         return await _fwd("get_logs", {"lines": lines}, ctx)
 
     @server.tool()
-    async def get_sessions(ctx: Context) -> str:
+    async def get_sessions(ctx: Context, since: int | str | None = None) -> str:
         """List all active agent sessions with status and metadata.
 
         Returns session details including name, hostname, health status,
         tmux pane, tool call count, pending messages, and inbox state.
         Use this to inspect live agents and their current state.
 
+        Parameters
+        ----------
+        since:
+            Optional cursor from a previous call's "cursor" field — also
+            returns every session's events (speech, selections, messages,
+            activity) recorded after it. With several backends the
+            cursor is a composite string; pass it back unchanged.
+
         Returns
         -------
         str
-            JSON with sessions array and count.
+            JSON with sessions array and count (plus "events" and
+            "cursor" when since is given).
         """
-        return await _fwd("get_sessions", {}, ctx)
+        args: dict = {}
+        if since is not None:
+            args["since"] = since
+        return await _fwd("get_sessions", args, ctx)
 
     @server.tool()
     async def get_speech_history(
         ctx: Context,
         lines: int = 30,
         session: str = "self",
+        since: int | None = None,
+        page: int = 0,
     ) -> str:
         """Get speech history (what was said aloud) and selection history.
 
@@ -902,15 +1435,27 @@ def create_proxy_server(
             Number of recent entries to return (default 30).
         session:
             Which session to query: "self" (default), "all", or a session_id.
+        since:
+            Optional cursor from a previous call's "cursor" field — only
+            entries recorded after it are returned.
+        page:
+            Page back through older history, ``lines`` entries per page
+            (0 = most recent). Older pages come from the on-disk archive,
+            so history is available past the in-memory cap. Ignored for
+            session="all".
 
         Returns
         -------
         str
-            JSON with speech and selection history.
+            JSON with speech and selection history, plus a "cursor" and
+            "more" (true when an older page exists).
         """
-        return await _fwd("get_speech_history", {
-            "lines": lines, "session": session,
-        }, ctx)
+        args: dict = {"lines": lines, "session": session}
+        if since is not None:
+            args["since"] = since
+        if page:
+            args["page"] = page
+        return await _fwd("get_speech_history", args, ctx)
 
     @server.tool()
     async def get_current_choices(
@@ -959,11 +1504,13 @@ def run_proxy_server(
     port: int = 8444,
     backend_url: str = DEFAULT_BACKEND,
     foreground: bool = True,
+    backends: list[tuple[str, str]] | None = None,
 ) -> None:
     """Run the MCP proxy server.
 
     Always runs in foreground — daemonization is handled by the parent
-    process via subprocess.Popen with start_new_session=True.
+    process via subprocess.Popen with start_new_session=True. Pass
+    ``backends`` to shard sessions across several backends.
     """
     _write_pid(os.getpid())
 
@@ -973,7 +1520,12 @@ def run_proxy_server(
         _log.setLevel(logging.WARNING)
         _log.handlers = []
 
-    server = create_proxy_server(host=host, port=port, backend_url=backend_url)
+    # Registrations left on disk while no proxy was listening
+    registrations = RegistrationRegistry()
+    registrations.import_dir()
+
+    server = create_proxy_server(host=host, port=port, backend_url=backend_url,
+                                 backends=backends, registrations=registrations)
 
     log.info(f"MCP proxy server starting on {host}:{port}, backend={backend_url}")
     _server_log.info("MCP proxy on %s:%s → backend %s", host, port, backend_url)
@@ -1121,12 +1673,26 @@ def _format_uptime(seconds: float) -> str:
     return f"{d}d {h}h"
 
 
+def _fetch_proxy_stats(host: str, port: int, timeout: float = 2.0) -> dict:
+    """Read the running proxy's /proxy-stats, or {} if unavailable."""
+    try:
+        url = f"http://{host}:{port}/proxy-stats"
+        with urllib.request.urlopen(url, timeout=timeout) as resp:
+            data = json.loads(resp.read().decode())
+        return data if isinstance(data, dict) else {}
+    except Exception:
+        return {}
+
+
 def proxy_health(address: str = "localhost:8444") -> dict:
     """Comprehensive health check for the MCP proxy server.
 
     Performs a multi-level health check:
     1. PID file check (fast — is the process alive?)
     2. TCP port check (verifies the server is actually accepting connections)
+    3. Uptime of the live process
+    4. Backend connection-pool and shard stats from the proxy's
+       /proxy-stats route (only when the port is open)
 
     Args:
         address: Proxy address as "host:port" (default: "localhost:8444").
@@ -1141,6 +1707,10 @@ def proxy_health(address: str = "localhost:8444") -> dict:
         - uptime_seconds: Uptime in seconds (if available)
         - address: The address checked
         - details: Human-readable summary
+        - backend_pool: Per-lane ("blocking"/"fast") pool counters and
+          p50/p95 latency in ms, or None if the proxy didn't report them
+        - shards: For a sharded proxy, failover count and per-backend
+          health, session count and pool stats; otherwise None
     """
     host, port = _parse_address(address)
     result: dict = {
@@ -1152,6 +1722,8 @@ def proxy_health(address: str = "localhost:8444") -> dict:
         "uptime_seconds": None,
         "status": "unhealthy",
         "details": "",
+        "backend_pool": None,
+        "shards": None,
     }
 
     # Step 1: Check PID file
@@ -1175,6 +1747,13 @@ def proxy_health(address: str = "localhost:8444") -> dict:
             result["uptime_seconds"] = round(uptime_secs, 1)
             result["uptime"] = _format_uptime(uptime_secs)
 
+    # Step 4: Pool and shard stats (older proxies without the route report None)
+    if result["port_open"]:
+        stats = _fetch_proxy_stats(host, port)
+        for key in ("backend_pool", "shards"):
+            if isinstance(stats.get(key), dict):
+                result[key] = stats[key]
+
     # Determine overall status
     if result["pid_alive"] and result["port_open"]:
         result["status"] = "healthy"
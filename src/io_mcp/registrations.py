@@ -0,0 +1,207 @@
+"""Agent environment registrations posted by the Start hook.
+
+``agents/start-register.sh`` runs when an agent starts and posts its
+environment (tmux pane, hostname, IPs, cwd, PID) to the proxy's
+``POST /registrations``. When the agent later calls ``register_session``
+the proxy fills whatever the agent left out from the matching record
+before routing the call, so whichever backend shard serves the session
+gets the enriched args, and so does a shard it later fails over to.
+
+Records are indexed by tmux pane and by (hostname, PID), so lookups are
+dictionary hits rather than a directory scan, and they expire after
+``ttl`` seconds. An agent that doesn't know its pane gets the newest
+record nobody has claimed yet, so agents starting together never share
+one.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+# Where older hooks (and the current one, when the proxy is down) leave
+# their registration as pane-{id}.json; imported once at proxy start.
+REG_DIR = "/tmp/io-mcp-registrations"
+
+REGISTRATION_TTL = 12 * 3600.0
+MAX_REGISTRATIONS = 1024
+
+_FIELDS = ("tmux_pane", "tmux_session", "ipv4", "tailscale_hostname", "hostname", "cwd", "pid")
+
+
+def _pane_key(pane: str) -> str:
+    return pane.replace("%", "")
+
+
+class RegistrationRegistry:
+    """Expiring in-memory index of Start hook registrations. Thread-safe."""
+
+    def __init__(self, ttl: float = REGISTRATION_TTL,
+                 max_entries: int = MAX_REGISTRATIONS) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        # id -> record, oldest first; records carry "_at" and "_claimed"
+        self._records: OrderedDict[int, dict] = OrderedDict()
+        self._by_pane: dict[str, int] = {}
+        self._by_pid: dict[tuple[str, int], int] = {}
+        self._next_id = 0
+
+    def add(self, data: dict, now: Optional[float] = None) -> dict:
+        """Index a registration, replacing any earlier one for the same pane."""
+        now = time.time() if now is None else now
+        record = {k: data[k] for k in _FIELDS if data.get(k)}
+        if "pid" in record:
+            try:
+                record["pid"] = int(record["pid"])
+            except (TypeError, ValueError):
+                del record["pid"]
+        with self._lock:
+            self._expire(now)
+            pane = _pane_key(record.get("tmux_pane", ""))
+            if pane and pane in self._by_pane:
+                self._drop(self._by_pane[pane])
+            rid = self._next_id
+            self._next_id += 1
+            self._records[rid] = dict(record, _at=now, _claimed=False)
+            if pane:
+                self._by_pane[pane] = rid
+            if "pid" in record:
+                self._by_pid[(record.get("hostname", ""), record["pid"])] = rid
+            while len(self._records) > self.max_entries:
+                self._drop(next(iter(self._records)))
+        return record
+
+    def lookup(self, tmux_pane: str = "", hostname: str = "", pid: int = 0,
+               claim_newest: bool = True,
+               now: Optional[float] = None) -> Optional[dict]:
+        """The registration for an agent, claiming it; None if there is none.
+
+        Tries the pane, then (hostname, pid), then — only with
+        ``claim_newest``, i.e. for a session registering for the first
+        time — the newest unclaimed record (from ``hostname`` when given).
+        A pane that is known to the agent but not registered gets nothing
+        — it is some other terminal's.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            self._expire(now)
+            rid = None
+            if tmux_pane:
+                rid = self._by_pane.get(_pane_key(tmux_pane))
+            else:
+                if pid:
+                    rid = self._by_pid.get((hostname, pid))
+                if rid is None and claim_newest:
+                    rid = self._newest_unclaimed(hostname)
+            if rid is None:
+                return None
+            record = self._records[rid]
+            record["_claimed"] = True
+            return {k: v for k, v in record.items() if not k.startswith("_")}
+
+    def import_dir(self, path: str = REG_DIR, now: Optional[float] = None) -> int:
+        """Index unexpired ``pane-*.json`` files from ``path`` and delete them all."""
+        now = time.time() if now is None else now
+        try:
+            names = sorted(os.listdir(path))
+        except OSError:
+            return 0
+        imported = 0
+        for name in names:
+            if not (name.startswith("pane-") and name.endswith(".json")):
+                continue
+            fpath = os.path.join(path, name)
+            try:
+                mtime = os.path.getmtime(fpath)
+                if now - mtime <= self.ttl:
+                    with open(fpath) as f:
+                        self.add(json.load(f), now=mtime)
+                    imported += 1
+                os.unlink(fpath)
+            except (OSError, ValueError):
+                continue
+        return imported
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "registrations": len(self._records),
+                "unclaimed": sum(1 for r in self._records.values() if not r["_claimed"]),
+            }
+
+    # ── internals (lock held) ───────────────────────────────────────
+
+    def _newest_unclaimed(self, hostname: str) -> Optional[int]:
+        for rid in reversed(self._records):
+            record = self._records[rid]
+            if record["_claimed"]:
+                continue
+            if hostname and record.get("hostname", hostname) != hostname \
+                    and record.get("tailscale_hostname") != hostname:
+                continue
+            return rid
+        return None
+
+    def _expire(self, now: float) -> None:
+        while self._records:
+            rid, record = next(iter(self._records.items()))
+            if now - record["_at"] <= self.ttl:
+                break
+            self._drop(rid)
+
+    def _drop(self, rid: int) -> None:
+        record = self._records.pop(rid)
+        pane = _pane_key(record.get("tmux_pane", ""))
+        if pane and self._by_pane.get(pane) == rid:
+            del self._by_pane[pane]
+        key = (record.get("hostname", ""), record.get("pid", 0))
+        if self._by_pid.get(key) == rid:
+            del self._by_pid[key]
+
+
+def apply_registration(args: dict, record: dict) -> dict:
+    """``register_session`` args with blanks filled from ``record``.
+
+    Values the agent passed win. IPs and the Tailscale name go into
+    ``metadata``.
+    """
+    args = dict(args)
+    for field in ("tmux_pane", "tmux_session", "cwd"):
+        if not args.get(field) and record.get(field):
+            args[field] = record[field]
+    if not args.get("hostname"):
+        hostname = record.get("tailscale_hostname") or record.get("hostname")
+        if hostname:
+            args["hostname"] = hostname
+    metadata = dict(args.get("metadata") or {})
+    for field in ("ipv4", "tailscale_hostname"):
+        if record.get(field):
+            metadata[field] = record[field]
+    args["metadata"] = metadata
+    return args
+
+
+def enrich_registration(registry: RegistrationRegistry, args: dict,
+                        previous: Optional[dict] = None) -> dict:
+    """``register_session`` args enriched from the agent's Start hook record.
+
+    ``previous`` is the session's last (enriched) registration, if any: a
+    re-registering session keeps the pane it was given and never claims
+    some other agent's unclaimed record.
+    """
+    hostname = args.get("hostname", "")
+    if hostname == "localhost" or hostname.endswith(".local"):
+        hostname = ""  # not what the hook reports; don't filter on it
+    try:
+        pid = int((args.get("metadata") or {}).get("pid") or 0)
+    except (TypeError, ValueError):
+        pid = 0
+    pane = args.get("tmux_pane") or (previous or {}).get("tmux_pane", "")
+    record = registry.lookup(pane, hostname=hostname, pid=pid,
+                             claim_newest=previous is None)
+    return apply_registration(args, record) if record else args
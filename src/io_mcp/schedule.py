@@ -0,0 +1,9 @@
+"""Inbox scheduling policy names.
+
+Kept apart from session.py so config validation can name the policies
+without importing the session machinery (and the archive) behind them.
+"""
+
+# Orderings for pending choices across sessions (config.session.inboxSchedule).
+# "tabs" keeps the plain tab-order walk; the others rank by agent idle time.
+SCHEDULE_POLICIES = ("tabs", "longest-blocked", "age-priority", "shortest-answer")
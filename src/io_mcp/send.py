@@ -14,9 +14,12 @@ Usage:
 Options:
     --host HOST       io-mcp host (default: 127.0.0.1)
     --port PORT       Backend port (default: 8446)
+    --socket PATH     Backend Unix socket (default: /tmp/io-mcp-backend-PORT.sock)
+    --tcp             Always use TCP, even when a local socket is available
     -s, --session ID  Session ID (default: cli-sender)
 
-Uses the backend REST endpoints on port 8446. Sessions auto-create
+Uses the backend REST endpoints on port 8446 — over the backend's Unix
+socket when it is live and the host is local. Sessions auto-create
 on first use — no registration needed.
 """
 
@@ -28,11 +31,25 @@ import sys
 import urllib.request
 import urllib.error
 
+from .transport import UNIX_PREFIX, backend_socket, local_base, unix_request
+
 
 def _post(base: str, path: str, body: dict, timeout: int = 300) -> str:
     """POST to the backend REST API. Returns raw response text."""
-    url = f"{base}{path}"
     data = json.dumps(body).encode()
+    if base.startswith(UNIX_PREFIX):
+        try:
+            status, raw = unix_request(base, path, "POST", data,
+                                       {"Content-Type": "application/json"}, timeout)
+        except OSError:
+            print(f"Error: cannot connect to io-mcp at {base}", file=sys.stderr)
+            print(f"  Is io-mcp running? Start it with: io-mcp", file=sys.stderr)
+            sys.exit(1)
+        if status >= 400:
+            print(f"Error: {status} {raw.decode()}", file=sys.stderr)
+            sys.exit(1)
+        return raw.decode()
+    url = f"{base}{path}"
     req = urllib.request.Request(
         url, data=data,
         headers={"Content-Type": "application/json"},
@@ -64,6 +81,15 @@ def main() -> None:
         "--port", type=int, default=8446,
         help="Backend port (default: 8446)",
     )
+    parser.add_argument(
+        "--socket", default=None, metavar="PATH",
+        help="Backend Unix socket (default: /tmp/io-mcp-backend-PORT.sock, "
+             "used when live and the host is local)",
+    )
+    parser.add_argument(
+        "--tcp", action="store_true",
+        help="Always use TCP, even when a local socket is available",
+    )
     parser.add_argument(
         "-s", "--session", default="cli-sender",
         help="Session ID (default: cli-sender)",
@@ -88,7 +114,8 @@ def main() -> None:
     sub.add_parser("inbox", help="Check for queued user messages")
 
     args = parser.parse_args()
-    base = f"http://{args.host}:{args.port}"
+    socket_path = None if args.tcp else (args.socket or backend_socket(args.port))
+    base = local_base(args.host, args.port, socket_path)
 
     if args.command in ("speak", "speak-async"):
         text = " ".join(args.text) if args.text else ""
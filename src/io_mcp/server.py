@@ -81,6 +81,11 @@ class Frontend(Protocol):
         """Show choices with checkboxes. Returns list of selected items."""
         ...
 
+    def present_choices_batch(self, session: Any,
+                              questions: list[tuple[str, list[dict]]]) -> list[dict]:
+        """Show several choice sets back-to-back. Returns one selection dict per set."""
+        ...
+
     def session_speak(self, session: Any, text: str, block: bool = True,
                       priority: int = 0, emotion: str = "") -> None:
         """Speak text for a session."""
@@ -12,11 +12,18 @@ playing speech in sequence.
 
 from __future__ import annotations
 
+import asyncio
+import bisect
 import collections
+import os
 import threading
 import time
+import uuid
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Callable, Optional
+
+from .archive import ARCHIVE_PRUNE_INTERVAL, SessionArchive, prune_archives
+from .schedule import SCHEDULE_POLICIES
 
 
 @dataclass
@@ -45,12 +52,72 @@ class FlushedMessage:
     flushed_at: float = field(default_factory=time.time)
 
 
+class InboxEvent(threading.Event):
+    """threading.Event that asyncio code can await without a parked thread.
+
+    ``set()`` also runs registered callbacks (on the setting thread), which
+    ``wait_async`` uses to resolve a future on the waiter's event loop. So
+    an async backend can hold hundreds of pending choice prompts as plain
+    futures while TUI threads keep calling ``set()`` as before.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._callbacks: list[Callable[[], None]] = []
+        self._callbacks_lock = threading.Lock()
+
+    def set(self) -> None:
+        super().set()
+        with self._callbacks_lock:
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                pass  # a closed waiter loop must not break the setter
+
+    def add_callback(self, callback: Callable[[], None]) -> None:
+        """Run ``callback`` once when the event is set (now, if it already is)."""
+        with self._callbacks_lock:
+            if not self.is_set():
+                self._callbacks.append(callback)
+                return
+        callback()
+
+    def remove_callback(self, callback: Callable[[], None]) -> None:
+        with self._callbacks_lock:
+            try:
+                self._callbacks.remove(callback)
+            except ValueError:
+                pass
+
+    async def wait_async(self, timeout: Optional[float] = None) -> bool:
+        """Await the event; returns its state, like ``wait()``."""
+        if self.is_set():
+            return True
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def _wake() -> None:
+            loop.call_soon_threadsafe(
+                lambda: future.done() or future.set_result(True))
+
+        self.add_callback(_wake)
+        try:
+            await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            self.remove_callback(_wake)
+        return self.is_set()
+
+
 @dataclass
 class InboxItem:
     """A queued tool call waiting for TUI display/response.
 
     Each present_choices call creates one InboxItem with its own
-    threading.Event, so the calling thread can block independently.
+    InboxEvent, so the caller can block (or await) independently.
     Speech calls also create InboxItems but resolve immediately
     after playback.
     """
@@ -64,15 +131,394 @@ class InboxItem:
     priority: int = 0
     # Resolution
     result: Optional[dict] = None
-    event: threading.Event = field(default_factory=threading.Event)
+    event: InboxEvent = field(default_factory=InboxEvent)
     timestamp: float = field(default_factory=time.time)
+    presented_at: float = 0.0  # when the TUI showed it (0 = never presented)
     done: bool = False
     # Processing guard — prevents multiple drain workers from activating the same item
     processing: bool = False
+    # Idempotency key of the proxied call that created it ("" if unkeyed)
+    call_key: str = ""
     # Thread tracking — used to detect orphaned items when the HTTP thread dies
     owner_thread: Optional[threading.Thread] = field(default_factory=lambda: threading.current_thread())
 
 
+class TokenBucket:
+    """Token-bucket rate limiter: ``rate`` tokens/second, at most ``burst`` held.
+
+    Starts full, so a quiet caller can always make ``burst`` calls in a row.
+    """
+
+    __slots__ = ("rate", "burst", "tokens", "updated")
+
+    def __init__(self, rate: float, burst: int, now: Optional[float] = None) -> None:
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.updated = time.time() if now is None else now
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def take(self, now: Optional[float] = None) -> bool:
+        """Spend a token if one is available."""
+        self._refill(time.time() if now is None else now)
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return True
+        return False
+
+    def retry_after(self, now: Optional[float] = None) -> float:
+        """Seconds until the next token is available (0 if one is now)."""
+        self._refill(time.time() if now is None else now)
+        if self.tokens >= 1.0 or self.rate <= 0:
+            return 0.0
+        return (1.0 - self.tokens) / self.rate
+
+
+def _archive_record(obj: object) -> dict:
+    """JSON record for a history entry being spilled to the archive."""
+    if isinstance(obj, dict):  # activity log entry
+        return dict(obj)
+    if isinstance(obj, InboxItem):
+        return {
+            "kind": obj.kind,
+            "preamble": obj.preamble,
+            "choices": [{"label": c.get("label", ""), "summary": c.get("summary", "")}
+                        for c in obj.choices],
+            "text": obj.text,
+            "result": obj.result,
+            "timestamp": obj.timestamp,
+        }
+    # SpeechEntry / HistoryEntry
+    return dict(obj.__dict__)
+
+
+@dataclass
+class TimelineEvent:
+    """One entry in a session's timeline index.
+
+    ``ref`` is the source object itself (a SpeechEntry, HistoryEntry,
+    InboxItem, FlushedMessage or activity dict), so later mutations such
+    as an inbox item being resolved are visible without re-indexing.
+    """
+    seq: int            # monotonically increasing cursor (ingest order)
+    kind: str           # "speech" | "selection" | "choices" | "user_msg" | "activity"
+    timestamp: float
+    ref: object
+    session_id: str = ""
+
+    def to_dict(self) -> dict:
+        """JSON-safe summary for tool results and the HTTP API."""
+        d: dict = {"seq": self.seq, "kind": self.kind, "time": self.timestamp,
+                   "session_id": self.session_id}
+        ref = self.ref
+        if self.kind in ("speech", "user_msg"):
+            d["text"] = ref.text[:300]
+        elif self.kind == "selection":
+            d["preamble"] = (ref.preamble or "")[:200]
+            d["selected"] = (ref.label or "")[:200]
+        elif self.kind == "choices":
+            d["preamble"] = (ref.preamble or "")[:200]
+            d["selected"] = (ref.result or {}).get("selected", "")[:200]
+        elif self.kind == "activity":
+            d["tool"] = ref.get("tool", "")
+            d["detail"] = ref.get("detail", "")[:200]
+            d["activity_kind"] = ref.get("kind", "tool")
+        return d
+
+
+class EventStore:
+    """Global append-only event log shared by all sessions.
+
+    Session timelines write every event they index here, so one store
+    holds all agents' history in a single sequence. ``seq`` is assigned
+    under the store lock, making it a global cursor: ``since(cursor)``
+    returns everything recorded after a previous read in O(log n + new)
+    rather than re-merging every session's lists. Per-session secondary
+    indexes serve ``since(cursor, session_id=...)`` the same way.
+
+    Timelines ingest lazily on sync, so ``seq`` is index order, not
+    strictly wall-clock order — readers that need chronology sort by
+    ``timestamp``; readers that need "what's new" use ``seq``.
+
+    Events only leave the store by age (``max_events``) or when a session
+    is forgotten or an event discarded; the latter two bump ``epoch`` so
+    cursor-based readers know to do a full re-read.
+    """
+
+    def __init__(self, max_events: int = 10000) -> None:
+        self.max_events = max_events
+        self.epoch: int = 0
+        self._events: list[TimelineEvent] = []          # seq order
+        self._by_session: dict[str, list[TimelineEvent]] = {}
+        self._seq: int = 0
+        self._lock = threading.Lock()
+
+    @property
+    def cursor(self) -> int:
+        """Sequence number of the most recent event (0 if none)."""
+        return self._seq
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def add(self, session_id: str, kind: str, timestamp: float, ref: object) -> TimelineEvent:
+        """Record a new event and return it with its global ``seq``."""
+        with self._lock:
+            self._seq += 1
+            event = TimelineEvent(seq=self._seq, kind=kind, timestamp=timestamp,
+                                  ref=ref, session_id=session_id)
+            self._events.append(event)
+            self._by_session.setdefault(session_id, []).append(event)
+            overflow = len(self._events) - self.max_events
+            if overflow > 0:
+                # Trim in chunks so the front-delete cost is amortised
+                overflow = max(overflow, self.max_events // 10)
+                del self._events[:overflow]
+                oldest = self._events[0].seq if self._events else self._seq + 1
+                for sid, lst in list(self._by_session.items()):
+                    cut = bisect.bisect_left(lst, oldest, key=lambda e: e.seq)
+                    if cut:
+                        del lst[:cut]
+                    if not lst:
+                        del self._by_session[sid]
+            return event
+
+    def forget(self, session_id: str) -> None:
+        """Drop all events for a session (session removed or re-indexed)."""
+        with self._lock:
+            if self._by_session.pop(session_id, None) is None:
+                return
+            self._events = [e for e in self._events if e.session_id != session_id]
+            self.epoch += 1
+
+    def discard(self, ref: object) -> None:
+        """Drop the event for a single source object."""
+        with self._lock:
+            for i in range(len(self._events) - 1, -1, -1):
+                ev = self._events[i]
+                if ev.ref is ref:
+                    del self._events[i]
+                    lst = self._by_session.get(ev.session_id, [])
+                    if ev in lst:
+                        lst.remove(ev)
+                    self.epoch += 1
+                    return
+
+    def since(self, cursor: int, session_id: str | None = None,
+              kinds: tuple[str, ...] | None = None,
+              limit: int | None = None) -> list[TimelineEvent]:
+        """Events recorded after ``cursor``, in seq order.
+
+        With ``limit``, only the oldest ``limit`` matching events are
+        returned, so a reader can page forward by re-querying with the
+        last returned ``seq``.
+        """
+        with self._lock:
+            lst = self._events if session_id is None else self._by_session.get(session_id, [])
+            start = bisect.bisect_right(lst, cursor, key=lambda e: e.seq)
+            out = []
+            for e in lst[start:]:
+                if kinds is None or e.kind in kinds:
+                    out.append(e)
+                    if limit is not None and len(out) >= limit:
+                        break
+            return out
+
+    def latest(self, n: int, session_id: str | None = None,
+               kinds: tuple[str, ...] | None = None) -> list[TimelineEvent]:
+        """The ``n`` most recently recorded matching events, oldest first."""
+        if n <= 0:
+            return []
+        with self._lock:
+            lst = self._events if session_id is None else self._by_session.get(session_id, [])
+            out: list[TimelineEvent] = []
+            for e in reversed(lst):
+                if kinds is None or e.kind in kinds:
+                    out.append(e)
+                    if len(out) >= n:
+                        break
+            out.reverse()
+            return out
+
+
+class SessionTimeline:
+    """Timestamp-ordered event index over a session's history lists.
+
+    The session's public lists (``speech_log``, ``history``, ``inbox_done``,
+    ``flushed_messages``, ``activity_log``) remain the source of truth and
+    are appended to directly. ``sync()`` catches the index up by ingesting
+    only the items appended since the last sync — each source remembers the
+    last object it indexed, so a sync with nothing new is O(1) per source
+    and new items are inserted in O(log n). If a source list is replaced or
+    trimmed past the last indexed item, the index is rebuilt from scratch.
+
+    Events get a monotonically increasing ``seq`` at ingest time, which
+    readers use as a cursor: ``since(cursor)`` returns only events indexed
+    after that cursor. The index is capped at ``max_events`` (oldest by
+    timestamp dropped first).
+    """
+
+    # (session attribute, event kind, timestamp getter, filter)
+    _SOURCES = (
+        ("speech_log", "speech", lambda e: e.timestamp, None),
+        ("history", "selection", lambda e: e.timestamp, None),
+        ("inbox_done", "choices", lambda e: e.timestamp, lambda e: e.kind == "choices"),
+        ("flushed_messages", "user_msg", lambda e: e.flushed_at, None),
+        ("activity_log", "activity", lambda e: e.get("timestamp", 0.0), None),
+    )
+
+    def __init__(self, max_events: int = 1000) -> None:
+        self.max_events = max_events
+        self._events: list[TimelineEvent] = []
+        self._keys: list[tuple[float, int]] = []  # parallel (timestamp, seq) sort keys
+        self._seq: int = 0
+        # attr -> (source list object, last ingested item)
+        self._sources: dict[str, tuple[list, object]] = {}
+        self._lock = threading.Lock()
+        # Global store this timeline feeds (set by SessionManager)
+        self.store: Optional[EventStore] = None
+        self.session_id: str = ""
+
+    def attach(self, store: EventStore, session_id: str) -> None:
+        """Feed this timeline's events into a global EventStore.
+
+        Seqs are then drawn from the store, so per-session and global
+        cursors share one number space. Anything already indexed is
+        re-ingested on the next sync so the store sees it too.
+        """
+        with self._lock:
+            self.store = store
+            self.session_id = session_id
+            self._events.clear()
+            self._keys.clear()
+            self._sources.clear()
+
+    @property
+    def cursor(self) -> int:
+        """Sequence number of the most recently indexed event (0 if none)."""
+        return self._seq
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def _insert(self, kind: str, timestamp: float, ref: object) -> None:
+        if self.store is not None:
+            event = self.store.add(self.session_id, kind, timestamp, ref)
+            self._seq = event.seq
+        else:
+            self._seq += 1
+            event = TimelineEvent(seq=self._seq, kind=kind, timestamp=timestamp, ref=ref)
+        key = (timestamp, self._seq)
+        if not self._keys or key >= self._keys[-1]:
+            # Common case: new events are the newest
+            self._keys.append(key)
+            self._events.append(event)
+        else:
+            idx = bisect.bisect_right(self._keys, key)
+            self._keys.insert(idx, key)
+            self._events.insert(idx, event)
+
+    def _rebuild(self, session: "Session") -> None:
+        self._events.clear()
+        self._keys.clear()
+        self._sources.clear()
+        if self.store is not None:
+            self.store.forget(self.session_id)
+        for attr, kind, ts_fn, keep in self._SOURCES:
+            items = list(getattr(session, attr, ()))
+            for obj in items:
+                if keep is None or keep(obj):
+                    self._insert(kind, ts_fn(obj), obj)
+            self._sources[attr] = (getattr(session, attr, None), items[-1] if items else None)
+
+    def sync(self, session: "Session") -> None:
+        """Ingest items appended to the session's source lists since the last sync."""
+        with self._lock:
+            for attr, kind, ts_fn, keep in self._SOURCES:
+                lst = getattr(session, attr, None)
+                if lst is None:
+                    continue
+                tracked, last = self._sources.get(attr, (None, None))
+                if tracked is not lst and tracked is not None:
+                    self._rebuild(session)
+                    break
+                if not lst:
+                    if last is not None:
+                        # Cleared in place — drop stale events
+                        self._rebuild(session)
+                        break
+                    self._sources[attr] = (lst, None)
+                    continue
+                if lst[-1] is last:
+                    continue  # nothing new
+                # Walk back to the last indexed item; everything after it is new
+                start = 0
+                if last is not None:
+                    for i in range(len(lst) - 2, -1, -1):
+                        if lst[i] is last:
+                            start = i + 1
+                            break
+                    else:
+                        self._rebuild(session)
+                        break
+                new_items = lst[start:]
+                for obj in new_items:
+                    if keep is None or keep(obj):
+                        self._insert(kind, ts_fn(obj), obj)
+                self._sources[attr] = (lst, new_items[-1])
+
+            overflow = len(self._events) - self.max_events
+            if overflow > 0:
+                del self._events[:overflow]
+                del self._keys[:overflow]
+
+    def discard(self, ref: object) -> None:
+        """Remove the event for a source object removed mid-list (e.g. on undo)."""
+        with self._lock:
+            for i in range(len(self._events) - 1, -1, -1):
+                if self._events[i].ref is ref:
+                    del self._events[i]
+                    del self._keys[i]
+                    break
+            if self.store is not None:
+                self.store.discard(ref)
+
+    def since(self, cursor: int, kinds: tuple[str, ...] | None = None) -> list[TimelineEvent]:
+        """Events indexed after ``cursor``, in timestamp order."""
+        with self._lock:
+            return [e for e in self._events
+                    if e.seq > cursor and (kinds is None or e.kind in kinds)]
+
+    def latest(self, n: int, kinds: tuple[str, ...] | None = None,
+               where: Optional[Callable[[TimelineEvent], bool]] = None) -> list[TimelineEvent]:
+        """The ``n`` most recent matching events (by timestamp), oldest first."""
+        if n <= 0:
+            return []
+        with self._lock:
+            if kinds is None and where is None:
+                return self._events[-n:]
+            out: list[TimelineEvent] = []
+            for e in reversed(self._events):
+                if (kinds is None or e.kind in kinds) and (where is None or where(e)):
+                    out.append(e)
+                    if len(out) >= n:
+                        break
+            out.reverse()
+            return out
+
+    def between(self, start: float, end: float,
+                kinds: tuple[str, ...] | None = None) -> list[TimelineEvent]:
+        """Events with ``start <= timestamp < end``, oldest first."""
+        with self._lock:
+            lo = bisect.bisect_left(self._keys, (start, 0))
+            hi = bisect.bisect_left(self._keys, (end, 0))
+            return [e for e in self._events[lo:hi]
+                    if kinds is None or e.kind in kinds]
+
+
 @dataclass
 class Session:
     """State for one MCP client session (one tab)."""
@@ -98,7 +544,7 @@ class Session:
 
     # ── Speech inbox ──────────────────────────────────────────────
     speech_log: list[SpeechEntry] = field(default_factory=list)
-    _speech_log_max: int = 200  # cap to prevent unbounded growth
+    _speech_log_max: int = 100  # in-memory cap; overflow spills to the archive
     unplayed_speech: list[SpeechEntry] = field(default_factory=list)
 
     # ── UI state (saved/restored on tab switch) ───────────────────
@@ -125,7 +571,7 @@ class Session:
 
     # ── Activity log (timestamped feed of agent actions) ──────────
     activity_log: list[dict] = field(default_factory=list)
-    _activity_log_max: int = 50  # cap to prevent unbounded growth
+    _activity_log_max: int = 50  # in-memory cap; overflow spills to the archive
 
     # ── Achievements ──────────────────────────────────────────────
     achievements_unlocked: set = field(default_factory=set)
@@ -150,7 +596,7 @@ class Session:
 
     # ── Selection history ─────────────────────────────────────────
     history: list[HistoryEntry] = field(default_factory=list)
-    _history_max: int = 200  # cap to prevent unbounded growth
+    _history_max: int = 100  # in-memory cap; overflow spills to the archive
 
     # ── Undo support ──────────────────────────────────────────────
     last_preamble: str = ""                  # previous present_choices preamble
@@ -210,17 +656,39 @@ class Session:
     # ── Tool call inbox (queued choices/speech for TUI display) ──
     inbox: collections.deque = field(default_factory=collections.deque)
     inbox_done: list[InboxItem] = field(default_factory=list)
-    _inbox_done_max: int = 50  # cap to prevent unbounded growth
+    _inbox_done_max: int = 50  # in-memory cap; overflow spills to the archive
     # Generation counter — bumped on every inbox mutation so the TUI can
     # skip redundant _update_inbox_list() rebuilds.
     _inbox_generation: int = 0
     # Kicked after resolving an inbox item so waiting threads wake immediately
     drain_kick: threading.Event = field(default_factory=threading.Event)
 
+    # ── Blocked-time accounting (for inbox scheduling) ────────────
+    # Seconds agents spent blocked on choice items that have resolved
+    blocked_seconds: float = 0.0
+    # How long the user took to answer recent choices, presentation to answer
+    response_times: collections.deque = field(
+        default_factory=lambda: collections.deque(maxlen=20))
+
+    # ── Admission control (per-session rate limits, see admit()) ──
+    _rate_buckets: dict = field(default_factory=dict, repr=False)
+    throttled_calls: int = 0                 # tool calls that were rate limited
+
+    # ── Timeline index (merged view over the history lists above) ──
+    _timeline: SessionTimeline = field(default_factory=SessionTimeline, repr=False)
+
+    # ── On-disk archive for entries trimmed from the lists above ──
+    archive: Optional[SessionArchive] = field(default=None, repr=False)
+
+    # ── Change listener (set by SessionManager; see _changed()) ───
+    on_change: Optional[Callable[["Session", str], None]] = field(
+        default=None, repr=False, compare=False)
+
     # ── Agent health monitoring ───────────────────────────────────
     health_status: str = "healthy"           # "healthy", "warning", "unresponsive"
     health_alert_spoken: bool = False        # True once we've spoken the warning alert
     health_last_check: float = 0.0          # timestamp of last health evaluation
+    pane_dead: Optional[bool] = None         # tmux pane verdict from the last health pass (None = not probed)
 
     # ── Waiting-state TTS announcement ─────────────────────────────
     _waiting_announced: bool = False         # True once we've spoken the waiting-state shortcut hints
@@ -239,19 +707,73 @@ class Session:
         """Update the last_activity timestamp."""
         self.last_activity = time.time()
 
+    def _changed(self, what: str) -> None:
+        """Tell the listener what changed: ``inbox``, ``speech``, ``activity``
+        or ``messages``. Runs on the mutating thread, so listeners must only
+        record the change (the TUI marks regions dirty)."""
+        listener = self.on_change
+        if listener is not None:
+            try:
+                listener(self, what)
+            except Exception:
+                pass
+
+    @property
+    def events(self) -> SessionTimeline:
+        """The session's timeline index, caught up with all history lists."""
+        self._timeline.sync(self)
+        return self._timeline
+
     def append_speech(self, entry: SpeechEntry) -> None:
-        """Append a speech entry and trim if over the cap."""
+        """Append a speech entry and trim (spilling to the archive) if over the cap."""
         self.speech_log.append(entry)
         overflow = len(self.speech_log) - self._speech_log_max
         if overflow > 0:
-            self.speech_log = self.speech_log[overflow:]
+            self._spill("speech", self.speech_log[:overflow])
+            del self.speech_log[:overflow]
+        self._changed("speech")
 
     def append_history(self, entry: HistoryEntry) -> None:
-        """Append a history entry and trim if over the cap."""
+        """Append a history entry and trim (spilling to the archive) if over the cap."""
         self.history.append(entry)
         overflow = len(self.history) - self._history_max
         if overflow > 0:
-            self.history = self.history[overflow:]
+            self._spill("history", self.history[:overflow])
+            del self.history[:overflow]
+
+    def _spill(self, stream: str, entries: list) -> None:
+        """Write entries about to be trimmed to the on-disk archive."""
+        if self.archive is not None:
+            self.archive.extend(stream, [_archive_record(e) for e in entries])
+
+    _ARCHIVE_STREAMS = {
+        "speech": "speech_log",
+        "history": "history",
+        "done": "inbox_done",
+        "activity": "activity_log",
+    }
+
+    def page_history(self, stream: str, skip: int = 0,
+                     limit: int = 50) -> tuple[list[dict], int]:
+        """Page back through a history stream, memory first, then the archive.
+
+        ``stream`` is "speech", "history", "done" or "activity". Skips the
+        ``skip`` newest entries and returns up to ``limit`` entries before
+        them, oldest first, as archive-style dicts — plus the stream's total
+        length (archived + in memory) so callers know when to stop.
+        """
+        live = getattr(self, self._ARCHIVE_STREAMS[stream])
+        archived = self.archive.count(stream) if self.archive is not None else 0
+        total = archived + len(live)
+        end = max(0, total - skip)
+        start = max(0, end - limit)
+        records: list[dict] = []
+        if start < archived:
+            records = self.archive.read(stream, start, min(end, archived))
+        if end > archived:
+            records.extend(_archive_record(e)
+                           for e in live[max(0, start - archived):end - archived])
+        return records, total
 
     @property
     def mood(self) -> str:
@@ -358,12 +880,75 @@ class Session:
         # Trim from the front when over the cap
         overflow = len(self.activity_log) - self._activity_log_max
         if overflow > 0:
-            self.activity_log = self.activity_log[overflow:]
+            self._spill("activity", self.activity_log[:overflow])
+            del self.activity_log[:overflow]
+        self._changed("activity")
+
+    def supersede_status(self, detail: str) -> bool:
+        """Replace the latest activity entry if it is a status line.
+
+        Used when status reports are rate limited: the newest status wins
+        and the one it supersedes is dropped rather than piling up.
+        Returns False if the latest entry isn't a status line.
+        """
+        if not self.activity_log:
+            return False
+        last = self.activity_log[-1]
+        if last.get("kind") != "status" or last.get("tool") != "report_status":
+            return False
+        last["detail"] = detail
+        self._changed("activity")
+        return True
+
+    def admit(self, kind: str, per_minute: float, burst: int,
+              now: Optional[float] = None) -> bool:
+        """Take a token from this session's ``kind`` bucket (speech, choices, ...).
+
+        The bucket is rebuilt when the configured limit changes. Returns
+        False when the session is over its limit.
+        """
+        rate = per_minute / 60.0
+        bucket = self._rate_buckets.get(kind)
+        if bucket is None or bucket.rate != rate or bucket.burst != max(1, burst):
+            bucket = self._rate_buckets[kind] = TokenBucket(rate, burst, now)
+        if bucket.take(now):
+            return True
+        self.throttled_calls += 1
+        return False
+
+    def retry_after(self, kind: str, now: Optional[float] = None) -> float:
+        """Seconds until ``admit(kind, ...)`` would next succeed."""
+        bucket = self._rate_buckets.get(kind)
+        return bucket.retry_after(now) if bucket else 0.0
+
+    def coalesce_speech(self, text: str, max_chars: int) -> tuple[Optional[InboxItem], bool]:
+        """Merge ``text`` into the newest queued, not-yet-playing speech item.
+
+        Only items behind the inbox front are considered — the drain
+        worker only ever takes the front, so a merge can't race playback.
+        Returns ``(item, True)`` when merged, ``(item, False)`` when the
+        merged text would exceed ``max_chars`` (the caller drops ``text``),
+        and ``(None, False)`` when there is nothing to merge into.
+        """
+        with self._inbox_lock:
+            if len(self.inbox) < 2:
+                return None, False
+            item = self.inbox[-1]
+            if item.kind != "speech" or item.done or item.processing or item.priority:
+                return None, False
+            merged = f"{item.text} {text}".strip()
+            if len(merged) > max_chars:
+                return item, False
+            item.text = item.preamble = merged
+            self._inbox_generation += 1
+        self._changed("inbox")
+        return item, True
 
     def enqueue(self, item: InboxItem) -> None:
         """Add an item to the inbox queue."""
         self.inbox.append(item)
         self._inbox_generation += 1
+        self._changed("inbox")
 
     def enqueue_speech(self, text: str, blocking: bool = True,
                        priority: int = 0) -> InboxItem:
@@ -391,8 +976,23 @@ class Session:
             self.inbox.append(item)
         self._inbox_generation += 1
         self.drain_kick.set()
+        self._changed("inbox")
         return item
 
+    def enqueue_batch(self, items: list[InboxItem]) -> None:
+        """Enqueue several items contiguously (nothing can interleave)."""
+        with self._inbox_lock:
+            self.inbox.extend(items)
+            self._inbox_generation += 1
+        self._changed("inbox")
+
+    def enqueue_front(self, item: InboxItem) -> None:
+        """Put an item at the front of the inbox (re-present after undo)."""
+        with self._inbox_lock:
+            self.inbox.appendleft(item)
+            self._inbox_generation += 1
+        self._changed("inbox")
+
     def dedup_and_enqueue(self, item: InboxItem) -> "bool | InboxItem":
         """Atomically check for duplicates and enqueue a choices item.
 
@@ -401,6 +1001,9 @@ class Session:
            already exists, return it so the caller can piggyback — wait on
            the existing item's event and return its result.  This prevents
            MCP client retries from cancelling/re-creating inbox items.
+           Skipped for items with a ``call_key``: their retries are caught
+           by the backend's idempotency ledger, so an identical question
+           asked again is a real second question.
         2. Otherwise enqueue normally.
 
         Returns:
@@ -412,7 +1015,7 @@ class Session:
 
         with self._inbox_lock:
             # ── Piggyback on existing pending item with identical content ──
-            for existing in list(self.inbox):
+            for existing in ([] if item.call_key else list(self.inbox)):
                 if existing.done:
                     continue
                 existing_key = (
@@ -428,7 +1031,8 @@ class Session:
             self.inbox.append(item)
             self._inbox_generation += 1
 
-            return True
+        self._changed("inbox")
+        return True
 
     def _append_done(self, item: InboxItem) -> None:
         """Move an item to inbox_done, skipping _restart items and capping size.
@@ -438,10 +1042,14 @@ class Session:
         memory.  We drop them entirely.
 
         Also trims ``inbox_done`` to ``_inbox_done_max`` to prevent unbounded
-        growth that degrades TUI performance.
+        growth that degrades TUI performance; trimmed items go to the archive.
         """
-        # Skip items that were never really presented to the user
         result = item.result or {}
+        if item.kind == "choices":
+            self._record_wait(item, result)
+        self._changed("inbox")  # it has left the inbox either way
+
+        # Skip items that were never really presented to the user
         if result.get("selected") == "_restart":
             return
 
@@ -451,8 +1059,39 @@ class Session:
         # Trim from the front when over the cap
         overflow = len(self.inbox_done) - self._inbox_done_max
         if overflow > 0:
+            self._spill("done", self.inbox_done[:overflow])
             del self.inbox_done[:overflow]
 
+    def _record_wait(self, item: InboxItem, result: dict) -> None:
+        """Account a resolved choice item's wait in the blocked-time stats.
+
+        Every resolution counts towards ``blocked_seconds`` (the agent was
+        blocked either way); only real user answers feed ``response_times``.
+        """
+        now = time.time()
+        self.blocked_seconds += max(0.0, now - item.timestamp)
+        selected = str(result.get("selected", ""))
+        if item.presented_at and selected and not selected.startswith("_") \
+                and selected not in ("error", "timeout"):
+            self.response_times.append(max(0.0, now - item.presented_at))
+
+    def pending_choices(self) -> list[InboxItem]:
+        """Unresolved choice items in the inbox, oldest first."""
+        return [item for item in self.inbox if item.kind == "choices" and not item.done]
+
+    def blocked_seconds_total(self, now: Optional[float] = None) -> float:
+        """Cumulative agent blocked-seconds, including still-pending items."""
+        now = time.time() if now is None else now
+        return self.blocked_seconds + sum(
+            max(0.0, now - item.timestamp) for item in self.pending_choices())
+
+    def expected_answer_seconds(self) -> Optional[float]:
+        """Median of recent response times, or None with no history yet."""
+        if not self.response_times:
+            return None
+        times = sorted(self.response_times)
+        return times[len(times) // 2]
+
     def peek_inbox(self) -> Optional[InboxItem]:
         """Get the next unresolved inbox item without removing it.
 
@@ -530,6 +1169,7 @@ class Session:
         if overflow > 0:
             del self.flushed_messages[:overflow]
         msgs.clear()
+        self._changed("messages")
         lines = "\n".join(f"- {m}" for m in drained)
         return f"\n\n--- Queued User Messages ---\n{lines}"
 
@@ -596,8 +1236,8 @@ class Session:
     def timeline(self, max_entries: int = 20) -> list[dict]:
         """Build a chronological timeline of session activity.
 
-        Merges speech entries and history (selections) into a unified
-        timeline sorted by timestamp. Each entry has:
+        Reads speech entries and history (selections) from the session's
+        timeline index. Each entry has:
             type:      "speech" | "selection"
             text:      The speech text or selection label
             detail:    Summary for selections, empty for speech
@@ -613,42 +1253,24 @@ class Session:
         now = time.time()
         entries: list[dict] = []
 
-        # Add speech entries
-        for s in self.speech_log:
-            entries.append({
-                "type": "speech",
-                "text": s.text,
-                "detail": "",
-                "timestamp": s.timestamp,
-            })
-
-        # Add history (selection) entries
-        for h in self.history:
-            entries.append({
-                "type": "selection",
-                "text": h.label,
-                "detail": h.summary,
-                "timestamp": h.timestamp,
-            })
-
-        # Sort by timestamp descending (most recent first)
-        entries.sort(key=lambda e: e["timestamp"], reverse=True)
-
-        # Trim to max
-        entries = entries[:max_entries]
-
-        # Add age strings
-        for e in entries:
-            age_secs = now - e["timestamp"]
+        for ev in reversed(self.events.latest(max_entries, kinds=("speech", "selection"))):
+            if ev.kind == "speech":
+                entry = {"type": "speech", "text": ev.ref.text, "detail": ""}
+            else:
+                entry = {"type": "selection", "text": ev.ref.label, "detail": ev.ref.summary}
+            entry["timestamp"] = ev.timestamp
+
+            age_secs = now - ev.timestamp
             if age_secs < 60:
-                e["age"] = f"{int(age_secs)}s ago"
+                entry["age"] = f"{int(age_secs)}s ago"
             elif age_secs < 3600:
                 mins = int(age_secs) // 60
-                e["age"] = f"{mins}m ago"
+                entry["age"] = f"{mins}m ago"
             else:
                 hours = int(age_secs) // 3600
                 mins = (int(age_secs) % 3600) // 60
-                e["age"] = f"{hours}h{mins:02d}m ago"
+                entry["age"] = f"{hours}h{mins:02d}m ago"
+            entries.append(entry)
 
         return entries
 
@@ -673,18 +1295,81 @@ def _resolve_pending_inbox(session: Session) -> int:
     return resolved
 
 
+def schedule_pending(pending: list[tuple[InboxItem, Session]], policy: str,
+                     now: Optional[float] = None) -> list[tuple[InboxItem, Session]]:
+    """Order pending ``(item, session)`` pairs by a scheduling policy, best first.
+
+    - ``longest-blocked``: oldest item first, so no agent starves.
+    - ``age-priority``: highest ``age × (1 + priority)`` first, so urgent
+      items overtake older normal ones once they have waited a while.
+    - ``shortest-answer``: the agent whose choices the user historically
+      answers fastest first (median response time), which minimises the
+      total time agents spend blocked. Agents with no history get the
+      median across all agents; ties go to the oldest item.
+
+    Any other policy (including ``tabs``) returns the pairs unchanged.
+    """
+    key = _schedule_key(policy, [session for _, session in pending], now)
+    if key is None:
+        return list(pending)
+    return sorted(pending, key=lambda p: key(p[0].timestamp, p[0].priority, p[1]))
+
+
+def _schedule_key(policy: str, sessions: list[Session], now: Optional[float] = None
+                  ) -> Optional[Callable[[float, int, Session], tuple]]:
+    """Sort key for ``policy`` over ``(waiting since, priority, session)``.
+
+    See ``schedule_pending``; None for an unordered policy such as ``tabs``.
+    """
+    now = time.time() if now is None else now
+    if policy == "longest-blocked":
+        return lambda ts, prio, sess: (ts,)
+    if policy == "age-priority":
+        return lambda ts, prio, sess: (-(now - ts) * (1 + max(0, prio)), ts)
+    if policy == "shortest-answer":
+        expected = {id(sess): sess.expected_answer_seconds() for sess in sessions}
+        known = sorted(v for v in expected.values() if v is not None)
+        prior = known[len(known) // 2] if known else 0.0
+
+        def _key(ts: float, prio: int, sess: Session) -> tuple:
+            e = expected[id(sess)]
+            return (prior if e is None else e, ts)
+
+        return _key
+    return None
+
+
 class SessionManager:
     """Manages multiple sessions with tab navigation.
 
     Thread-safe — all mutations go through the lock.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, archive_dir: Optional[str] = None) -> None:
         self.sessions: dict[str, Session] = {}
         self.session_order: list[str] = []      # ordered list of session IDs
         self.active_session_id: Optional[str] = None
         self._counter: int = 0
         self._lock = threading.Lock()
+        # Global event log fed by every session's timeline index
+        self.events = EventStore()
+        # Root for per-session history archives (None = archive.ARCHIVE_DIR)
+        self.archive_dir = archive_dir
+        self._archives_pruned_at = 0.0
+        # Blocked-seconds of sessions already removed (keeps the metric cumulative)
+        self._retired_blocked_seconds = 0.0
+        # Called as on_change(session, what) for every session mutation,
+        # and with (None, "sessions") when sessions are added or removed.
+        # May run on any thread, sometimes with the manager lock held.
+        self.on_change: Optional[Callable[[Optional[Session], str], None]] = None
+
+    def _notify(self, session: Optional[Session], what: str) -> None:
+        listener = self.on_change
+        if listener is not None:
+            try:
+                listener(session, what)
+            except Exception:
+                pass
 
     def get_or_create(self, session_id: str) -> tuple[Session, bool]:
         """Get existing session or create a new one.
@@ -695,9 +1380,22 @@ class SessionManager:
             if session_id in self.sessions:
                 return self.sessions[session_id], False
 
+        # Archive setup touches the disk, so it stays outside the lock; a
+        # fresh directory per session means nothing left over needs clearing
+        archive = SessionArchive.for_session(session_id, root=self.archive_dir,
+                                             instance=uuid.uuid4().hex[:8])
+        self._maybe_prune_archives()
+
+        with self._lock:
+            if session_id in self.sessions:  # created meanwhile
+                return self.sessions[session_id], False
+
             self._counter += 1
             name = f"Agent {self._counter}"
             session = Session(session_id=session_id, name=name)
+            session.on_change = self._notify
+            session._timeline.attach(self.events, session_id)
+            session.archive = archive
             self.sessions[session_id] = session
             self.session_order.append(session_id)
 
@@ -705,7 +1403,19 @@ class SessionManager:
             if self.active_session_id is None:
                 self.active_session_id = session_id
 
-            return session, True
+        self._notify(None, "sessions")
+        return session, True
+
+    def _maybe_prune_archives(self) -> None:
+        """Drop stale archives of removed sessions (at most once per interval)."""
+        now = time.time()
+        with self._lock:
+            if now - self._archives_pruned_at < ARCHIVE_PRUNE_INTERVAL:
+                return
+            self._archives_pruned_at = now
+            keep = [os.path.basename(s.archive.path)
+                    for s in self.sessions.values() if s.archive is not None]
+        prune_archives(self.archive_dir, keep=keep)
 
     def remove(self, session_id: str) -> Optional[str]:
         """Remove a session. Returns new active_session_id (or None).
@@ -714,7 +1424,9 @@ class SessionManager:
         Resolves all pending inbox items so blocked threads are unblocked.
         """
         with self._lock:
-            return self._remove_locked(session_id)
+            active = self._remove_locked(session_id)
+        self._notify(None, "sessions")
+        return active
 
     def _remove_locked(self, session_id: str) -> Optional[str]:
         """Remove a session while the lock is held.
@@ -727,11 +1439,14 @@ class SessionManager:
 
         session = self.sessions[session_id]
 
+        self._retired_blocked_seconds += session.blocked_seconds_total()
+
         # Resolve all pending inbox items so blocked threads don't hang forever
         _resolve_pending_inbox(session)
 
         del self.sessions[session_id]
         self.session_order.remove(session_id)
+        self.events.forget(session_id)
 
         if self.active_session_id == session_id:
             if self.session_order:
@@ -786,12 +1501,21 @@ class SessionManager:
             self.active_session_id = self.session_order[idx]
             return self.sessions[self.active_session_id]
 
-    def next_with_choices(self) -> Optional[Session]:
-        """Cycle to the next tab that has active choices. Returns session or None."""
+    def next_with_choices(self, policy: str = "tabs") -> Optional[Session]:
+        """Cycle to the next tab that has active choices. Returns session or None.
+
+        With ``policy="tabs"`` this walks tabs in order after the focused
+        one. Any other ``SCHEDULE_POLICIES`` entry picks the session whose
+        best pending item ranks first under ``schedule_pending``, preferring
+        sessions other than the focused one.
+        """
         with self._lock:
             if not self.session_order or self.active_session_id is None:
                 return None
 
+            if policy != "tabs" and policy in SCHEDULE_POLICIES:
+                return self._scheduled_next_locked(policy)
+
             try:
                 start_idx = self.session_order.index(self.active_session_id)
             except ValueError:
@@ -810,6 +1534,66 @@ class SessionManager:
 
             return None  # no other session has active choices
 
+    def _scheduled_next_locked(self, policy: str) -> Optional[Session]:
+        """Policy-ordered pick for next_with_choices (lock held).
+
+        Returns None when no session other than the focused one has
+        choices, so callers announce "no other tabs".
+        """
+        candidates = []
+        for sid in self.session_order:
+            session = self.sessions[sid]
+            if not session.active or sid == self.active_session_id:
+                continue
+            items = session.pending_choices()
+            if items:
+                candidates.extend((item.timestamp, item.priority, session) for item in items)
+            else:
+                # An active session with an empty inbox (legacy path) still
+                # counts, as if blocked since its last activity
+                candidates.append((session.last_activity, 0, session))
+        if not candidates:
+            return None
+        key = _schedule_key(policy, [c[2] for c in candidates])
+        _, _, best = min(candidates, key=lambda c: key(*c))
+        self.active_session_id = best.session_id
+        return best
+
+    def pending_choices(self, policy: str = "tabs") -> list[tuple[InboxItem, Session]]:
+        """Pending choice items across every session, ordered by ``policy``.
+
+        ``tabs`` lists them in tab order, each session's items oldest first.
+        """
+        pending = [(item, session) for session in self.all_sessions()
+                   for item in session.pending_choices()]
+        return schedule_pending(pending, policy)
+
+    def blocked_seconds(self) -> float:
+        """Cumulative seconds all agents have spent blocked on choices."""
+        now = time.time()
+        return self._retired_blocked_seconds + sum(
+            s.blocked_seconds_total(now) for s in self.all_sessions())
+
+    def sync_events(self) -> EventStore:
+        """Catch every session's timeline up and return the global store.
+
+        Each sync with nothing new is O(1), so this is O(sessions) plus
+        the cost of indexing whatever was appended since the last call.
+        """
+        for session in self.all_sessions():
+            if session._timeline.store is not self.events:
+                # Added without get_or_create (e.g. restored or injected)
+                session._timeline.attach(self.events, session.session_id)
+            session._timeline.sync(session)
+        return self.events
+
+    def events_since(self, cursor: int, session_id: str | None = None,
+                     kinds: tuple[str, ...] | None = None,
+                     limit: int | None = None) -> list[TimelineEvent]:
+        """All sessions' events recorded after ``cursor``, in seq order."""
+        return self.sync_events().since(cursor, session_id=session_id,
+                                        kinds=kinds, limit=limit)
+
     def count(self) -> int:
         """Number of active sessions."""
         with self._lock:
@@ -929,4 +1713,6 @@ class SessionManager:
             for sid in to_remove:
                 self._remove_locked(sid)
 
+        if to_remove:
+            self._notify(None, "sessions")
         return to_remove
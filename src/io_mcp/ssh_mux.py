@@ -0,0 +1,211 @@
+"""Shared SSH connection multiplexing for remote agent operations.
+
+Health probes, the pane view's control-mode client, killing panes and
+sending messages to remote agents all shell out to ``ssh``. Each used to
+pay a full TCP + key exchange + authentication handshake. ``SSH_MUX``
+keeps one OpenSSH master connection (``ssh -M -N``) per remote host,
+started lazily on first use, and ``command()`` builds client argv that
+ride it through its control socket, so a remote command costs a local
+socket hop plus one round trip.
+
+Masters are checked before each use (process alive, socket present) and
+by ``check()`` (``ssh -O check``), restarted when the link dropped, and
+closed with ``ssh -O exit`` at interpreter exit. A host whose master
+can't be started (unreachable, needs a password) is retried after
+``MASTER_RETRY_SECS``; meanwhile ``command()`` returns plain ssh argv.
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import os
+import subprocess
+import tempfile
+import threading
+import time
+from typing import Optional
+
+from .logging import get_logger, TUI_ERROR_LOG
+
+_log = get_logger("io-mcp.ssh_mux", TUI_ERROR_LOG)
+
+MASTER_CONNECT_TIMEOUT = 5.0
+MASTER_RETRY_SECS = 30.0
+
+
+def _control_dir() -> str:
+    # Short: unix socket paths are limited to ~104 bytes
+    return os.path.join(tempfile.gettempdir(), f"io-mcp-ssh-{os.getuid()}")
+
+
+class _Master:
+    def __init__(self, host: str, path: str) -> None:
+        self.host = host
+        self.path = path
+        self.lock = threading.Lock()
+        self.proc: Optional[subprocess.Popen] = None
+        self.retry_at = 0.0
+        self.starts = 0
+
+    def alive(self) -> bool:
+        return (self.proc is not None and self.proc.poll() is None
+                and os.path.exists(self.path))
+
+
+class SSHMultiplexer:
+    """Pool of persistent SSH master connections, one per host. Thread-safe."""
+
+    def __init__(self, control_dir: Optional[str] = None, ssh: str = "ssh") -> None:
+        self.control_dir = control_dir or _control_dir()
+        self.ssh = ssh
+        self._lock = threading.Lock()
+        self._masters: dict[str, _Master] = {}
+        self._atexit = False
+        # Counters for stats()
+        self.muxed = 0
+        self.direct = 0
+
+    def control_path(self, host: str) -> str:
+        digest = hashlib.sha1(host.encode()).hexdigest()[:16]
+        return os.path.join(self.control_dir, digest)
+
+    def command(self, host: str, remote_cmd: str, *ssh_args: str,
+                connect_timeout: int = 5) -> list[str]:
+        """ssh argv running ``remote_cmd`` on ``host``, through its master.
+
+        Starts the host's master first if needed (this can block for up to
+        ``MASTER_CONNECT_TIMEOUT`` once per host; call from a worker
+        thread). ``ssh_args`` are extra client options such as ``-T``.
+        """
+        cmd = [self.ssh, *ssh_args, "-o", f"ConnectTimeout={connect_timeout}"]
+        if self.ensure(host):
+            self.muxed += 1
+            cmd += ["-o", "ControlMaster=no", "-o", f"ControlPath={self.control_path(host)}"]
+        else:
+            self.direct += 1
+        return cmd + [host, remote_cmd]
+
+    def ensure(self, host: str) -> bool:
+        """Make sure ``host`` has a live master; True if commands can use it."""
+        with self._lock:
+            master = self._masters.get(host)
+            if master is None:
+                master = self._masters[host] = _Master(host, self.control_path(host))
+        with master.lock:
+            if master.alive():
+                return True
+            self._stop(master)
+            if time.monotonic() < master.retry_at:
+                return False
+            if self._start(master):
+                return True
+            master.retry_at = time.monotonic() + MASTER_RETRY_SECS
+            return False
+
+    def _start(self, master: _Master) -> bool:
+        os.makedirs(self.control_dir, mode=0o700, exist_ok=True)
+        try:
+            os.unlink(master.path)  # left behind by a master that crashed
+        except FileNotFoundError:
+            pass
+        cmd = [self.ssh, "-M", "-N",
+               "-o", f"ControlPath={master.path}",
+               "-o", "ControlPersist=no",
+               "-o", "BatchMode=yes",
+               "-o", f"ConnectTimeout={int(MASTER_CONNECT_TIMEOUT)}",
+               "-o", "ServerAliveInterval=15",
+               "-o", "ServerAliveCountMax=3",
+               master.host]
+        try:
+            master.proc = subprocess.Popen(
+                cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL, start_new_session=True)
+        except OSError:
+            _log.warning("ssh master for %s: ssh not available", master.host)
+            return False
+        master.starts += 1
+        with self._lock:
+            if not self._atexit:
+                atexit.register(self.close)
+                self._atexit = True
+        # The socket appears once the master has authenticated
+        deadline = time.monotonic() + MASTER_CONNECT_TIMEOUT + 1
+        while time.monotonic() < deadline:
+            if master.alive():
+                return True
+            if master.proc.poll() is not None:
+                break
+            time.sleep(0.05)
+        _log.warning("ssh master for %s did not come up; using direct ssh", master.host)
+        self._stop(master)
+        return False
+
+    def _stop(self, master: _Master) -> None:
+        proc, master.proc = master.proc, None
+        if proc is None:
+            return
+        if proc.poll() is None:
+            try:
+                subprocess.run([self.ssh, "-o", f"ControlPath={master.path}",
+                                "-O", "exit", master.host],
+                               capture_output=True, timeout=2)
+            except (subprocess.TimeoutExpired, OSError):
+                pass
+            try:
+                proc.wait(timeout=1)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+        try:
+            os.unlink(master.path)
+        except FileNotFoundError:
+            pass
+
+    def check(self) -> dict[str, bool]:
+        """Ask every running master whether it still holds its connection.
+
+        Masters that fail are stopped; the next ``ensure()`` restarts them.
+        """
+        with self._lock:
+            masters = list(self._masters.values())
+        health = {}
+        for master in masters:
+            with master.lock:
+                if master.proc is None:
+                    continue
+                ok = master.alive()
+                if ok:
+                    try:
+                        ok = subprocess.run(
+                            [self.ssh, "-o", f"ControlPath={master.path}",
+                             "-O", "check", master.host],
+                            capture_output=True, timeout=2).returncode == 0
+                    except (subprocess.TimeoutExpired, OSError):
+                        ok = False
+                if not ok:
+                    self._stop(master)
+                health[master.host] = ok
+        return health
+
+    def close(self) -> None:
+        """Shut down every master connection."""
+        with self._lock:
+            masters = list(self._masters.values())
+            self._masters.clear()
+        for master in masters:
+            with master.lock:
+                self._stop(master)
+
+    def stats(self) -> dict:
+        with self._lock:
+            masters = list(self._masters.values())
+        return {
+            "masters": {m.host: {"alive": m.alive(), "starts": m.starts} for m in masters},
+            "muxed": self.muxed,
+            "direct": self.direct,
+        }
+
+
+# Shared by every remote operation in this process (survives TUI restarts)
+SSH_MUX = SSHMultiplexer()
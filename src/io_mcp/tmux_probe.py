@@ -0,0 +1,110 @@
+"""Batched tmux pane liveness probing for agent health checks.
+
+A health pass used to run ``tmux display-message`` -- or a whole ``ssh``
+for a remote agent -- once per session, serially, and then again for each
+session in the auto-prune pass. ``PaneLiveness`` instead groups the
+sessions by host and runs a single ``tmux list-panes -a`` per host, all
+hosts in parallel, so a pass costs about one round trip to the slowest
+host no matter how many agents it runs. The result answers every
+``is_dead()`` question for the rest of the pass.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Optional
+
+from .ssh_mux import SSH_MUX
+
+PROBE_TIMEOUT = 2.0
+MAX_PROBE_WORKERS = 8
+
+# One line per pane: "%42 0 work"
+_PANE_FORMAT = "#{pane_id} #{pane_dead} #{session_name}"
+
+
+def is_remote_host(hostname: str) -> bool:
+    return bool(hostname) and hostname not in ("localhost", os.uname().nodename)
+
+
+def _host_key(session) -> str:
+    """Probe key for a session's host: "" for this machine."""
+    hostname = getattr(session, 'hostname', '')
+    return hostname if is_remote_host(hostname) else ""
+
+
+def probe_host(hostname: str, timeout: float = PROBE_TIMEOUT) -> Optional[list[tuple[str, bool, str]]]:
+    """List every tmux pane on ``hostname`` ("" = local) in one call.
+
+    Returns ``(pane_id, dead, session_name)`` tuples; an empty list when
+    the host runs no tmux server (so none of its panes are alive); None
+    when the host couldn't be asked (ssh failed, timeout, no tmux binary)
+    so callers don't flag anything on it as dead.
+    """
+    if hostname:
+        cmd = SSH_MUX.command(hostname, f"tmux list-panes -a -F '{_PANE_FORMAT}'",
+                              "-o", "StrictHostKeyChecking=no", connect_timeout=2)
+    else:
+        cmd = ["tmux", "list-panes", "-a", "-F", _PANE_FORMAT]
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+        return None
+    if result.returncode != 0:
+        # ssh exits 255 when it can't reach the host; anything else is
+        # tmux failing, i.e. no server running there
+        return None if hostname and result.returncode == 255 else []
+    panes = []
+    for line in result.stdout.splitlines():
+        parts = line.split(" ", 2)
+        if len(parts) >= 2:
+            panes.append((parts[0], parts[1] == "1", parts[2] if len(parts) > 2 else ""))
+    return panes
+
+
+class PaneLiveness:
+    """Pane liveness for a set of sessions, probed once per host."""
+
+    def __init__(self, sessions: Iterable, probe: Callable[[str], Optional[list]] = probe_host,
+                 max_workers: int = MAX_PROBE_WORKERS) -> None:
+        hosts = sorted({_host_key(s) for s in sessions
+                        if getattr(s, 'tmux_pane', '') or getattr(s, 'tmux_session', '')})
+        # host -> {pane id or session name -> dead}, or None if unreachable
+        self._hosts: dict[str, Optional[dict[str, bool]]] = {}
+        if not hosts:
+            return
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(hosts)),
+                                thread_name_prefix="pane-probe") as pool:
+            for host, panes in zip(hosts, pool.map(probe, hosts)):
+                self._hosts[host] = None if panes is None else self._index(panes)
+
+    @staticmethod
+    def _index(panes: list[tuple[str, bool, str]]) -> dict[str, bool]:
+        index: dict[str, bool] = {}
+        for pane_id, dead, session_name in panes:
+            index[pane_id] = dead
+            # A tmux session is alive while any of its panes is
+            index[session_name] = index.get(session_name, True) and dead
+        return index
+
+    @property
+    def hosts(self) -> list[str]:
+        return list(self._hosts)
+
+    def is_dead(self, session) -> bool:
+        """True only when the session's pane (or tmux session) is confirmed gone.
+
+        Sessions without tmux info, and hosts that couldn't be probed,
+        count as alive.
+        """
+        target = getattr(session, 'tmux_pane', '') or getattr(session, 'tmux_session', '')
+        if not target:
+            return False
+        panes = self._hosts.get(_host_key(session))
+        if panes is None:
+            return False
+        if target.isdigit():
+            target = f"%{target}"
+        return panes.get(target, True)
@@ -0,0 +1,137 @@
+"""Unix-domain-socket transport for co-located io-mcp processes.
+
+The backend and the Frontend API listen on TCP for remote clients and,
+alongside it, on a Unix socket under /tmp. Local callers — the MCP
+proxy, ``io-mcp-msg``, ``io-mcp-send`` and the activity hook — prefer
+the socket whenever it is live: no TCP handshake or loopback stack per
+call, and no port to collide with a stale process.
+
+Everything falls back to TCP when the socket is missing, stale or the
+target host isn't local, so the socket is purely an optimisation.
+"""
+
+from __future__ import annotations
+
+import http.client
+import logging
+import os
+import socket
+import stat
+
+log = logging.getLogger("io-mcp.transport")
+
+# Socket paths carry the TCP port they shadow, so a caller aimed at a
+# non-default port never lands on the default instance's socket.
+BACKEND_SOCKET = "/tmp/io-mcp-backend-{port}.sock"
+API_SOCKET = "/tmp/io-mcp-api-{port}.sock"
+
+# Addresses that mean "this machine" — only these may be served by a socket.
+LOCAL_HOSTS = frozenset({"localhost", "127.0.0.1", "::1", "0.0.0.0", ""})
+
+# Prefix marking a CLI base address that points at a Unix socket.
+UNIX_PREFIX = "unix:"
+
+
+def backend_socket(port: int = 8446) -> str:
+    """Unix socket path of the backend whose TCP port is ``port``."""
+    return BACKEND_SOCKET.format(port=port)
+
+
+def api_socket(port: int = 8445) -> str:
+    """Unix socket path of the Frontend API whose TCP port is ``port``."""
+    return API_SOCKET.format(port=port)
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    """``http.client`` connection over a Unix socket instead of TCP."""
+
+    def __init__(self, socket_path: str, timeout: float | None = None) -> None:
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.settimeout(self.timeout)
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            raise
+        self.sock = sock
+
+
+def socket_live(path: str, timeout: float = 0.5) -> bool:
+    """Whether something is accepting connections on the Unix socket ``path``."""
+    try:
+        if not stat.S_ISSOCK(os.stat(path).st_mode):
+            return False
+    except OSError:
+        return False
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(path)
+        return True
+    except OSError:
+        return False
+    finally:
+        sock.close()
+
+
+def bind_unix_socket(path: str, backlog: int = 128) -> socket.socket | None:
+    """Listen on ``path``, replacing a stale socket file left by a crash.
+
+    Returns None (and logs) if another live process already owns the
+    socket or it can't be created — callers carry on with TCP only.
+    """
+    if socket_live(path):
+        log.warning(f"Unix socket {path} is in use by another process; TCP only")
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        sock.bind(path)
+        os.chmod(path, 0o600)
+        sock.listen(backlog)
+        return sock
+    except OSError as e:
+        sock.close()
+        log.warning(f"Cannot listen on Unix socket {path}: {e}")
+        return None
+
+
+def unlink_socket(path: str) -> None:
+    """Remove a socket file we created (best effort)."""
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+def local_base(host: str, port: int, socket_path: str | None) -> str:
+    """Base address for a CLI talking to a local service.
+
+    ``unix:<path>`` when ``host`` is this machine and the socket is live,
+    otherwise ``http://host:port``. Pass ``socket_path=None`` to force TCP.
+    """
+    if socket_path and host in LOCAL_HOSTS and socket_live(socket_path):
+        return UNIX_PREFIX + socket_path
+    return f"http://{host}:{port}"
+
+
+def unix_request(base: str, path: str, method: str = "GET", body: bytes | None = None,
+                 headers: dict | None = None, timeout: float = 10) -> tuple[int, bytes]:
+    """One HTTP request to a ``unix:<path>`` base. Returns ``(status, body)``.
+
+    Connection failures raise OSError; HTTP error statuses are returned.
+    """
+    conn = UnixHTTPConnection(base[len(UNIX_PREFIX):], timeout=timeout)
+    try:
+        conn.request(method, path, body=body, headers=headers or {})
+        resp = conn.getresponse()
+        return resp.status, resp.read()
+    finally:
+        conn.close()
@@ -59,6 +59,18 @@ STREAMING_HEADER_TIMEOUT = 10
 # Default pregeneration workers
 DEFAULT_PREGEN_WORKERS = 3
 
+# Audio formats a cached clip can be served in: extension → (MIME type,
+# ffmpeg encoder args). "wav" is the cached original; the others are
+# transcoded on first request (needs ffmpeg) and kept next to it.
+AUDIO_FORMATS = {
+    "wav": ("audio/wav", None),
+    "ogg": ("audio/ogg", ["-c:a", "libopus", "-b:a", "32k"]),
+    "mp3": ("audio/mpeg", ["-c:a", "libmp3lame", "-b:a", "64k"]),
+}
+
+# Timeout for transcoding a cached clip to a compressed variant (seconds)
+TRANSCODE_TIMEOUT = 30
+
 
 def _find_binary(name: str) -> Optional[str]:
     """Find a binary in PATH or common Nix locations."""
@@ -195,6 +207,14 @@ class TTSEngine:
         self._cache: dict[str, str] = {}
         os.makedirs(CACHE_DIR, exist_ok=True)
 
+        # Remote audio — set by the frontend API. remote_audio() is True
+        # while a client that plays clips itself is attached (see
+        # config.tts.localPlayback); on_audio_cached(key) is called when a
+        # new clip lands in the cache so it can be announced.
+        self.remote_audio = None
+        self.on_audio_cached = None
+        self._ffmpeg = _find_binary("ffmpeg")
+
         # Scroll generation counter — incremented on each speak_with_local_fallback
         # call. Background threads check this before playing to avoid stale audio
         # overlapping with newer requests.
@@ -239,6 +259,81 @@ class TTSEngine:
             params = f"{text}|local={self._local}|speed={self._speed}"
         return hashlib.md5(params.encode()).hexdigest()
 
+    # ─── Remote audio (clips served by content key) ───────────────
+
+    def audio_key(self, text: str, voice_override: Optional[str] = None,
+                  emotion_override: Optional[str] = None,
+                  model_override: Optional[str] = None,
+                  speed_override: Optional[float] = None) -> str:
+        """Content key of the clip for this text and voice settings.
+
+        The same key names the cached WAV, so remote frontends can fetch
+        it from the API once it has been generated.
+        """
+        return self._cache_key(text, voice_override, emotion_override,
+                               model_override=model_override,
+                               speed_override=speed_override)
+
+    def cached_audio(self, key: str, fmt: str = "wav") -> Optional[str]:
+        """Path of a cached clip in ``fmt`` (see AUDIO_FORMATS), or None.
+
+        Compressed variants are transcoded with ffmpeg on first use and
+        cached alongside the WAV. Returns None when the clip hasn't been
+        generated yet or the format can't be produced.
+        """
+        if fmt not in AUDIO_FORMATS:
+            return None
+        wav = self._cache.get(key) or os.path.join(CACHE_DIR, f"{key}.wav")
+        if not os.path.isfile(wav):
+            return None
+        encoder = AUDIO_FORMATS[fmt][1]
+        if encoder is None:
+            return wav
+        out_path = os.path.join(CACHE_DIR, f"{key}.{fmt}")
+        if os.path.isfile(out_path):
+            return out_path
+        if not getattr(self, "_ffmpeg", None):
+            return None
+        tmp_path = f"{out_path}.{threading.get_ident()}.tmp"
+        try:
+            subprocess.run(
+                [self._ffmpeg, "-nostdin", "-loglevel", "error", "-y", "-i", wav,
+                 *encoder, "-f", fmt, tmp_path],
+                stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                timeout=TRANSCODE_TIMEOUT, check=True,
+            )
+            os.replace(tmp_path, out_path)
+            return out_path
+        except (subprocess.SubprocessError, OSError) as e:
+            _log.warning(f"Transcoding {key} to {fmt} failed: {e}")
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            return None
+
+    def _remote_playback(self) -> bool:
+        """True when local playback should be skipped for a remote client."""
+        remote_audio = getattr(self, "remote_audio", None)
+        if not remote_audio or not self._config:
+            return False
+        if self._config.tts_local_playback != "unless-remote":
+            return False
+        try:
+            return bool(remote_audio())
+        except Exception:
+            return False
+
+    def _cached(self, key: str, path: str) -> None:
+        """Record a freshly generated clip and announce it."""
+        self._cache[key] = path
+        cb = getattr(self, "on_audio_cached", None)
+        if cb:
+            try:
+                cb(key)
+            except Exception:
+                _log.debug("on_audio_cached callback failed", exc_info=True)
+
     # ─── Failure tracking and health ──────────────────────────────
 
     def _record_failure(self, message: str) -> None:
@@ -546,7 +641,7 @@ class TTSEngine:
                         except OSError:
                             pass
 
-                    self._cache[key] = out_path
+                    self._cached(key, out_path)
                     self._record_api_gen_success()
                     return out_path
 
@@ -1113,7 +1208,7 @@ class TTSEngine:
                 except OSError:
                     pass
 
-            self._cache[key] = out_path
+            self._cached(key, out_path)
             self._record_api_gen_success()
             return out_path
 
@@ -1293,7 +1388,11 @@ class TTSEngine:
         IMPORTANT: Popen is called via the subprocess manager which handles
         process group setup (preexec_fn=os.setsid) and tracking automatically.
         No lock is needed — the manager uses GIL-atomic list operations.
+
+        Returns True without playing while a remote client does playback.
         """
+        if self._remote_playback():
+            return True
         if max_attempts < 0:
             max_attempts = self._max_retries
         for attempt in range(1 + max_attempts):
@@ -1381,6 +1480,12 @@ class TTSEngine:
         speech is fundamental and must always attempt the API.
         """
         with self._speech_lock:
+            if self._remote_playback():
+                # A remote client plays the clip — just make sure it exists
+                self._generate_to_file(text, voice_override, emotion_override,
+                                       model_override=model_override,
+                                       speed_override=speed_override, force=True)
+                return
             if self._local and self._local_backend == "termux" and self._termux_exec:
                 self._speak_termux(text)
                 return
@@ -1432,6 +1537,11 @@ class TTSEngine:
                     # Check if stop() was called while we were queued
                     if self._speech_gen != my_gen:
                         return
+                    if self._remote_playback():
+                        self._generate_to_file(text, voice_override, emotion_override,
+                                               model_override=model_override,
+                                               speed_override=speed_override, force=True)
+                        return
                     if self._local and self._local_backend == "termux" and self._termux_exec:
                         self._speak_termux(text)
                         return
@@ -2218,7 +2328,7 @@ class TTSEngine:
             disconnect: Descending three-note (agent disconnected)
             inbox: Quick triple ascending (new inbox item queued)
         """
-        if self._muted:
+        if self._muted or self._remote_playback():
             return
         # Early exit if chimes are disabled in config — avoids spawning
         # a background thread just to have play_tone return immediately.
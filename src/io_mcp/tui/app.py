@@ -5,6 +5,7 @@ Contains the IoMcpApp (Textual App subclass) and TUI controller wrapper.
 
 from __future__ import annotations
 
+import asyncio
 import os
 import random
 import signal
@@ -23,8 +24,11 @@ from textual.timer import Timer
 from textual.widget import Widget
 from textual.widgets import Header, Input, Label, ListView, RichLog, Static
 
-from ..session import Session, SessionManager, SpeechEntry, HistoryEntry, InboxItem, _resolve_pending_inbox
+from ..session import Session, SessionManager, SpeechEntry, HistoryEntry, InboxItem, _resolve_pending_inbox, schedule_pending
+from ..idempotency import current_call_key
 from ..settings import Settings
+from ..ssh_mux import SSH_MUX
+from ..tmux_probe import PaneLiveness
 from ..tts import TTSEngine, _find_binary
 from .. import api as frontend_api
 from .. import state as ui_state
@@ -45,11 +49,12 @@ def _strip_rich_markup(text: str) -> str:
     return _RICH_TAG_RE.sub('', text).strip()
 
 from .themes import COLOR_SCHEMES, DEFAULT_SCHEME, get_scheme, build_css
-from .widgets import ChoiceItem, InboxListItem, PreambleItem, DwellBar, ManagedListView, TextInputModal, SubmitTextArea, VoiceButton, VOICE_REQUESTED, EXTRA_OPTIONS, PRIMARY_EXTRAS, SECONDARY_EXTRAS, MORE_OPTIONS_ITEM, _safe_action
+from .widgets import ChoiceItem, InboxListItem, PreambleItem, DwellBar, ManagedListView, TextInputModal, SubmitTextArea, VoiceButton, VOICE_REQUESTED, EXTRA_OPTIONS, PRIMARY_EXTRAS, SECONDARY_EXTRAS, MORE_OPTIONS_ITEM, _safe_action, INBOX_WINDOW, inbox_window_start, reconcile_inbox_list
 from .views import ViewsMixin
 from .voice import VoiceMixin
 from .settings_menu import SettingsMixin
 from .chat_view import ChatViewMixin, ChatBubbleItem
+from .invalidation import UIInvalidator
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -108,6 +113,15 @@ def _is_continuation_choice(choices: list[dict]) -> Optional[int]:
     return matches[0] if len(matches) == 1 else None
 
 
+async def _offload(fn, *args):
+    """Run a blocking step on the running loop's default executor.
+
+    ``asyncio.to_thread`` carries context variables (the call's
+    idempotency key) over to the worker thread.
+    """
+    return await asyncio.to_thread(fn, *args)
+
+
 # ─── Main TUI App ───────────────────────────────────────────────────────────
 
 class IoMcpApp(ChatViewMixin, ViewsMixin, VoiceMixin, SettingsMixin, App):
@@ -274,6 +288,18 @@ class IoMcpApp(ChatViewMixin, ViewsMixin, VoiceMixin, SettingsMixin, App):
         # Session manager
         self.manager = SessionManager()
 
+        # Redraws are pushed, not polled: session mutations and tool threads
+        # mark regions dirty and one flush per frame renders them
+        self._ui = UIInvalidator(self, {
+            "timers": self._sync_idle_timers,
+            "tab_bar": self._update_tab_bar,
+            "footer": self._update_footer_status,
+            "inbox": self._update_inbox_list,
+            "chat": self._refresh_chat_feed,
+            "pane": self._update_pane_view,
+        })
+        self.manager.on_change = self._on_session_changed
+
         # Freeform text input
         self._freeform_spoken_pos = 0
 
@@ -350,6 +376,8 @@ class IoMcpApp(ChatViewMixin, ViewsMixin, VoiceMixin, SettingsMixin, App):
         # Inbox pane focus state (two-column layout)
         self._inbox_pane_focused = False
         self._inbox_scroll_index = 0  # cursor position in inbox list
+        self._inbox_window_start = 0  # first inbox row mounted (see INBOX_WINDOW)
+        self._inbox_window_total = 0  # rows in the full inbox list
         self._inbox_was_visible = False  # saved inbox state for message mode
         self._inbox_last_generation = -1  # tracks session._inbox_generation to skip no-op rebuilds
         self._inbox_collapsed = ui_state.get("inbox_collapsed", False)  # persistent toggle
@@ -750,8 +778,12 @@ class IoMcpApp(ChatViewMixin, ViewsMixin, VoiceMixin, SettingsMixin, App):
         if self._config and hasattr(self._config, 'health_check_interval'):
             health_interval = self._config.health_check_interval
         self._agent_health_timer = self.set_interval(health_interval, self._check_agent_health)
+        # Session-watching timers sleep until an agent connects
+        self._sync_idle_timers()
         # Initial health check
         self._update_daemon_status()
+        # Render anything invalidated before the app was running
+        self._ui.start()
 
         # Pregenerate common UI phrases and number words on mount so they're
         # cached before the first agent connects. This runs in the UI pregen
@@ -782,6 +814,52 @@ class IoMcpApp(ChatViewMixin, ViewsMixin, VoiceMixin, SettingsMixin, App):
         except RuntimeError:
             return False
 
+    # Which regions each kind of session change makes dirty
+    _CHANGE_REGIONS = {
+        "inbox": ("tab_bar", "inbox", "chat"),
+        "speech": ("chat",),
+        "activity": ("tab_bar", "footer", "chat"),
+        "messages": ("chat",),
+        "sessions": ("timers", "tab_bar", "footer", "inbox", "chat"),
+    }
+
+    def _invalidate(self, *regions: str) -> None:
+        """Mark UI regions dirty; they are redrawn once on the next frame.
+
+        Safe from any thread and never blocks on the event loop, so tool
+        threads use this rather than ``call_from_thread`` for redraws.
+        The chat feed is skipped while hidden (opening it rebuilds it).
+        """
+        if not self._chat_view_active:
+            regions = tuple(r for r in regions if r != "chat")
+        if regions:
+            self._ui.invalidate(*regions)
+
+    def _on_session_changed(self, session: Optional[Session], what: str) -> None:
+        """SessionManager listener: map a session mutation to dirty regions."""
+        self._invalidate(*self._CHANGE_REGIONS.get(what, ()))
+
+    @on(UIInvalidator.Flush)
+    def _on_ui_flush(self, event: UIInvalidator.Flush) -> None:
+        self._ui.flush()
+
+    def _sync_idle_timers(self) -> None:
+        """Pause the session-watching timers while no agent is connected.
+
+        Heartbeat, stale-session cleanup and agent health have nothing to
+        look at without sessions; pausing them leaves an idle TUI with
+        only the daemon status check waking it.
+        """
+        idle = self.manager.count() == 0
+        for name in ("_heartbeat_timer", "_cleanup_timer", "_agent_health_timer"):
+            timer = getattr(self, name, None)
+            if timer is None:
+                continue
+            if idle:
+                timer.pause()
+            else:
+                timer.resume()
+
     def _touch_session(self, session: Session) -> None:
         """Update last_activity, safe for old Session objects without the field."""
         try:
@@ -939,10 +1017,7 @@ class IoMcpApp(ChatViewMixin, ViewsMixin, VoiceMixin, SettingsMixin, App):
 
         self._daemon_status_text = " ".join(parts)
 
-        try:
-            self.call_from_thread(self._update_tab_bar)
-        except Exception:
-            pass
+        self._invalidate("tab_bar")
 
     def _try_pulse_reconnect(self) -> None:
         """Attempt PulseAudio auto-reconnect if enabled and within limits.
@@ -1157,7 +1232,10 @@ class IoMcpApp(ChatViewMixin, ViewsMixin, VoiceMixin, SettingsMixin, App):
 
         Runs subprocess calls (tmux pane checks, SSH) in a thread to avoid
         blocking the event loop. UI updates are dispatched via call_from_thread.
+        Also health-checks the shared ssh master connections first, so a
+        dropped one is restarted before this pass's remote probes.
         """
+        SSH_MUX.check()
         self._check_agent_health_inner()
 
     def _check_agent_health_inner(self) -> None:
@@ -1202,95 +1280,102 @@ class IoMcpApp(ChatViewMixin, ViewsMixin, VoiceMixin, SettingsMixin, App):
         now = time.time()
         tab_bar_dirty = False
 
-        for session in self.manager.all_sessions():
-            # Only monitor sessions that have actually registered/connected
-            last_call = getattr(session, 'last_tool_call', 0)
-            if last_call == 0:
-                continue
+        # One tmux query per host, all hosts in parallel; the health and
+        # prune loops below both read pane liveness from this snapshot
+        self._pane_liveness = self._probe_pane_liveness()
+        try:
+            for session in self.manager.all_sessions():
+                # Only monitor sessions that have actually registered/connected
+                last_call = getattr(session, 'last_tool_call', 0)
+                if last_call == 0:
+                    continue
+
+                # If agent is actively waiting for user selection, it's healthy —
+                # it made a successful present_choices() call
+                if session.active:
+                    if session.health_status != "healthy":
+                        session.health_status = "healthy"
+                        session.health_alert_spoken = False
+                        tab_bar_dirty = True
+                    continue
+
+                elapsed = now - last_call
+                old_status = session.health_status
+
+                # ── Check tmux pane liveness ─────────────────────────
+                pane_dead = False
+                if check_tmux:
+                    pane_dead = self._is_tmux_pane_dead(session)
+
+                # ── Determine new health status ───────────────────────
+                if pane_dead:
+                    new_status = "unresponsive"
+                elif elapsed >= unresponsive_threshold:
+                    new_status = "unresponsive"
+                elif elapsed >= warning_threshold:
+                    new_status = "warning"
+                else:
+                    new_status = "healthy"
 
-            # If agent is actively waiting for user selection, it's healthy —
-            # it made a successful present_choices() call
-            if session.active:
-                if session.health_status != "healthy":
+                # ── Reset alert flag when recovering to healthy ───────
+                if new_status == "healthy" and old_status != "healthy":
                     session.health_status = "healthy"
                     session.health_alert_spoken = False
                     tab_bar_dirty = True
-                continue
+                    continue
 
-            elapsed = now - last_call
-            old_status = session.health_status
-
-            # ── Check tmux pane liveness ─────────────────────────
-            pane_dead = False
-            if check_tmux:
-                pane_dead = self._is_tmux_pane_dead(session)
-
-            # ── Determine new health status ───────────────────────
-            if pane_dead:
-                new_status = "unresponsive"
-            elif elapsed >= unresponsive_threshold:
-                new_status = "unresponsive"
-            elif elapsed >= warning_threshold:
-                new_status = "warning"
-            else:
-                new_status = "healthy"
-
-            # ── Reset alert flag when recovering to healthy ───────
-            if new_status == "healthy" and old_status != "healthy":
-                session.health_status = "healthy"
-                session.health_alert_spoken = False
-                tab_bar_dirty = True
-                continue
-
-            # ── Handle escalating alert on new bad status ─────────
-            if new_status != old_status or (new_status != "healthy" and not session.health_alert_spoken):
-                session.health_status = new_status
-                tab_bar_dirty = True
+                # ── Handle escalating alert on new bad status ─────────
+                if new_status != old_status or (new_status != "healthy" and not session.health_alert_spoken):
+                    session.health_status = new_status
+                    tab_bar_dirty = True
 
-                if new_status == "unresponsive" and not session.health_alert_spoken:
+                    if new_status == "unresponsive" and not session.health_alert_spoken:
+                        session.health_alert_spoken = True
+                        self._fire_health_alert(session, "unresponsive", pane_dead, elapsed)
+                    elif new_status == "warning" and not session.health_alert_spoken:
+                        session.health_alert_spoken = True
+                        self._fire_health_alert(session, "warning", pane_dead, elapsed)
+                elif new_status == old_status and new_status != "healthy":
+                    # Status unchanged and still bad — ensure flag is set
                     session.health_alert_spoken = True
-                    self._fire_health_alert(session, "unresponsive", pane_dead, elapsed)
-                elif new_status == "warning" and not session.health_alert_spoken:
-                    session.health_alert_spoken = True
-                    self._fire_health_alert(session, "warning", pane_dead, elapsed)
-            elif new_status == old_status and new_status != "healthy":
-                # Status unchanged and still bad — ensure flag is set
-                session.health_alert_spoken = True
 
-        # ── Auto-prune dead sessions ─────────────────────────────
-        # Heuristics for detecting dead sessions:
-        # 1. Dead tmux pane AND unresponsive for >5min — conservative cleanup
-        # 2. Unresponsive sessions without tmux info (no way to verify)
-        dead_sessions = []
+            # ── Auto-prune dead sessions ─────────────────────────────
+            # Heuristics for detecting dead sessions:
+            # 1. Dead tmux pane AND unresponsive for >5min — conservative cleanup
+            # 2. Unresponsive sessions without tmux info (no way to verify)
+            dead_sessions = []
 
-        for session in self.manager.all_sessions():
-            if session.session_id == self.manager.active_session_id:
-                continue  # never auto-prune focused session
+            for session in self.manager.all_sessions():
+                if session.session_id == self.manager.active_session_id:
+                    continue  # never auto-prune focused session
 
-            last_call = getattr(session, 'last_tool_call', 0)
-            elapsed = now - last_call if last_call > 0 else 0
-
-            # Heuristic 1: Dead tmux pane AND unresponsive for >5min
-            pane_dead = self._is_tmux_pane_dead(session)
-            if pane_dead and elapsed > 300:
-                dead_sessions.append((session, "dead tmux pane"))
-                continue
+                last_call = getattr(session, 'last_tool_call', 0)
+                elapsed = now - last_call if last_call > 0 else 0
 
-            # Heuristic 2: Unresponsive without tmux info (can't verify liveness)
-            if session.health_status == "unresponsive":
-                has_tmux = bool(getattr(session, 'tmux_pane', ''))
-                if not has_tmux:
-                    dead_sessions.append((session, "unresponsive, no tmux"))
-
-        for session, reason in dead_sessions:
-            self._auto_cleanup_dead_session(session)
-            tab_bar_dirty = True
+                # Heuristic 1: Dead tmux pane AND unresponsive for >5min
+                pane_dead = self._is_tmux_pane_dead(session)
+                if pane_dead and elapsed > 300:
+                    dead_sessions.append((session, "dead tmux pane"))
+                    continue
+
+                # Heuristic 2: Unresponsive without tmux info (can't verify liveness)
+                if session.health_status == "unresponsive":
+                    has_tmux = bool(getattr(session, 'tmux_pane', ''))
+                    if not has_tmux:
+                        dead_sessions.append((session, "unresponsive, no tmux"))
+
+            for session, reason in dead_sessions:
+                self._auto_cleanup_dead_session(session)
+                tab_bar_dirty = True
+        finally:
+            self._pane_liveness = None
 
         if tab_bar_dirty:
-            try:
-                self.call_from_thread(self._update_tab_bar)
-            except Exception:
-                pass
+            self._invalidate("tab_bar")
+
+    def _probe_pane_liveness(self) -> PaneLiveness:
+        """Probe every host with a tmux-registered session, once each."""
+        return PaneLiveness(self.manager.all_sessions())
 
     def _is_tmux_pane_dead(self, session: "Session") -> bool:
         """Check if a session's registered tmux pane has exited.
@@ -1298,49 +1383,17 @@ class IoMcpApp(ChatViewMixin, ViewsMixin, VoiceMixin, SettingsMixin, App):
         Returns True if the pane is confirmed dead (process exited or doesn't exist).
         Returns False if the pane is alive, not registered, or check fails.
 
-        Supports both local and remote tmux checks. For remote agents,
-        uses SSH to check the tmux pane on the remote host.
-
-        Uses `tmux display-message -p -t <pane_id> "#{pane_dead}"` which outputs
-        "1" if the pane's shell has exited (pane is in a "dead" state), "0" otherwise.
+        During a health pass this reads the pass's ``PaneLiveness``
+        snapshot; outside one it probes just the session's host. The
+        verdict is kept on ``session.pane_dead`` for get_sessions.
         """
-        pane = getattr(session, 'tmux_pane', '')
-        tmux_session_name = getattr(session, 'tmux_session', '')
-
-        if not pane and not tmux_session_name:
+        if not getattr(session, 'tmux_pane', '') and not getattr(session, 'tmux_session', ''):
             return False  # no tmux info, can't check
 
-        try:
-            target = pane if pane else tmux_session_name
-            hostname = getattr(session, 'hostname', '')
-
-            # Check if this is a remote agent
-            is_remote = False
-            if hostname:
-                local_hostname = os.uname().nodename
-                is_remote = hostname not in ("", "localhost", local_hostname)
-
-            if is_remote:
-                cmd = [
-                    "ssh", "-o", "ConnectTimeout=2", "-o", "StrictHostKeyChecking=no",
-                    hostname,
-                    f"tmux display-message -p -t {target} '#{{pane_dead}}'",
-                ]
-            else:
-                cmd = ["tmux", "display-message", "-p", "-t", target, "#{pane_dead}"]
-
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=2,
-            )
-            if result.returncode != 0:
-                # tmux command failed — pane/session doesn't exist
-                return True
-            return result.stdout.strip() == "1"
-        except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
-            return False  # tmux not available or timeout — don't flag as dead
+        liveness = getattr(self, '_pane_liveness', None) or PaneLiveness([session])
+        dead = liveness.is_dead(session)
+        session.pane_dead = dead
+        return dead
 
     def _fire_health_alert(self, session: "Session", status: str,
                            pane_dead: bool, elapsed: float) -> None:
@@ -1498,7 +1551,6 @@ class IoMcpApp(ChatViewMixin, ViewsMixin, VoiceMixin, SettingsMixin, App):
                 self._update_ambient_indicator(session, elapsed)
                 # Log to activity feed so chat view shows the ambient update
                 session.log_activity("ambient", phrase, kind="ambient")
-                self._notify_chat_feed_update(session)
         else:
             # Subsequent updates: exponential backoff after 4th update
             # 1st repeat at initial + repeat
@@ -1549,7 +1601,6 @@ class IoMcpApp(ChatViewMixin, ViewsMixin, VoiceMixin, SettingsMixin, App):
                 self._update_ambient_indicator(session, elapsed)
                 # Log to activity feed so chat view shows the ambient update
                 session.log_activity("ambient", msg[:120], kind="ambient")
-                self._notify_chat_feed_update(session)
 
     def _update_ambient_indicator(self, session: Session, elapsed: float) -> None:
         """Update the agent activity label with elapsed time and last tool."""
@@ -1836,12 +1887,8 @@ class IoMcpApp(ChatViewMixin, ViewsMixin, VoiceMixin, SettingsMixin, App):
         # Kick the drain loop so the next queued item wakes immediately
         session.drain_kick.set()
 
-        # Update inbox list to show item as done
-        self._safe_call(self._update_inbox_list)
-
-        # Immediately refresh chat feed so the selection appears without
-        # waiting for the 3-second timer
-        self._safe_call(lambda: self._notify_chat_feed_update(session))
+        # Update inbox list and chat feed to show the item as done
+        self._invalidate("inbox", "chat")
 
     def _dismiss_active_item(self) -> None:
         """Dismiss the active inbox item without sending a response to the agent.
@@ -1882,8 +1929,7 @@ class IoMcpApp(ChatViewMixin, ViewsMixin, VoiceMixin, SettingsMixin, App):
             session.choices = []
 
             self._speak_ui("Dismissed")
-            self._safe_call(self._update_inbox_list)
-            self._safe_call(self._update_tab_bar)
+            self._invalidate("inbox", "tab_bar")
 
             # Suppress the waiting-state TTS announcement — dismiss already spoke
             session._waiting_announced = True
@@ -1901,8 +1947,7 @@ class IoMcpApp(ChatViewMixin, ViewsMixin, VoiceMixin, SettingsMixin, App):
             session.choices = []
 
             self._speak_ui("Dismissed stale item")
-            self._safe_call(self._update_inbox_list)
-            self._safe_call(self._update_tab_bar)
+            self._invalidate("inbox", "tab_bar")
 
             # Suppress the waiting-state TTS announcement — dismiss already spoke
             session._waiting_announced = True
@@ -1961,27 +2006,47 @@ class IoMcpApp(ChatViewMixin, ViewsMixin, VoiceMixin, SettingsMixin, App):
                 return {"selected": "_restart", "summary": "TUI restarting"}
             raise
         except Exception as exc:
-            import traceback
-            err = f"{type(exc).__name__}: {str(exc)[:200]}"
-            _log.error("present_choices error: %s", err, exc_info=True)
-            # Speak the error so the user hears it
-            try:
-                self._tts.speak_async(f"Choice presentation error: {str(exc)[:80]}")
-            except Exception:
-                pass
-            # Notify via webhook
-            try:
-                self._notifier.notify(NotificationEvent(
-                    event_type="error",
-                    title="TUI Error",
-                    message=f"Choice presentation error: {err}",
-                    priority=4,
-                    tags=["x", "error"],
-                ))
-            except Exception:
-                pass
-            # Return error to agent so it has context
-            return {"selected": "error", "summary": f"TUI error: {err}"}
+            return self._presentation_error(exc)
+
+    async def present_choices_async(self, session: Session, preamble: str,
+                                    choices: list[dict]) -> dict:
+        """Async twin of present_choices for the asyncio backend.
+
+        The wait for the user is a future on the caller's loop, not a
+        parked thread: only the short enqueue/activate/teardown steps
+        borrow a worker from the loop's default executor.
+        """
+        try:
+            return await self._present_choices_inner_async(session, preamble, choices)
+        except RuntimeError as exc:
+            if "App is not running" in str(exc):
+                return {"selected": "_restart", "summary": "TUI restarting"}
+            raise
+        except Exception as exc:
+            return await _offload(self._presentation_error, exc)
+
+    def _presentation_error(self, exc: Exception) -> dict:
+        """Report a failed choice presentation and build the agent's result."""
+        err = f"{type(exc).__name__}: {str(exc)[:200]}"
+        _log.error("present_choices error: %s", err, exc_info=exc)
+        # Speak the error so the user hears it
+        try:
+            self._tts.speak_async(f"Choice presentation error: {str(exc)[:80]}")
+        except Exception:
+            pass
+        # Notify via webhook
+        try:
+            self._notifier.notify(NotificationEvent(
+                event_type="error",
+                title="TUI Error",
+                message=f"Choice presentation error: {err}",
+                priority=4,
+                tags=["x", "error"],
+            ))
+        except Exception:
+            pass
+        # Return error to agent so it has context
+        return {"selected": "error", "summary": f"TUI error: {err}"}
 
     def _present_choices_inner(self, session: Session, preamble: str, choices: list[dict]) -> dict:
         """Inner implementation of present_choices.
@@ -1994,34 +2059,55 @@ class IoMcpApp(ChatViewMixin, ViewsMixin, VoiceMixin, SettingsMixin, App):
         we piggyback on it — wait for its event and return its result.
         This prevents MCP client retries from spamming the inbox.
         """
-        import time as _time
+        item, state = self._enqueue_choices(session, preamble, choices)
+        if state == "piggyback":
+            item.event.wait()
+            return item.result or {"selected": "_restart", "summary": "Piggyback resolved"}
+        if state == "suppressed":
+            return item.result or {"selected": "_restart", "summary": "Duplicate suppressed"}
+        return self._await_inbox_turn(session, item)
+
+    async def _present_choices_inner_async(self, session: Session, preamble: str,
+                                           choices: list[dict]) -> dict:
+        item, state = await _offload(self._enqueue_choices, session, preamble, choices)
+        if state == "piggyback":
+            await item.event.wait_async()
+            return item.result or {"selected": "_restart", "summary": "Piggyback resolved"}
+        if state == "suppressed":
+            return item.result or {"selected": "_restart", "summary": "Duplicate suppressed"}
+        return await self._await_inbox_turn_async(session, item)
+
+    def _enqueue_choices(self, session: Session, preamble: str,
+                         choices: list[dict]) -> tuple[InboxItem, str]:
+        """Dedup and enqueue a choices item; returns ``(item, state)``.
 
+        ``state`` is "queued" for a new item, "piggyback" when ``item`` is
+        an identical pending one (an MCP retry — wait for its result), or
+        "suppressed" when the duplicate already carries its result.
+        """
         self._touch_session(session)
 
         # Create and atomically dedup+enqueue our inbox item.
         # dedup_and_enqueue() returns:
         #   True — item was enqueued as new
         #   InboxItem — existing pending item to piggyback on
-        item = InboxItem(kind="choices", preamble=preamble, choices=list(choices))
+        item = InboxItem(kind="choices", preamble=preamble, choices=list(choices),
+                         call_key=current_call_key.get())
         enqueued = session.dedup_and_enqueue(item)
 
         if isinstance(enqueued, InboxItem):
-            # Piggyback on existing pending item — wait for its result.
-            # This is an MCP retry; the original is already queued/presented.
-            existing = enqueued
-            existing.event.wait()
-            return existing.result or {"selected": "_restart", "summary": "Piggyback resolved"}
+            # The original is already queued/presented
+            return enqueued, "piggyback"
 
         if not enqueued:
-            # Item was suppressed as a duplicate — return the pre-set result
-            return item.result or {"selected": "_restart", "summary": "Duplicate suppressed"}
+            return item, "suppressed"
 
         # Update tab bar to show inbox count
-        self._safe_call(self._update_tab_bar)
+        self._invalidate("tab_bar")
 
         # Always update the unified inbox so new items appear immediately
         self._inbox_scroll_index = 0
-        self._safe_call(self._update_inbox_list)
+        self._invalidate("inbox")
 
         # Play inbox chime if user is already viewing choices for this session
         if session.active and self._is_focused(session.session_id):
@@ -2030,6 +2116,14 @@ class IoMcpApp(ChatViewMixin, ViewsMixin, VoiceMixin, SettingsMixin, App):
         # Kick a drain worker in case there are speech items ahead of us
         self._drain_session_inbox_worker(session)
 
+        return item, "queued"
+
+    def _await_inbox_turn(self, session: Session, item: InboxItem) -> dict:
+        """Wait until ``item`` reaches the front of the inbox, then present it.
+
+        Blocks until the user answers (or the item is resolved externally)
+        and returns the result.
+        """
         # ── Drain loop: wait for our turn, then present ──
         while True:
             front = session.peek_inbox()
@@ -2037,14 +2131,7 @@ class IoMcpApp(ChatViewMixin, ViewsMixin, VoiceMixin, SettingsMixin, App):
             if front is item:
                 # We're at the front — present our choices
                 result = self._activate_and_present(session, item)
-
-                # Drain completed item
-                session.peek_inbox()  # moves done items to inbox_done
-
-                # Wake up the next queued item (if any) immediately
-                session.drain_kick.set()
-                self._safe_call(self._update_tab_bar)
-
+                self._advance_inbox(session)
                 return result
 
             # Not at front — wait for our turn via drain_kick or item event
@@ -2057,16 +2144,209 @@ class IoMcpApp(ChatViewMixin, ViewsMixin, VoiceMixin, SettingsMixin, App):
                 # We were resolved externally (e.g. quit, restart)
                 return item.result or {"selected": "timeout", "summary": ""}
 
+    async def _await_inbox_turn_async(self, session: Session, item: InboxItem) -> dict:
+        """Async _await_inbox_turn: waits on inbox events instead of polling.
+
+        Wakes when our item or the one in front of it resolves, and
+        re-checks every second for queue changes that resolve nothing
+        (orphan cleanup, an undo re-inserted at the front).
+        """
+        while True:
+            front = session.peek_inbox()
+            if front is item:
+                await _offload(self._activate_choices, session, item)
+                await item.event.wait_async()
+                return await _offload(self._finish_inbox_turn, session, item)
+            if item.done:
+                return item.result or {"selected": "timeout", "summary": ""}
+            waiters = {asyncio.ensure_future(item.event.wait_async())}
+            if front is not None:
+                waiters.add(asyncio.ensure_future(front.event.wait_async()))
+            try:
+                await asyncio.wait(waiters, timeout=1.0,
+                                   return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                for waiter in waiters:
+                    waiter.cancel()
+
+    def _advance_inbox(self, session: Session) -> None:
+        """After a turn: drain the answered item and wake the next one."""
+        session.peek_inbox()  # moves done items to inbox_done
+        session.drain_kick.set()
+        self._invalidate("tab_bar")
+
+    def _finish_inbox_turn(self, session: Session, item: InboxItem) -> dict:
+        result = self._finish_choices(session, item)
+        self._advance_inbox(session)
+        return result
+
+    # Results that end a batch early — the remaining questions get the same result
+    _BATCH_ABORT = ("_cancelled", "_dismissed", "_restart", "error")
+
+    def present_choices_batch(self, session: Session,
+                              questions: list[tuple[str, list[dict]]]) -> list[dict]:
+        """Show several choice sets back-to-back and block until all are answered.
+
+        Thread-safe. One result dict per question, in order. If a question
+        is cancelled, dismissed or interrupted by a TUI restart, the
+        remaining ones are resolved with the same result.
+        """
+        try:
+            return self._present_choices_batch_inner(session, questions)
+        except RuntimeError as exc:
+            if "App is not running" in str(exc):
+                return [{"selected": "_restart", "summary": "TUI restarting"}
+                        for _ in questions]
+            raise
+        except Exception as exc:
+            return self._batch_presentation_error(exc, len(questions))
+
+    async def present_choices_batch_async(self, session: Session,
+                                          questions: list[tuple[str, list[dict]]]) -> list[dict]:
+        """Async twin of present_choices_batch (see present_choices_async)."""
+        try:
+            items = await _offload(self._enqueue_choice_batch, session, questions)
+            results: list[dict] = []
+            for idx, item in enumerate(items):
+                result = await self._await_inbox_turn_async(session, item)
+                while result.get("selected") == "_undo":
+                    item = await _offload(self._requeue_front, session, item)
+                    result = await self._await_inbox_turn_async(session, item)
+                results.append(result)
+                if result.get("selected") in self._BATCH_ABORT:
+                    results += await _offload(self._abort_batch, session, items[idx + 1:], result)
+                    break
+            return results
+        except RuntimeError as exc:
+            if "App is not running" in str(exc):
+                return [{"selected": "_restart", "summary": "TUI restarting"}
+                        for _ in questions]
+            raise
+        except Exception as exc:
+            return await _offload(self._batch_presentation_error, exc, len(questions))
+
+    def _batch_presentation_error(self, exc: Exception, n: int) -> list[dict]:
+        err = f"{type(exc).__name__}: {str(exc)[:200]}"
+        _log.error("present_choices_batch error: %s", err, exc_info=exc)
+        try:
+            self._tts.speak_async(f"Choice presentation error: {str(exc)[:80]}")
+        except Exception:
+            pass
+        return [{"selected": "error", "summary": f"TUI error: {err}"} for _ in range(n)]
+
+    def _present_choices_batch_inner(self, session: Session,
+                                     questions: list[tuple[str, list[dict]]]) -> list[dict]:
+        """Inner implementation of present_choices_batch.
+
+        All questions are enqueued together, so they sit next to each other
+        in the inbox and each one is presented the moment the previous one
+        is answered (the normal drain auto-advance). TTS fragments for every
+        question are pregenerated up front, so later questions start from a
+        warm cache instead of waiting on the TTS API.
+        """
+        items = self._enqueue_choice_batch(session, questions)
+        results: list[dict] = []
+        for idx, item in enumerate(items):
+            result = self._await_inbox_turn(session, item)
+            while result.get("selected") == "_undo":
+                item = self._requeue_front(session, item)
+                result = self._await_inbox_turn(session, item)
+            results.append(result)
+            if result.get("selected") in self._BATCH_ABORT:
+                results += self._abort_batch(session, items[idx + 1:], result)
+                break
+        return results
+
+    def _enqueue_choice_batch(self, session: Session,
+                              questions: list[tuple[str, list[dict]]]) -> list[InboxItem]:
+        """Pregenerate and enqueue one choices item per question, in order."""
+        self._touch_session(session)
+
+        n = len(questions)
+        items = [
+            InboxItem(kind="choices",
+                      preamble=f"({i + 1}/{n}) {preamble}" if n > 1 else preamble,
+                      choices=list(choices))
+            for i, (preamble, choices) in enumerate(questions)
+        ]
+
+        # Pregenerate every question's labels and summaries in one pass
+        fragments: list[str] = []
+        seen: set[str] = set()
+        for item in items:
+            for c in item.choices:
+                for text in (c.get('label', ''), c.get('summary', '')):
+                    if text and text not in seen:
+                        fragments.append(text)
+                        seen.add(text)
+        if fragments:
+            scroll_speed = self._config.tts_speed_for("scroll") if self._config else None
+            self._pregenerate_priority_worker(fragments, speed_override=scroll_speed)
+
+        session.enqueue_batch(items)
+
+        self._invalidate("tab_bar")
+        self._inbox_scroll_index = 0
+        self._invalidate("inbox")
+        if session.active and self._is_focused(session.session_id):
+            self._tts.play_chime("inbox")
+        self._drain_session_inbox_worker(session)
+        return items
+
+    def _requeue_front(self, session: Session, item: InboxItem) -> InboxItem:
+        """Re-present the same question in place (after an undo)."""
+        again = InboxItem(kind="choices", preamble=item.preamble, choices=list(item.choices),
+                          call_key=item.call_key)
+        session.enqueue_front(again)
+        return again
+
+    def _abort_batch(self, session: Session, rest: list[InboxItem], result: dict) -> list[dict]:
+        """Resolve a batch's remaining questions with the aborting ``result``."""
+        results = []
+        for item in rest:
+            if not item.done:
+                item.result = dict(result)
+                item.done = True
+                item.event.set()
+            results.append(item.result)
+        session.peek_inbox()  # move the aborted items to inbox_done
+        session.drain_kick.set()
+        self._invalidate("inbox", "tab_bar")
+        return results
+
     def _activate_and_present(self, session: Session, item: InboxItem) -> dict:
         """Activate an inbox item as the current choice presentation.
 
         Sets up session state from the item and blocks until the user selects.
         """
+        self._activate_choices(session, item)
+        # Block until selection (on the inbox item's event, not session.selection_event)
+        item.event.wait()
+        return self._finish_choices(session, item)
+
+    def _finish_choices(self, session: Session, item: InboxItem) -> dict:
+        """Deactivate the session once ``item`` is answered; returns the result."""
+        session.active = False
+
+        # Reset ambient timer — selection counts as activity
+        session.last_tool_call = time.time()
+        session.ambient_count = 0
+
+        self._invalidate("tab_bar")
+        return item.result or session.selection or {"selected": "timeout", "summary": ""}
+
+    def _activate_choices(self, session: Session, item: InboxItem) -> None:
+        """Show ``item``'s choices and read them out; returns before the answer.
+
+        Runs on a worker thread (speech blocks), but the wait for the user
+        is left to the caller.
+        """
         import time as _time
 
         preamble = item.preamble
         choices = item.choices
 
+        item.presented_at = _time.time()
         session.preamble = preamble
         session.choices = list(choices)
         session.selection = None
@@ -2094,9 +2374,36 @@ class IoMcpApp(ChatViewMixin, ViewsMixin, VoiceMixin, SettingsMixin, App):
                 # If app is not running, just clear the guard directly
                 self._settings_just_closed = False
 
-        # Emit event for remote frontends
+        # Build TTS texts (skip silent options in intro readout)
+        numbered_labels = []
+        numbered_full_all = []
+        for i, c in enumerate(choices):
+            is_silent = c.get('_silent', False)
+            label_text = f"{i+1}. {c.get('label', '')}"
+            s = c.get('summary', '')
+            full_text = f"{i+1}. {c.get('label', '')}. {s}" if s else label_text
+
+            if not is_silent:
+                numbered_labels.append(label_text)
+            numbered_full_all.append(full_text)
+
+        titles_readout = " ".join(numbered_labels)
+        full_intro = f"{preamble} Your options are: {titles_readout}"
+
+        # Emit event for remote frontends, with the clip keys of the readout
         try:
-            frontend_api.emit_choices_presented(session.session_id, preamble, choices)
+            if self._conversation_mode and is_fg:
+                intro_key = self._audio_key(preamble)
+            else:
+                intro_key = self._audio_key(
+                    full_intro,
+                    speed_override=self._config.tts_speed_for("preamble") if self._config else None)
+            audio = None
+            if intro_key:
+                audio = {"intro": intro_key,
+                         "choices": [self._audio_key(t) for t in numbered_full_all]}
+            frontend_api.emit_choices_presented(session.session_id, preamble, choices,
+                                                audio=audio)
         except Exception:
             pass
 
@@ -2139,16 +2446,8 @@ class IoMcpApp(ChatViewMixin, ViewsMixin, VoiceMixin, SettingsMixin, App):
             if self._conversation_mode and session.active:
                 self._safe_call(self._start_voice_recording)
 
-            # Block until selection (voice recording will set it)
-            item.event.wait()
-            session.active = False
-
-            # Reset ambient timer
-            session.last_tool_call = _time.time()
-            session.ambient_count = 0
-
-            self._safe_call(self._update_tab_bar)
-            return item.result or session.selection or {"selected": "timeout", "summary": ""}
+            # The voice recording resolves the item
+            return
 
         # ── Normal mode: full choice presentation ──
         # Build the full list: extras + real choices
@@ -2157,22 +2456,6 @@ class IoMcpApp(ChatViewMixin, ViewsMixin, VoiceMixin, SettingsMixin, App):
         session.extras_count = len(EXTRA_OPTIONS)
         session.all_items = list(EXTRA_OPTIONS) + session.choices
 
-        # Build TTS texts (skip silent options in intro readout)
-        numbered_labels = []
-        numbered_full_all = []
-        for i, c in enumerate(choices):
-            is_silent = c.get('_silent', False)
-            label_text = f"{i+1}. {c.get('label', '')}"
-            s = c.get('summary', '')
-            full_text = f"{i+1}. {c.get('label', '')}. {s}" if s else label_text
-
-            if not is_silent:
-                numbered_labels.append(label_text)
-            numbered_full_all.append(full_text)
-
-        titles_readout = " ".join(numbered_labels)
-        full_intro = f"{preamble} Your options are: {titles_readout}"
-
         # Show UI immediately if this is the focused session
         if is_fg:
             self._safe_call(self._show_choices)
@@ -2188,7 +2471,7 @@ class IoMcpApp(ChatViewMixin, ViewsMixin, VoiceMixin, SettingsMixin, App):
                 self._safe_call(self._show_choices)
 
         # Update tab bar (session now has active choices indicator)
-        self._safe_call(self._update_tab_bar)
+        self._invalidate("tab_bar")
 
         # Pregenerate TTS fragments with priority for the first 3 choices.
         # Instead of pregenerating full strings like "1. Fix a bug. Debug and fix",
@@ -2360,18 +2643,6 @@ class IoMcpApp(ChatViewMixin, ViewsMixin, VoiceMixin, SettingsMixin, App):
 
                 threading.Thread(target=_auto_reply_worker, daemon=True).start()
 
-        # Block until selection (on the inbox item's event, not session.selection_event)
-        item.event.wait()
-        session.active = False
-
-        # Reset ambient timer — selection counts as activity
-        session.last_tool_call = _time.time()
-        session.ambient_count = 0
-
-        self._safe_call(self._update_tab_bar)
-
-        return item.result or session.selection or {"selected": "timeout", "summary": ""}
-
     def present_multi_select(self, session: Session, preamble: str, choices: list[dict]) -> list[dict]:
         """Show choices with toggleable checkboxes. Returns list of selected items.
 
@@ -2971,28 +3242,6 @@ class IoMcpApp(ChatViewMixin, ViewsMixin, VoiceMixin, SettingsMixin, App):
 
     # ─── Inbox list (left pane of two-column layout) ───────────────
 
-    @staticmethod
-    def _dedup_done_items(done: list) -> list:
-        """Deduplicate done inbox items by preamble.
-
-        When agents repeatedly present choices with the same preamble
-        (e.g. "What would you like to do next?"), the done list accumulates
-        many visually identical entries.  This keeps only the most recent
-        item for each unique preamble, preserving chronological order.
-        """
-        seen: dict[str, int] = {}  # preamble → index of kept item
-        deduped: list = []
-        for item in done:
-            key = item.preamble
-            if key in seen:
-                # Replace the earlier item with this newer one
-                deduped[seen[key]] = item
-            else:
-                seen[key] = len(deduped)
-                deduped.append(item)
-        # Remove any None placeholders (shouldn't happen, but be safe)
-        return [i for i in deduped if i is not None]
-
     def _update_inbox_list(self) -> None:
         """Update the inbox list (left pane) with items from ALL sessions.
 
@@ -3000,7 +3249,12 @@ class IoMcpApp(ChatViewMixin, ViewsMixin, VoiceMixin, SettingsMixin, App):
         name prefix so the user knows which agent sent it. Items are sorted
         by timestamp (newest first for pending, oldest first for done).
 
-        Uses a combined generation counter to skip no-op rebuilds.
+        Uses a combined generation counter to skip no-op updates, and
+        reconciles rows by item identity (``reconcile_inbox_list``) rather
+        than rebuilding, so scroll position and the highlighted row survive.
+        Only a window of ``INBOX_WINDOW`` rows around the cursor is mounted;
+        ``inbox_index`` and ``_inbox_scroll_index`` are positions in the
+        full list, not the window.
         Skips UI updates when user is composing freeform input or a message.
         In chat view, the inbox is never shown — skip entirely.
         """
@@ -3020,7 +3274,7 @@ class IoMcpApp(ChatViewMixin, ViewsMixin, VoiceMixin, SettingsMixin, App):
             sessions = self.manager.all_sessions()
 
             if not sessions:
-                inbox_list.clear()
+                reconcile_inbox_list(inbox_list, [])
                 inbox_list.display = False
                 self._inbox_last_generation = -1
                 return
@@ -3034,41 +3288,21 @@ class IoMcpApp(ChatViewMixin, ViewsMixin, VoiceMixin, SettingsMixin, App):
                 return
 
             if gen == self._inbox_last_generation:
-                if self._inbox_scroll_index < len(inbox_list.children):
-                    inbox_list.index = self._inbox_scroll_index
-                return
+                pos = self._inbox_scroll_index - self._inbox_window_start
+                if 0 <= pos < len(inbox_list.children):
+                    inbox_list.index = pos
+                    return
+                # Cursor moved outside the mounted window: slide it below
             self._inbox_last_generation = gen
 
-            inbox_list.clear()
-
-            # Collect choice items from all sessions (skip speech-only items
-            # which process automatically and add noise to the inbox)
-            all_pending: list[tuple[InboxItem, Session]] = []
-            all_done: list[tuple[InboxItem, Session]] = []
-            any_registered = False
-
-            for sess in sessions:
-                if sess.registered:
-                    any_registered = True
-                for item in sess.inbox:
-                    if not item.done and item.kind == "choices":
-                        all_pending.append((item, sess))
-                for item in sess.inbox_done:
-                    all_done.append((item, sess))
-
-            # Deduplicate done items per session — only show choice items
-            # (speech-only done items are noise: "Running tests", "All passed", etc.)
-            done_deduped: list[tuple[InboxItem, Session]] = []
-            for sess in sessions:
-                sess_done = [item for item in sess.inbox_done if item.kind == "choices"]
-                deduped = self._dedup_done_items(sess_done)
-                for item in deduped[-5:]:  # Last 5 done per session
-                    done_deduped.append((item, sess))
+            all_pending, done_deduped = self._inbox_rows(sessions)
+            any_registered = any(sess.registered for sess in sessions)
 
             total = len(all_pending) + len(done_deduped)
             multi_agent = self.manager.count() > 1
 
             if total == 0 and not any_registered:
+                reconcile_inbox_list(inbox_list, [])
                 inbox_list.display = False
                 return
 
@@ -3084,54 +3318,99 @@ class IoMcpApp(ChatViewMixin, ViewsMixin, VoiceMixin, SettingsMixin, App):
                 if ai is not None:
                     active_items.add(id(ai))
 
-            # Sort pending by timestamp (newest first)
-            all_pending.sort(key=lambda x: x[0].timestamp, reverse=True)
-            # Sort done by timestamp (newest first)
-            done_deduped.sort(key=lambda x: x[0].timestamp, reverse=True)
-
-            idx = 0
-            for item, sess in all_pending:
-                is_active = id(item) in active_items
-                inbox_list.append(InboxListItem(
+            ordered = all_pending + done_deduped
+            rows = []
+            for idx, (item, sess) in enumerate(ordered):
+                rows.append(((sess.session_id, id(item)), dict(
                     preamble=item.preamble or item.text,
-                    is_done=False,
-                    is_active=is_active,
+                    is_done=item.done,
+                    is_active=not item.done and id(item) in active_items,
                     inbox_index=idx,
                     n_choices=len(item.choices),
                     session_name=sess.name if multi_agent else "",
                     accent_color=accent_color if multi_agent else "",
                     kind=item.kind,
                     session_id=sess.session_id,
-                ))
-                idx += 1
-
-            for item, sess in done_deduped[:10]:  # Show last 10 done total
-                inbox_list.append(InboxListItem(
-                    preamble=item.preamble or item.text,
-                    is_done=True,
-                    is_active=False,
-                    inbox_index=idx,
-                    n_choices=len(item.choices),
-                    session_name=sess.name if multi_agent else "",
-                    accent_color=accent_color if multi_agent else "",
-                    kind=item.kind,
-                    session_id=sess.session_id,
-                ))
-                idx += 1
-
-            # Highlight the active item
-            if self._inbox_scroll_index < len(inbox_list.children):
-                inbox_list.index = self._inbox_scroll_index
-            else:
-                inbox_list.index = 0
+                )))
+
+            # The cursor follows its row when the user left it there;
+            # callers that moved _inbox_scroll_index want that position.
+            highlighted = inbox_list.highlighted_child
+            cursor = self._inbox_scroll_index
+            if (isinstance(highlighted, InboxListItem) and not highlighted.retired
+                    and highlighted.inbox_index == cursor):
+                cursor = next((i for i, (key, _) in enumerate(rows)
+                               if key == highlighted.row_key), cursor)
+            if not 0 <= cursor < len(rows):
+                cursor = 0
+            # Record it now: a redraw may run before the Highlighted message
+            self._inbox_scroll_index = cursor
+            start = inbox_window_start(len(rows), cursor, self._inbox_window_start)
+            self._inbox_window_start = start
+            self._inbox_window_total = len(rows)
+            reconcile_inbox_list(inbox_list, rows[start:start + INBOX_WINDOW],
+                                 cursor_index=cursor - start)
 
         except Exception:
             _log.debug("_update_inbox_list failed", exc_info=True)
 
+    def _slide_inbox_window(self) -> None:
+        """Re-window the inbox list once the cursor nears a window edge."""
+        start = self._inbox_window_start
+        total = self._inbox_window_total
+        if inbox_window_start(total, self._inbox_scroll_index, start) != start:
+            self._inbox_last_generation = -1
+            self.call_later(self._update_inbox_list)
+
+    def _inbox_rows(self, sessions: list[Session]
+                    ) -> tuple[list[tuple[InboxItem, Session]], list[tuple[InboxItem, Session]]]:
+        """Rows of the unified inbox list, in display order.
+
+        Returns ``(pending, done)``: pending choice items from all sessions
+        sorted newest first (or in ``config.session.inboxSchedule`` order
+        when a scheduling policy is set), then up to 10 resolved choice
+        items (the last 5 distinct preambles per session), also newest
+        first. Speech-only items are skipped — they process automatically
+        and add noise.
+
+        Done rows are found by walking each session's ``inbox_done`` from
+        the end and stopping after 5 distinct preambles, so the cost doesn't
+        grow with the length of the resolved history. Shared by
+        ``_update_inbox_list`` and ``_get_inbox_item_at_index`` so list
+        positions always map back to the same item.
+        """
+        pending: list[tuple[InboxItem, Session]] = []
+        done: list[tuple[InboxItem, Session]] = []
+        for sess in sessions:
+            for item in sess.inbox:
+                if not item.done and item.kind == "choices":
+                    pending.append((item, sess))
+            seen: set[str] = set()
+            for item in reversed(sess.inbox_done):
+                if item.kind != "choices" or item.preamble in seen:
+                    continue
+                seen.add(item.preamble)
+                done.append((item, sess))
+                if len(seen) >= 5:  # Last 5 done per session
+                    break
+        policy = self._inbox_schedule()
+        if policy == "tabs":
+            pending.sort(key=lambda x: x[0].timestamp, reverse=True)
+        else:
+            pending = schedule_pending(pending, policy)
+        done.sort(key=lambda x: x[0].timestamp, reverse=True)
+        return pending, done[:10]  # Show last 10 done total
+
+    def _inbox_schedule(self) -> str:
+        """The configured cross-session scheduling policy ("tabs" if unset)."""
+        if self._config and hasattr(self._config, 'inbox_schedule'):
+            return self._config.inbox_schedule
+        return "tabs"
+
     def _get_inbox_item_at_index(self, idx: int) -> Optional[InboxItem]:
         """Get the InboxItem corresponding to an inbox list position.
 
-        Mirrors the unified inbox ordering from _update_inbox_list:
+        Uses the same ``_inbox_rows`` ordering as _update_inbox_list:
         all pending items sorted by timestamp desc, then done items.
         Returns the InboxItem or None.
         """
@@ -3139,24 +3418,11 @@ class IoMcpApp(ChatViewMixin, ViewsMixin, VoiceMixin, SettingsMixin, App):
         if not sessions:
             return None
 
-        # Collect from all sessions (same logic as _update_inbox_list)
-        all_pending: list[InboxItem] = []
-        all_done: list[InboxItem] = []
-
-        for sess in sessions:
-            for item in sess.inbox:
-                if not item.done:
-                    all_pending.append(item)
-            sess_done = self._dedup_done_items(list(sess.inbox_done))
-            all_done.extend(sess_done[-5:])
-
-        all_pending.sort(key=lambda x: x.timestamp, reverse=True)
-        all_done.sort(key=lambda x: x.timestamp, reverse=True)
-
-        ordered = all_pending + all_done[:10]
+        pending, done = self._inbox_rows(sessions)
+        ordered = pending + done
 
         if 0 <= idx < len(ordered):
-            return ordered[idx]
+            return ordered[idx][0]
         return None
 
     def _handle_inbox_select(self, inbox_widget: InboxListItem) -> None:
@@ -3282,10 +3548,21 @@ class IoMcpApp(ChatViewMixin, ViewsMixin, VoiceMixin, SettingsMixin, App):
         """
         self._touch_session(session)
 
+        voice_ov = getattr(session, 'voice_override', None)
+        model_ov = getattr(session, 'model_override', None)
+        # Per-call emotion > session override > config default
+        emotion_ov = emotion if emotion else getattr(session, 'emotion_override', None)
+        speed = (self._config.tts_speed_for("speak" if block else "speakAsync")
+                 if self._config else None)
+
         # Emit event for remote frontends
         try:
             frontend_api.emit_speech_requested(
-                session.session_id, text, blocking=block, priority=priority)
+                session.session_id, text, blocking=block, priority=priority,
+                audio_key=self._audio_key(text, voice_override=voice_ov,
+                                          emotion_override=emotion_ov,
+                                          model_override=model_ov,
+                                          speed_override=speed))
         except Exception:
             _log.debug("Failed to emit speech event to frontend API", exc_info=True)
 
@@ -3299,26 +3576,19 @@ class IoMcpApp(ChatViewMixin, ViewsMixin, VoiceMixin, SettingsMixin, App):
 
         if self._is_focused(session.session_id):
             # Foreground: play immediately
-            voice_ov = getattr(session, 'voice_override', None)
-            model_ov = getattr(session, 'model_override', None)
-            # Per-call emotion > session override > config default
-            emotion_ov = emotion if emotion else getattr(session, 'emotion_override', None)
-
             # No interruption — speech queues sequentially via the
             # TTSEngine speech lock. Urgent items queue at front of
             # the inbox but don't kill current playback.
             if block:
-                speak_speed = self._config.tts_speed_for("speak") if self._config else None
                 self._tts.speak(text, voice_override=voice_ov,
                                 emotion_override=emotion_ov,
                                 model_override=model_ov,
-                                speed_override=speak_speed)
+                                speed_override=speed)
             else:
-                async_speed = self._config.tts_speed_for("speakAsync") if self._config else None
                 self._tts.speak_async(text, voice_override=voice_ov,
                                      emotion_override=emotion_ov,
                                      model_override=model_ov,
-                                     speed_override=async_speed)
+                                     speed_override=speed)
         else:
             # Background: queue (urgent goes to front)
             entry.played = False
@@ -3328,6 +3598,11 @@ class IoMcpApp(ChatViewMixin, ViewsMixin, VoiceMixin, SettingsMixin, App):
                 session.unplayed_speech.append(entry)
             self._try_play_background_queue()
 
+    def _audio_key(self, text: str, **overrides) -> Optional[str]:
+        """Content key of the clip TTS makes for ``text`` (for remote frontends)."""
+        audio_key = getattr(self._tts, "audio_key", None)
+        return audio_key(text, **overrides) if audio_key else None
+
     def session_speak_async(self, session: Session, text: str) -> None:
         """Non-blocking speak for a session."""
         self.session_speak(session, text, block=False)
@@ -3345,12 +3620,7 @@ class IoMcpApp(ChatViewMixin, ViewsMixin, VoiceMixin, SettingsMixin, App):
         session.drain_kick.set()
         # Scroll inbox to top so newest item is visible
         self._inbox_scroll_index = 0
-        self._safe_call(self._update_tab_bar)
-        self._safe_call(self._update_inbox_list)
-
-        # Immediately refresh chat feed so new items appear without
-        # waiting for the 3-second timer
-        self._safe_call(lambda: self._notify_chat_feed_update(session))
+        self._invalidate("tab_bar", "inbox", "chat")
 
         # Start a drain worker for this session if speech items need processing
         try:
@@ -3425,16 +3695,23 @@ class IoMcpApp(ChatViewMixin, ViewsMixin, VoiceMixin, SettingsMixin, App):
         entry = SpeechEntry(text=text, priority=priority)
         session.append_speech(entry)
 
+        voice_ov = getattr(session, 'voice_override', None)
+        model_ov = getattr(session, 'model_override', None)
+        emotion_ov = getattr(session, 'emotion_override', None)
+
         # Emit event for remote frontends
         try:
             frontend_api.emit_speech_requested(
-                session.session_id, text, blocking=True, priority=priority)
+                session.session_id, text, blocking=True, priority=priority,
+                audio_key=self._audio_key(text, voice_override=voice_ov,
+                                          emotion_override=emotion_ov,
+                                          model_override=model_ov))
         except Exception:
             _log.debug("Failed to emit speech event for inbox speech item", exc_info=True)
 
         # Update inbox UI to show this item as active
         session._active_inbox_item = item
-        self._safe_call(self._update_inbox_list)
+        self._invalidate("inbox")
 
         # Show speech text in right pane if this is the focused session
         if self._is_focused(session.session_id):
@@ -3442,10 +3719,6 @@ class IoMcpApp(ChatViewMixin, ViewsMixin, VoiceMixin, SettingsMixin, App):
 
         # Play TTS — only for the focused session to prevent agents
         # talking over each other (all agents share one TTSEngine/paplay)
-        voice_ov = getattr(session, 'voice_override', None)
-        model_ov = getattr(session, 'model_override', None)
-        emotion_ov = getattr(session, 'emotion_override', None)
-
         is_focused = self._is_focused(session.session_id)
 
         if is_focused:
@@ -3468,12 +3741,10 @@ class IoMcpApp(ChatViewMixin, ViewsMixin, VoiceMixin, SettingsMixin, App):
             # Item already removed by concurrent cancel or drain worker
             pass
         session.drain_kick.set()
-        self._safe_call(self._update_inbox_list)
-        self._safe_call(self._update_tab_bar)
+        self._invalidate("inbox", "tab_bar")
 
-        # Immediately refresh chat feed so the new speech bubble appears
-        # without waiting for the 3-second timer
-        self._safe_call(lambda: self._notify_chat_feed_update(session))
+        # Show the new speech bubble in the chat feed
+        self._invalidate("chat")
 
     def _show_speech_item(self, text: str) -> None:
         """Show a speech item's text in the right pane (runs on textual thread)."""
@@ -3858,7 +4129,7 @@ class IoMcpApp(ChatViewMixin, ViewsMixin, VoiceMixin, SettingsMixin, App):
             self._tts.speak_async("Proxy restarted. Agents need to reconnect.")
         else:
             self._tts.speak_async("Proxy restart failed.")
-        self.call_from_thread(self._update_tab_bar)
+        self._invalidate("tab_bar")
 
     def _enter_worktree_mode(self) -> None:
         """Start worktree creation flow.
@@ -4493,7 +4764,7 @@ class IoMcpApp(ChatViewMixin, ViewsMixin, VoiceMixin, SettingsMixin, App):
         session = self._focused()
         if session and (session.input_mode or session.voice_recording):
             return
-        new_session = self.manager.next_with_choices()
+        new_session = self.manager.next_with_choices(self._inbox_schedule())
         if new_session:
             self._tts.stop()
             self._speak_tab_summary(new_session)
@@ -4629,18 +4900,13 @@ class IoMcpApp(ChatViewMixin, ViewsMixin, VoiceMixin, SettingsMixin, App):
                     self.query_one("#pane-view").display = False
                 except Exception:
                     pass
-                # Build feed immediately so it's not empty for 3 seconds
+                # Build feed immediately; later updates arrive as invalidations
                 focused = self._focused()
                 if focused:
                     if self._chat_unified:
                         self._build_chat_feed(focused, sessions=all_sessions)
                     else:
                         self._build_chat_feed(focused)
-                # Start auto-refresh (stop any existing timer first)
-                if hasattr(self, '_chat_refresh_timer') and self._chat_refresh_timer:
-                    self._chat_refresh_timer.stop()
-                self._chat_refresh_timer = self.set_interval(
-                    3.0, lambda: self._refresh_chat_feed())
                 self._update_footer_status()
             try:
                 self._call_on_main_thread(_activate_chat)
@@ -4836,6 +5102,9 @@ class IoMcpApp(ChatViewMixin, ViewsMixin, VoiceMixin, SettingsMixin, App):
 
         # Chat bubble item: read clean TTS text (no markup/timestamps)
         if isinstance(event.item, ChatBubbleItem):
+            self._slide_chat_window(event.item)
+            # Scrolling back down to the newest bubble clears "↓ New"
+            self.call_after_refresh(self._check_chat_scroll_position)
             text = getattr(event.item, 'tts_text', '')
             if text:
                 now = time.time()
@@ -4855,6 +5124,7 @@ class IoMcpApp(ChatViewMixin, ViewsMixin, VoiceMixin, SettingsMixin, App):
             # is confusing. The user can still select done items to review them.
             if event.item.is_done:
                 self._inbox_scroll_index = event.item.inbox_index
+                self._slide_inbox_window()
                 return
 
             preamble = event.item.inbox_preamble if event.item.inbox_preamble else "no preamble"
@@ -4874,6 +5144,7 @@ class IoMcpApp(ChatViewMixin, ViewsMixin, VoiceMixin, SettingsMixin, App):
                 self._tts.speak_with_local_fallback(text)
             # Track scroll position in inbox
             self._inbox_scroll_index = event.item.inbox_index
+            self._slide_inbox_window()
             return
 
         session = self._focused()
@@ -4960,10 +5231,14 @@ class IoMcpApp(ChatViewMixin, ViewsMixin, VoiceMixin, SettingsMixin, App):
             if getattr(self, '_history_mode', False):
                 if isinstance(event.item, ChoiceItem) and session:
                     idx = event.item.display_index
-                    history = getattr(session, 'history', [])
-                    if idx < len(history):
+                    history = getattr(self, '_history_entries', [])
+                    if idx < 0:
+                        self._speak_ui("Load older selections")
+                    elif idx < len(history):
                         entry = history[idx]
-                        text = f"{entry.label}. {entry.summary}" if entry.summary else entry.label
+                        label = entry.get("label", "")
+                        summary = entry.get("summary", "")
+                        text = f"{label}. {summary}" if summary else label
                         self._speak_ui(text)
                 return
             # Tab picker: switch to the highlighted tab live
@@ -5191,8 +5466,12 @@ class IoMcpApp(ChatViewMixin, ViewsMixin, VoiceMixin, SettingsMixin, App):
                     self._clear_all_modal_state(session=session)
                     self._do_spawn(spawn_opts[idx])
                     return
-                # Check if we're in system logs mode (Enter closes it)
+                # Check if we're in system logs mode (Enter closes it,
+                # except on the "load older" row)
                 if getattr(self, '_system_logs_mode', False):
+                    if idx == getattr(self, '_system_log_older_index', None):
+                        self._load_older_speech_log()
+                        return
                     self._system_logs_mode = False
                     self._exit_settings()
                     return
@@ -5201,8 +5480,12 @@ class IoMcpApp(ChatViewMixin, ViewsMixin, VoiceMixin, SettingsMixin, App):
                     self._help_mode = False
                     self._exit_settings()
                     return
-                # Check if we're in history mode (Enter closes it)
+                # Check if we're in history mode (Enter closes it,
+                # except on the "load older" row)
                 if getattr(self, '_history_mode', False):
+                    if idx < 0:
+                        self._load_older_history()
+                        return
                     self._history_mode = False
                     self._exit_settings()
                     return
@@ -6322,8 +6605,8 @@ class IoMcpApp(ChatViewMixin, ViewsMixin, VoiceMixin, SettingsMixin, App):
         if current_session.inbox_choices_count() > 0:
             return  # Same session has more — drain loop will present them
 
-        # Find another session with pending choices
-        next_session = self.manager.next_with_choices()
+        # Find another session with pending choices (in scheduling-policy order)
+        next_session = self.manager.next_with_choices(self._inbox_schedule())
         if next_session and next_session.session_id != current_session.session_id:
             # Brief delay so "Selected: X" audio has a moment to start.
             # Use set_timer instead of time.sleep to avoid blocking the event loop.
@@ -6682,14 +6965,17 @@ class IoMcpApp(ChatViewMixin, ViewsMixin, VoiceMixin, SettingsMixin, App):
 
         Displays entries with timestamps, labels, and preambles.
         Each entry is read aloud when highlighted. Press Escape to return.
+        Starts with the in-memory history; when older selections were
+        spilled to the session's archive, a "load older" row at the top
+        pages them in 50 at a time.
         """
         session = self._focused()
         if not session:
             self._speak_ui("No session active")
             return
 
-        history = getattr(session, 'history', [])
-        if not history:
+        entries, total = session.page_history("history", limit=session._history_max)
+        if not entries:
             self._speak_ui("No history yet for this session")
             return
 
@@ -6705,14 +6991,41 @@ class IoMcpApp(ChatViewMixin, ViewsMixin, VoiceMixin, SettingsMixin, App):
         self._in_settings = True
         self._setting_edit_mode = False
         self._history_mode = True
+        self._history_entries = entries
+        self._history_total = total
+
+        self._render_history(session)
+
+        count = len(entries)
+        self._speak_ui(f"History. {count} selections. Most recent shown.")
+
+    def _load_older_history(self) -> None:
+        """Page the next 50 archived selections into the history view."""
+        session = self._focused()
+        if not session:
+            return
+        loaded = getattr(self, '_history_entries', [])
+        older, total = session.page_history("history", skip=len(loaded), limit=50)
+        if not older:
+            return
+        self._history_entries = older + loaded
+        self._history_total = total
+        # Land on the newest of the freshly loaded entries
+        self._render_history(session, index=len(older) - 1)
+        self._speak_ui(f"Loaded {len(older)} older selections")
+
+    def _render_history(self, session: Session, index: Optional[int] = None) -> None:
+        """Populate #choices from ``_history_entries`` (oldest first)."""
+        entries = self._history_entries
+        total = self._history_total
+        older = total - len(entries)
 
         s = self._cs
-        count = len(history)
         preamble_widget = self.query_one("#preamble", Label)
         preamble_widget.update(
             f"[bold {s['accent']}]History[/bold {s['accent']}] — "
             f"[{s['fg_dim']}]{session.name}[/{s['fg_dim']}] — "
-            f"{count} selection{'s' if count != 1 else ''} "
+            f"{total} selection{'s' if total != 1 else ''} "
             f"[dim](esc to close)[/dim]"
         )
         preamble_widget.display = True
@@ -6724,8 +7037,16 @@ class IoMcpApp(ChatViewMixin, ViewsMixin, VoiceMixin, SettingsMixin, App):
 
         import time as _time
 
-        for i, entry in enumerate(history):
-            age = _time.time() - entry.timestamp
+        offset = 0
+        if older > 0:
+            # display_index -1 marks the pager row (Enter loads, not closes)
+            list_view.append(ChoiceItem(
+                f"[{s['fg_dim']}]↑ Load older[/{s['fg_dim']}]",
+                f"{older} more archived", index=0, display_index=-1))
+            offset = 1
+
+        for i, entry in enumerate(entries):
+            age = _time.time() - entry.get("timestamp", 0)
             if age < 60:
                 time_str = f"{int(age)}s ago"
             elif age < 3600:
@@ -6733,16 +7054,16 @@ class IoMcpApp(ChatViewMixin, ViewsMixin, VoiceMixin, SettingsMixin, App):
             else:
                 time_str = f"{int(age)//3600}h{int(age)%3600//60:02d}m ago"
 
-            label = f"[{s['fg_dim']}]{time_str}[/{s['fg_dim']}]  {entry.label}"
-            summary = entry.summary if entry.summary else entry.preamble if entry.preamble else ""
+            label = f"[{s['fg_dim']}]{time_str}[/{s['fg_dim']}]  {entry.get('label', '')}"
+            summary = entry.get("summary") or entry.get("preamble") or ""
             list_view.append(ChoiceItem(label, summary, index=i + 1, display_index=i))
 
         list_view.display = True
-        list_view.index = max(0, len(history) - 1)  # Start at most recent
+        if index is None:
+            index = len(entries) - 1  # Start at most recent
+        list_view.index = max(0, index + offset)
         list_view.focus()
 
-        self._speak_ui(f"History. {count} selections. Most recent shown.")
-
     def action_undo_selection(self) -> None:
         """Undo the last selection — signal the server to re-present choices.
 
@@ -6810,6 +7131,7 @@ class IoMcpApp(ChatViewMixin, ViewsMixin, VoiceMixin, SettingsMixin, App):
                 session._inbox_generation += 1
             elif item in session.inbox_done:
                 session.inbox_done.remove(item)
+                session._timeline.discard(item)
                 session._inbox_generation += 1
 
         # Re-activate the session with the saved choices
@@ -12,7 +12,9 @@ When active, #main-content is hidden but choices still render normally.
 
 from __future__ import annotations
 
+import heapq
 import time as _time
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 from textual.app import ComposeResult
@@ -28,6 +30,43 @@ if TYPE_CHECKING:
 
 _log = get_logger("io-mcp.tui.chat", TUI_ERROR_LOG)
 
+# The feed keeps a ChatRow per event for the whole history but mounts
+# ChatBubbleItem widgets only for CHAT_WINDOW rows around the cursor.
+CHAT_WINDOW = 60
+CHAT_WINDOW_MARGIN = 10
+# Events per session in the row model — the timeline index's own cap.
+CHAT_HISTORY = 1000
+
+_CHAT_KINDS = ("speech", "choices", "user_msg", "activity")
+
+
+def _chat_shown(ev) -> bool:
+    """Whether a timeline event gets a chat row (activity already shown
+    as speech/selection/choices is skipped)."""
+    if ev.kind == "activity":
+        return ev.ref.get("kind", "tool") not in ("speech", "selection", "choices")
+    return True
+
+
+def _chat_tts_text(kind: str, text: str, agent_name: str, resolved: bool,
+                   result: str, choices: list[dict], flushed: bool, freeform: bool) -> str:
+    """Clean plain text for TTS readout of one chat row."""
+    if kind == "header":
+        return f"{agent_name} session"
+    elif kind == "speech":
+        return text
+    elif kind == "choices":
+        if freeform and resolved and result:
+            return f"replied: {result}"
+        if resolved and result:
+            return f"selected {result}"
+        labels = ", ".join(c.get("label", "") for c in choices[:5])
+        return f"{text}. {labels}"
+    elif kind == "user_msg":
+        status = "sent" if flushed else "queued"
+        return f"you, {status}: {text}"
+    return text
+
 
 # ─── Chat Bubble Item ────────────────────────────────────────────────
 
@@ -81,23 +120,9 @@ class ChatBubbleItem(ListItem):
 
     def _make_tts_text(self) -> str:
         """Build clean plain text for TTS readout."""
-        if self.bubble_kind == "header":
-            return f"{self.agent_name} session"
-        elif self.bubble_kind == "speech":
-            return self.bubble_text
-        elif self.bubble_kind == "choices":
-            if self.bubble_freeform and self.bubble_resolved and self.bubble_result:
-                return f"replied: {self.bubble_result}"
-            if self.bubble_resolved and self.bubble_result:
-                return f"selected {self.bubble_result}"
-            labels = ", ".join(c.get("label", "") for c in self.bubble_choices[:5])
-            return f"{self.bubble_text}. {labels}"
-        elif self.bubble_kind == "user_msg":
-            status = "sent" if self.bubble_flushed else "queued"
-            return f"you, {status}: {self.bubble_text}"
-        elif self.bubble_kind == "system":
-            return self.bubble_text
-        return self.bubble_text
+        return _chat_tts_text(self.bubble_kind, self.bubble_text, self.agent_name,
+                              self.bubble_resolved, self.bubble_result,
+                              self.bubble_choices, self.bubble_flushed, self.bubble_freeform)
 
     def compose(self) -> ComposeResult:
         """Render the bubble's Textual widgets based on its kind.
@@ -228,6 +253,42 @@ class ChatBubbleItem(ListItem):
             )
 
 
+# ─── Chat Row Model ──────────────────────────────────────────────────
+
+@dataclass(slots=True)
+class ChatRow:
+    """One chat feed row as plain data; ``bubble()`` builds its widget.
+
+    Fields mirror ``ChatBubbleItem``'s constructor. Rows are cheap enough
+    to keep for the whole history while only the visible window is
+    mounted as widgets.
+    """
+
+    kind: str
+    text: str
+    timestamp: float
+    detail: str = ""
+    resolved: bool = False
+    result: str = ""
+    choices: list[dict] = field(default_factory=list)
+    flushed: bool = False
+    agent_name: str = "agent"
+    freeform: bool = False
+
+    @property
+    def tts_text(self) -> str:
+        return _chat_tts_text(self.kind, self.text, self.agent_name, self.resolved,
+                              self.result, self.choices, self.flushed, self.freeform)
+
+    def bubble(self) -> ChatBubbleItem:
+        return ChatBubbleItem(
+            kind=self.kind, text=self.text, timestamp=self.timestamp,
+            detail=self.detail, resolved=self.resolved, result=self.result,
+            choices=self.choices, flushed=self.flushed,
+            agent_name=self.agent_name, freeform=self.freeform,
+        )
+
+
 # ─── Chat View Mixin ─────────────────────────────────────────────────
 
 class ChatViewMixin:
@@ -248,10 +309,17 @@ class ChatViewMixin:
     - **Unified**: merges all agents' histories chronologically
       (auto-selected when multiple sessions exist).
 
+    The feed is virtualized: ``_chat_rows`` holds a ``ChatRow`` for every
+    event in the history, but only a window of ``CHAT_WINDOW`` rows is
+    mounted as widgets. The window follows new events while the user is
+    at the bottom and slides over older rows as the highlight nears its
+    edge, so mount and layout cost stay flat however long the history.
+
     Uses incremental appending when possible to avoid expensive full
-    rebuilds on every refresh. A 3-second auto-refresh timer polls
-    for data changes; callers can also trigger immediate refreshes
-    via ``_notify_chat_feed_update()``.
+    rebuilds on every refresh. Nothing polls: session changes mark the
+    ``chat`` region dirty (see ``invalidation.py``) and the next frame
+    runs ``_refresh_chat_feed()``. ``_notify_chat_feed_update()`` does the
+    same but forces a rebuild check even if the fingerprint is unchanged.
 
     Class Attributes:
         _chat_view_active: Whether the chat view is currently displayed.
@@ -262,6 +330,10 @@ class ChatViewMixin:
         _chat_base_fingerprint: Fingerprint of stable items for delta detection.
         _chat_force_full_rebuild: Flag to skip incremental append once.
         _chat_has_new_content: True when new content arrived while scrolled up.
+        _chat_cursor: Global event store cursor of the last build.
+        _chat_rows: Row model of the whole feed, oldest first.
+        _chat_mounted: Live widgets for the mounted window, in order.
+        _chat_window_start: Row index of the first mounted widget.
     """
 
     _chat_view_active: bool = False
@@ -272,6 +344,16 @@ class ChatViewMixin:
     _chat_base_fingerprint: str = ""  # Fingerprint of "stable" data (detect modifications)
     _chat_force_full_rebuild: bool = False  # Set by external code to skip incremental
     _chat_has_new_content: bool = False  # New content below scroll position
+    # Unified-mode incremental state (global EventStore cursor)
+    _chat_cursor: int = 0  # Store seq the unified feed was last built up to
+    _chat_store_epoch: int = -1  # Store epoch at last build (bumps on removals)
+    _chat_unified_key: tuple = ()  # (session id, header ts) pairs of the last unified build
+    _chat_last_ts: float = 0.0  # Newest timestamp shown in the unified feed
+    _chat_had_pending: bool = False  # Last unified build included queued messages
+    # Virtualized window (lists are assigned per instance on first build)
+    _chat_rows: list = ()  # ChatRow for every feed entry, oldest first
+    _chat_mounted: list = ()  # ChatBubbleItems for rows[_chat_window_start:...]
+    _chat_window_start: int = 0  # Row index of the first mounted bubble
 
     @_safe_action
     def action_chat_view(self: "IoMcpApp") -> None:
@@ -284,11 +366,9 @@ class ChatViewMixin:
           exist, otherwise single-session for the focused agent.
         - Builds the initial feed via ``_build_chat_feed()``.
         - If the focused session has active choices, shows them below the feed.
-        - Starts a 3-second auto-refresh timer.
 
         When toggling **off**:
         - Hides ``#chat-feed`` and ``#chat-input-bar``; restores normal views.
-        - Stops the auto-refresh timer.
         - Restores ``#main-content`` layout (height, inbox width).
         - Re-shows active choices if any, otherwise restores default view.
 
@@ -312,9 +392,6 @@ class ChatViewMixin:
                 self.query_one("#chat-input-bar").display = False
             except Exception:
                 pass
-            if hasattr(self, '_chat_refresh_timer') and self._chat_refresh_timer:
-                self._chat_refresh_timer.stop()
-                self._chat_refresh_timer = None
             # Restore main-content height and inbox width from chat view overrides
             try:
                 mc = self.query_one("#main-content")
@@ -386,12 +463,6 @@ class ChatViewMixin:
         if session.active and session.choices:
             self._show_choices()  # This will show #main-content with auto height
 
-        # Auto-refresh every 3 seconds (stop existing timer first)
-        if hasattr(self, '_chat_refresh_timer') and self._chat_refresh_timer:
-            self._chat_refresh_timer.stop()
-        self._chat_refresh_timer = self.set_interval(
-            3.0, lambda: self._refresh_chat_feed())
-
     def _chat_feed_is_at_bottom(self: "IoMcpApp") -> bool:
         """Check if the chat feed ListView is scrolled to the bottom.
 
@@ -411,6 +482,9 @@ class ChatViewMixin:
         """
         try:
             feed = self.query_one("#chat-feed", ListView)
+            # Newer rows exist below the mounted window
+            if self._chat_window_start + len(self._chat_mounted) < len(self._chat_rows):
+                return False
             # ListView inherits from ScrollView — check scroll position
             # max_scroll_y is the maximum scroll offset; scroll_y is current
             max_y = feed.max_scroll_y
@@ -427,14 +501,19 @@ class ChatViewMixin:
         """Build or incrementally update the chronological chat feed.
 
         Collects all chat-relevant data from the session(s) into
-        ``ChatBubbleItem`` widgets and populates the ``#chat-feed``
-        ``ListView``.
-
-        Uses an optimized incremental append strategy when possible:
-        items are only appended (not rebuilt) if the base fingerprint
-        is unchanged, item count didn't decrease, the 200-item cap
-        wasn't hit, and we're not in unified mode. Falls back to a
-        full clear-and-rebuild otherwise.
+        ``ChatRow`` entries (``_chat_rows``) and mounts a window of them
+        as ``ChatBubbleItem`` widgets in the ``#chat-feed`` ``ListView``.
+
+        Uses an optimized incremental append strategy when possible: the
+        delta is read from the global event store since ``_chat_cursor``
+        and appended only when the session headers (and, for a single
+        session, the base fingerprint) are unchanged, nothing is queued,
+        and every new event is newer
+        than anything already shown (so the merge order can't shift
+        existing rows). An append costs O(delta) — new rows are mounted
+        only if the window sits at the bottom, and the top is trimmed in
+        batches. Falls back to re-collecting the rows and remounting the
+        window otherwise.
 
         After populating, pre-generates TTS audio for recent items
         (last 20 on full rebuild, delta items on incremental) so
@@ -447,9 +526,9 @@ class ChatViewMixin:
                 mode.
 
         Side effects:
-            - Clears and repopulates ``#chat-feed`` (full rebuild) or
-              appends new items (incremental).
-            - Updates ``_chat_last_item_count`` and
+            - Remounts ``#chat-feed`` (full rebuild) or appends new
+              items (incremental).
+            - Updates ``_chat_rows``, ``_chat_last_item_count`` and
               ``_chat_base_fingerprint`` tracking state.
             - Scrolls to bottom if the user was already at the bottom.
             - Triggers TTS pregeneration in a background worker.
@@ -463,105 +542,88 @@ class ChatViewMixin:
         # Check scroll position BEFORE clearing so we know if user was at bottom
         was_at_bottom = self._chat_feed_is_at_bottom()
 
-        items = self._collect_chat_items(session, sessions=sessions)
+        all_sessions = sessions if sessions is not None else [session]
+        store = session._timeline.store
+        has_pending = any(s.pending_messages for s in all_sessions)
+        # Header rows sort by registration (or last activity) time, so a
+        # change there moves existing rows — include it in the key
+        unified_key = tuple(
+            (s.session_id, getattr(s, "registered_at", 0.0) or s.last_activity)
+            for s in all_sessions)
+        base_fp = "||".join(self._chat_base_fingerprint_for(s) for s in all_sessions)
 
-        # Determine whether we can do an incremental append
         # Conditions for incremental:
-        #   1. Feed already has items (not first build)
-        #   2. New item count >= old item count (items were added, not removed)
-        #   3. Base fingerprint unchanged (existing items not modified)
-        #   4. Not in unified mode (multi-session sorting makes incremental unreliable)
-        #   5. Old count was below the 200-item cap (otherwise truncation shifts items)
-        #   6. No explicit force-full-rebuild flag set
-        can_append = False
+        #   1. Row model matches the last build and is below its cap
+        #   2. Same sessions/headers, no store removals, nothing queued
+        #   3. Single-session: base fingerprint unchanged (existing items
+        #      not modified). Unified relies on the store epoch, which
+        #      bumps when a timeline re-indexes after a front trim.
+        #   4. Every event since the last cursor sorts after everything shown
+        #   5. No explicit force-full-rebuild flag set
         old_count = self._chat_last_item_count
-
+        history_cap = CHAT_HISTORY * len(all_sessions)
+        delta_rows: list[ChatRow] | None = None
         if (not self._chat_force_full_rebuild
-                and old_count > 0
-                and old_count < 200  # At cap, new items cause front truncation
-                and len(items) >= old_count
-                and sessions is None):
-            # Compute base fingerprint for all relevant sessions
-            base_fp = self._chat_base_fingerprint_for(session)
-            if base_fp == self._chat_base_fingerprint:
-                can_append = True
+                and 0 < old_count == len(self._chat_rows)
+                and old_count < history_cap + CHAT_HISTORY // 10
+                and store is not None
+                and store.epoch == self._chat_store_epoch
+                and unified_key == self._chat_unified_key
+                and not has_pending and not self._chat_had_pending
+                and (sessions is not None or base_fp == self._chat_base_fingerprint)):
+            delta_rows = self._chat_delta_rows(all_sessions, sessions is not None)
 
         # Clear the force flag after checking it
         self._chat_force_full_rebuild = False
 
-        if can_append:
-            # Incremental append — only add new items
-            delta = items[old_count:]
+        if delta_rows is not None:
             _log.info("_build_chat_feed: incremental append", extra={"context": {
                 "old_count": old_count,
-                "new_count": len(items),
-                "delta": len(delta),
+                "delta": len(delta_rows),
+                "mounted": len(self._chat_mounted),
                 "was_at_bottom": was_at_bottom,
             }})
-            for item in delta:
-                try:
-                    feed.append(item)
-                except Exception:
-                    pass
-
-            # Pregenerate TTS only for the new items
-            try:
-                tts_texts = set()
-                for item in delta:
-                    t = getattr(item, 'tts_text', '')
-                    if t and len(t) < 200:
-                        tts_texts.add(t)
-                if tts_texts and hasattr(self, '_pregenerate_ui_worker'):
-                    self._pregenerate_ui_worker(list(tts_texts))
-            except Exception:
-                pass
+            self._chat_rows.extend(delta_rows)
+            self._chat_append_rows(feed, old_count, trim=was_at_bottom)
+            pregen = delta_rows
         else:
-            # Full rebuild — clear and re-add everything
-            feed.clear()
-
+            self._chat_rows = self._collect_chat_rows(session, sessions=sessions)
             _log.info("_build_chat_feed: full rebuild", extra={"context": {
-                "n_items": len(items),
+                "n_items": len(self._chat_rows),
                 "unified": sessions is not None,
                 "was_at_bottom": was_at_bottom,
                 "auto_scroll": self._chat_auto_scroll,
                 "old_count": old_count,
             }})
-
-            for item in items:
-                try:
-                    feed.append(item)
-                except Exception:
-                    pass
-
-            # Pregenerate TTS for visible chat bubble items so scroll readout
-            # is instant (cache hit) instead of silent (cache miss → API call).
-            # Only pregenerate the last ~20 items since the user is most likely
-            # to scroll through recent history.
-            try:
-                tts_texts = set()
-                recent = items[-20:] if len(items) > 20 else items
-                for item in recent:
-                    t = getattr(item, 'tts_text', '')
-                    if t and len(t) < 200:  # skip very long texts
-                        tts_texts.add(t)
-                if tts_texts and hasattr(self, '_pregenerate_ui_worker'):
-                    self._pregenerate_ui_worker(list(tts_texts))
-            except Exception:
-                pass
+            start = len(self._chat_rows) if was_at_bottom else self._chat_window_start
+            self._chat_mount_window(feed, start)
+            # Only pregenerate the last ~20 items since the user is most
+            # likely to scroll through recent history.
+            pregen = self._chat_rows[-20:]
+
+        # Pregenerate TTS so scroll readout is instant (cache hit) instead
+        # of silent (cache miss → API call).
+        try:
+            tts_texts = {row.tts_text for row in pregen}
+            tts_texts = [t for t in tts_texts if t and len(t) < 200]  # skip very long texts
+            if tts_texts and hasattr(self, '_pregenerate_ui_worker'):
+                self._pregenerate_ui_worker(tts_texts)
+        except Exception:
+            pass
 
         # Update trackers for next incremental check
-        self._chat_last_item_count = len(items)
-        if sessions is None:
-            self._chat_base_fingerprint = self._chat_base_fingerprint_for(session)
-        else:
-            # Unified mode: store combined base fingerprint
-            self._chat_base_fingerprint = "||".join(
-                self._chat_base_fingerprint_for(s) for s in sessions
-            )
+        self._chat_last_item_count = len(self._chat_rows)
+        self._chat_base_fingerprint = base_fp
+        if store is not None:
+            self._chat_cursor = store.cursor
+            self._chat_store_epoch = store.epoch
+        self._chat_unified_key = unified_key
+        self._chat_had_pending = has_pending
+        self._chat_last_ts = max((row.timestamp for row in self._chat_rows), default=0.0)
 
         # Only scroll to bottom if user was already at the bottom
         # (respects their scroll position if they scrolled up to read history)
-        had_new_items = len(items) > old_count
+        had_new_items = len(self._chat_rows) > old_count
         try:
             if len(feed.children) > 0 and was_at_bottom:
                 feed.scroll_end(animate=False)
@@ -579,17 +641,150 @@ class ChatViewMixin:
         except Exception:
             pass
 
-    def _collect_chat_items(self: "IoMcpApp", session: "Session",
-                            sessions: list["Session"] | None = None) -> list[ChatBubbleItem]:
-        """Merge session data into a chronological list of ChatBubbleItems.
+    def _chat_delta_rows(self: "IoMcpApp", sessions: list["Session"],
+                         unified: bool) -> list[ChatRow] | None:
+        """Rows for events indexed since ``_chat_cursor``, or None if they
+        can't simply be appended (unknown session, or not newer than
+        everything shown)."""
+        for sess in sessions:
+            sess.events  # catch each timeline (and the store) up
+        store = sessions[0]._timeline.store
+        names = {s.session_id: s.name or "agent" for s in sessions}
+        events = store.since(self._chat_cursor,
+                             session_id=None if unified else sessions[0].session_id,
+                             kinds=_CHAT_KINDS)
+        events = [ev for ev in events if _chat_shown(ev)]
+        if any(ev.session_id not in names or ev.timestamp <= self._chat_last_ts
+               for ev in events):
+            return None
+        events.sort(key=lambda ev: (ev.timestamp, ev.seq))
+        return [self._chat_row_for_event(ev, names[ev.session_id]) for ev in events]
+
+    # ── Virtualized window ───────────────────────────────────────────
+
+    def _chat_mount_window(self: "IoMcpApp", feed: ListView, start: int) -> None:
+        """Clear the feed and mount ``CHAT_WINDOW`` rows from ``start``
+        (clamped so the window is full where possible)."""
+        feed.clear()
+        rows = self._chat_rows
+        start = max(0, min(start, len(rows) - CHAT_WINDOW))
+        self._chat_window_start = start
+        self._chat_mounted = [row.bubble() for row in rows[start:start + CHAT_WINDOW]]
+        if self._chat_mounted:
+            feed.extend(self._chat_mounted)
+
+    def _chat_append_rows(self: "IoMcpApp", feed: ListView, old_count: int,
+                          trim: bool) -> None:
+        """Mount rows appended after ``old_count`` if the window ends there.
+
+        With ``trim`` (user following the bottom) the window then drops
+        its oldest widgets once it is ``CHAT_WINDOW_MARGIN`` over size;
+        otherwise it grows to at most that much and stops following.
+        """
+        mounted = self._chat_mounted
+        if not mounted or self._chat_window_start + len(mounted) != old_count:
+            return
+        room = len(self._chat_rows) - old_count
+        if not trim:
+            room = min(room, CHAT_WINDOW + CHAT_WINDOW_MARGIN - len(mounted))
+        if room <= 0:
+            return
+        new = [row.bubble() for row in self._chat_rows[old_count:old_count + room]]
+        feed.mount(*new, after=mounted[-1])
+        mounted.extend(new)
+        if trim and len(mounted) > CHAT_WINDOW + CHAT_WINDOW_MARGIN:
+            self._chat_retire(feed, len(mounted) - CHAT_WINDOW, from_top=True)
+
+    def _chat_retire(self: "IoMcpApp", feed: ListView, count: int,
+                     from_top: bool) -> None:
+        """Unmount ``count`` bubbles from one end of the window.
+
+        Retired bubbles are hidden, disabled and moved to the end before
+        ``remove()``: Textual prunes them a frame later, and until then
+        they must not shift live rows (``ListView.index`` counts every
+        child). The cursor index is re-pointed at the highlighted bubble
+        without re-firing the highlight (which would re-read it aloud).
+        """
+        mounted = self._chat_mounted
+        highlighted = feed.highlighted_child
+        if from_top:
+            gone = mounted[:count]
+            del mounted[:count]
+            self._chat_window_start += count
+        else:
+            gone = mounted[len(mounted) - count:]
+            del mounted[len(mounted) - count:]
+        for widget in gone:
+            widget.display = False
+            widget.disabled = True
+            if widget is not feed.children[-1]:
+                feed.move_child(widget, after=feed.children[-1])
+            widget.remove()
+        self._chat_fix_index(feed, highlighted)
+
+    def _chat_fix_index(self: "IoMcpApp", feed: ListView, highlighted) -> None:
+        """Point ``feed.index`` back at ``highlighted`` after the window moved."""
+        if highlighted is None:
+            return
+        if highlighted in self._chat_mounted:
+            feed.set_reactive(ListView.index, feed.children.index(highlighted))
+        else:
+            highlighted.highlighted = False
+            feed.set_reactive(ListView.index, None)
 
-        Iterates over one or more sessions and collects all displayable
-        events into ``ChatBubbleItem`` instances, then sorts them by
-        timestamp. The result is capped at the most recent 200 items.
+    def _slide_chat_window(self: "IoMcpApp", item: ChatBubbleItem) -> None:
+        """Slide the mounted window when the highlight nears either edge.
 
-        Collected event sources per session (in order):
+        Called on every chat bubble highlight. Within ``CHAT_WINDOW_MARGIN``
+        of an edge that has more rows beyond it, half a window of rows is
+        mounted on that side and the same amount retired from the other,
+        keeping the highlighted bubble (and the index pointing at it).
+        """
+        mounted = self._chat_mounted
+        if item not in mounted:
+            return
+        try:
+            feed = self.query_one("#chat-feed", ListView)
+        except Exception:
+            return
+        pos = mounted.index(item)
+        start = self._chat_window_start
+        end = start + len(mounted)
+        step = CHAT_WINDOW // 2
+        if pos < CHAT_WINDOW_MARGIN and start > 0:
+            k = min(start, step)
+            new = [row.bubble() for row in self._chat_rows[start - k:start]]
+            feed.mount(*new, before=mounted[0])
+            mounted[:0] = new
+            self._chat_window_start = start - k
+            if len(mounted) > CHAT_WINDOW:
+                self._chat_retire(feed, len(mounted) - CHAT_WINDOW, from_top=False)
+        elif len(mounted) - pos <= CHAT_WINDOW_MARGIN and end < len(self._chat_rows):
+            k = min(len(self._chat_rows) - end, step)
+            new = [row.bubble() for row in self._chat_rows[end:end + k]]
+            feed.mount(*new, after=mounted[-1])
+            mounted.extend(new)
+            if len(mounted) > CHAT_WINDOW:
+                self._chat_retire(feed, len(mounted) - CHAT_WINDOW, from_top=True)
+        else:
+            return
+        self._chat_fix_index(feed, item)
+        feed.call_after_refresh(feed.scroll_to_widget, item, animate=False)
+
+    def _collect_chat_rows(self: "IoMcpApp", session: "Session",
+                           sessions: list["Session"] | None = None) -> list[ChatRow]:
+        """Merge session data into a chronological list of ChatRows.
+
+        Reads events from each session's timeline index
+        (``Session.events``), which is already timestamp-ordered, so no
+        per-refresh re-sort is needed. In unified mode the per-session
+        slices are k-way merged. Each session contributes at most
+        ``CHAT_HISTORY`` events (the timeline's own cap); only the
+        mounted window is turned into widgets.
+
+        Event sources per session:
         1. **Session header** — synthetic item at registration time.
-        2. **Speech log** — agent speak/speak_async calls (truncated to 200 chars).
+        2. **Speech log** — agent speak/speak_async calls.
         3. **Resolved inbox items** — answered choice presentations.
         4. **User messages** — both flushed (delivered) and pending (queued).
            Flushed messages use their delivery timestamp; pending messages
@@ -603,130 +798,102 @@ class ChatViewMixin:
                 only ``session`` is processed.
 
         Returns:
-            Chronologically sorted list of ``ChatBubbleItem`` instances,
-            capped at 200 items (most recent kept).
+            Chronologically sorted list of ``ChatRow`` instances.
         """
         all_sessions = sessions if sessions else [session]
-        raw_items: list[tuple[float, str, ChatBubbleItem]] = []
+        streams: list[list[tuple[float, ChatRow]]] = []
+        pending: list[ChatRow] = []
+        now = _time.time()
 
         for sess in all_sessions:
             name = sess.name or "agent"
 
-            # 0. Session header — appears at the very top of each session's feed
+            # Session header — appears at the very top of each session's feed
             reg_ts = getattr(sess, "registered_at", 0.0) or 0.0
             # Use registered_at if available, otherwise fall back to session creation time
             header_ts = reg_ts if reg_ts > 0 else sess.last_activity
             cwd = getattr(sess, "cwd", "") or ""
-            raw_items.append((
+            streams.append([(
                 header_ts - 0.001,  # slightly before first real event
-                "header",
-                ChatBubbleItem(
+                ChatRow(
                     kind="header",
                     text="",
                     timestamp=header_ts,
                     detail=cwd,
                     agent_name=name,
                 ),
-            ))
-
-            # 1. Speech log entries
-            for entry in sess.speech_log:
-                raw_items.append((
-                    entry.timestamp,
-                    "speech",
-                    ChatBubbleItem(
-                        kind="speech",
-                        text=entry.text,
-                        timestamp=entry.timestamp,
-                        agent_name=name,
-                    ),
-                ))
+            )])
 
-            # 2. Resolved inbox items (choices that were answered)
-            for item in sess.inbox_done:
-                if item.kind == "choices":
-                    result_label = ""
-                    is_freeform = False
-                    if item.result:
-                        result_label = item.result.get("selected", "")
-                        is_freeform = item.result.get("summary", "") == "(freeform input)"
-                    raw_items.append((
-                        item.timestamp,
-                        "choices",
-                        ChatBubbleItem(
-                            kind="choices",
-                            text=item.preamble,
-                            timestamp=item.timestamp,
-                            resolved=True,
-                            result=result_label,
-                            choices=item.choices[:9],
-                            agent_name=name,
-                            freeform=is_freeform,
-                        ),
-                    ))
-
-            # 3. Pending choices — skip, they're shown in the #chat-choices scrollable list
-
-            # 4. User messages (pending = queued, flushed = delivered)
-            # Show flushed messages first (delivered to agent, ✓ icon)
-            for fm in getattr(sess, 'flushed_messages', []):
-                raw_items.append((
-                    fm.flushed_at,
-                    "user_msg",
-                    ChatBubbleItem(
-                        kind="user_msg",
-                        text=fm.text,
-                        timestamp=fm.flushed_at,
-                        flushed=True,
-                        agent_name=name,
-                    ),
-                ))
-            # Show pending messages (still queued, ○ icon)
-            now = _time.time()
-            for msg in sess.pending_messages:
-                raw_items.append((
-                    now,
-                    "user_msg",
-                    ChatBubbleItem(
-                        kind="user_msg",
-                        text=msg,
-                        timestamp=now,
-                        flushed=False,
-                        agent_name=name,
-                    ),
-                ))
+            events = sess.events.latest(CHAT_HISTORY, kinds=_CHAT_KINDS, where=_chat_shown)
+            streams.append([(ev.timestamp, self._chat_row_for_event(ev, name))
+                            for ev in events])
 
-            # 5. Activity log entries (tool calls, status updates)
-            for entry in sess.activity_log:
-                kind = entry.get("kind", "tool")
-                if kind in ("speech", "selection", "choices"):
-                    continue
-                tool = entry.get("tool", "")
-                detail = entry.get("detail", "")
-                if kind == "ambient":
-                    # Ambient updates: show the phrase with a ~ prefix
-                    text = f"~ {detail}" if detail else "~ working"
-                else:
-                    text = f"{tool}" + (f": {detail[:60]}" if detail else "")
-                raw_items.append((
-                    entry["timestamp"],
-                    "system",
-                    ChatBubbleItem(
-                        kind="system",
-                        text=text,
-                        timestamp=entry["timestamp"],
-                        agent_name=name,
-                    ),
+            # Pending messages (still queued, ○ icon) are not indexed —
+            # they're stamped "now" and always sort last.
+            for msg in sess.pending_messages:
+                pending.append(ChatRow(
+                    kind="user_msg",
+                    text=msg,
+                    timestamp=now,
+                    flushed=False,
+                    agent_name=name,
                 ))
 
-        # Sort by timestamp and return just the ChatBubbleItems
-        raw_items.sort(key=lambda x: x[0])
-
-        # Limit to last 200 items
-        if len(raw_items) > 200:
-            raw_items = raw_items[-200:]
-
-        return [item for _, _, item in raw_items]
+        merged = [row for _, row in heapq.merge(*streams, key=lambda x: x[0])]
+        merged.extend(pending)
+        return merged
+
+    @staticmethod
+    def _chat_row_for_event(ev, name: str) -> ChatRow:
+        """Build the ChatRow for one timeline index event."""
+        if ev.kind == "speech":
+            return ChatRow(
+                kind="speech",
+                text=ev.ref.text,
+                timestamp=ev.timestamp,
+                agent_name=name,
+            )
+        if ev.kind == "choices":
+            item = ev.ref
+            result_label = ""
+            is_freeform = False
+            if item.result:
+                result_label = item.result.get("selected", "")
+                is_freeform = item.result.get("summary", "") == "(freeform input)"
+            return ChatRow(
+                kind="choices",
+                text=item.preamble,
+                timestamp=ev.timestamp,
+                resolved=True,
+                result=result_label,
+                choices=item.choices[:9],
+                agent_name=name,
+                freeform=is_freeform,
+            )
+        if ev.kind == "user_msg":
+            return ChatRow(
+                kind="user_msg",
+                text=ev.ref.text,
+                timestamp=ev.timestamp,
+                flushed=True,
+                agent_name=name,
+            )
+        # Activity log entry (tool calls, status updates)
+        entry = ev.ref
+        kind = entry.get("kind", "tool")
+        tool = entry.get("tool", "")
+        detail = entry.get("detail", "")
+        if kind == "ambient":
+            # Ambient updates: show the phrase with a ~ prefix
+            text = f"~ {detail}" if detail else "~ working"
+        else:
+            text = f"{tool}" + (f": {detail[:60]}" if detail else "")
+        return ChatRow(
+            kind="system",
+            text=text,
+            timestamp=ev.timestamp,
+            agent_name=name,
+        )
 
     def _chat_content_fingerprint(self: "IoMcpApp", session: "Session") -> str:
         """Compute a lightweight fingerprint of chat-relevant session data.
@@ -801,8 +968,8 @@ class ChatViewMixin:
     def _refresh_chat_feed(self: "IoMcpApp") -> None:
         """Refresh the chat feed if session data has changed.
 
-        Called every 3 seconds by the auto-refresh timer set up in
-        ``action_chat_view()``. Computes a content fingerprint for
+        The renderer for the ``chat`` UI region, run on the frame after a
+        session change invalidates it. Computes a content fingerprint for
         the relevant session(s) and compares it to the cached hash.
         If unchanged, the refresh is skipped to avoid unnecessary
         DOM manipulation.
@@ -847,12 +1014,10 @@ class ChatViewMixin:
             self._build_chat_feed(session)
 
     def _notify_chat_feed_update(self: "IoMcpApp", session: "Session") -> None:
-        """Force an immediate chat feed refresh when new content arrives.
+        """Force a chat feed refresh on the next frame when new content arrives.
 
-        Called from ``_activate_speech_item()`` and ``notify_inbox_update()``
-        to push new bubbles into the feed without waiting for the 3-second
-        auto-refresh timer. Clears the cached content hash to ensure the
-        next ``_refresh_chat_feed()`` call detects a change.
+        Clears the cached content hash so the ``_refresh_chat_feed()`` run
+        by the ``chat`` region's redraw detects a change.
 
         In unified mode, any session's update triggers a refresh. In
         single-session mode, only refreshes if the updated session
@@ -863,14 +1028,11 @@ class ChatViewMixin:
                 whether a refresh is needed in single-session mode.
 
         Side effects:
-            Resets ``_chat_content_hash`` to empty and calls
-            ``_refresh_chat_feed()``, which may rebuild or append to
-            the feed.
+            Resets ``_chat_content_hash`` to empty and invalidates the
+            ``chat`` region, so the feed is rebuilt or appended to once.
 
         Thread safety:
-            Must be called from the Textual event loop (main thread).
-            Callers from background threads should use
-            ``self.call_from_thread()`` to marshal onto the main thread.
+            Safe from any thread, like ``_invalidate()``.
         """
         if not self._chat_view_active:
             return
@@ -884,7 +1046,7 @@ class ChatViewMixin:
         # Force a rebuild by clearing the content hash
         # (incremental append will still be used if base fingerprint is unchanged)
         self._chat_content_hash = ""
-        self._refresh_chat_feed()
+        self._invalidate("chat")
 
     def _update_chat_new_indicator(self: "IoMcpApp") -> None:
         """Show or hide the '↓ New' indicator below the chat feed.
@@ -917,9 +1079,10 @@ class ChatViewMixin:
     def action_chat_scroll_bottom(self: "IoMcpApp") -> None:
         """Scroll the chat feed to the bottom and clear the new-content indicator.
 
-        Bound to the ``G`` key. Scrolls the ``#chat-feed`` ListView to
-        the end, re-enables auto-scroll, and clears the '↓ New' indicator
-        if it was showing.
+        Bound to the ``G`` key. Remounts the newest window if the mounted
+        one stops short of the end, scrolls the ``#chat-feed`` ListView
+        to the end, re-enables auto-scroll, and clears the '↓ New'
+        indicator if it was showing.
 
         Only active when the chat view is displayed. No-op otherwise.
         """
@@ -927,6 +1090,8 @@ class ChatViewMixin:
             return
         try:
             feed = self.query_one("#chat-feed", ListView)
+            if self._chat_window_start + len(self._chat_mounted) < len(self._chat_rows):
+                self._chat_mount_window(feed, len(self._chat_rows))
             feed.scroll_end(animate=False)
             self._chat_auto_scroll = True
             if self._chat_has_new_content:
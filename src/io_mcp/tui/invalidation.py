@@ -0,0 +1,108 @@
+"""Dirty-region invalidation for the TUI.
+
+Tool threads and session mutations don't redraw anything themselves; they
+mark regions (``tab_bar``, ``footer``, ``inbox``, ``chat``, ...) dirty.
+The first mark after a flush posts one message to the app; the flush runs
+on the event loop, waits out the rest of the current frame if the last
+flush was under ``1 / UI_FRAME_RATE`` ago, then calls each dirty region's
+renderer once. A burst of any size therefore costs one cross-thread hop
+and at most one redraw per region per frame, and an idle app wakes for
+nothing.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING, Callable
+
+from textual.message import Message
+
+from ..logging import get_logger, TUI_ERROR_LOG
+
+if TYPE_CHECKING:
+    from textual.app import App
+
+_log = get_logger("io-mcp.tui.invalidation", TUI_ERROR_LOG)
+
+UI_FRAME_RATE = 30.0
+
+
+class UIInvalidator:
+    """Collects dirty regions from any thread; redraws them once per frame.
+
+    ``renderers`` maps region name to the callable that redraws it;
+    regions render in the mapping's order.
+    """
+
+    class Flush(Message):
+        """Posted to the app; its handler calls ``UIInvalidator.flush()``."""
+
+    def __init__(self, app: "App", renderers: dict[str, Callable[[], None]],
+                 frame_rate: float = UI_FRAME_RATE,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        self._app = app
+        self._renderers = dict(renderers)
+        self._interval = 1.0 / frame_rate
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._dirty: set[str] = set()
+        self._scheduled = False
+        self._last_flush = float("-inf")
+        # Counters for stats() — invalidations vs. what they cost
+        self.requests = 0
+        self.flushes = 0
+        self.renders: dict[str, int] = {name: 0 for name in self._renderers}
+
+    def invalidate(self, *regions: str) -> None:
+        """Mark ``regions`` dirty. Safe from any thread; never blocks on the UI."""
+        with self._lock:
+            self.requests += 1
+            self._dirty.update(regions)
+            if self._scheduled or not self._app.is_running:
+                return
+            self._scheduled = True
+        if not self._app.post_message(self.Flush()):
+            with self._lock:
+                self._scheduled = False
+
+    def start(self) -> None:
+        """Schedule a flush for anything marked before the app was running."""
+        with self._lock:
+            if not self._dirty or self._scheduled:
+                return
+            self._scheduled = True
+        self._app.post_message(self.Flush())
+
+    def flush(self) -> None:
+        """Render every dirty region once (event loop only).
+
+        Within a frame of the previous flush, re-arms itself for the end
+        of the frame instead, so marks arriving meanwhile join this flush.
+        """
+        wait = self._last_flush + self._interval - self._clock()
+        if wait > 0:
+            self._app.set_timer(wait, self.flush)
+            return
+        with self._lock:
+            dirty, self._dirty = self._dirty, set()
+            self._scheduled = False
+        self._last_flush = self._clock()
+        self.flushes += 1
+        for region, render in self._renderers.items():
+            if region not in dirty:
+                continue
+            self.renders[region] += 1
+            try:
+                render()
+            except Exception:
+                _log.exception("UI flush: %s renderer failed", region)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "flushes": self.flushes,
+                "renders": dict(self.renders),
+                "dirty": sorted(self._dirty),
+            }
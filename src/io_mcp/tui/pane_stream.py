@@ -0,0 +1,278 @@
+"""Streaming tmux pane mirror over a control-mode connection.
+
+The pane view used to run ``tmux capture-pane`` every two seconds (through
+a fresh ``ssh`` for remote agents) and rewrite the whole log each time.
+``PaneStream`` instead keeps one ``tmux -C attach`` client open per watched
+pane -- wrapped in a single long-lived ``ssh`` session on the host's shared
+master connection (``ssh_mux``) when the pane is remote -- and talks to it
+over that channel:
+
+- on connect it asks for the pane's id and its last ``PANE_BACKLOG_LINES``
+  lines of history;
+- tmux then pushes ``%output %<pane> ...`` whenever the pane writes, and
+  only then is a fresh ``capture-pane`` sent down the same channel (one in
+  flight at a time; output arriving meanwhile asks for one more);
+- ``take()`` diffs the newest capture against what the view already shows
+  (``pane_delta``), so a log that scrolled gets only its new lines
+  appended, an unchanged pane costs nothing, and only a real redraw of the
+  screen replaces the view.
+
+The client attaches to the pane's *session*, looked up by name first:
+attaching with the pane itself as target would make the pane's window the
+current one for every client of that session (the user's terminal
+included). ``%output`` for the session's other panes is ignored.
+
+Raw ``%output`` bytes are only used as a change signal: agents run
+full-screen TUIs whose cursor movement doesn't map onto appended lines,
+while ``capture-pane`` returns the rendered text.
+"""
+
+from __future__ import annotations
+
+import shlex
+import subprocess
+import threading
+from collections import deque
+from typing import Callable, Optional
+
+from ..logging import get_logger, TUI_ERROR_LOG
+from ..ssh_mux import SSH_MUX
+
+_log = get_logger("io-mcp.tui.pane_stream", TUI_ERROR_LOG)
+
+PANE_BACKLOG_LINES = 50
+PANE_RECONNECT_DELAY = 2.0
+PANE_LOOKUP_TIMEOUT = 5.0
+
+
+def pane_delta(shown: list[str], new: list[str]) -> tuple[bool, list[str]]:
+    """Work out how a view showing ``shown`` catches up to ``new``.
+
+    Returns ``(reset, lines)``: when ``new`` continues ``shown`` (the same
+    lines, possibly scrolled, with more below) ``reset`` is False and
+    ``lines`` are only the ones to append; otherwise the view must be
+    cleared and ``lines`` is all of ``new``. A scroll has to keep at least
+    half of ``shown`` on screen: a line or two that happen to match (a
+    prompt, a blank row) are a redraw, not a scroll.
+    """
+    if new == shown:
+        return False, []
+    if not shown:
+        return False, list(new)
+    min_overlap = (len(shown) + 1) // 2
+    for off in range(len(shown) - min_overlap + 1):
+        overlap = len(shown) - off
+        if overlap <= len(new) and new[:overlap] == shown[off:]:
+            return False, new[overlap:]
+    return True, list(new)
+
+
+class PaneStream:
+    """One tmux control-mode client mirroring a single pane.
+
+    ``on_change`` is called from the reader thread whenever a new capture
+    is ready; the UI then pulls it with ``take()`` on its own thread.
+    """
+
+    def __init__(self, pane: str, hostname: str = "",
+                 on_change: Optional[Callable[[], None]] = None,
+                 backlog: int = PANE_BACKLOG_LINES) -> None:
+        self.pane = pane
+        self.hostname = hostname
+        self.backlog = backlog
+        self._on_change = on_change
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._proc: Optional[subprocess.Popen] = None
+        # Control-mode replies arrive in command order; this holds the kind
+        # of each command still waiting for its %begin/%end block
+        self._waiting: deque[str] = deque()
+        self._block: Optional[list[str]] = None
+        self._pane_id = ""
+        self._capturing = False
+        self._dirty = False
+        self._snapshot: list[str] = []
+        self._shown: list[str] = []
+        self._fresh = False
+        # Counters for stats()
+        self.connects = 0
+        self.outputs = 0
+        self.captures = 0
+
+    def command(self, session_name: str) -> list[str]:
+        """The control-mode client command (through ssh for a remote host)."""
+        target = f"={session_name}"  # exact session name, not a prefix
+        if self.hostname:
+            return SSH_MUX.command(self.hostname,
+                                   f"tmux -C attach -r -t {shlex.quote(target)}", "-T")
+        return ["tmux", "-C", "attach", "-r", "-t", target]
+
+    def session_name(self) -> Optional[str]:
+        """Name of the tmux session holding the pane.
+
+        Returns "" when the pane is gone and None when it couldn't be asked
+        (ssh failed, timeout).
+        """
+        fmt = "#{session_name}"
+        if self.hostname:
+            cmd = SSH_MUX.command(self.hostname, f"tmux display-message -p -t "
+                                                 f"{shlex.quote(self.pane)} '{fmt}'")
+        else:
+            cmd = ["tmux", "display-message", "-p", "-t", self.pane, fmt]
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True,
+                                    timeout=PANE_LOOKUP_TIMEOUT)
+        except (subprocess.TimeoutExpired, OSError):
+            return None
+        if result.returncode != 0:
+            return None if self.hostname and result.returncode == 255 else ""
+        return result.stdout.strip()
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, daemon=True,
+                                        name=f"pane-stream-{self.pane}")
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Detach the client; safe to call more than once.
+
+        Doesn't block: the client is reaped on a worker thread.
+        """
+        self._stopped.set()
+        proc = self._proc
+        if proc is None:
+            return
+        threading.Thread(target=self._reap, args=(proc,), daemon=True,
+                         name=f"pane-stream-reap-{self.pane}").start()
+
+    @staticmethod
+    def _reap(proc: subprocess.Popen) -> None:
+        try:
+            proc.stdin.close()  # a control client exits when its input ends
+            proc.wait(timeout=1)
+        except Exception:
+            proc.kill()
+            proc.wait()
+
+    def take(self) -> Optional[tuple[bool, list[str]]]:
+        """Catch the consumer up to the newest capture (``pane_delta``).
+
+        Returns None when nothing was captured since the last call.
+        """
+        with self._lock:
+            if not self._fresh:
+                return None
+            self._fresh = False
+            delta = pane_delta(self._shown, self._snapshot)
+            self._shown = self._snapshot
+        return delta
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "connects": self.connects,
+                "outputs": self.outputs,
+                "captures": self.captures,
+                "lines": len(self._snapshot),
+            }
+
+    # ─── Reader thread ─────────────────────────────────────────────
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                if self._connect():
+                    for raw in self._proc.stdout:
+                        self._handle(raw.decode("utf-8", "replace").rstrip("\r\n"))
+            except Exception:
+                _log.exception("Pane stream %s failed", self.pane)
+            if self._proc is not None:
+                self._proc.kill()
+                self._proc.wait()
+            # The agent's host dropped or tmux restarted: reconnect after a
+            # pause, like the old poll would have picked it up again
+            self._stopped.wait(PANE_RECONNECT_DELAY)
+
+    def _connect(self) -> bool:
+        """Attach a new control client; False if there is nothing to attach to."""
+        self._waiting.clear()
+        self._block = None
+        self._capturing = False
+        self._dirty = False
+        session_name = self.session_name()
+        if not session_name:
+            if session_name == "":
+                _log.warning("Pane stream %s: pane not found", self.pane)
+                self._stopped.set()
+            return False
+        self._proc = subprocess.Popen(
+            self.command(session_name), stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL)
+        self.connects += 1
+        target = shlex.quote(self.pane)
+        self._send("pane_id", f"display-message -p -t {target} '#{{pane_id}}'")
+        self._capture()
+        return True
+
+    def _send(self, kind: str, command: str) -> None:
+        self._waiting.append(kind)
+        self._proc.stdin.write(command.encode() + b"\n")
+        self._proc.stdin.flush()
+
+    def _capture(self) -> None:
+        self._capturing = True
+        self._send("capture", f"capture-pane -p -t {shlex.quote(self.pane)} "
+                              f"-S -{self.backlog}")
+
+    def _handle(self, line: str) -> None:
+        """Parse one line of control-mode output."""
+        if self._block is not None:
+            if line.startswith(("%end ", "%error ")):
+                block, self._block = self._block, None
+                # Only flags=1 blocks answer our commands; tmux's own (the
+                # attach itself) carry 0
+                if line.rsplit(" ", 1)[-1] == "1" and self._waiting:
+                    self._reply(self._waiting.popleft(), block,
+                                line.startswith("%error "))
+            else:
+                self._block.append(line)
+        elif line.startswith("%begin "):
+            self._block = []
+        elif line.startswith("%output "):
+            pane_id = line.split(" ", 2)[1]
+            if self._pane_id and pane_id != self._pane_id:
+                return
+            self.outputs += 1
+            if self._capturing or not self._pane_id:
+                self._dirty = True
+            else:
+                self._capture()
+        elif line.startswith("%exit"):
+            self._proc.stdin.close()
+
+    def _reply(self, kind: str, lines: list[str], error: bool) -> None:
+        if error:
+            _log.warning("Pane stream %s: %s failed: %s",
+                         self.pane, kind, " ".join(lines))
+            if kind == "pane_id":
+                self._stopped.set()
+                self._proc.stdin.close()
+            return
+        if kind == "pane_id":
+            self._pane_id = lines[0].strip() if lines else ""
+            return
+        while lines and not lines[-1].strip():
+            lines.pop()  # capture-pane pads the screen with blank rows
+        with self._lock:
+            self.captures += 1
+            changed = lines != self._snapshot
+            if changed:
+                self._snapshot = lines
+                self._fresh = True
+        self._capturing = False
+        if self._dirty:
+            self._dirty = False
+            self._capture()
+        if changed and self._on_change is not None:
+            self._on_change()
@@ -56,10 +56,6 @@ class SettingsMixin:
                 self.query_one("#chat-input-bar").display = False
             except Exception:
                 pass
-            # Stop chat refresh timer
-            if hasattr(self, '_chat_refresh_timer') and self._chat_refresh_timer:
-                self._chat_refresh_timer.stop()
-                self._chat_refresh_timer = None
 
         scheme = getattr(self, '_color_scheme', DEFAULT_SCHEME)
 
@@ -198,9 +194,7 @@ class SettingsMixin:
             pane_view = self.query_one("#pane-view", RichLog)
             if pane_view.display:
                 pane_view.display = False
-                if hasattr(self, '_pane_refresh_timer') and self._pane_refresh_timer:
-                    self._pane_refresh_timer.stop()
-                    self._pane_refresh_timer = None
+                self._stop_pane_stream()
                 self._pane_view_was_chat = False
         except Exception:
             pass
@@ -208,9 +202,6 @@ class SettingsMixin:
         # Clean up chat view if active
         if getattr(self, '_chat_view_active', False):
             self._chat_view_active = False
-            if hasattr(self, '_chat_refresh_timer') and self._chat_refresh_timer:
-                self._chat_refresh_timer.stop()
-                self._chat_refresh_timer = None
             try:
                 self.query_one("#chat-feed").display = False
             except Exception:
@@ -258,11 +249,6 @@ class SettingsMixin:
                     self._build_chat_feed(session, sessions=all_sessions)
                 else:
                     self._build_chat_feed(session)
-            # Restart refresh timer
-            if hasattr(self, '_chat_refresh_timer') and self._chat_refresh_timer:
-                self._chat_refresh_timer.stop()
-            self._chat_refresh_timer = self.set_interval(
-                3.0, lambda: self._refresh_chat_feed())
             self._update_footer_status()
             self._tts.stop()
             self._speak_ui("Back to chat")
@@ -14,6 +14,8 @@ from textual import work
 from textual.widgets import Label, ListView, RichLog
 
 from ..logging import read_log_tail, TUI_ERROR_LOG, PROXY_LOG
+from ..ssh_mux import SSH_MUX
+from .pane_stream import PaneStream
 from .widgets import ChoiceItem, _safe_action
 
 if TYPE_CHECKING:
@@ -133,34 +135,38 @@ class ViewsMixin:
 
     def _kill_session(self: "IoMcpApp", session) -> None:
         """Kill a session's tmux pane and close the tab."""
-        import subprocess as sp
-
         name = session.name
         pane = getattr(session, 'tmux_pane', '')
         hostname = getattr(session, 'hostname', '')
 
         if pane:
-            try:
-                is_remote = hostname and hostname not in ("", "localhost", os.uname().nodename)
-                if is_remote:
-                    cmd = ["ssh", "-o", "ConnectTimeout=2", hostname,
-                           f"tmux kill-pane -t {pane}"]
-                else:
-                    cmd = ["tmux", "kill-pane", "-t", pane]
-                sp.run(cmd, capture_output=True, timeout=5)
-            except Exception:
-                pass
+            self._kill_pane_worker(pane, hostname)
 
         self.on_session_removed(session.session_id)
         self._speak_ui(f"Killed {name}")
         self._exit_settings()
 
+    @work(thread=True, exit_on_error=False, name="kill_pane")
+    def _kill_pane_worker(self: "IoMcpApp", pane: str, hostname: str) -> None:
+        """Worker: kill a tmux pane (bringing up an ssh master can take seconds)."""
+        try:
+            is_remote = hostname and hostname not in ("", "localhost", os.uname().nodename)
+            if is_remote:
+                cmd = SSH_MUX.command(hostname, f"tmux kill-pane -t {pane}",
+                                      connect_timeout=2)
+            else:
+                cmd = ["tmux", "kill-pane", "-t", pane]
+            subprocess.run(cmd, capture_output=True, timeout=5)
+        except Exception:
+            pass
+
     @_safe_action
     def action_pane_view(self: "IoMcpApp") -> None:
         """Show live tmux pane output for the focused agent.
 
-        Uses tmux capture-pane locally, or ssh+tmux for remote agents.
-        Auto-refreshes every 2 seconds. Press v or Escape to close.
+        Streams the pane through a tmux control-mode client (inside one
+        long-lived ssh for remote agents) and appends only new lines.
+        Press v or Escape to close.
 
         Works from both normal view and chat view — saves and restores
         the previous view state on close.
@@ -169,9 +175,7 @@ class ViewsMixin:
         pane_view = self.query_one("#pane-view", RichLog)
         if pane_view.display:
             pane_view.display = False
-            if hasattr(self, '_pane_refresh_timer') and self._pane_refresh_timer:
-                self._pane_refresh_timer.stop()
-                self._pane_refresh_timer = None
+            self._stop_pane_stream()
             self._speak_ui("Pane view closed.")
 
             # Restore chat view if it was active before pane view
@@ -194,11 +198,6 @@ class ViewsMixin:
                 self._refresh_chat_feed()
                 if session and session.active and session.choices:
                     self._show_choices()
-                # Restart chat refresh timer
-                if hasattr(self, '_chat_refresh_timer') and self._chat_refresh_timer:
-                    self._chat_refresh_timer.stop()
-                self._chat_refresh_timer = self.set_interval(
-                    3.0, lambda: self._refresh_chat_feed())
             else:
                 session = self._focused()
                 if session and session.active:
@@ -239,9 +238,6 @@ class ViewsMixin:
                 self.query_one("#chat-input-bar").display = False
             except Exception:
                 pass
-            if hasattr(self, '_chat_refresh_timer') and self._chat_refresh_timer:
-                self._chat_refresh_timer.stop()
-                self._chat_refresh_timer = None
 
         # Show pane view, hide main content
         self.query_one("#main-content").display = False
@@ -251,47 +247,40 @@ class ViewsMixin:
         pane_view.clear()
         pane_view.display = True
 
-        # Store pane info for the worker
-        self._pane_view_hostname = hostname
-        self._pane_view_pane = pane
-
-        # Initial refresh
-        self._refresh_pane_worker()
-
-        # Auto-refresh every 2 seconds
-        self._pane_refresh_timer = self.set_interval(
-            2.0, lambda: self._refresh_pane_worker())
-
-    @work(thread=True, exit_on_error=False, name="refresh_pane", exclusive=True)
-    def _refresh_pane_worker(self: "IoMcpApp") -> None:
-        """Worker: capture tmux pane content in background thread."""
-        hostname = getattr(self, '_pane_view_hostname', '')
-        pane = getattr(self, '_pane_view_pane', '')
-        try:
-            is_remote = hostname and hostname not in ("", "localhost", os.uname().nodename)
-            if is_remote:
-                cmd = ["ssh", "-o", "ConnectTimeout=2", hostname,
-                       f"tmux capture-pane -p -t {pane} -S -50"]
-            else:
-                cmd = ["tmux", "capture-pane", "-p", "-t", pane, "-S", "-50"]
-
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
-                content = result.stdout
-                try:
-                    self.call_from_thread(lambda: self._update_pane_view(content))
-                except Exception:
-                    pass
-        except Exception:
-            pass
-
-    def _update_pane_view(self: "IoMcpApp", content: str) -> None:
-        """Update the pane view widget with captured tmux output."""
+        # One control-mode client per watched pane; it marks the "pane"
+        # region dirty whenever a new capture is ready
+        self._stop_pane_stream()
+        is_remote = hostname and hostname not in ("", "localhost", os.uname().nodename)
+        self._pane_stream = PaneStream(
+            pane, hostname if is_remote else "",
+            on_change=lambda: self._invalidate("pane"))
+        self._pane_stream.start()
+
+    def _stop_pane_stream(self: "IoMcpApp") -> None:
+        """Detach the pane view's control-mode client, if any."""
+        stream = getattr(self, '_pane_stream', None)
+        self._pane_stream = None
+        if stream is not None:
+            stream.stop()
+
+    def _update_pane_view(self: "IoMcpApp") -> None:
+        """Append what the pane wrote since the last frame to the pane view.
+
+        Only a redraw of the pane's screen (not a scroll) clears the log.
+        """
+        stream = getattr(self, '_pane_stream', None)
+        if stream is None:
+            return
+        delta = stream.take()
+        if delta is None:
+            return
+        reset, lines = delta
         try:
             pane_view = self.query_one("#pane-view", RichLog)
             if pane_view.display:
-                pane_view.clear()
-                for line in content.split("\n"):
+                if reset:
+                    pane_view.clear()
+                for line in lines:
                     pane_view.write(line)
         except Exception:
             pass
@@ -305,7 +294,7 @@ class ViewsMixin:
         Uses tmux-cli for reliable delivery (handles Enter key verification).
         Falls back to tmux send-keys if tmux-cli is unavailable.
 
-        For remote agents, prepends ssh to the command.
+        For remote agents, runs it over the host's shared ssh connection.
         """
         pane = getattr(session, 'tmux_pane', '')
         if not pane:
@@ -356,19 +345,15 @@ class ViewsMixin:
 
             if tmux_cli:
                 if is_remote:
-                    cmd = [
-                        "ssh", "-o", "ConnectTimeout=5", hostname,
-                        f"tmux-cli send {repr(message)} --pane={pane}",
-                    ]
+                    cmd = SSH_MUX.command(
+                        hostname, f"tmux-cli send {repr(message)} --pane={pane}")
                 else:
                     cmd = [tmux_cli, "send", message, f"--pane={pane}"]
             else:
                 # Fallback to tmux send-keys
                 if is_remote:
-                    cmd = [
-                        "ssh", "-o", "ConnectTimeout=5", hostname,
-                        f"tmux send-keys -t {pane} {repr(message)} Enter",
-                    ]
+                    cmd = SSH_MUX.command(
+                        hostname, f"tmux send-keys -t {pane} {repr(message)} Enter")
                 else:
                     cmd = ["tmux", "send-keys", "-t", pane, message, "Enter"]
 
@@ -497,10 +482,6 @@ class ViewsMixin:
                 self.query_one("#chat-input-bar").display = False
             except Exception:
                 pass
-            # Stop chat refresh timer
-            if hasattr(self, '_chat_refresh_timer') and self._chat_refresh_timer:
-                self._chat_refresh_timer.stop()
-                self._chat_refresh_timer = None
 
         self._in_settings = True
         self._setting_edit_mode = False
@@ -566,7 +547,9 @@ class ViewsMixin:
 
         Reads from /tmp/io-mcp-tui-error.log, /tmp/io-mcp-proxy.log,
         and the focused session's speech log. Displays entries in a
-        scrollable list. Press Enter or Escape to return.
+        scrollable list. Press Enter or Escape to return. When older
+        speech was spilled to the session's archive, a "load older" row
+        pages it in 30 at a time.
         """
         # Toggle off if already in system logs mode
         if getattr(self, '_system_logs_mode', False):
@@ -594,44 +577,79 @@ class ViewsMixin:
                 self.query_one("#chat-input-bar").display = False
             except Exception:
                 pass
-            # Stop chat refresh timer
-            if hasattr(self, '_chat_refresh_timer') and self._chat_refresh_timer:
-                self._chat_refresh_timer.stop()
-                self._chat_refresh_timer = None
 
         # Collect logs from all sources
-        log_entries = []  # (section, text) tuples
-        flat_entries = []  # plain text for TTS on scroll
+        self._system_log_tui_errors = read_log_tail(TUI_ERROR_LOG, 50)
+        self._system_log_proxy_lines = read_log_tail(PROXY_LOG, 30)
+        # Speech log from focused session; includes entries spilled to the
+        # archive once the log is short, older ones load on demand
+        self._system_log_speech, self._system_log_speech_total = (
+            session.page_history("speech", limit=30) if session else ([], 0))
 
-        # TUI error log
-        tui_errors = read_log_tail(TUI_ERROR_LOG, 50)
+        # Enter system logs mode (uses settings infrastructure for modal display)
+        self._in_settings = True
+        self._setting_edit_mode = False
+        self._spawn_options = None
+        self._quick_action_options = None
+        self._system_logs_mode = True
+        self._help_mode = False
 
-        # Proxy log
-        proxy_lines = read_log_tail(PROXY_LOG, 30)
+        self._render_system_logs()
 
-        # Speech log from focused session
+        # Narrate summary
+        parts = []
+        if self._system_log_tui_errors:
+            parts.append(f"{len(self._system_log_tui_errors)} TUI errors")
+        if self._system_log_proxy_lines:
+            parts.append(f"{len(self._system_log_proxy_lines)} proxy log lines")
+        if self._system_log_speech:
+            parts.append(f"{len(self._system_log_speech)} speech entries")
+        summary = ", ".join(parts) if parts else "No logs found"
+        self._speak_ui(f"System logs. {summary}.")
+
+    def _load_older_speech_log(self: "IoMcpApp") -> None:
+        """Page the next 30 archived speech entries into the system logs."""
+        session = self._focused()
+        if not session:
+            return
+        loaded = self._system_log_speech
+        older, total = session.page_history("speech", skip=len(loaded), limit=30)
+        if not older:
+            return
+        self._system_log_speech = older + loaded
+        self._system_log_speech_total = total
+        # Land on the newest of the freshly loaded entries
+        self._render_system_logs(index=self._system_log_older_index + len(older))
+        self._speak_ui(f"Loaded {len(older)} older speech entries")
+
+    def _render_system_logs(self: "IoMcpApp", index: int = 0) -> None:
+        """Populate #choices from the collected ``_system_log_*`` lists."""
+        tui_errors = self._system_log_tui_errors
+        proxy_lines = self._system_log_proxy_lines
+        speech = self._system_log_speech
+        speech_total = self._system_log_speech_total
+
+        import time as _time
+        now = _time.time()
         speech_lines = []
-        if session:
-            import time as _time
-            now = _time.time()
-            for entry in session.speech_log[-30:]:
-                elapsed = now - entry.timestamp
-                if elapsed < 60:
-                    age = f"{int(elapsed)}s ago"
-                elif elapsed < 3600:
-                    age = f"{int(elapsed)//60}m ago"
-                else:
-                    age = f"{int(elapsed)//3600}h ago"
-                speech_lines.append((age, entry.text[:200]))
+        for entry in speech:
+            elapsed = now - entry.get("timestamp", 0)
+            if elapsed < 60:
+                age = f"{int(elapsed)}s ago"
+            elif elapsed < 3600:
+                age = f"{int(elapsed)//60}m ago"
+            else:
+                age = f"{int(elapsed)//3600}h ago"
+            speech_lines.append((age, entry.get("text", "")[:200]))
 
         # Build display entries
+        log_entries = []  # (section, text, detail) tuples
         s = self._cs
 
         if tui_errors:
             log_entries.append(("header", "TUI Errors", f"{len(tui_errors)} lines"))
             for line in tui_errors:
                 log_entries.append(("tui_error", line.strip(), ""))
-                flat_entries.append(line.strip())
         else:
             log_entries.append(("header", "TUI Errors", "none"))
 
@@ -639,29 +657,26 @@ class ViewsMixin:
             log_entries.append(("header", "Proxy Log", f"{len(proxy_lines)} lines"))
             for line in proxy_lines:
                 log_entries.append(("proxy", line.strip(), ""))
-                flat_entries.append(line.strip())
         else:
             log_entries.append(("header", "Proxy Log", "none"))
 
+        self._system_log_older_index = None
         if speech_lines:
-            log_entries.append(("header", "Speech History", f"{len(speech_lines)} entries"))
+            log_entries.append(("header", "Speech History",
+                                f"last {len(speech_lines)} of {speech_total} entries"))
+            if speech_total > len(speech_lines):
+                # Enter on this row loads, rather than closes
+                self._system_log_older_index = len(log_entries)
+                log_entries.append(("older", "Load older",
+                                    f"{speech_total - len(speech_lines)} more archived"))
             for age, text in speech_lines:
                 log_entries.append(("speech", text, age))
-                flat_entries.append(text)
         else:
             log_entries.append(("header", "Speech History", "none"))
 
-        # Store flat entries for TTS on scroll
+        # Flat entries for TTS on scroll, full text for expanded view
         self._system_log_entries = []
-        self._system_log_full_entries = []  # full text for expanded view on scroll
-
-        # Enter system logs mode (uses settings infrastructure for modal display)
-        self._in_settings = True
-        self._setting_edit_mode = False
-        self._spawn_options = None
-        self._quick_action_options = None
-        self._system_logs_mode = True
-        self._help_mode = False
+        self._system_log_full_entries = []
 
         preamble_widget = self.query_one("#preamble", Label)
         total = len(tui_errors) + len(proxy_lines) + len(speech_lines)
@@ -687,6 +702,11 @@ class ViewsMixin:
                 list_view.append(ChoiceItem(label, summary, index=display_idx + 1, display_index=display_idx))
                 self._system_log_entries.append(f"{text}: {detail}")
                 self._system_log_full_entries.append(f"{text}: {detail}")
+            elif entry_type == "older":
+                label = f"[{s['fg_dim']}]↑ {text}[/{s['fg_dim']}]"
+                list_view.append(ChoiceItem(label, detail, index=display_idx + 1, display_index=display_idx))
+                self._system_log_entries.append(f"{text}. {detail}")
+                self._system_log_full_entries.append(f"{text}: {detail}")
             elif entry_type == "tui_error":
                 # Error lines — use error color for "---" delimiters
                 if text.startswith("---"):
@@ -710,16 +730,5 @@ class ViewsMixin:
             display_idx += 1
 
         list_view.display = True
-        list_view.index = 0
+        list_view.index = index
         list_view.focus()
-
-        # Narrate summary
-        parts = []
-        if tui_errors:
-            parts.append(f"{len(tui_errors)} TUI errors")
-        if proxy_lines:
-            parts.append(f"{len(proxy_lines)} proxy log lines")
-        if speech_lines:
-            parts.append(f"{len(speech_lines)} speech entries")
-        summary = ", ".join(parts) if parts else "No logs found"
-        self._speak_ui(f"System logs. {summary}.")
@@ -202,15 +202,25 @@ class InboxListItem(ListItem):
     - Speech items: ♪ pending/playing, > done
     Active (currently displayed) item is highlighted. Done items are dimmed.
     In multi-agent mode, shows the agent/session name prefix.
+
+    ``row_key`` identifies the inbox item the row shows, so
+    ``reconcile_inbox_list`` can update the row in place as the item
+    changes instead of rebuilding the list.
     """
 
+    # Attributes the label is rendered from (inbox_index etc. aren't shown)
+    _LABEL_FIELDS = ("inbox_preamble", "is_done", "is_active", "session_name",
+                     "accent_color", "kind")
+
     def __init__(self, preamble: str, is_done: bool = False,
                  is_active: bool = False, inbox_index: int = 0,
                  n_choices: int = 0, session_name: str = "",
                  accent_color: str = "", kind: str = "choices",
-                 session_id: str = "",
+                 session_id: str = "", row_key: object = None,
                  **kwargs) -> None:
         super().__init__(**kwargs)
+        self.row_key = row_key
+        self.retired = False  # removed by reconcile_inbox_list, awaiting prune
         self.inbox_preamble = preamble
         self.is_done = is_done
         self.is_active = is_active
@@ -221,7 +231,24 @@ class InboxListItem(ListItem):
         self.kind = kind  # "choices" or "speech"
         self.session_id = session_id  # session ID for message routing
 
+    def update_row(self, preamble: str, **fields) -> bool:
+        """Apply new constructor values; re-render the label only if it changed."""
+        fields["inbox_preamble"] = preamble
+        before = tuple(getattr(self, f) for f in self._LABEL_FIELDS)
+        for name, value in fields.items():
+            setattr(self, name, value)
+        if tuple(getattr(self, f) for f in self._LABEL_FIELDS) == before:
+            return False
+        try:
+            self.query_one(".inbox-label", Label).update(self._label_markup())
+        except Exception:
+            pass  # not composed yet — compose renders the new values
+        return True
+
     def compose(self) -> ComposeResult:
+        yield Label(self._label_markup(), classes="inbox-label")
+
+    def _label_markup(self) -> str:
         # Status icon — varies by kind
         if self.kind == "speech":
             if self.is_active:
@@ -256,11 +283,106 @@ class InboxListItem(ListItem):
             text += "…"
 
         if self.is_done:
-            yield Label(f" {icon} {name_tag}[dim]{text}[/dim]", classes="inbox-label")
-        elif self.is_active:
-            yield Label(f" {icon} {name_tag}{text}", classes="inbox-label")
-        else:
-            yield Label(f" {icon} {name_tag}{text}", classes="inbox-label")
+            return f" {icon} {name_tag}[dim]{text}[/dim]"
+        return f" {icon} {name_tag}{text}"
+
+
+# Most inbox rows mounted at once. Textual lays out every child each frame,
+# so a long inbox is shown through a window that slides with the cursor.
+INBOX_WINDOW = 40
+INBOX_WINDOW_MARGIN = 5
+
+
+def inbox_window_start(total: int, cursor: int, start: int,
+                       size: int = INBOX_WINDOW, margin: int = INBOX_WINDOW_MARGIN) -> int:
+    """First row of the inbox window: ``start`` kept while ``cursor`` sits
+    comfortably inside it, else re-centred on ``cursor``."""
+    if total <= size:
+        return 0
+    last_start = total - size
+    start = min(max(start, 0), last_start)
+    low = start + margin if start > 0 else start
+    high = start + size - margin if start < last_start else start + size
+    if low <= cursor < high:
+        return start
+    return min(max(cursor - size // 2, 0), last_start)
+
+
+def reconcile_inbox_list(list_view: ListView, rows: list[tuple[object, dict]],
+                         cursor_key: object = None, cursor_index: int = 0) -> dict:
+    """Make ``list_view``'s rows match ``rows`` without rebuilding it.
+
+    ``rows`` is ``[(row_key, InboxListItem kwargs), ...]`` in display
+    order. Rows whose key is already shown are moved into place and
+    updated in place; new keys are mounted and vanished ones removed, so a
+    change costs work proportional to what changed, and scroll position
+    and focus survive. The cursor stays on the row keyed ``cursor_key``
+    when it is still listed, else goes to ``cursor_index``.
+
+    Removed rows are hidden and moved to the end before ``remove()``:
+    Textual prunes them a frame later, and until then they must not shift
+    the positions of live rows (``ListView.index`` counts every child).
+
+    Returns counts of ``inserted``, ``moved``, ``updated``, ``removed``.
+    """
+    counts = {"inserted": 0, "moved": 0, "updated": 0, "removed": 0}
+    previous = list_view.highlighted_child
+    live = [c for c in list_view.children if isinstance(c, InboxListItem) and not c.retired]
+    wanted = {key for key, _ in rows}
+
+    for child in live:
+        if child.row_key not in wanted:
+            child.retired = True
+            child.display = False
+            if child is not list_view.children[-1]:
+                list_view.move_child(child, after=list_view.children[-1])
+            child.remove()
+            counts["removed"] += 1
+    current = [c for c in live if not c.retired]
+    by_key = {c.row_key: c for c in current}
+    retired_tail = next((c for c in list_view.children
+                         if isinstance(c, InboxListItem) and c.retired), None)
+
+    for pos, (key, fields) in enumerate(rows):
+        widget = by_key.get(key)
+        if widget is None:
+            widget = InboxListItem(row_key=key, **fields)
+            if pos < len(current):
+                list_view.mount(widget, before=current[pos])
+            elif retired_tail is not None:
+                list_view.mount(widget, before=retired_tail)
+            else:
+                list_view.mount(widget)
+            current.insert(pos, widget)
+            by_key[key] = widget
+            counts["inserted"] += 1
+            continue
+        if current[pos] is not widget:
+            list_view.move_child(widget, before=current[pos])
+            current.remove(widget)
+            current.insert(pos, widget)
+            counts["moved"] += 1
+        if widget.update_row(**fields):
+            counts["updated"] += 1
+
+    # Cursor: ListView only re-highlights on an index *change*, so clear
+    # the old row's highlight and re-run the watcher when the row under an
+    # unchanged index is a different one.
+    target = cursor_index
+    if cursor_key is not None and cursor_key in by_key:
+        target = current.index(by_key[cursor_key])
+    if not current:
+        list_view.index = None
+        return counts
+    if not 0 <= target < len(current):
+        target = 0
+    if previous is not None and previous is not current[target]:
+        previous.highlighted = False
+    if list_view.index != target:
+        list_view.index = target
+    elif previous is not current[target]:
+        list_view.watch_index(target, target)
+    return counts
 
 
 # ─── Dwell Progress Bar ─────────────────────────────────────────────────────
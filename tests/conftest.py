@@ -0,0 +1,11 @@
+"""Shared fixtures for the test suite."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _archive_dir(tmp_path, monkeypatch):
+    """Keep session archives spilled by any test inside its own tmp dir."""
+    root = tmp_path / "archive"
+    monkeypatch.setattr("io_mcp.archive.ARCHIVE_DIR", str(root))
+    return root
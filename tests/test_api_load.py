@@ -0,0 +1,157 @@
+"""Load tests for the asyncio frontend API server.
+
+REST latency must not depend on how many SSE clients are subscribed, and
+a slow REST handler must not hold up SSE delivery or other requests.
+"""
+
+from __future__ import annotations
+
+import http.client
+import json
+import socket
+import statistics
+import threading
+import time
+
+import pytest
+
+from io_mcp.api import FrontendAPIServer, emit_selection_made, event_bus
+from io_mcp.session import Session
+
+from tests.test_frontend_api import _free_port, _make_frontend, _wait_for_port
+
+
+@pytest.fixture()
+def server():
+    """Running FrontendAPIServer with one active session and a no-op key handler."""
+    s = Session(session_id="s1", name="Agent 1")
+    s.active = True
+    srv = FrontendAPIServer(("127.0.0.1", _free_port()), _make_frontend([s]))
+    srv._key_callback = lambda sid, key: None
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    port = srv.server_address[1]
+    assert _wait_for_port("127.0.0.1", port)
+    yield srv, port, s
+    srv.shutdown()
+    srv.server_close()
+
+
+def _open_sse(port: int) -> socket.socket:
+    sock = socket.create_connection(("127.0.0.1", port), timeout=5)
+    sock.sendall(b"GET /api/events HTTP/1.1\r\nHost: x\r\nAccept: text/event-stream\r\n\r\n")
+    return sock
+
+
+def _wait_subscribers(n: int, timeout: float = 10.0) -> None:
+    deadline = time.monotonic() + timeout
+    while event_bus.subscriber_count() < n and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert event_bus.subscriber_count() >= n
+
+
+def _post(port: int, path: str, body: dict) -> float:
+    payload = json.dumps(body)
+    start = time.perf_counter()
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+    conn.request("POST", path, body=payload,
+                 headers={"Content-Type": "application/json",
+                          "Content-Length": str(len(payload))})
+    resp = conn.getresponse()
+    resp.read()
+    conn.close()
+    assert resp.status == 200
+    return time.perf_counter() - start
+
+
+def _p50(port: int, n: int = 30) -> float:
+    samples = []
+    for i in range(n):
+        samples.append(_post(port, "/api/sessions/s1/key", {"key": "j"}))
+        samples.append(_post(port, "/api/sessions/s1/select", {"label": f"L{i}"}))
+    return statistics.median(samples)
+
+
+class TestSubscriberScaling:
+
+    def test_key_and_select_latency_flat_as_subscribers_grow(self, server):
+        _, port, _ = server
+        base_subs = event_bus.subscriber_count()
+        stop = threading.Event()
+
+        def _publisher():
+            # Steady event traffic so every stream has something to write
+            while not stop.is_set():
+                emit_selection_made("s1", "x", "")
+                time.sleep(0.01)
+
+        pub = threading.Thread(target=_publisher, daemon=True)
+        pub.start()
+        socks: list[socket.socket] = []
+        latencies = {}
+        try:
+            for count in (0, 50, 200):
+                while len(socks) < count:
+                    socks.append(_open_sse(port))
+                _wait_subscribers(base_subs + count)
+                latencies[count] = _p50(port)
+        finally:
+            stop.set()
+            for sock in socks:
+                sock.close()
+
+        # Generous bound for noisy CI machines; the old single-threaded
+        # server could not answer at all with even one subscriber.
+        assert latencies[200] < max(3 * latencies[0], latencies[0] + 0.05), latencies
+        assert latencies[50] < max(3 * latencies[0], latencies[0] + 0.05), latencies
+
+    def test_disconnected_subscribers_are_dropped(self, server):
+        _, port, _ = server
+        base_subs = event_bus.subscriber_count()
+        socks = [_open_sse(port) for _ in range(20)]
+        _wait_subscribers(base_subs + 20)
+        for sock in socks:
+            sock.close()
+        deadline = time.monotonic() + 5
+        while event_bus.subscriber_count() > base_subs and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert event_bus.subscriber_count() == base_subs
+
+
+class TestIndependentLatency:
+
+    def test_slow_key_handler_does_not_block_other_requests(self, server):
+        srv, port, _ = server
+        release = threading.Event()
+        srv._key_callback = lambda sid, key: release.wait(5)
+        slow = threading.Thread(target=_post, args=(port, "/api/sessions/s1/key", {"key": "j"}))
+        slow.start()
+        try:
+            time.sleep(0.05)
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=2)
+            conn.request("GET", "/api/health")
+            assert conn.getresponse().status == 200
+        finally:
+            release.set()
+            slow.join(timeout=5)
+
+    def test_sse_delivers_while_rest_is_busy(self, server):
+        srv, port, _ = server
+        release = threading.Event()
+        srv._key_callback = lambda sid, key: release.wait(5)
+        base_subs = event_bus.subscriber_count()
+        sock = _open_sse(port)
+        slow = threading.Thread(target=_post, args=(port, "/api/sessions/s1/key", {"key": "j"}))
+        try:
+            _wait_subscribers(base_subs + 1)
+            slow.start()
+            emit_selection_made("s1", "during-slow-call", "")
+            data = b""
+            deadline = time.monotonic() + 2
+            while b"during-slow-call" not in data and time.monotonic() < deadline:
+                data += sock.recv(4096)
+            assert b"during-slow-call" in data
+        finally:
+            release.set()
+            slow.join(timeout=5)
+            sock.close()
@@ -0,0 +1,146 @@
+"""Tests for the on-disk session history archive (io_mcp.archive)."""
+
+import os
+import stat
+import time
+
+from io_mcp.archive import ARCHIVE_DIR, ARCHIVE_RETENTION_SECS, SessionArchive, prune_archives
+from io_mcp.session import HistoryEntry, InboxItem, SessionManager, SpeechEntry
+
+
+class TestSessionArchive:
+
+    def test_empty(self, tmp_path):
+        a = SessionArchive(str(tmp_path / "s"))
+        assert a.count("speech") == 0
+        assert a.read("speech", 0, 10) == []
+
+    def test_extend_and_read_across_segments(self, tmp_path):
+        a = SessionArchive(str(tmp_path / "s"), segment_records=4)
+        a.extend("speech", [{"n": i} for i in range(10)])
+        assert a.count("speech") == 10
+        assert [r["n"] for r in a.read("speech", 2, 9)] == list(range(2, 9))
+
+    def test_streams_are_independent(self, tmp_path):
+        a = SessionArchive(str(tmp_path / "s"))
+        a.extend("speech", [{"n": 1}])
+        a.extend("done", [{"n": 2}, {"n": 3}])
+        assert a.count("speech") == 1
+        assert a.count("done") == 2
+
+    def test_reopen_recovers_counts(self, tmp_path):
+        path = str(tmp_path / "s")
+        SessionArchive(path, segment_records=2).extend("history", [{"n": i} for i in range(5)])
+        again = SessionArchive(path, segment_records=2)
+        assert again.count("history") == 5
+        assert [r["n"] for r in again.read("history", 0, 5)] == [0, 1, 2, 3, 4]
+
+    def test_for_session_sanitises_id(self, tmp_path):
+        a = SessionArchive.for_session("../pane/%1", root=str(tmp_path))
+        assert a.path.startswith(str(tmp_path))
+        assert ".." not in a.path[len(str(tmp_path)):].split("/")
+
+    def test_default_root_is_per_user(self):
+        assert os.path.basename(ARCHIVE_DIR).endswith(f"-{os.getuid()}")
+
+    def test_directories_are_private(self, tmp_path):
+        root = tmp_path / "root"
+        a = SessionArchive.for_session("s", root=str(root))
+        a.extend("speech", [{"n": 1}])
+        assert stat.S_IMODE(os.stat(root).st_mode) == 0o700
+        assert stat.S_IMODE(os.stat(a.path).st_mode) == 0o700
+
+
+class TestSessionSpill:
+
+    def _session(self, tmp_path):
+        m = SessionManager(archive_dir=str(tmp_path))
+        s, _ = m.get_or_create("s1")
+        return s
+
+    def test_speech_overflow_spills(self, tmp_path):
+        s = self._session(tmp_path)
+        s._speech_log_max = 3
+        for i in range(10):
+            s.append_speech(SpeechEntry(text=f"m{i}"))
+        assert [e.text for e in s.speech_log] == ["m7", "m8", "m9"]
+        assert s.archive.count("speech") == 7
+
+    def test_page_history_spans_archive_and_memory(self, tmp_path):
+        s = self._session(tmp_path)
+        s._history_max = 3
+        for i in range(10):
+            s.append_history(HistoryEntry(label=f"h{i}", summary="", preamble=""))
+        records, total = s.page_history("history", limit=4)
+        assert total == 10
+        assert [r["label"] for r in records] == ["h6", "h7", "h8", "h9"]
+        records, _ = s.page_history("history", skip=4, limit=4)
+        assert [r["label"] for r in records] == ["h2", "h3", "h4", "h5"]
+        records, _ = s.page_history("history", skip=8, limit=4)
+        assert [r["label"] for r in records] == ["h0", "h1"]
+
+    def test_done_overflow_spills_choices(self, tmp_path):
+        s = self._session(tmp_path)
+        s._inbox_done_max = 1
+        for i in range(3):
+            item = InboxItem(kind="choices", preamble=f"p{i}", choices=[{"label": "A"}])
+            item.result = {"selected": "A", "summary": ""}
+            s._append_done(item)
+        records, total = s.page_history("done", limit=10)
+        assert total == 3
+        assert [r["preamble"] for r in records] == ["p0", "p1", "p2"]
+        assert records[0]["result"]["selected"] == "A"
+
+    def test_no_archive_keeps_old_behaviour(self):
+        from io_mcp.session import Session
+        s = Session(session_id="x", name="X")
+        s._speech_log_max = 2
+        for i in range(4):
+            s.append_speech(SpeechEntry(text=f"m{i}"))
+        records, total = s.page_history("speech")
+        assert total == 2
+        assert [r["text"] for r in records] == ["m2", "m3"]
+
+    def test_removed_session_keeps_archive_and_reuse_starts_fresh(self, tmp_path):
+        m = SessionManager(archive_dir=str(tmp_path))
+        s, _ = m.get_or_create("s1")
+        s._speech_log_max = 1
+        s.append_speech(SpeechEntry(text="a"))
+        s.append_speech(SpeechEntry(text="b"))
+        m.remove("s1")
+        assert os.path.isdir(s.archive.path)
+        assert SessionArchive(s.archive.path).count("speech") == 1
+        s2, _ = m.get_or_create("s1")
+        assert s2.archive.path != s.archive.path
+        assert s2.page_history("speech") == ([], 0)
+
+
+class TestPruneArchives:
+
+    def _archive(self, root, name, age):
+        a = SessionArchive(str(root / name))
+        a.extend("speech", [{"n": 1}])
+        then = time.time() - age
+        for f in os.scandir(a.path):
+            os.utime(f.path, (then, then))
+        return a
+
+    def test_prunes_only_stale_archives(self, tmp_path):
+        old = self._archive(tmp_path, "old.1", age=7200)
+        live = self._archive(tmp_path, "live.1", age=7200)
+        recent = self._archive(tmp_path, "recent.1", age=10)
+        assert prune_archives(str(tmp_path), max_age=3600, keep=["live.1"]) == 1
+        assert not os.path.exists(old.path)
+        assert os.path.exists(live.path) and os.path.exists(recent.path)
+
+    def test_manager_prunes_at_most_once_per_interval(self, tmp_path):
+        self._archive(tmp_path, "gone.1", age=ARCHIVE_RETENTION_SECS + 60)
+        m = SessionManager(archive_dir=str(tmp_path))
+        m.get_or_create("s1")
+        assert not (tmp_path / "gone.1").exists()
+        self._archive(tmp_path, "gone.2", age=ARCHIVE_RETENTION_SECS + 60)
+        m.get_or_create("s2")
+        assert (tmp_path / "gone.2").exists()
+
+    def test_missing_root(self, tmp_path):
+        assert prune_archives(str(tmp_path / "nope")) == 0
@@ -0,0 +1,225 @@
+"""Tests for the asyncio backend: blocking tools held as futures, not threads."""
+
+import asyncio
+import json
+import socket
+import threading
+import time
+from unittest.mock import MagicMock
+
+from io_mcp.__main__ import _create_tool_dispatcher
+from io_mcp.backend import start_backend_server
+from io_mcp.session import InboxEvent, SessionManager
+
+
+def _result(raw) -> dict:
+    """The JSON result, ignoring any reminder text appended after it."""
+    return json.JSONDecoder().raw_decode(raw if isinstance(raw, str) else raw.decode())[0]
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+class TestInboxEvent:
+
+    def test_wait_async_woken_from_thread(self):
+        event = InboxEvent()
+
+        async def main():
+            threading.Timer(0.05, event.set).start()
+            return await event.wait_async(timeout=5)
+
+        assert asyncio.run(main()) is True
+
+    def test_wait_async_timeout_drops_callback(self):
+        event = InboxEvent()
+        assert asyncio.run(event.wait_async(timeout=0.01)) is False
+        assert event._callbacks == []
+
+    def test_callback_runs_once(self):
+        event = InboxEvent()
+        calls = []
+        event.add_callback(lambda: calls.append(1))
+        event.set()
+        event.set()
+        assert calls == [1]
+        event.add_callback(lambda: calls.append(2))  # already set: runs now
+        assert calls == [1, 2]
+
+
+class _NoLimits:
+    extra_options: list = []
+
+    def rate_limit(self, kind):
+        return None
+
+
+def _dispatcher():
+    """Dispatcher over a mock app whose choices wait on per-session events."""
+    app = MagicMock()
+    app.manager = SessionManager()
+    app._config = _NoLimits()
+    pending: dict[str, InboxEvent] = {}
+
+    async def present_choices_async(session, preamble, choices):
+        event = pending.setdefault(session.session_id, InboxEvent())
+        await event.wait_async()
+        return {"selected": choices[0]["label"], "summary": ""}
+
+    app.present_choices_async = present_choices_async
+    return _create_tool_dispatcher([app], [], []), pending
+
+
+class TestDispatchAsync:
+
+    def test_coroutine_tool_result(self):
+        dispatch, pending = _dispatcher()
+
+        async def main():
+            call = asyncio.ensure_future(dispatch.dispatch_async(
+                "present_choices", {"preamble": "p", "choices": [{"label": "A"}]}, "s1"))
+            while "s1" not in pending:
+                await asyncio.sleep(0.01)
+            pending["s1"].set()
+            return await call
+
+        assert _result(asyncio.run(main()))["selected"] == "A"
+
+    def test_sync_tool_is_offloaded(self):
+        dispatch, _ = _dispatcher()
+        result = asyncio.run(dispatch.dispatch_async("report_status", {"status": "x"}, "s1"))
+        assert "status" in result
+
+    def test_sync_tools_use_their_own_pool(self):
+        dispatch, _ = _dispatcher()
+        seen = []
+        real = dispatch.blocking_executor.submit
+
+        def submit(fn, *args):
+            seen.append(args[1])
+            return real(fn, *args)
+        dispatch.blocking_executor.submit = submit
+        asyncio.run(dispatch.dispatch_async("report_status", {"status": "x"}, "s1"))
+        assert seen == ["report_status"]
+
+    def test_sync_dispatch_runs_coroutine_tools_on_a_live_loop(self):
+        dispatch, pending = _dispatcher()
+        threading.Timer(0.1, lambda: pending["s1"].set()).start()
+        result = dispatch("present_choices", {"preamble": "p", "choices": [{"label": "A"}]}, "s1")
+        assert _result(result)["selected"] == "A"
+        # Tasks the tool left behind still run: the loop wasn't closed under them
+        assert _result(dispatch("present_choices", {
+            "preamble": "p", "choices": [{"label": "B"}], "timeout": 0.1}, "s2"))[
+                "selected"] == "_timeout"
+
+    def test_timeout_returns_while_choices_stay_pending(self):
+        dispatch, pending = _dispatcher()
+        result = asyncio.run(dispatch.dispatch_async(
+            "present_choices", {"preamble": "p", "choices": [{"label": "A"}], "timeout": 0.1},
+            "s1"))
+        assert _result(result)["selected"] == "_timeout"
+
+
+class TestBackendServer:
+
+    def test_many_pending_choices_do_not_park_threads(self):
+        n = 200
+        dispatch, pending = _dispatcher()
+        port = _free_port()
+        server = start_backend_server(dispatch, host="127.0.0.1", port=port)
+        baseline = threading.active_count()
+
+        async def call(i):
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            body = json.dumps({"tool": "present_choices", "session_id": f"s{i}",
+                               "args": {"preamble": "p", "choices": [{"label": f"L{i}"}]}})
+            writer.write((f"POST /handle-mcp HTTP/1.1\r\nHost: x\r\n"
+                          f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n"
+                          f"{body}").encode())
+            await writer.drain()
+            raw = await reader.read()
+            writer.close()
+            return raw
+
+        async def main():
+            calls = [asyncio.ensure_future(call(i)) for i in range(n)]
+            deadline = time.monotonic() + 10
+            while len(pending) < n and time.monotonic() < deadline:
+                await asyncio.sleep(0.02)
+            assert len(pending) == n
+            grown = threading.active_count() - baseline
+            for event in pending.values():
+                event.set()
+            return grown, await asyncio.gather(*calls)
+
+        try:
+            grown, responses = asyncio.run(main())
+        finally:
+            server.shutdown()
+            server.server_close()
+        assert grown < n // 2
+        for i, raw in enumerate(responses):
+            head, _, body = raw.partition(b"\r\n\r\n")
+            assert head.startswith(b"HTTP/1.1 200")
+            assert _result(body)["selected"] == f"L{i}"
+
+    def test_non_object_body_is_rejected(self):
+        port = _free_port()
+        server = start_backend_server(lambda tool, args, sid: tool, host="127.0.0.1", port=port)
+        try:
+            for body in (b"[]", b'"x"'):
+                with socket.create_connection(("127.0.0.1", port), timeout=5) as s:
+                    s.sendall(b"POST /speak HTTP/1.1\r\nConnection: close\r\nContent-Length: "
+                              + str(len(body)).encode() + b"\r\n\r\n" + body)
+                    assert s.makefile("rb").readline().startswith(b"HTTP/1.1 400")
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_keep_alive_serves_several_requests(self):
+        port = _free_port()
+        server = start_backend_server(lambda tool, args, sid: tool, host="127.0.0.1", port=port)
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=5) as s:
+                f = s.makefile("rb")
+                for tool in ("a", "b"):
+                    body = json.dumps({"tool": tool}).encode()
+                    s.sendall(b"POST /handle-mcp HTTP/1.1\r\nContent-Length: "
+                              + str(len(body)).encode() + b"\r\n\r\n" + body)
+                    assert f.readline().startswith(b"HTTP/1.1 200")
+                    headers = {}
+                    while (line := f.readline()) != b"\r\n":
+                        k, _, v = line.decode().partition(":")
+                        headers[k.lower()] = v.strip()
+                    assert f.read(int(headers["content-length"])) == tool.encode()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_report_activity_runs_off_the_loop(self):
+        calls = []
+
+        def report(session_id, tool, detail, kind):
+            # May spill to the archive, so it must not run on the loop thread
+            try:
+                asyncio.get_running_loop()
+                calls.append("loop")
+            except RuntimeError:
+                calls.append((session_id, tool, detail, kind))
+
+        port = _free_port()
+        server = start_backend_server(lambda tool, args, sid: tool, host="127.0.0.1",
+                                      port=port, report_activity=report)
+        try:
+            body = json.dumps({"session_id": "s1", "tool": "Bash", "detail": "ls"}).encode()
+            with socket.create_connection(("127.0.0.1", port), timeout=5) as s:
+                s.sendall(b"POST /report-activity HTTP/1.1\r\nConnection: close\r\n"
+                          b"Content-Length: " + str(len(body)).encode() + b"\r\n\r\n" + body)
+                assert s.makefile("rb").readline().startswith(b"HTTP/1.1 200")
+        finally:
+            server.shutdown()
+            server.server_close()
+        assert calls == [("s1", "Bash", "ls", "tool")]
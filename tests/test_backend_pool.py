@@ -0,0 +1,108 @@
+"""Tests for the proxy's keep-alive connection pool to the backend."""
+
+import json
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from io_mcp.proxy import BackendPool, _forward_to_backend, _lane
+
+
+class _EchoHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections: set = set()
+
+    def do_POST(self):
+        self.connections.add(self.client_address)
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        request = json.loads(body)
+        status = 500 if request.get("tool") == "boom" else 200
+        out = json.dumps({"tool": request.get("tool")}).encode()
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(out)))
+        self.end_headers()
+        self.wfile.write(out)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture()
+def backend():
+    _EchoHandler.connections = set()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _EchoHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _url(server):
+    return f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def _payload(tool):
+    return json.dumps({"tool": tool, "args": {}, "session_id": "s"}).encode()
+
+
+class TestBackendPool:
+
+    def test_connection_is_reused(self, backend):
+        pool = BackendPool(_url(backend))
+        for _ in range(5):
+            status, body = pool.post("/handle-mcp", _payload("speak_async"), 5)
+            assert status == 200
+        stats = pool.stats()["fast"]
+        assert stats["created"] == 1
+        assert stats["reused"] == 4
+        assert stats["idle"] == 1 and stats["in_use"] == 0
+        assert len(_EchoHandler.connections) == 1
+        assert stats["latency_p50_ms"] is not None
+
+    def test_lanes_are_separate(self, backend):
+        pool = BackendPool(_url(backend))
+        pool.post("/handle-mcp", _payload("speak"), 5, lane="blocking")
+        pool.post("/handle-mcp", _payload("speak_async"), 5, lane="fast")
+        stats = pool.stats()
+        assert stats["blocking"]["created"] == 1
+        assert stats["fast"]["created"] == 1
+
+    def test_idle_pool_is_bounded(self, backend):
+        pool = BackendPool(_url(backend), sizes={"fast": 1})
+        conns = [pool._checkout("fast", 5)[0] for _ in range(3)]
+        for conn in conns:
+            pool._checkin("fast", conn, keep=True)
+        assert pool.stats()["fast"]["idle"] == 1
+
+    def test_stale_connection_retried_once(self, backend):
+        pool = BackendPool(_url(backend))
+        pool.post("/handle-mcp", _payload("a"), 5)
+        conn, _ = pool._idle["fast"][0]
+        conn.sock.shutdown(socket.SHUT_RDWR)  # backend "restarted" while idle
+        status, body = pool.post("/handle-mcp", _payload("b"), 5)
+        assert status == 200 and json.loads(body)["tool"] == "b"
+        assert pool.stats()["fast"]["stale"] == 1
+
+    def test_http_error_status_returned(self, backend):
+        status, _ = BackendPool(_url(backend)).post("/handle-mcp", _payload("boom"), 5)
+        assert status == 500
+
+    def test_lane_for_tool(self):
+        assert _lane("present_choices") == "blocking"
+        assert _lane("speak_async") == "fast"
+
+
+class TestForwardUsesPool:
+
+    def test_forward_reuses_connection(self, backend):
+        url = _url(backend)
+        for _ in range(3):
+            result = _forward_to_backend(url, "check_inbox", {}, "s")
+            assert json.loads(result)["tool"] == "check_inbox"
+        assert len(_EchoHandler.connections) == 1
+
+    def test_forward_http_error_returns_body(self, backend):
+        result = _forward_to_backend(_url(backend), "boom", {}, "s", max_retries=3)
+        assert '"tool": "boom"' in result
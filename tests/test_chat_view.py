@@ -6,7 +6,7 @@ Verifies that the chat view guards and layout logic work correctly:
 - _show_choices delegates to _populate_chat_choices_list in chat view
 - _show_session_waiting returns early in chat view mode
 - Auto-scroll respects user scroll position
-- _notify_chat_feed_update triggers immediate refresh
+- _notify_chat_feed_update triggers a refresh on the next frame
 """
 
 import pytest
@@ -314,25 +314,19 @@ async def test_notify_chat_feed_update_noop_when_chat_inactive():
         session = _setup_session_with_choices(app)
 
         app._chat_view_active = False
-        refresh_calls = []
-        original_refresh = app._refresh_chat_feed
-
-        def mock_refresh():
-            refresh_calls.append(True)
-            original_refresh()
-
-        app._refresh_chat_feed = mock_refresh
+        invalidated = []
+        app._invalidate = lambda *regions: invalidated.extend(regions)
 
         app._notify_chat_feed_update(session)
         await pilot.pause(0.1)
 
-        # Should NOT have called _refresh_chat_feed
-        assert len(refresh_calls) == 0
+        # Should NOT have scheduled a chat refresh
+        assert invalidated == []
 
 
 @pytest.mark.asyncio
 async def test_notify_chat_feed_update_triggers_refresh_when_active():
-    """_notify_chat_feed_update triggers immediate refresh when chat is active."""
+    """_notify_chat_feed_update triggers a refresh when chat is active."""
     app = make_app()
     async with app.run_test() as pilot:
         session = _setup_session_with_choices(app)
@@ -374,20 +368,14 @@ async def test_notify_chat_feed_update_skips_unfocused_session():
         app._chat_unified = False  # Single-session mode
 
         # Focus is on session1 (it was created first and is active)
-        refresh_calls = []
-        original_refresh = app._refresh_chat_feed
-
-        def mock_refresh():
-            refresh_calls.append(True)
-            original_refresh()
-
-        app._refresh_chat_feed = mock_refresh
+        invalidated = []
+        app._invalidate = lambda *regions: invalidated.extend(regions)
 
         # Notify about session2 (not focused) — should skip
         app._notify_chat_feed_update(session2)
         await pilot.pause(0.1)
 
-        assert len(refresh_calls) == 0
+        assert invalidated == []
 
 
 @pytest.mark.asyncio
@@ -1074,8 +1062,8 @@ async def test_force_full_rebuild_flag():
 
 
 @pytest.mark.asyncio
-async def test_incremental_append_skipped_for_unified_mode():
-    """Incremental append is not used in unified (multi-session) mode."""
+async def test_incremental_append_used_for_unified_mode():
+    """Unified mode appends events newer than the feed via the store cursor."""
     app = make_app()
     async with app.run_test() as pilot:
         session1 = _setup_session_with_choices(app, session_id="s1", name="S1")
@@ -1102,9 +1090,40 @@ async def test_incremental_append_skipped_for_unified_mode():
         app._build_chat_feed(session1, sessions=all_sessions)
         await pilot.pause(0.1)
 
-        # Should be a full rebuild (unified mode doesn't use incremental)
+        # Existing widgets kept, one new bubble appended
+        ids = [id(child) for child in feed.children]
+        assert ids[:initial_count] == existing_ids
+        assert len(ids) == initial_count + 1
+        assert "S2 speech" in feed.children[-1].tts_text
+
+
+@pytest.mark.asyncio
+async def test_unified_mode_rebuilds_on_out_of_order_event():
+    """An event older than the newest shown row forces a full rebuild."""
+    app = make_app()
+    async with app.run_test() as pilot:
+        session1 = _setup_session_with_choices(app, session_id="s1", name="S1")
+        session2, _ = app.manager.get_or_create("s2")
+        session2.registered = True
+        session2.name = "S2"
+        app.on_session_created(session2)
+
+        all_sessions = list(app.manager.all_sessions())
+        session1.speech_log.append(SpeechEntry(text="S1 speech"))
+        app._chat_view_active = True
+        app._chat_unified = True
+        app._build_chat_feed(session1, sessions=all_sessions)
+        await pilot.pause(0.1)
+
+        feed = app.query_one("#chat-feed", ListView)
+        existing_ids = [id(child) for child in feed.children]
+
+        session2.speech_log.append(SpeechEntry(text="old", timestamp=1.0))
+        app._build_chat_feed(session1, sessions=all_sessions)
+        await pilot.pause(0.1)
+
         rebuilt_ids = [id(child) for child in feed.children]
-        assert rebuilt_ids != existing_ids
+        assert rebuilt_ids[:len(existing_ids)] != existing_ids
 
 
 @pytest.mark.asyncio
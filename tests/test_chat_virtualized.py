@@ -0,0 +1,151 @@
+"""Tests for the virtualized (windowed) chat feed.
+
+The row model keeps the whole history while only ``CHAT_WINDOW`` bubbles
+are mounted. Includes a small benchmark: opening the feed and appending
+to it must cost about the same for a short and a long history.
+"""
+
+import time
+
+import pytest
+from textual.widgets import ListView
+
+from io_mcp.session import SpeechEntry
+from io_mcp.tui.chat_view import CHAT_WINDOW, CHAT_WINDOW_MARGIN, ChatBubbleItem
+
+from tests.test_tui_pilot import make_app
+
+
+def _live(feed):
+    return [c for c in feed.children if isinstance(c, ChatBubbleItem) and c.display]
+
+
+def _speak(session, text, ts):
+    session.speech_log.append(SpeechEntry(text=text, timestamp=ts))
+
+
+async def _setup(pilot, app, n_entries):
+    session, _ = app.manager.get_or_create("s1")
+    session.registered = True
+    session.registered_at = 1000.0
+    session.name = "Agent"
+    app.on_session_created(session)
+    for i in range(n_entries):
+        _speak(session, f"m{i}", 2000.0 + i)
+    app._chat_view_active = True
+    app._chat_force_full_rebuild = True
+    app._build_chat_feed(session)
+    await pilot.pause()
+    return session, app.query_one("#chat-feed", ListView)
+
+
+@pytest.mark.asyncio
+async def test_long_history_mounts_only_the_newest_window():
+    app = make_app()
+    async with app.run_test() as pilot:
+        _, feed = await _setup(pilot, app, 300)
+        assert len(app._chat_rows) == 301  # header + entries, no 200 cap
+        assert app._chat_rows[0].kind == "header"
+        live = _live(feed)
+        assert live == app._chat_mounted
+        assert len(live) == CHAT_WINDOW
+        assert live[-1].bubble_text == "m299"
+        assert app._chat_window_start == 301 - CHAT_WINDOW
+
+
+@pytest.mark.asyncio
+async def test_append_keeps_widgets_and_trims_in_batches():
+    app = make_app()
+    async with app.run_test() as pilot:
+        session, feed = await _setup(pilot, app, 100)
+        app._chat_feed_is_at_bottom = lambda: True
+        before = list(app._chat_mounted)
+
+        _speak(session, "new0", 5000.0)
+        app._build_chat_feed(session)
+        await pilot.pause()
+        assert _live(feed) == before + [app._chat_mounted[-1]]
+        assert app._chat_mounted[-1].bubble_text == "new0"
+
+        for i in range(1, CHAT_WINDOW_MARGIN + 1):
+            _speak(session, f"new{i}", 5000.0 + i)
+            app._build_chat_feed(session)
+        await pilot.pause()
+        live = _live(feed)
+        assert len(live) == CHAT_WINDOW
+        assert live[-1].bubble_text == f"new{CHAT_WINDOW_MARGIN}"
+        assert app._chat_window_start == len(app._chat_rows) - CHAT_WINDOW
+        assert [w.bubble_text for w in live] == [
+            r.text for r in app._chat_rows[app._chat_window_start:]]
+
+
+@pytest.mark.asyncio
+async def test_highlight_near_top_slides_to_older_rows():
+    app = make_app()
+    async with app.run_test() as pilot:
+        _, feed = await _setup(pilot, app, 300)
+        start = app._chat_window_start
+        top = app._chat_mounted[0]
+
+        feed.focus()
+        feed.index = 0
+        await pilot.pause()
+
+        assert app._chat_window_start == start - CHAT_WINDOW // 2
+        assert len(_live(feed)) == CHAT_WINDOW
+        assert feed.highlighted_child is top
+        assert top.highlighted
+        row = app._chat_rows[app._chat_window_start + feed.index]
+        assert row.text == top.bubble_text
+
+
+@pytest.mark.asyncio
+async def test_scrolled_up_append_stops_following_until_jump_to_bottom():
+    app = make_app()
+    async with app.run_test() as pilot:
+        session, feed = await _setup(pilot, app, 100)
+        app._chat_feed_is_at_bottom = lambda: False
+        for i in range(CHAT_WINDOW_MARGIN + 5):
+            _speak(session, f"new{i}", 5000.0 + i)
+            app._build_chat_feed(session)
+        await pilot.pause()
+        assert len(_live(feed)) == CHAT_WINDOW + CHAT_WINDOW_MARGIN
+        assert app._chat_has_new_content is True
+
+        del app._chat_feed_is_at_bottom
+        assert app._chat_feed_is_at_bottom() is False  # newer rows unmounted
+        app.action_chat_scroll_bottom()
+        await pilot.pause()
+        live = _live(feed)
+        assert len(live) == CHAT_WINDOW
+        assert live[-1].bubble_text == f"new{CHAT_WINDOW_MARGIN + 4}"
+        assert app._chat_has_new_content is False
+
+
+async def _feed_costs(n_entries: int, samples: int = 5) -> tuple[float, float]:
+    """Seconds to open a feed of ``n_entries`` and median seconds per append."""
+    app = make_app()
+    async with app.run_test() as pilot:
+        start = time.perf_counter()
+        session, feed = await _setup(pilot, app, n_entries)
+        opened = time.perf_counter() - start
+        app._chat_feed_is_at_bottom = lambda: True
+        times = []
+        for i in range(samples):
+            _speak(session, f"extra{i}", 9000.0 + i)
+            start = time.perf_counter()
+            app._build_chat_feed(session)
+            await pilot.pause()
+            times.append(time.perf_counter() - start)
+        assert len(_live(feed)) <= CHAT_WINDOW + CHAT_WINDOW_MARGIN
+    return opened, sorted(times)[samples // 2]
+
+
+@pytest.mark.asyncio
+async def test_benchmark_feed_cost_is_flat():
+    small_open, small_append = await _feed_costs(50)
+    large_open, large_append = await _feed_costs(1000)
+    # Only the window is mounted, so a 20x longer history costs about the
+    # same to open and to append to.
+    assert large_open < small_open * 3 + 0.1, (small_open, large_open)
+    assert large_append < small_append * 3 + 0.05, (small_append, large_append)
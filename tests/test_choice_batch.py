@@ -0,0 +1,135 @@
+"""Tests for batched multi-question choice presentation (present_choices_batch)."""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from io_mcp.__main__ import _create_tool_dispatcher
+from io_mcp.session import InboxItem, Session, SessionManager
+from io_mcp.tui.app import IoMcpApp
+
+from tests.test_tui_pilot import MockTTS
+
+
+def _app(answers):
+    """App whose per-item presentation answers from ``answers`` in order.
+
+    Records the preamble of every item presented so tests can check what
+    the user saw and in which order.
+    """
+    tts = MockTTS()
+    app = IoMcpApp(tts=tts, freeform_tts=tts, demo=True)
+    app._safe_call = lambda fn: None
+    app._drain_session_inbox_worker = lambda session: None
+    pregen = []
+    app._pregenerate_priority_worker = lambda texts, **kw: pregen.append(list(texts))
+    presented = []
+    queue = list(answers)
+
+    def _await(session, item):
+        assert session.peek_inbox() is item  # always presented from the front
+        presented.append(item.preamble)
+        item.result = queue.pop(0)
+        item.done = True
+        item.event.set()
+        session.peek_inbox()
+        return item.result
+
+    app._await_inbox_turn = _await
+    app._presented = presented
+    app._pregen = pregen
+    return app
+
+
+def _questions(n):
+    return [(f"Q{i}", [{"label": f"A{i}", "summary": f"s{i}"}, {"label": f"B{i}"}])
+            for i in range(n)]
+
+
+class TestSessionBatchEnqueue:
+
+    def test_enqueue_batch_is_contiguous(self):
+        s = Session(session_id="s", name="S")
+        gen = s._inbox_generation
+        items = [InboxItem(kind="choices", preamble=f"q{i}") for i in range(3)]
+        s.enqueue_batch(items)
+        assert list(s.inbox) == items
+        assert s._inbox_generation == gen + 1
+
+    def test_enqueue_front(self):
+        s = Session(session_id="s", name="S")
+        s.enqueue_batch([InboxItem(kind="choices", preamble="a")])
+        front = InboxItem(kind="choices", preamble="b")
+        s.enqueue_front(front)
+        assert s.inbox[0] is front
+
+
+class TestPresentChoicesBatch:
+
+    def test_returns_one_result_per_question_in_order(self):
+        answers = [{"selected": f"A{i}", "summary": ""} for i in range(3)]
+        app = _app(answers)
+        session = Session(session_id="s", name="S")
+        results = app._present_choices_batch_inner(session, _questions(3))
+        assert [r["selected"] for r in results] == ["A0", "A1", "A2"]
+        assert app._presented == ["(1/3) Q0", "(2/3) Q1", "(3/3) Q2"]
+        assert len(session.inbox) == 0
+        assert len(session.inbox_done) == 3
+
+    def test_pregenerates_all_questions_up_front(self):
+        app = _app([{"selected": "A0"}, {"selected": "A1"}])
+        session = Session(session_id="s", name="S")
+        app._present_choices_batch_inner(session, _questions(2))
+        assert len(app._pregen) == 1
+        assert {"A0", "s0", "B0", "A1", "s1", "B1"} <= set(app._pregen[0])
+
+    def test_single_question_keeps_plain_preamble(self):
+        app = _app([{"selected": "A0"}])
+        session = Session(session_id="s", name="S")
+        app._present_choices_batch_inner(session, _questions(1))
+        assert app._presented == ["Q0"]
+
+    def test_undo_re_presents_same_question(self):
+        answers = [{"selected": "A0"}, {"selected": "_undo"}, {"selected": "B1"}]
+        app = _app(answers)
+        session = Session(session_id="s", name="S")
+        results = app._present_choices_batch_inner(session, _questions(2))
+        assert [r["selected"] for r in results] == ["A0", "B1"]
+        assert app._presented == ["(1/2) Q0", "(2/2) Q1", "(2/2) Q1"]
+
+    @pytest.mark.parametrize("marker", ["_dismissed", "_cancelled", "_restart"])
+    def test_abort_resolves_remaining_questions(self, marker):
+        app = _app([{"selected": "A0"}, {"selected": marker, "summary": "x"}])
+        session = Session(session_id="s", name="S")
+        results = app._present_choices_batch_inner(session, _questions(4))
+        assert [r["selected"] for r in results] == ["A0", marker, marker, marker]
+        assert len(app._presented) == 2
+        assert all(item.done for item in session.inbox) or not session.inbox
+
+    def test_undo_keeps_call_key(self):
+        app = _app([])
+        session = Session(session_id="s", name="S")
+        item = InboxItem(kind="choices", preamble="q", call_key="k1")
+        assert app._requeue_front(session, item).call_key == "k1"
+
+
+class TestBatchTool:
+
+    def test_results_line_up_with_questions(self):
+        app = MagicMock()
+        app.manager = SessionManager()
+        app._config = None
+        session, _ = app.manager.get_or_create("s1")
+        session.registered = True
+        app.present_choices_batch.side_effect = lambda session, qs: [
+            {"selected": choices[0]["label"]} for _, choices in qs]
+        dispatch = _create_tool_dispatcher([app], [], [])
+        questions = [{"preamble": "a", "choices": [{"label": "A"}]},
+                     {"preamble": "b", "choices": []},
+                     {"preamble": "c", "choices": [{"label": "C"}]}]
+        result = json.loads(dispatch("present_choices_batch", {"questions": questions}, "s1"))
+        assert [(r["preamble"], r["selected"]) for r in result["results"]] == [
+            ("a", "A"), ("b", "error"), ("c", "C")]
+        presented = app.present_choices_batch.call_args[0][1]
+        assert [p for p, _ in presented] == ["a", "c"]
@@ -125,7 +125,7 @@ class TestFreeformDetection:
         item.result = {"selected": "my custom reply", "summary": "(freeform input)"}
         item.done = True
 
-        # Simulate what _collect_chat_items does
+        # Simulate what _chat_row_for_event does
         result_label = ""
         is_freeform = False
         if item.result:
@@ -26,6 +26,7 @@ import pytest
 from io_mcp.api import (
     EventBus,
     FrontendAPIHandler,
+    FrontendAPIServer,
     FrontendEvent,
     emit_choices_presented,
     emit_recording_state,
@@ -35,9 +36,10 @@ from io_mcp.api import (
     emit_settings_changed,
     emit_speech_requested,
     event_bus,
+    parse_byte_range,
     start_api_server,
 )
-from io_mcp.session import Session, SessionManager
+from io_mcp.session import Session, SessionManager, SpeechEntry
 
 
 # ---------------------------------------------------------------------------
@@ -105,11 +107,11 @@ def _make_config(**kwargs) -> SimpleNamespace:
 
 
 class _APITestServer:
-    """Helper to start/stop a FrontendAPIHandler server for testing."""
+    """Helper to start/stop a FrontendAPIServer for testing."""
 
     def __init__(self, frontend=None, highlight_callback=None, key_callback=None):
         self.port = _free_port()
-        self.server = http.server.HTTPServer(("127.0.0.1", self.port), FrontendAPIHandler)
+        self.server = FrontendAPIServer(("127.0.0.1", self.port))
         if frontend is not None:
             self.server.frontend = frontend
         if highlight_callback is not None:
@@ -195,6 +197,7 @@ class _APITestServer:
 
     def shutdown(self):
         self.server.shutdown()
+        self.server.server_close()
 
 
 @pytest.fixture()
@@ -288,24 +291,42 @@ class TestEventBus:
         # Fill the queue completely
         bus.publish(FrontendEvent(event_type="fill", data={}))
 
-        # Now monkey-patch the queue so get_nowait and put_nowait both fail
+        # Now monkey-patch the queue so offering an event fails
         # (simulating a broken subscriber)
-        original_get = q.get_nowait
-        original_put = q.put_nowait
+        def fail_offer(*args, **kwargs):
+            raise RuntimeError("broken")
 
-        def fail_get(*args, **kwargs):
-            raise queue.Empty()
+        q.offer = fail_offer
 
-        def fail_put(*args, **kwargs):
-            raise queue.Full()
-
-        q.get_nowait = fail_get
-        q.put_nowait = fail_put
-
-        # Publishing now should try to drop oldest (fails), then add (fails) → dead
+        # Publishing now fails for this subscriber → dead
         bus.publish(FrontendEvent(event_type="trigger_cleanup", data={}))
         assert bus.subscriber_count() == 0
 
+    def test_slow_offer_does_not_hold_the_bus_lock(self):
+        bus = EventBus()
+        q = bus.subscribe()
+        entered, release = threading.Event(), threading.Event()
+        offer = q.offer
+
+        def slow_offer(event):
+            entered.set()
+            release.wait(2)
+            return offer(event)
+
+        q.offer = slow_offer
+        publisher = threading.Thread(
+            target=bus.publish, args=(FrontendEvent(event_type="slow", data={}),))
+        publisher.start()
+        assert entered.wait(2)
+        # The event is already in the replay ring: a subscriber joining now
+        # gets it from there, once, without waiting for the fan-out
+        late = bus.subscribe(last_event_id=0)
+        assert bus.subscriber_count() == 2
+        release.set()
+        publisher.join(2)
+        assert [late.get_nowait().event_type] == ["slow"] and late.empty()
+        assert q.get_nowait().event_type == "slow"
+
     def test_publish_with_no_subscribers_is_noop(self):
         bus = EventBus()
         event = FrontendEvent(event_type="orphan", data={})
@@ -582,6 +603,7 @@ class TestHealthEndpoint:
         assert data["status"] == "ok"
         assert data["sessions"] == 2
         assert "sse_subscribers" in data
+        assert data["agent_blocked_seconds"] == 0
 
     def test_health_sse_subscriber_count(self, api_server):
         """SSE subscriber count reflects actual subscriptions."""
@@ -631,6 +653,147 @@ class TestSessionsEndpoint:
         assert sessions[1]["choices"] == []
 
 
+class TestSessionStateEndpoint:
+    """GET /api/sessions/:id — versions, ETags and deltas."""
+
+    def _get(self, srv, path, etag=None):
+        conn = http.client.HTTPConnection("127.0.0.1", srv.port)
+        conn.request("GET", path, headers={"If-None-Match": etag} if etag else {})
+        resp = conn.getresponse()
+        body = resp.read()
+        return resp.status, resp.getheader("ETag"), json.loads(body) if body else None
+
+    def test_unknown_session_404(self, api_server):
+        srv = api_server(frontend=_make_frontend())
+        status, _, data = self._get(srv, "/api/sessions/nope")
+        assert status == 404
+
+    def test_full_state_with_etag(self, api_server):
+        s = _make_session("s1", active=True, preamble="Pick", choices=[{"label": "A"}])
+        srv = api_server(frontend=_make_frontend([s]))
+        status, etag, data = self._get(srv, "/api/sessions/s1")
+        assert status == 200
+        assert etag
+        assert data["full"] is True
+        assert data["state"]["preamble"] == "Pick"
+        assert data["state"]["choices"] == [{"label": "A"}]
+
+    def test_unchanged_etag_returns_304_without_body(self, api_server):
+        s = _make_session("s1")
+        srv = api_server(frontend=_make_frontend([s]))
+        _, etag, data = self._get(srv, "/api/sessions/s1")
+        status, etag2, body = self._get(srv, "/api/sessions/s1", etag=etag)
+        assert status == 304
+        assert body is None
+        assert etag2 == etag
+
+    def test_change_bumps_version_and_etag(self, api_server):
+        s = _make_session("s1")
+        srv = api_server(frontend=_make_frontend([s]))
+        _, etag, first = self._get(srv, "/api/sessions/s1")
+        s.active = True
+        s.preamble = "New question"
+        s.choices = [{"label": "X"}]
+        status, etag2, data = self._get(srv, "/api/sessions/s1", etag=etag)
+        assert status == 200
+        assert etag2 != etag
+        assert data["version"] == first["version"] + 1
+
+    def test_since_returns_only_changed_fields(self, api_server):
+        s = _make_session("s1", active=True, preamble="Q1", choices=[{"label": "A"}])
+        srv = api_server(frontend=_make_frontend([s]))
+        _, _, first = self._get(srv, "/api/sessions/s1")
+        s.pending_messages.append("hi")
+        status, _, data = self._get(srv, f"/api/sessions/s1?since={first['version']}")
+        assert status == 200
+        assert data["full"] is False
+        assert data["state"] == {"pending_messages": 1}
+
+    def test_since_current_version_is_304(self, api_server):
+        s = _make_session("s1")
+        srv = api_server(frontend=_make_frontend([s]))
+        _, _, first = self._get(srv, "/api/sessions/s1")
+        status, _, _ = self._get(srv, f"/api/sessions/s1?since={first['version']}")
+        assert status == 304
+
+    def test_since_from_the_future_gets_full_state(self, api_server):
+        s = _make_session("s1")
+        srv = api_server(frontend=_make_frontend([s]))
+        status, _, data = self._get(srv, "/api/sessions/s1?since=999")
+        assert status == 200
+        assert data["full"] is True
+
+    def test_in_place_choice_edit_is_detected(self, api_server):
+        s = _make_session("s1", active=True, preamble="Q", choices=[{"label": "A"}])
+        srv = api_server(frontend=_make_frontend([s]))
+        _, etag, _ = self._get(srv, "/api/sessions/s1")
+        s.choices[0]["label"] = "B"
+        status, _, data = self._get(srv, "/api/sessions/s1", etag=etag)
+        assert status == 200
+
+    def test_bad_since_400(self, api_server):
+        srv = api_server(frontend=_make_frontend([_make_session("s1")]))
+        status, _, _ = self._get(srv, "/api/sessions/s1?since=abc")
+        assert status == 400
+
+    def test_list_etag(self, api_server):
+        s = _make_session("s1")
+        frontend = _make_frontend([s])
+        srv = api_server(frontend=frontend)
+        _, etag, data = self._get(srv, "/api/sessions")
+        assert data["sessions"][0]["version"] >= 1
+        assert self._get(srv, "/api/sessions", etag=etag)[0] == 304
+        frontend.manager.get_or_create("s2")
+        assert self._get(srv, "/api/sessions", etag=etag)[0] == 200
+
+
+class TestTimelineEndpoint:
+    """GET /api/timeline"""
+
+    def test_timeline_no_frontend(self, api_server):
+        srv = api_server()
+        status, data = srv.get("/api/timeline")
+        assert status == 500
+
+    def test_timeline_pages_with_cursor(self, api_server):
+        s1 = _make_session("s1", "Agent 1")
+        s2 = _make_session("s2", "Agent 2")
+        frontend = _make_frontend([s1, s2])
+        s1.append_speech(SpeechEntry(text="one"))
+        s2.append_speech(SpeechEntry(text="two"))
+        s1.append_speech(SpeechEntry(text="three"))
+        srv = api_server(frontend=frontend)
+
+        status, first = srv.get("/api/timeline?limit=2")
+        assert status == 200
+        assert len(first["events"]) == 2
+        assert first["more"] is True
+
+        status, data = srv.get(f"/api/timeline?since={first['cursor']}")
+        assert len(data["events"]) == 1
+        assert data["more"] is False
+        texts = {e["text"] for e in first["events"] + data["events"]}
+        assert texts == {"one", "two", "three"}
+
+        status, data = srv.get(f"/api/timeline?since={data['cursor']}")
+        assert data["events"] == []
+
+    def test_timeline_session_filter(self, api_server):
+        s1 = _make_session("s1", "Agent 1")
+        s2 = _make_session("s2", "Agent 2")
+        frontend = _make_frontend([s1, s2])
+        s1.append_speech(SpeechEntry(text="one"))
+        s2.append_speech(SpeechEntry(text="two"))
+        srv = api_server(frontend=frontend)
+        status, data = srv.get("/api/timeline?session=s2")
+        assert [e["session_id"] for e in data["events"]] == ["s2"]
+
+    def test_timeline_bad_cursor(self, api_server):
+        srv = api_server(frontend=_make_frontend())
+        status, data = srv.get("/api/timeline?since=abc")
+        assert status == 400
+
+
 class TestSettingsEndpoint:
     """GET /api/settings"""
 
@@ -915,6 +1078,15 @@ class TestHighlightEndpoint:
         status, data = srv.post("/api/sessions/s1/highlight", {"index": -1})
         assert status == 400
 
+    @pytest.mark.parametrize("index", ["3", None, 1.5, True, [1]])
+    def test_highlight_non_integer_index(self, api_server, index):
+        s = _make_session("s1", active=True)
+        frontend = _make_frontend([s])
+        srv = api_server(frontend=frontend)
+        status, data = srv.post("/api/sessions/s1/highlight", {"index": index})
+        assert status == 400
+        assert "invalid index" in data["error"]
+
     def test_highlight_no_callback(self, api_server):
         """Highlight succeeds even without a callback registered."""
         s = _make_session("s1", active=True)
@@ -1066,6 +1238,16 @@ class TestErrorCases:
         status, data = srv.post("/api/sessions/s1/invalid_action", {})
         assert status == 404
 
+    def test_oversized_body_is_refused_unread(self, api_server):
+        srv = api_server()
+        s = socket.create_connection(("127.0.0.1", srv.port), timeout=2)
+        s.sendall(b"POST /api/sessions/s1/message HTTP/1.1\r\n"
+                  b"Content-Length: 999999999\r\n\r\n{}")
+        data = s.recv(4096)
+        s.close()
+        assert data.startswith(b"HTTP/1.0 413 ")
+        assert b"body too large" in data
+
     def test_json_response_has_cors_header(self, api_server):
         """Even error responses should include CORS headers."""
         srv = api_server()
@@ -1253,3 +1435,603 @@ class TestEdgeCases:
         srv.post("/api/sessions/s1/select", {"label": "First"})
         srv.post("/api/sessions/s1/select", {"label": "Second"})
         assert s.selection["selected"] == "Second"
+
+
+# ===========================================================================
+# 8. SSE event ids and Last-Event-ID resume
+# ===========================================================================
+
+class TestEventReplay:
+    """Event ids, the replay ring and resuming with Last-Event-ID."""
+
+    def test_publish_assigns_increasing_ids(self):
+        bus = EventBus()
+        events = [FrontendEvent(event_type="t", data={}) for _ in range(3)]
+        for e in events:
+            bus.publish(e)
+        assert [e.event_id for e in events] == [1, 2, 3]
+        assert bus.last_event_id == 3
+
+    def test_to_sse_includes_id_line(self):
+        bus = EventBus()
+        e = FrontendEvent(event_type="t", data={})
+        bus.publish(e)
+        sse = e.to_sse()
+        assert "\nid: 1\n" in sse
+        assert json.loads(sse.split("\n")[1][len("data: "):])["id"] == 1
+
+    def test_subscribe_replays_missed_events(self):
+        bus = EventBus()
+        for i in range(5):
+            bus.publish(FrontendEvent(event_type="t", data={"i": i}))
+        q = bus.subscribe(last_event_id=2)
+        assert [q.get_nowait().event_id for _ in range(3)] == [3, 4, 5]
+        assert q.empty()
+
+    def test_subscribe_up_to_date_gets_nothing(self):
+        bus = EventBus()
+        bus.publish(FrontendEvent(event_type="t", data={}))
+        assert bus.subscribe(last_event_id=1).empty()
+
+    def test_gap_beyond_ring_sends_resync(self):
+        bus = EventBus(replay_size=3)
+        for _ in range(10):
+            bus.publish(FrontendEvent(event_type="t", data={}))
+        q = bus.subscribe(last_event_id=2)
+        event = q.get_nowait()
+        assert event.event_type == "resync"
+        assert q.empty()
+
+    def test_id_from_previous_run_sends_resync(self):
+        bus = EventBus()
+        bus.publish(FrontendEvent(event_type="t", data={}))
+        assert bus.subscribe(last_event_id=99).get_nowait().event_type == "resync"
+
+    def test_replay_larger_than_queue(self):
+        bus = EventBus(max_queue_size=2)
+        for _ in range(5):
+            bus.publish(FrontendEvent(event_type="t", data={}))
+        q = bus.subscribe(last_event_id=0)
+        assert q.qsize() == 5
+
+    def test_replay_lifts_capacity_only_until_drained(self):
+        bus = EventBus(max_queue_size=2)
+        for _ in range(5):
+            bus.publish(FrontendEvent(event_type="t", data={}))
+        q = bus.subscribe(last_event_id=0)
+        bus.publish(FrontendEvent(event_type="t", data={}))
+        assert q.qsize() == 6  # live events queue behind the replay
+        assert [q.get_nowait().event_id for _ in range(5)] == [1, 2, 3, 4, 5]
+        assert q.backlog == 0 and q.capacity == 2
+        for _ in range(3):
+            bus.publish(FrontendEvent(event_type="t", data={}))
+        assert [e.event_id for e in list(q.queue)] == [8, 9]
+        assert q.dropped == 2
+
+    def test_parse_last_event_id(self):
+        from io_mcp.api import parse_last_event_id
+        assert parse_last_event_id("7") == 7
+        assert parse_last_event_id(None, "lastEventId=4") == 4
+        assert parse_last_event_id("x") is None
+        assert parse_last_event_id(None) is None
+
+    def _read_until(self, sock, marker: bytes, timeout: float = 2.0) -> bytes:
+        data = b""
+        deadline = time.monotonic() + timeout
+        while marker not in data and time.monotonic() < deadline:
+            try:
+                data += sock.recv(4096)
+            except socket.timeout:
+                pass
+        return data
+
+    def test_server_resumes_from_last_event_id(self, api_server):
+        srv = api_server()
+        for label in ("first", "second", "third"):
+            emit_selection_made("s1", label, "")
+        second_id = event_bus.last_event_id - 1
+        sock = socket.create_connection(("127.0.0.1", srv.port), timeout=0.5)
+        try:
+            sock.sendall(
+                f"GET /api/events HTTP/1.1\r\nHost: x\r\nLast-Event-ID: {second_id - 1}\r\n\r\n".encode())
+            data = self._read_until(sock, b'"third"')
+        finally:
+            sock.close()
+        assert b'"first"' not in data
+        assert data.index(b'"second"') < data.index(b'"third"')
+        assert f"id: {second_id}\n".encode() in data
+
+    def test_server_resume_via_query_param(self, api_server):
+        srv = api_server()
+        emit_selection_made("s1", "missed", "")
+        last = event_bus.last_event_id
+        sock = socket.create_connection(("127.0.0.1", srv.port), timeout=0.5)
+        try:
+            sock.sendall(f"GET /api/events?lastEventId={last - 1} HTTP/1.1\r\nHost: x\r\n\r\n".encode())
+            data = self._read_until(sock, b'"missed"')
+        finally:
+            sock.close()
+        assert b'"missed"' in data
+
+
+# ===========================================================================
+# 9. Encode-once broadcast, overflow policies and lag metrics
+# ===========================================================================
+
+class TestOverflowPolicies:
+    """Per-subscriber overflow policies and the shared encoded buffer."""
+
+    def test_event_encoded_once_and_shared(self):
+        bus = EventBus()
+        q1, q2 = bus.subscribe(), bus.subscribe()
+        event = FrontendEvent(event_type="t", data={"n": 1})
+        with patch.object(FrontendEvent, "to_sse", wraps=event.to_sse) as to_sse:
+            bus.publish(event)
+            a, b = q1.get_nowait(), q2.get_nowait()
+            assert a.encoded() is b.encoded()
+        assert to_sse.call_count == 1
+        assert event.sse.startswith(b"event: t\n")
+
+    def test_coalesce_keeps_latest_per_type_and_session(self):
+        bus = EventBus()
+        q = bus.subscribe(policy="coalesce")
+        emit = bus.publish
+        emit(FrontendEvent(event_type="recording_state", session_id="a", data={"recording": True}))
+        emit(FrontendEvent(event_type="recording_state", session_id="b", data={"recording": True}))
+        emit(FrontendEvent(event_type="selection_made", session_id="a", data={}))
+        emit(FrontendEvent(event_type="recording_state", session_id="a", data={"recording": False}))
+        emit(FrontendEvent(event_type="settings_changed", data={"speed": 1}))
+        emit(FrontendEvent(event_type="settings_changed", data={"speed": 2}))
+        events = [q.get_nowait() for _ in range(q.qsize())]
+        assert [(e.event_type, e.session_id) for e in events] == [
+            ("recording_state", "b"), ("selection_made", "a"),
+            ("recording_state", "a"), ("settings_changed", None)]
+        assert events[2].data == {"recording": False}
+        assert events[3].data == {"speed": 2}
+        assert q.coalesced == 2
+
+    def test_drop_oldest_does_not_coalesce(self):
+        bus = EventBus()
+        q = bus.subscribe()
+        for speed in (1, 2):
+            bus.publish(FrontendEvent(event_type="settings_changed", data={"speed": speed}))
+        assert q.qsize() == 2
+
+    def test_disconnect_policy_drops_slow_subscriber(self):
+        bus = EventBus(max_queue_size=2)
+        slow = bus.subscribe(policy="disconnect")
+        fast = bus.subscribe()
+        for i in range(3):
+            bus.publish(FrontendEvent(event_type="t", data={"i": i}))
+        assert bus.subscriber_count() == 1
+        assert bus.disconnected == 1
+        assert slow.get_nowait() is None  # reader sees the disconnect marker
+        assert fast.qsize() == 2
+
+    def test_unknown_policy_falls_back(self):
+        from io_mcp.api import parse_overflow_policy
+        assert EventBus().subscribe(policy="bogus").policy == "drop-oldest"
+        assert parse_overflow_policy("overflow=coalesce") == "coalesce"
+        assert parse_overflow_policy("overflow=nope") is None
+
+    def test_lag_stats(self):
+        bus = EventBus(max_queue_size=3)
+        q = bus.subscribe(name="phone")
+        for _ in range(5):
+            bus.publish(FrontendEvent(event_type="t", data={}))
+        q.get_nowait()
+        [stats] = bus.subscriber_stats()
+        assert stats["name"] == "phone"
+        assert stats["policy"] == "drop-oldest"
+        assert stats["queued"] == 2
+        assert stats["dropped"] == 2
+        assert stats["lag_events"] == 2
+        assert stats["lag_seconds"] >= 0
+
+    def test_health_reports_lag(self, api_server):
+        srv = api_server()
+        sock = socket.create_connection(("127.0.0.1", srv.port), timeout=2)
+        try:
+            sock.sendall(b"GET /api/events?overflow=coalesce HTTP/1.1\r\nHost: x\r\n\r\n")
+            sock.recv(4096)
+            status, data = srv.get("/api/health")
+        finally:
+            sock.close()
+        assert status == 200
+        assert "sse_last_event_id" in data
+        assert any(sub["policy"] == "coalesce" and "unsent_bytes" in sub
+                   for sub in data["sse_lag"])
+
+
+# ===========================================================================
+# 10. WebSocket input channel
+# ===========================================================================
+
+class _WSClient:
+    """Minimal WebSocket client over a raw socket (masked frames)."""
+
+    def __init__(self, port: int, path: str = "/api/ws"):
+        import base64
+        import os
+        self.sock = socket.create_connection(("127.0.0.1", port), timeout=3)
+        key = base64.b64encode(os.urandom(16)).decode()
+        self.sock.sendall(
+            f"GET {path} HTTP/1.1\r\nHost: x\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+            f"Sec-WebSocket-Key: {key}\r\nSec-WebSocket-Version: 13\r\n\r\n".encode())
+        self.buf = b""
+        while b"\r\n\r\n" not in self.buf:
+            self.buf += self.sock.recv(4096)
+        head, _, self.buf = self.buf.partition(b"\r\n\r\n")
+        self.head = head.decode()
+        from io_mcp.api import ws_accept
+        self.expected_accept = ws_accept(key)
+
+    def send(self, obj, opcode: int = 0x1) -> None:
+        import os
+        import struct
+        payload = json.dumps(obj).encode() if opcode == 0x1 else obj
+        mask = os.urandom(4)
+        n = len(payload)
+        header = struct.pack("!BB", 0x80 | opcode, 0x80 | n) if n < 126 else \
+            struct.pack("!BBH", 0x80 | opcode, 0x80 | 126, n)
+        masked = bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+        self.sock.sendall(header + mask + masked)
+
+    def _read(self, n: int) -> bytes:
+        while len(self.buf) < n:
+            chunk = self.sock.recv(4096)
+            if not chunk:
+                raise ConnectionError("closed")
+            self.buf += chunk
+        out, self.buf = self.buf[:n], self.buf[n:]
+        return out
+
+    def recv_frame(self) -> tuple[int, bytes]:
+        import struct
+        b1, b2 = self._read(2)
+        n = b2 & 0x7F
+        if n == 126:
+            (n,) = struct.unpack("!H", self._read(2))
+        elif n == 127:
+            (n,) = struct.unpack("!Q", self._read(8))
+        return b1 & 0x0F, self._read(n)
+
+    def recv(self, pred=lambda m: True, limit: int = 200) -> dict:
+        for _ in range(limit):
+            opcode, data = self.recv_frame()
+            if opcode == 0x1:
+                msg = json.loads(data)
+                if pred(msg):
+                    return msg
+        raise AssertionError("message not received")
+
+    def close(self) -> None:
+        self.sock.close()
+
+
+class TestCoalesceInputs:
+
+    def _kinds(self, out):
+        return [(m and (m.get("key") or m.get("index")), n, [s["id"] for s in sup])
+                for m, n, sup in out]
+
+    def test_non_scroll_passes_through(self):
+        from io_mcp.api import coalesce_inputs
+        batch = [{"id": 1, "type": "select", "session_id": "s", "label": "A"}]
+        assert coalesce_inputs(batch) == [(batch[0], 1, [])]
+
+    def test_last_highlight_wins(self):
+        from io_mcp.api import coalesce_inputs
+        batch = [{"id": i, "type": "highlight", "session_id": "s", "index": i} for i in range(1, 6)]
+        assert self._kinds(coalesce_inputs(batch)) == [(5, 1, [1, 2, 3, 4])]
+
+    def test_keys_net_out(self):
+        from io_mcp.api import coalesce_inputs
+        keys = "jjjkj"
+        batch = [{"id": i, "type": "key", "session_id": "s", "key": k} for i, k in enumerate(keys)]
+        out = coalesce_inputs(batch)
+        assert self._kinds(out) == [("j", 3, [0, 1, 2, 3])]
+
+    def test_cancelling_keys_run_nothing(self):
+        from io_mcp.api import coalesce_inputs
+        batch = [{"id": i, "type": "key", "session_id": "s", "key": k} for i, k in enumerate("jk")]
+        assert coalesce_inputs(batch) == [(None, 0, batch)]
+
+    def test_select_breaks_run(self):
+        from io_mcp.api import coalesce_inputs
+        batch = [
+            {"id": 1, "type": "highlight", "session_id": "s", "index": 1},
+            {"id": 2, "type": "highlight", "session_id": "s", "index": 2},
+            {"id": 3, "type": "key", "session_id": "s", "key": "enter"},
+            {"id": 4, "type": "highlight", "session_id": "s", "index": 3},
+        ]
+        assert self._kinds(coalesce_inputs(batch)) == [
+            (2, 1, [1]), ("enter", 1, []), (3, 1, [])]
+
+    def test_highlight_then_keys(self):
+        from io_mcp.api import coalesce_inputs
+        batch = [
+            {"id": 1, "type": "key", "session_id": "s", "key": "j"},
+            {"id": 2, "type": "highlight", "session_id": "s", "index": 4},
+            {"id": 3, "type": "key", "session_id": "s", "key": "k"},
+        ]
+        assert self._kinds(coalesce_inputs(batch)) == [(4, 1, [1]), ("k", 1, [])]
+
+    def test_sessions_not_merged(self):
+        from io_mcp.api import coalesce_inputs
+        batch = [{"id": 1, "type": "highlight", "session_id": "a", "index": 1},
+                 {"id": 2, "type": "highlight", "session_id": "b", "index": 2}]
+        assert len(coalesce_inputs(batch)) == 2
+
+
+class TestWebSocket:
+
+    def test_handshake_and_connected(self, api_server):
+        srv = api_server(frontend=_make_frontend())
+        ws = _WSClient(srv.port)
+        try:
+            assert ws.head.startswith("HTTP/1.1 101")
+            assert f"Sec-WebSocket-Accept: {ws.expected_accept}" in ws.head
+            assert ws.recv()["type"] == "connected"
+        finally:
+            ws.close()
+
+    def test_plain_get_is_426(self, api_server):
+        srv = api_server()
+        status, _ = srv.get("/api/ws")
+        assert status == 426
+
+    def test_key_is_acked(self, api_server):
+        called = []
+        srv = api_server(frontend=_make_frontend(), key_callback=lambda sid, k: called.append((sid, k)))
+        ws = _WSClient(srv.port)
+        try:
+            ws.send({"id": 7, "type": "key", "session_id": "s1", "key": "enter"})
+            ack = ws.recv(lambda m: m["type"] == "ack")
+            assert ack == {"type": "ack", "id": 7, "status": 200,
+                           "result": {"status": "ok", "key": "enter"}}
+            assert called == [("s1", "enter")]
+        finally:
+            ws.close()
+
+    def test_select_and_errors(self, api_server):
+        s = _make_session("s1", active=True)
+        srv = api_server(frontend=_make_frontend([s]))
+        ws = _WSClient(srv.port)
+        try:
+            ws.send({"id": 1, "type": "select", "session_id": "s1", "label": "Yes"})
+            ack = ws.recv(lambda m: m["type"] == "ack")
+            assert ack["status"] == 200
+            assert s.selection == {"selected": "Yes", "summary": ""}
+            ws.send({"id": 2, "type": "bogus"})
+            assert ws.recv(lambda m: m["type"] == "ack")["status"] == 400
+            ws.send({"id": 3, "type": "highlight", "session_id": "nope", "index": 1})
+            assert ws.recv(lambda m: m["type"] == "ack")["status"] == 404
+        finally:
+            ws.close()
+
+    def test_events_flow_downstream(self, api_server):
+        srv = api_server(frontend=_make_frontend())
+        ws = _WSClient(srv.port)
+        try:
+            ws.recv()  # connected
+            deadline = time.monotonic() + 2
+            while event_bus.subscriber_count() == 0 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            emit_selection_made("s1", "via-ws", "")
+            msg = ws.recv(lambda m: m["type"] == "event")
+            assert msg["event"]["type"] == "selection_made"
+            assert msg["event"]["data"]["label"] == "via-ws"
+            assert msg["event"]["id"] == event_bus.last_event_id
+        finally:
+            ws.close()
+
+    def test_ping_answered_with_pong(self, api_server):
+        srv = api_server()
+        ws = _WSClient(srv.port)
+        try:
+            ws.recv()
+            ws.send(b"hi", opcode=0x9)
+            opcode, data = ws.recv_frame()
+            assert (opcode, data) == (0xA, b"hi")
+        finally:
+            ws.close()
+
+    def test_unmasked_frame_is_closed_with_1002(self, api_server):
+        import struct
+        srv = api_server()
+        ws = _WSClient(srv.port)
+        try:
+            ws.recv()
+            payload = b'{"type": "key"}'
+            ws.sock.sendall(struct.pack("!BB", 0x81, len(payload)) + payload)
+            opcode, data = ws.recv_frame()
+            while opcode != 0x8:  # skip any keepalive traffic
+                opcode, data = ws.recv_frame()
+            assert struct.unpack("!H", data) == (1002,)
+        finally:
+            ws.close()
+
+    def test_scroll_burst_is_coalesced_and_every_message_acked(self, api_server):
+        s = _make_session("s1", active=True)
+        calls = []
+
+        def slow_highlight(sid, index):
+            calls.append(index)
+            time.sleep(0.05)
+
+        srv = api_server(frontend=_make_frontend([s]), highlight_callback=slow_highlight)
+        ws = _WSClient(srv.port)
+        try:
+            for i in range(1, 31):
+                ws.send({"id": i, "type": "highlight", "session_id": "s1", "index": i})
+            acks = {}
+            while len(acks) < 30:
+                msg = ws.recv(lambda m: m["type"] == "ack")
+                acks[msg["id"]] = msg
+            assert calls[-1] == 30  # final position always applied
+            assert len(calls) < 30
+            assert sum(1 for a in acks.values() if a.get("coalesced")) == 30 - len(calls)
+        finally:
+            ws.close()
+
+
+class _FakeClipTTS:
+    """Stands in for TTSEngine.cached_audio: key -> {format: path}."""
+
+    def __init__(self, clips: dict[str, dict[str, str]]):
+        self.clips = clips
+
+    def cached_audio(self, key: str, fmt: str = "wav"):
+        return self.clips.get(key, {}).get(fmt)
+
+
+class TestParseByteRange:
+
+    @pytest.mark.parametrize("header,expected", [
+        (None, None),
+        ("bytes=0-9", (0, 9)),
+        ("bytes=10-", (10, 99)),
+        ("bytes=-10", (90, 99)),
+        ("bytes=90-200", (90, 99)),
+        ("bytes=0-1,5-6", None),   # multi-range: whole body
+        ("bytes=5-2", None),       # malformed
+        ("items=0-1", None),
+        ("bytes=abc", None),
+    ])
+    def test_parse(self, header, expected):
+        assert parse_byte_range(header, 100) == expected
+
+    @pytest.mark.parametrize("header", ["bytes=100-", "bytes=-0"])
+    def test_unsatisfiable(self, header):
+        with pytest.raises(ValueError):
+            parse_byte_range(header, 100)
+
+
+class TestAudioEndpoint:
+    """GET /api/audio/:key"""
+
+    KEY = "0123456789abcdef0123456789abcdef"
+
+    def _server(self, api_server, tmp_path, formats=("wav",)):
+        clips = {}
+        for fmt in formats:
+            path = tmp_path / f"{self.KEY}.{fmt}"
+            path.write_bytes(fmt.encode() * 100)
+            clips[fmt] = str(path)
+        frontend = _make_frontend()
+        frontend.tts = _FakeClipTTS({self.KEY: clips})
+        return api_server(frontend=frontend)
+
+    def _get(self, srv, path, **headers):
+        conn = http.client.HTTPConnection("127.0.0.1", srv.port)
+        conn.request("GET", path, headers=headers)
+        resp = conn.getresponse()
+        return resp.status, {k.lower(): v for k, v in resp.getheaders()}, resp.read()
+
+    def test_full_clip(self, api_server, tmp_path):
+        srv = self._server(api_server, tmp_path)
+        status, headers, body = self._get(srv, f"/api/audio/{self.KEY}.wav")
+        assert status == 200
+        assert body == b"wav" * 100
+        assert headers["content-type"] == "audio/wav"
+        assert headers["accept-ranges"] == "bytes"
+        assert headers["content-length"] == "300"
+        assert "immutable" in headers["cache-control"]
+
+    def test_range_request(self, api_server, tmp_path):
+        srv = self._server(api_server, tmp_path)
+        status, headers, body = self._get(srv, f"/api/audio/{self.KEY}.wav", Range="bytes=3-8")
+        assert status == 206
+        assert body == b"wavwav"
+        assert headers["content-range"] == "bytes 3-8/300"
+
+    def test_unsatisfiable_range(self, api_server, tmp_path):
+        srv = self._server(api_server, tmp_path)
+        status, headers, _ = self._get(srv, f"/api/audio/{self.KEY}.wav", Range="bytes=500-")
+        assert status == 416
+        assert headers["content-range"] == "bytes */300"
+
+    def test_etag_revalidation(self, api_server, tmp_path):
+        srv = self._server(api_server, tmp_path)
+        _, headers, _ = self._get(srv, f"/api/audio/{self.KEY}.wav")
+        status, _, body = self._get(srv, f"/api/audio/{self.KEY}.wav",
+                                    **{"If-None-Match": headers["etag"]})
+        assert status == 304
+        assert body == b""
+
+    def test_compressed_variant(self, api_server, tmp_path):
+        srv = self._server(api_server, tmp_path, formats=("wav", "ogg"))
+        status, headers, body = self._get(srv, f"/api/audio/{self.KEY}.ogg")
+        assert status == 200
+        assert headers["content-type"] == "audio/ogg"
+        assert body == b"ogg" * 100
+
+    def test_bare_key_negotiates_from_accept(self, api_server, tmp_path):
+        srv = self._server(api_server, tmp_path, formats=("wav", "ogg"))
+        status, headers, _ = self._get(srv, f"/api/audio/{self.KEY}", Accept="audio/ogg, */*")
+        assert status == 200
+        assert headers["content-type"] == "audio/ogg"
+        assert headers["vary"] == "Accept"
+
+    def test_negotiation_falls_back_to_wav(self, api_server, tmp_path):
+        srv = self._server(api_server, tmp_path)
+        status, headers, _ = self._get(srv, f"/api/audio/{self.KEY}", Accept="audio/mpeg")
+        assert status == 200
+        assert headers["content-type"] == "audio/wav"
+
+    def test_explicit_variant_unavailable_is_406(self, api_server, tmp_path):
+        srv = self._server(api_server, tmp_path)
+        status, _, _ = self._get(srv, f"/api/audio/{self.KEY}.mp3")
+        assert status == 406
+
+    @pytest.mark.parametrize("name", ["nothex", "0123456789abcdef0123456789abcdef.flac",
+                                      "..%2F..%2Fetc%2Fpasswd"])
+    def test_bad_names_are_404(self, api_server, tmp_path, name):
+        srv = self._server(api_server, tmp_path)
+        status, _, _ = self._get(srv, f"/api/audio/{name}")
+        assert status == 404
+
+    def test_not_generated_is_404(self, api_server, tmp_path):
+        srv = self._server(api_server, tmp_path)
+        status, headers, body = self._get(srv, "/api/audio/" + "f" * 32)
+        assert status == 404
+        assert json.loads(body)["error"] == "audio not generated"
+
+
+class TestRemoteAudioClients:
+
+    def test_audio_flag_counts_subscriber(self, api_server):
+        srv = api_server()
+        s = socket.create_connection(("127.0.0.1", srv.port), timeout=2)
+        try:
+            s.sendall(b"GET /api/events?audio=1 HTTP/1.1\r\nHost: x\r\n\r\n")
+            s.recv(4096)
+            deadline = time.monotonic() + 2
+            while event_bus.audio_clients() < 1 and time.monotonic() < deadline:
+                time.sleep(0.02)
+            assert event_bus.audio_clients() == 1
+            _, data = srv.get("/api/health")
+            assert data["audio_clients"] == 1
+            assert any(sub.get("audio") for sub in data["sse_lag"])
+        finally:
+            s.close()
+        deadline = time.monotonic() + 2
+        while event_bus.audio_clients() and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert event_bus.audio_clients() == 0
+
+    def test_plain_subscriber_is_not_an_audio_client(self):
+        bus = EventBus()
+        bus.subscribe()
+        assert bus.audio_clients() == 0
+
+    def test_speech_event_carries_audio_key(self):
+        bus = EventBus()
+        q = bus.subscribe()
+        with patch("io_mcp.api.event_bus", bus):
+            emit_speech_requested("s1", "hello", audio_key="ab" * 16)
+            emit_choices_presented("s1", "Pick", [{"label": "A"}],
+                                   audio={"intro": "cd" * 16, "choices": ["ef" * 16]})
+        assert q.get_nowait().data["audio_key"] == "ab" * 16
+        assert q.get_nowait().data["audio"] == {"intro": "cd" * 16, "choices": ["ef" * 16]}
@@ -0,0 +1,188 @@
+"""Tests for idempotency keys on proxied tool calls."""
+
+import asyncio
+import json
+import socket
+import threading
+import urllib.request
+from unittest import mock
+
+import pytest
+
+from io_mcp.backend import start_backend_server
+from io_mcp.idempotency import CallLedger, current_call_key
+from io_mcp.proxy import BackendPool, _forward_to_backend
+from io_mcp.session import InboxItem, Session
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+class TestCallLedger:
+
+    def test_concurrent_retry_attaches_to_original(self):
+        ledger = CallLedger()
+        runs = []
+
+        async def call():
+            runs.append(1)
+            await asyncio.sleep(0.05)
+            return "answer"
+
+        async def main():
+            return await asyncio.gather(ledger.run("k", call), ledger.run("k", call))
+
+        assert asyncio.run(main()) == ["answer", "answer"]
+        assert len(runs) == 1
+        assert ledger.stats()["retries_attached"] == 1
+
+    def test_finished_call_is_served_from_cache(self):
+        ledger = CallLedger()
+        runs = []
+
+        async def call():
+            runs.append(1)
+            return f"r{len(runs)}"
+
+        async def main():
+            return [await ledger.run("k", call), await ledger.run("k", call),
+                    await ledger.run("other", call)]
+
+        assert asyncio.run(main()) == ["r1", "r1", "r2"]
+        assert ledger.stats()["retries_cached"] == 1
+
+    def test_unkeyed_calls_always_run(self):
+        ledger = CallLedger()
+        runs = []
+
+        async def call():
+            runs.append(1)
+            return "x"
+
+        async def main():
+            await ledger.run("", call)
+            await ledger.run("", call)
+
+        asyncio.run(main())
+        assert len(runs) == 2
+
+    def test_errors_are_shared_but_not_cached(self):
+        ledger = CallLedger()
+        runs = []
+
+        async def boom():
+            runs.append(1)
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        async def main():
+            return await asyncio.gather(ledger.run("k", boom), ledger.run("k", boom),
+                                        return_exceptions=True)
+
+        results = asyncio.run(main())
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert len(runs) == 1
+        with pytest.raises(RuntimeError):
+            asyncio.run(ledger.run("k", boom))
+        assert len(runs) == 2
+
+    def test_cache_is_bounded_and_expires(self):
+        ledger = CallLedger(max_results=2, ttl=60)
+
+        async def call():
+            return "x"
+
+        async def main():
+            for key in ("a", "b", "c"):
+                await ledger.run(key, call)
+
+        asyncio.run(main())
+        assert list(ledger._results) == ["b", "c"]
+        assert ledger._cached("b", now=10**9) is None
+        assert not ledger._results
+
+
+class TestKeyedDedup:
+
+    def test_keyed_items_skip_content_heuristic(self):
+        s = Session(session_id="s", name="S")
+        first = InboxItem(kind="choices", preamble="Deploy?", choices=[{"label": "Yes"}])
+        assert s.dedup_and_enqueue(first) is True
+        again = InboxItem(kind="choices", preamble="Deploy?", choices=[{"label": "Yes"}],
+                          call_key="k2")
+        assert s.dedup_and_enqueue(again) is True
+        assert len(s.inbox) == 2
+
+    def test_unkeyed_duplicate_still_piggybacks(self):
+        s = Session(session_id="s", name="S")
+        first = InboxItem(kind="choices", preamble="Deploy?", choices=[{"label": "Yes"}])
+        s.dedup_and_enqueue(first)
+        dup = InboxItem(kind="choices", preamble="Deploy?", choices=[{"label": "Yes"}])
+        assert s.dedup_and_enqueue(dup) is first
+
+
+class TestBackendIdempotency:
+
+    def test_retry_with_same_key_runs_tool_once(self):
+        release = threading.Event()
+        calls = []
+
+        def dispatch(tool, args, sid):
+            calls.append(current_call_key.get())
+            release.wait(5)
+            return f"done-{len(calls)}"
+
+        port = _free_port()
+        server = start_backend_server(dispatch, host="127.0.0.1", port=port)
+        body = json.dumps({"tool": "present_choices", "args": {}, "session_id": "s",
+                           "idempotency_key": "abc"}).encode()
+
+        def post():
+            req = urllib.request.Request(f"http://127.0.0.1:{port}/handle-mcp", data=body,
+                                         method="POST")
+            with urllib.request.urlopen(req, timeout=10) as resp:
+                return resp.read().decode()
+
+        try:
+            results = []
+            threads = [threading.Thread(target=lambda: results.append(post())) for _ in range(2)]
+            for t in threads:
+                t.start()
+            for _ in range(100):
+                if calls:
+                    break
+                threading.Event().wait(0.02)
+            threading.Event().wait(0.1)
+            release.set()
+            for t in threads:
+                t.join(10)
+            assert results == ["done-1", "done-1"]
+            assert post() == "done-1"  # finished: served from the cache
+            assert calls == ["abc"]
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+class TestProxyStampsKey:
+
+    def test_retries_reuse_the_key(self):
+        payloads = []
+
+        def post(self, path, payload, timeout, lane="fast"):
+            payloads.append(json.loads(payload))
+            if len(payloads) == 1:
+                raise ConnectionRefusedError("restarting")
+            return 200, b"ok"
+
+        with mock.patch.object(BackendPool, "post", post):
+            assert _forward_to_backend("http://localhost:1", "speak", {}, "s",
+                                       initial_backoff=0.01) == "ok"
+            _forward_to_backend("http://localhost:1", "speak", {}, "s")
+
+        keys = [p["idempotency_key"] for p in payloads]
+        assert keys[0] and keys[0] == keys[1]
+        assert keys[2] != keys[0]
@@ -0,0 +1,175 @@
+"""Tests for keyed reconciliation of the inbox list (left pane).
+
+Includes a small benchmark: updating the list after one enqueue must cost
+about the same whether the inbox holds a few items or hundreds.
+"""
+
+import time
+
+import pytest
+from textual.widgets import ListView
+
+from io_mcp.session import InboxItem
+from io_mcp.tui.widgets import INBOX_WINDOW, InboxListItem, inbox_window_start
+
+from tests.test_tui_pilot import _disable_chat_view, make_app
+
+
+def _rows(inbox_list):
+    return [c for c in inbox_list.children if isinstance(c, InboxListItem) and not c.retired]
+
+
+async def _setup(pilot, app, n_items):
+    app._inbox_collapsed = False
+    session, _ = app.manager.get_or_create("s1")
+    session.registered = True
+    session.name = "Agent"
+    app.on_session_created(session)
+    _disable_chat_view(app)
+    for i in range(n_items):
+        session.enqueue(InboxItem(kind="choices", preamble=f"Question {i}",
+                                  choices=[{"label": "A", "summary": ""}],
+                                  timestamp=1000.0 + i))
+    app._update_inbox_list()
+    await pilot.pause()
+    return session, app.query_one("#inbox-list", ListView)
+
+
+@pytest.mark.asyncio
+async def test_enqueue_inserts_one_row_and_keeps_the_rest():
+    app = make_app()
+    async with app.run_test() as pilot:
+        session, inbox_list = await _setup(pilot, app, 3)
+        before = _rows(inbox_list)
+        assert [r.inbox_preamble for r in before] == ["Question 2", "Question 1", "Question 0"]
+
+        session.enqueue(InboxItem(kind="choices", preamble="Question 3",
+                                  choices=[{"label": "A", "summary": ""}], timestamp=2000.0))
+        app._update_inbox_list()
+        await pilot.pause()
+
+        after = _rows(inbox_list)
+        assert [r.inbox_preamble for r in after] == [
+            "Question 3", "Question 2", "Question 1", "Question 0"]
+        assert after[1:] == before  # same widget objects
+        assert [r.inbox_index for r in after] == [0, 1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_resolved_item_moves_to_done_in_place():
+    app = make_app()
+    async with app.run_test() as pilot:
+        session, inbox_list = await _setup(pilot, app, 3)
+        widget = next(r for r in _rows(inbox_list) if r.inbox_preamble == "Question 2")
+
+        item = session.inbox[-1]
+        item.done = True
+        item.result = {"selected": "A", "summary": ""}
+        session.inbox.remove(item)
+        session.inbox_done.append(item)
+        session._inbox_generation += 1
+        app._update_inbox_list()
+        await pilot.pause()
+
+        rows = _rows(inbox_list)
+        assert rows[-1] is widget
+        assert widget.is_done and widget.inbox_index == 2
+        assert "[dim]" in widget._label_markup()
+
+
+@pytest.mark.asyncio
+async def test_cursor_follows_highlighted_row():
+    app = make_app()
+    async with app.run_test() as pilot:
+        session, inbox_list = await _setup(pilot, app, 3)
+        inbox_list.index = 1
+        await pilot.pause()
+        assert app._inbox_scroll_index == 1
+        highlighted = inbox_list.highlighted_child
+
+        session.enqueue(InboxItem(kind="choices", preamble="New",
+                                  choices=[{"label": "A", "summary": ""}], timestamp=3000.0))
+        app._update_inbox_list()
+        await pilot.pause()
+
+        assert inbox_list.index == 2
+        assert inbox_list.highlighted_child is highlighted
+        assert highlighted.highlighted
+        assert sum(r.highlighted for r in _rows(inbox_list)) == 1
+
+
+@pytest.mark.asyncio
+async def test_emptied_inbox_removes_rows():
+    app = make_app()
+    async with app.run_test() as pilot:
+        session, inbox_list = await _setup(pilot, app, 2)
+        session.inbox.clear()
+        session._inbox_generation += 1
+        app._update_inbox_list()
+        await pilot.pause()
+        assert _rows(inbox_list) == []
+
+
+class TestInboxWindowStart:
+
+    def test_short_list_is_not_windowed(self):
+        assert inbox_window_start(10, 9, 5, size=40) == 0
+
+    def test_window_kept_while_cursor_inside(self):
+        assert inbox_window_start(100, 20, 10, size=40, margin=5) == 10
+
+    def test_recentres_near_edges(self):
+        assert inbox_window_start(100, 46, 10, size=40, margin=5) == 26
+        assert inbox_window_start(100, 12, 10, size=40, margin=5) == 0
+
+    def test_ends_are_reachable(self):
+        assert inbox_window_start(100, 99, 60, size=40, margin=5) == 60
+        assert inbox_window_start(100, 0, 0, size=40, margin=5) == 0
+
+
+@pytest.mark.asyncio
+async def test_long_inbox_mounts_a_sliding_window():
+    app = make_app()
+    async with app.run_test() as pilot:
+        n = INBOX_WINDOW * 3
+        session, inbox_list = await _setup(pilot, app, n)
+        assert len(_rows(inbox_list)) == INBOX_WINDOW
+
+        # Walk the cursor down past the bottom edge of the window
+        for _ in range(INBOX_WINDOW + 10):
+            inbox_list.action_cursor_down()
+            await pilot.pause()
+        assert app._inbox_scroll_index == INBOX_WINDOW + 10
+        assert app._inbox_window_start > 0
+        assert len(_rows(inbox_list)) == INBOX_WINDOW
+        highlighted = inbox_list.highlighted_child
+        assert highlighted.inbox_index == INBOX_WINDOW + 10
+        assert app._get_inbox_item_at_index(highlighted.inbox_index).preamble == \
+            highlighted.inbox_preamble
+
+
+async def _update_cost(n_items: int, samples: int = 5) -> float:
+    """Median seconds to apply one enqueue to an inbox of ``n_items``."""
+    app = make_app()
+    async with app.run_test() as pilot:
+        session, inbox_list = await _setup(pilot, app, n_items)
+        times = []
+        for i in range(samples):
+            session.enqueue(InboxItem(kind="choices", preamble=f"Extra {i}",
+                                      choices=[{"label": "A", "summary": ""}],
+                                      timestamp=5000.0 + i))
+            start = time.perf_counter()
+            app._update_inbox_list()
+            await pilot.pause()
+            times.append(time.perf_counter() - start)
+        assert len(_rows(inbox_list)) == min(n_items + samples, INBOX_WINDOW)
+    return sorted(times)[samples // 2]
+
+
+@pytest.mark.asyncio
+async def test_benchmark_update_cost_is_flat():
+    small = await _update_cost(10)
+    large = await _update_cost(300)
+    # Reconciling mounts one row and the window caps what is laid out, so
+    # a 30x larger inbox costs about the same (a rebuild was ~14x slower).
+    assert large < small * 3 + 0.05, (small, large)
@@ -0,0 +1,134 @@
+"""Tests for cross-session scheduling of pending choices."""
+
+import time
+
+from io_mcp.config import IoMcpConfig
+from io_mcp.session import InboxItem, Session, SessionManager, schedule_pending
+
+
+def _manager(*ages):
+    """Manager with one active session per age, each blocked on one item."""
+    m = SessionManager()
+    now = time.time()
+    for i, age in enumerate(ages):
+        s, _ = m.get_or_create(f"s{i}")
+        s.active = True
+        s.inbox.append(InboxItem(kind="choices", preamble=f"q{i}", timestamp=now - age))
+    return m
+
+
+def _resolve(session, item, answered_after):
+    item.presented_at = time.time() - answered_after
+    item.result = {"selected": "A", "summary": ""}
+    item.done = True
+    session.inbox.remove(item)
+    session._append_done(item)
+
+
+class TestSchedulePending:
+
+    def test_tabs_keeps_order(self):
+        m = _manager(1, 50, 10)
+        assert [s.session_id for _, s in m.pending_choices("tabs")] == ["s0", "s1", "s2"]
+
+    def test_longest_blocked_first(self):
+        m = _manager(1, 50, 10)
+        order = [s.session_id for _, s in m.pending_choices("longest-blocked")]
+        assert order == ["s1", "s2", "s0"]
+
+    def test_age_priority_lets_urgent_overtake(self):
+        m = _manager(30, 20)
+        m.get("s1").inbox[0].priority = 1  # 20s × 2 beats 30s × 1
+        order = [s.session_id for _, s in m.pending_choices("age-priority")]
+        assert order == ["s1", "s0"]
+
+    def test_shortest_answer_uses_history(self):
+        s_slow = Session(session_id="slow", name="Slow")
+        s_fast = Session(session_id="fast", name="Fast")
+        s_slow.response_times.extend([40.0, 50.0])
+        s_fast.response_times.extend([2.0, 3.0])
+        now = time.time()
+        pending = [(InboxItem(kind="choices", timestamp=now - 100), s_slow),
+                   (InboxItem(kind="choices", timestamp=now - 1), s_fast)]
+        order = [s.session_id for _, s in schedule_pending(pending, "shortest-answer")]
+        assert order == ["fast", "slow"]
+
+    def test_shortest_answer_unknown_agent_gets_median_prior(self):
+        known = [Session(session_id=f"k{i}", name="") for i in range(3)]
+        for s, t in zip(known, (1.0, 10.0, 100.0)):
+            s.response_times.append(t)
+        new = Session(session_id="new", name="")
+        now = time.time()
+        pending = [(InboxItem(kind="choices", timestamp=now), s) for s in known]
+        pending.append((InboxItem(kind="choices", timestamp=now - 5), new))
+        order = [s.session_id for _, s in schedule_pending(pending, "shortest-answer")]
+        assert order == ["k0", "new", "k1", "k2"]
+
+
+class TestNextWithChoices:
+
+    def test_default_walks_tabs(self):
+        m = _manager(1, 50, 10)
+        assert m.next_with_choices().session_id == "s1"
+        assert m.next_with_choices().session_id == "s2"
+
+    def test_policy_skips_focused_session(self):
+        m = _manager(100, 5, 50)
+        assert m.next_with_choices("longest-blocked").session_id == "s2"
+        assert m.active_session_id == "s2"
+
+    def test_policy_none_when_focused_is_only_candidate(self):
+        m = _manager(5)
+        assert m.next_with_choices("longest-blocked") is None
+        assert m.active_session_id == "s0"
+
+    def test_policy_ranks_legacy_session_by_last_activity(self):
+        m = _manager(5, 50, 10)
+        legacy = m.get("s1")
+        legacy.inbox.clear()
+        legacy.last_activity = time.time() - 500
+        assert m.next_with_choices("longest-blocked").session_id == "s1"
+
+    def test_policy_none_active(self):
+        m = _manager(5, 5)
+        for s in m.all_sessions():
+            s.active = False
+        assert m.next_with_choices("shortest-answer") is None
+
+
+class TestBlockedSeconds:
+
+    def test_resolution_accumulates_and_records_response_time(self):
+        m = _manager(30)
+        s = m.get("s0")
+        _resolve(s, s.inbox[0], answered_after=4)
+        assert 29 < s.blocked_seconds < 35
+        assert len(s.response_times) == 1
+        assert 3.5 < s.expected_answer_seconds() < 5
+
+    def test_internal_results_count_as_blocked_but_not_answered(self):
+        s = Session(session_id="s", name="S")
+        item = InboxItem(kind="choices", timestamp=time.time() - 10)
+        item.presented_at = time.time() - 5
+        item.result = {"selected": "_restart", "summary": ""}
+        s._append_done(item)
+        assert s.blocked_seconds >= 10
+        assert not s.response_times
+        assert not s.inbox_done
+
+    def test_total_includes_pending_and_removed_sessions(self):
+        m = _manager(20, 10)
+        assert 29 < m.blocked_seconds() < 35
+        m.remove("s0")
+        assert 29 < m.blocked_seconds() < 35
+
+
+class TestConfig:
+
+    def test_default_and_validation(self, tmp_path):
+        cfg = IoMcpConfig.load(str(tmp_path / "config.yml"))
+        assert cfg.inbox_schedule == "tabs"
+        cfg.expanded.setdefault("config", {}).setdefault("session", {})["inboxSchedule"] = "bogus"
+        assert cfg.inbox_schedule == "tabs"
+        cfg.expanded["config"]["session"]["inboxSchedule"] = "age-priority"
+        assert cfg.inbox_schedule == "age-priority"
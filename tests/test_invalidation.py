@@ -0,0 +1,152 @@
+"""Tests for push-based UI invalidation (dirty regions, one flush per frame)."""
+
+import threading
+
+import pytest
+
+from io_mcp.session import InboxItem, Session, SessionManager
+from io_mcp.tui.invalidation import UIInvalidator
+
+from tests.test_tui_pilot import make_app
+
+
+class _FakeApp:
+    def __init__(self, running=True):
+        self.is_running = running
+        self.posted = []
+        self.timers = []
+
+    def post_message(self, message):
+        self.posted.append(message)
+        return True
+
+    def set_timer(self, delay, callback):
+        self.timers.append((delay, callback))
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def _invalidator(app, clock=None):
+    rendered = []
+    renderers = {name: (lambda name=name: rendered.append(name))
+                 for name in ("tab_bar", "footer", "inbox")}
+    ui = UIInvalidator(app, renderers, frame_rate=10, clock=clock or _Clock())
+    return ui, rendered
+
+
+class TestUIInvalidator:
+
+    def test_burst_from_threads_posts_once(self):
+        app = _FakeApp()
+        ui, rendered = _invalidator(app)
+        threads = [threading.Thread(target=lambda: [ui.invalidate("inbox", "tab_bar")
+                                                    for _ in range(50)])
+                   for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(app.posted) == 1
+        ui.flush()
+        assert rendered == ["tab_bar", "inbox"]  # renderer order, once each
+        assert ui.stats()["requests"] == 200
+
+    def test_flush_within_a_frame_waits_for_its_end(self):
+        app, clock = _FakeApp(), _Clock()
+        ui, rendered = _invalidator(app, clock)
+        ui.invalidate("footer")
+        ui.flush()
+        ui.invalidate("footer")
+        clock.now += 0.02
+        ui.flush()
+        assert rendered == ["footer"]
+        (delay, callback), = app.timers
+        assert delay == pytest.approx(0.08)
+        ui.invalidate("inbox")  # joins the pending flush
+        assert len(app.posted) == 2
+        clock.now += delay
+        callback()
+        assert rendered == ["footer", "footer", "inbox"]
+
+    def test_marks_before_running_flush_on_start(self):
+        app = _FakeApp(running=False)
+        ui, rendered = _invalidator(app)
+        ui.invalidate("tab_bar")
+        assert app.posted == []
+        app.is_running = True
+        ui.start()
+        assert len(app.posted) == 1
+        ui.flush()
+        assert rendered == ["tab_bar"]
+
+
+class TestSessionChanges:
+
+    def test_mutations_are_reported(self):
+        seen = []
+        s = Session(session_id="s", name="S", on_change=lambda sess, what: seen.append(what))
+        s.enqueue(InboxItem(kind="choices", preamble="q"))
+        s.log_activity("tool")
+        s.pending_messages.append("hi")
+        s.drain_messages()
+        s.resolve_front({"selected": "a"})
+        assert seen == ["inbox", "activity", "messages", "inbox"]
+
+    def test_manager_forwards_and_reports_sessions(self):
+        seen = []
+        manager = SessionManager()
+        manager.on_change = lambda sess, what: seen.append((sess and sess.session_id, what))
+        session, _ = manager.get_or_create("s1")
+        session.log_activity("tool")
+        manager.remove("s1")
+        assert seen == [(None, "sessions"), ("s1", "activity"), (None, "sessions")]
+
+
+@pytest.mark.asyncio
+async def test_tool_thread_burst_renders_once_per_region(_archive_dir):
+    app = make_app()
+    async with app.run_test() as pilot:
+        session, _ = app.manager.get_or_create("s1")
+        session.registered = True
+        app.on_session_created(session)
+        await pilot.pause(0.1)
+        before = app._ui.stats()
+
+        def burst():
+            for i in range(100):
+                session.enqueue(InboxItem(kind="choices", preamble=f"q{i}",
+                                          choices=[{"label": "A"}]))
+                session.log_activity("tool", f"call {i}")
+        t = threading.Thread(target=burst)
+        t.start()
+        t.join()
+        await pilot.pause(0.2)
+
+        after = app._ui.stats()
+        assert after["requests"] - before["requests"] == 200
+        # The activity overflow spilled into the test's own archive dir
+        assert session.archive.path.startswith(str(_archive_dir))
+        assert after["flushes"] - before["flushes"] <= 2
+        assert after["renders"]["tab_bar"] - before["renders"]["tab_bar"] <= 2
+        assert after["dirty"] == []
+
+
+@pytest.mark.asyncio
+async def test_session_timers_sleep_while_no_agent_is_connected():
+    app = make_app()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        assert app._heartbeat_timer._active.is_set() is False
+        session, _ = app.manager.get_or_create("s1")
+        await pilot.pause(0.1)
+        assert app._heartbeat_timer._active.is_set()
+        assert app._agent_health_timer._active.is_set()
+        app.manager.remove("s1")
+        await pilot.pause(0.1)
+        assert app._cleanup_timer._active.is_set() is False
@@ -844,6 +844,35 @@ class TestAllExtrasActions:
 
             assert getattr(app, '_system_logs_mode', False) is True
 
+    @pytest.mark.asyncio
+    async def test_view_logs_loads_older_speech(self, tmp_path):
+        """The system logs "load older" row pages in archived speech."""
+        from io_mcp.archive import SessionArchive
+        from io_mcp.session import SpeechEntry
+
+        app = make_app()
+        async with app.run_test() as pilot:
+            session = _setup_session(app)
+            session.archive = SessionArchive(str(tmp_path / "s"))
+            session._speech_log_max = 30
+            for i in range(45):
+                session.append_speech(SpeechEntry(text=f"line {i}"))
+            app._show_choices()
+            await pilot.pause(0.1)
+
+            app._handle_extra_select("View logs")
+            await pilot.pause(0.1)
+            assert [r["text"] for r in app._system_log_speech][0] == "line 15"
+            older = app._system_log_older_index
+            assert older is not None
+
+            app._load_older_speech_log()
+            await pilot.pause(0.1)
+            assert len(app._system_log_speech) == 45
+            assert app._system_log_speech[0]["text"] == "line 0"
+            assert app._system_log_older_index is None
+            assert app._system_logs_mode is True
+
     @pytest.mark.asyncio
     async def test_close_tab_handler(self):
         """'Close tab' attempts to close the session without crashing."""
@@ -644,7 +644,8 @@ class TestCliMain:
 
     def _run_main(self, args: list[str], stdin_text: str | None = None):
         """Helper to run main() with mocked sys.argv and optional stdin."""
-        with mock.patch("sys.argv", ["io-mcp-msg"] + args):
+        with mock.patch("sys.argv", ["io-mcp-msg"] + args), \
+                mock.patch("io_mcp.transport.socket_live", return_value=False):
             if stdin_text is not None:
                 with mock.patch("sys.stdin", io.StringIO(stdin_text)):
                     with mock.patch("sys.stdin") as mock_stdin:
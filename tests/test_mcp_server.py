@@ -572,9 +572,9 @@ class TestForwardToBackend:
         from io_mcp.proxy import _forward_to_backend
         from unittest.mock import patch
 
-        # Patch urlopen to raise an unexpected error
-        with patch("io_mcp.proxy.urllib.request.urlopen") as mock_urlopen:
-            mock_urlopen.side_effect = MemoryError("out of memory")
+        # Patch the pooled request to raise an unexpected error
+        with patch("io_mcp.proxy.BackendPool.post") as mock_post:
+            mock_post.side_effect = MemoryError("out of memory")
             result = _forward_to_backend(
                 "http://127.0.0.1:8446", "speak", {"text": "hi"}, "sid1",
                 max_retries=1,
@@ -586,19 +586,19 @@ class TestForwardToBackend:
         assert "out of memory" in data["error"]
 
     def test_non_retriable_url_error_fails_fast(self):
-        """Non-retriable URLError (bad hostname) fails immediately, no retries."""
+        """Non-retriable errors (bad hostname) fail immediately, no retries."""
         from io_mcp.proxy import _forward_to_backend
         from unittest.mock import patch
-        import urllib.error
+        import socket
 
         call_count = 0
 
-        def fake_urlopen(*args, **kwargs):
+        def fake_post(*args, **kwargs):
             nonlocal call_count
             call_count += 1
-            raise urllib.error.URLError("unknown hostname")
+            raise socket.gaierror(socket.EAI_NONAME, "Name or service not known")
 
-        with patch("io_mcp.proxy.urllib.request.urlopen", side_effect=fake_urlopen):
+        with patch("io_mcp.proxy.BackendPool.post", side_effect=fake_post):
             result = _forward_to_backend(
                 "http://bad-hostname-that-does-not-exist:8446",
                 "speak",
@@ -754,7 +754,7 @@ class TestFwdErrorHandling:
         tool_names = {t.name for t in tools}
 
         expected_tools = {
-            "present_choices", "present_multi_select",
+            "present_choices", "present_multi_select", "present_choices_batch",
             "speak", "speak_async", "speak_urgent",
             "set_speed", "set_voice", "set_tts_model", "set_stt_model", "set_emotion",
             "get_settings", "register_session", "rename_session",
@@ -0,0 +1,217 @@
+"""Tests for the streaming tmux pane mirror (control mode)."""
+
+import io
+import shutil
+import subprocess
+import time
+
+import pytest
+
+from io_mcp.ssh_mux import SSH_MUX
+from io_mcp.tui.pane_stream import PaneStream, pane_delta
+
+from tests.test_tui_pilot import make_app
+
+
+class TestPaneDelta:
+
+    def test_unchanged_appends_nothing(self):
+        assert pane_delta(["a", "b"], ["a", "b"]) == (False, [])
+
+    def test_new_lines_below_are_appended(self):
+        assert pane_delta(["a", "b"], ["a", "b", "c"]) == (False, ["c"])
+
+    def test_scrolled_window_appends_only_the_tail(self):
+        assert pane_delta(["a", "b", "c"], ["b", "c", "d", "e"]) == (False, ["d", "e"])
+
+    def test_redraw_replaces(self):
+        assert pane_delta(["a", "b"], ["x", "b"]) == (True, ["x", "b"])
+        assert pane_delta([], ["x"]) == (False, ["x"])
+
+    def test_small_overlap_is_a_redraw(self):
+        shown = ["a", "b", "c", "$"]
+        assert pane_delta(shown, ["$", "x", "y", "z"]) == (True, ["$", "x", "y", "z"])
+        assert pane_delta(shown, ["c", "$", "x"]) == (False, ["x"])
+
+
+class _FakeProc:
+    def __init__(self):
+        self.stdin = io.BytesIO()
+
+    def sent(self):
+        return self.stdin.getvalue().decode().splitlines()
+
+
+def _stream(**kw):
+    changes = []
+    stream = PaneStream("%3", on_change=lambda: changes.append(1), **kw)
+    stream._proc = _FakeProc()
+    return stream, changes
+
+
+def _feed(stream, text):
+    for line in text.strip("\n").split("\n"):
+        stream._handle(line)
+
+
+class TestControlProtocol:
+
+    def test_remote_uses_one_ssh_client(self, monkeypatch):
+        monkeypatch.setattr(SSH_MUX, "ensure", lambda host: False)
+        cmd = PaneStream("%3", "box").command("work")
+        assert cmd[0] == "ssh" and cmd[-2] == "box"
+        assert cmd[-1] == "tmux -C attach -r -t =work"
+
+    def test_missing_pane_stops_before_attaching(self, monkeypatch):
+        monkeypatch.setattr(subprocess, "run", lambda cmd, **kw: subprocess.CompletedProcess(
+            cmd, 1, "", "can't find pane"))
+        stream, _ = _stream()
+        assert stream._connect() is False
+        assert stream._stopped.is_set()
+
+    def test_output_triggers_one_capture_at_a_time(self):
+        stream, changes = _stream()
+        stream._send("pane_id", "display-message")
+        stream._capture()
+        _feed(stream, """
+%begin 1 10 1
+%3
+%end 1 10 1
+%begin 1 11 1
+line 1
+
+%end 1 11 1
+%begin 1 12 0
+%end 1 12 0
+%output %3 x\\015\\012
+%output %4 other pane
+%output %3 y
+%output %3 z
+""")
+        assert stream.take() == (False, ["line 1"])
+        assert stream.take() is None
+        assert changes == [1]
+        # Burst of output while a capture is in flight → exactly one more
+        assert [c.split()[0] for c in stream._proc.sent()] == [
+            "display-message", "capture-pane", "capture-pane"]
+        assert stream.outputs == 3
+
+        _feed(stream, """
+%begin 1 13 1
+line 1
+line 2
+%end 1 13 1
+""")
+        assert stream._proc.sent()[-1].startswith("capture-pane")  # dirty → re-capture
+        _feed(stream, """
+%begin 1 14 1
+line 1
+line 2
+%end 1 14 1
+""")
+        assert stream.take() == (False, ["line 2"])
+        assert changes == [1, 1]  # identical capture doesn't notify
+        assert len(stream._proc.sent()) == 4
+
+    def test_missing_pane_stops(self):
+        stream, _ = _stream()
+        stream._send("pane_id", "display-message")
+        _feed(stream, """
+%begin 1 10 1
+can't find pane: %3
+%error 1 10 1
+""")
+        assert stream._stopped.is_set()
+
+    def test_stop_reaps_off_the_caller_thread(self):
+        stream, _ = _stream()
+        stream._proc = proc = subprocess.Popen(["sleep", "30"], stdin=subprocess.PIPE)
+        start = time.monotonic()
+        stream.stop()
+        assert time.monotonic() - start < 0.2
+        assert _wait_for(lambda: proc.poll() is not None)
+
+
+def _wait_for(pred, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if pred():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+@pytest.mark.skipif(shutil.which("tmux") is None, reason="tmux not installed")
+def test_streams_a_real_pane(tmp_path, monkeypatch):
+    monkeypatch.setenv("TMUX_TMPDIR", str(tmp_path))
+    monkeypatch.delenv("TMUX", raising=False)
+    subprocess.run(["tmux", "new-session", "-d", "-s", "t", "-x", "80", "-y", "10",
+                    "sleep 0.5; echo one; sleep 0.5; echo two; sleep 30"], check=True)
+    try:
+        pane = subprocess.run(["tmux", "display", "-p", "-t", "t", "#{pane_id}"],
+                              capture_output=True, text=True).stdout.strip()
+        stream = PaneStream(pane)
+        stream.start()
+        try:
+            assert _wait_for(lambda: stream._snapshot == ["one"])
+            assert stream.take() == (False, ["one"])
+            assert _wait_for(lambda: stream._snapshot == ["one", "two"])
+            assert stream.take() == (False, ["two"])
+            stats = stream.stats()
+            assert stats["connects"] == 1 and stats["outputs"] >= 2
+        finally:
+            stream.stop()
+    finally:
+        subprocess.run(["tmux", "kill-server"])
+
+
+@pytest.mark.skipif(shutil.which("tmux") is None, reason="tmux not installed")
+def test_stream_leaves_current_window_alone(tmp_path, monkeypatch):
+    monkeypatch.setenv("TMUX_TMPDIR", str(tmp_path))
+    monkeypatch.delenv("TMUX", raising=False)
+
+    def tmux(*args):
+        return subprocess.run(["tmux", *args], capture_output=True, text=True,
+                              check=True).stdout.strip()
+
+    tmux("new-session", "-d", "-s", "w", "-x", "80", "-y", "10", "sleep 30")
+    try:
+        tmux("new-window", "-d", "-t", "w", "sleep 0.5; echo agent; sleep 30")
+        pane = tmux("list-panes", "-t", "=w:1", "-F", "#{pane_id}")
+        stream = PaneStream(pane)
+        stream.start()
+        try:
+            assert _wait_for(lambda: stream._snapshot == ["agent"])
+            assert stream.stats()["connects"] == 1
+            assert tmux("display", "-p", "-t", "w", "#{window_index}") == "0"
+        finally:
+            stream.stop()
+    finally:
+        subprocess.run(["tmux", "kill-server"])
+
+
+@pytest.mark.asyncio
+async def test_pane_view_appends_only_new_lines(monkeypatch):
+    monkeypatch.setattr(PaneStream, "start", lambda self: None)
+    app = make_app()
+    async with app.run_test() as pilot:
+        session, _ = app.manager.get_or_create("s1")
+        session.registered = True
+        session.tmux_pane = "%3"
+        app.on_session_created(session)
+        await pilot.pause()
+        app.action_pane_view()
+        stream = app._pane_stream
+        pane_view = app.query_one("#pane-view")
+        assert pane_view.display and stream.hostname == ""
+
+        stream._snapshot, stream._fresh = ["a", "b"], True
+        app._update_pane_view()
+        written = []
+        monkeypatch.setattr(pane_view, "write", lambda line: written.append(line))
+        stream._snapshot, stream._fresh = ["a", "b", "c"], True
+        app._update_pane_view()
+        assert written == ["c"]
+
+        app.action_pane_view()
+        assert app._pane_stream is None and stream._stopped.is_set()
@@ -364,7 +364,7 @@ class TestProxyHealth:
 
         expected_keys = {
             "status", "pid", "pid_alive", "port_open",
-            "uptime", "uptime_seconds", "address", "details",
+            "uptime", "uptime_seconds", "address", "details", "backend_pool", "shards",
         }
         assert set(result.keys()) == expected_keys
 
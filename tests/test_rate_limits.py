@@ -0,0 +1,173 @@
+"""Tests for per-session admission control (rate limits and speech coalescing)."""
+
+import json
+from unittest.mock import MagicMock
+
+from io_mcp.__main__ import _create_tool_dispatcher
+from io_mcp.config import IoMcpConfig
+from io_mcp.session import InboxItem, Session, SessionManager, TokenBucket
+
+
+class TestTokenBucket:
+
+    def test_burst_then_refill(self):
+        b = TokenBucket(rate=1.0, burst=3, now=0.0)
+        assert [b.take(0.0) for _ in range(4)] == [True, True, True, False]
+        assert b.retry_after(0.0) == 1.0
+        assert b.take(1.0)
+        assert not b.take(1.0)
+
+    def test_refill_caps_at_burst(self):
+        b = TokenBucket(rate=10.0, burst=2, now=0.0)
+        b.take(0.0)
+        b.take(0.0)
+        assert b.retry_after(100.0) == 0.0
+        assert [b.take(100.0) for _ in range(3)] == [True, True, False]
+
+
+class TestSessionAdmission:
+
+    def test_admit_counts_throttled_calls(self):
+        s = Session(session_id="s", name="S")
+        assert s.admit("speech", 60, 2, now=0.0)
+        assert s.admit("speech", 60, 2, now=0.0)
+        assert not s.admit("speech", 60, 2, now=0.0)
+        assert s.throttled_calls == 1
+        assert s.retry_after("speech", now=0.5) == 0.5
+
+    def test_kinds_are_independent(self):
+        s = Session(session_id="s", name="S")
+        assert s.admit("speech", 60, 1, now=0.0)
+        assert not s.admit("speech", 60, 1, now=0.0)
+        assert s.admit("choices", 60, 1, now=0.0)
+
+    def test_limit_change_rebuilds_bucket(self):
+        s = Session(session_id="s", name="S")
+        s.admit("speech", 60, 1, now=0.0)
+        assert not s.admit("speech", 60, 1, now=0.0)
+        assert s.admit("speech", 120, 5, now=0.0)
+
+    def test_coalesce_needs_item_behind_front(self):
+        s = Session(session_id="s", name="S")
+        assert s.coalesce_speech("x", 100) == (None, False)
+        s.enqueue_speech("first", blocking=False)
+        assert s.coalesce_speech("x", 100) == (None, False)  # front may be playing
+        queued = s.enqueue_speech("second", blocking=False)
+        item, merged = s.coalesce_speech("third", 100)
+        assert merged and item is queued
+        assert queued.text == "second third"
+
+    def test_coalesce_respects_max_chars(self):
+        s = Session(session_id="s", name="S")
+        s.enqueue_speech("first", blocking=False)
+        queued = s.enqueue_speech("second", blocking=False)
+        item, merged = s.coalesce_speech("a much longer addition", 20)
+        assert item is queued and not merged
+        assert queued.text == "second"
+
+    def test_coalesce_skips_choices(self):
+        s = Session(session_id="s", name="S")
+        s.enqueue_speech("first", blocking=False)
+        s.enqueue(InboxItem(kind="choices", preamble="pick"))
+        assert s.coalesce_speech("x", 100) == (None, False)
+
+    def test_supersede_status(self):
+        s = Session(session_id="s", name="S")
+        assert not s.supersede_status("x")
+        s.log_activity("report_status", "old", kind="status")
+        assert s.supersede_status("new")
+        assert [e["detail"] for e in s.activity_log] == ["new"]
+        s.log_activity("speak", "hi", kind="speech")
+        assert not s.supersede_status("newer")
+
+
+class TestConfig:
+
+    def test_opt_in_defaults_and_disable(self, tmp_path):
+        cfg = IoMcpConfig.load(str(tmp_path / "config.yml"))
+        assert cfg.rate_limit("speech") is None  # off unless enabled
+        cfg.expanded["config"]["rateLimits"]["enabled"] = True
+        assert cfg.rate_limit("speech") == (30.0, 8)
+        assert cfg.rate_limit("bogus") is None
+        cfg.expanded["config"]["rateLimits"]["speech"]["perMinute"] = 0
+        assert cfg.rate_limit("speech") is None
+        cfg.expanded["config"]["rateLimits"]["enabled"] = False
+        assert cfg.rate_limit("choices") is None
+
+
+class _Limits:
+    """Config stand-in: every kind limited to ``burst`` calls, no refill to speak of."""
+
+    extra_options: list = []
+    rate_limit_max_merged_chars = 60
+
+    def __init__(self, burst: int = 2):
+        self.burst = burst
+
+    def rate_limit(self, kind):
+        return (0.001, self.burst)
+
+
+def _dispatcher(burst: int = 2):
+    app = MagicMock()
+    app.manager = SessionManager()
+    app._config = _Limits(burst)
+    return _create_tool_dispatcher([app], [], []), app
+
+
+class TestDispatchThrottling:
+
+    def test_speech_flood_is_merged(self):
+        dispatch, app = _dispatcher(burst=2)
+        results = [dispatch("speak_async", {"text": f"m{i}"}, "s1") for i in range(5)]
+        session = app.manager.get("s1")
+        assert [i.text for i in session.inbox] == ["m0", "m1 m2 m3 m4"]
+        assert "THROTTLED" not in results[1]
+        assert all("merged into your queued speech" in r for r in results[2:])
+        assert session.throttled_calls == 3
+
+    def test_speech_dropped_past_merge_cap(self):
+        dispatch, app = _dispatcher(burst=2)
+        dispatch("speak_async", {"text": "a"}, "s1")
+        dispatch("speak_async", {"text": "b"}, "s1")
+        result = dispatch("speak_async", {"text": "x" * 100}, "s1")
+        assert "dropped" in result and result.startswith("Not spoken")
+        assert [i.text for i in app.manager.get("s1").inbox] == ["a", "b"]
+
+    def test_throttled_speech_with_nothing_queued_is_not_spoken(self):
+        dispatch, app = _dispatcher(burst=1)
+        dispatch("speak_async", {"text": "a"}, "s1")
+        session = app.manager.get("s1")
+        session.inbox.clear()
+        result = dispatch("speak_async", {"text": "b"}, "s1")
+        assert result.startswith("Not spoken") and "THROTTLED" in result
+        assert list(session.inbox) == []
+
+    def test_urgent_speech_is_never_merged(self):
+        dispatch, app = _dispatcher(burst=2)
+        dispatch("speak_async", {"text": "a"}, "s1")
+        dispatch("speak_async", {"text": "b"}, "s1")
+        result = dispatch("speak_urgent", {"text": "fire"}, "s1")
+        assert result.startswith("Not spoken")
+        session = app.manager.get("s1")
+        assert [(i.text, i.priority) for i in session.inbox] == [("a", 0), ("b", 0)]
+
+    def test_choices_refused_when_throttled(self):
+        dispatch, app = _dispatcher(burst=1)
+        session, _ = app.manager.get_or_create("s1")
+        session.registered = True
+        app.present_choices.return_value = {"selected": "A", "summary": ""}
+        first = json.loads(dispatch("present_choices", {"preamble": "p", "choices": [{"label": "A"}]}, "s1"))
+        assert first["selected"] == "A"
+        second = json.loads(dispatch("present_choices", {"preamble": "p", "choices": [{"label": "A"}]}, "s1"))
+        assert second["throttled"] is True
+        assert second["retry_after"] > 0
+        assert app.present_choices.call_count == 1
+
+    def test_status_lines_superseded(self):
+        dispatch, app = _dispatcher(burst=1)
+        dispatch("report_status", {"status": "one"}, "s1")
+        result = json.loads(dispatch("report_status", {"status": "two"}, "s1"))
+        assert result["status"] == "superseded"
+        statuses = [e["detail"] for e in app.manager.get("s1").activity_log if e["kind"] == "status"]
+        assert statuses == ["two"]
@@ -0,0 +1,186 @@
+"""Tests for the Start hook registration registry."""
+
+import asyncio
+import json
+import os
+import socket
+import threading
+
+from io_mcp import proxy
+from io_mcp.backend import start_backend_server
+from io_mcp.proxy import BackendRouter, create_proxy_server
+from io_mcp.registrations import RegistrationRegistry, apply_registration, enrich_registration
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+class TestRegistry:
+
+    def test_pane_lookup(self):
+        reg = RegistrationRegistry()
+        reg.add({"tmux_pane": "%3", "cwd": "/a"})
+        reg.add({"tmux_pane": "%4", "cwd": "/b"})
+        assert reg.lookup("%3")["cwd"] == "/a"
+        assert reg.lookup("3")["cwd"] == "/a"
+        assert reg.lookup("%9") is None
+
+    def test_new_registration_replaces_pane(self):
+        reg = RegistrationRegistry()
+        reg.add({"tmux_pane": "%3", "cwd": "/old"})
+        reg.add({"tmux_pane": "%3", "cwd": "/new"})
+        assert reg.lookup("%3")["cwd"] == "/new"
+        assert reg.stats()["registrations"] == 1
+
+    def test_pid_lookup(self):
+        reg = RegistrationRegistry()
+        reg.add({"hostname": "box", "pid": "41", "cwd": "/a"})
+        reg.add({"hostname": "box", "pid": 42, "cwd": "/b"})
+        assert reg.lookup(hostname="box", pid=41)["cwd"] == "/a"
+
+    def test_paneless_agents_never_share_a_record(self):
+        reg = RegistrationRegistry()
+        for i in range(20):
+            reg.add({"tmux_pane": f"%{i}", "cwd": f"/w{i}"})
+        got = []
+        threads = [threading.Thread(target=lambda: got.append(reg.lookup()["cwd"]))
+                   for _ in range(20)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert sorted(got) == sorted(f"/w{i}" for i in range(20))
+        assert reg.lookup() is None
+
+    def test_paneless_lookup_filters_by_host(self):
+        reg = RegistrationRegistry()
+        reg.add({"hostname": "a", "cwd": "/a"})
+        reg.add({"hostname": "b", "tailscale_hostname": "b-ts", "cwd": "/b"})
+        assert reg.lookup(hostname="a")["cwd"] == "/a"
+        assert reg.lookup(hostname="b-ts")["cwd"] == "/b"
+
+    def test_entries_expire(self):
+        reg = RegistrationRegistry(ttl=60)
+        reg.add({"tmux_pane": "%1"}, now=1000)
+        assert reg.lookup("%1", now=1030) is not None
+        assert reg.lookup("%1", now=1100) is None
+        assert reg.stats()["registrations"] == 0
+
+    def test_bounded(self):
+        reg = RegistrationRegistry(max_entries=3)
+        for i in range(5):
+            reg.add({"tmux_pane": f"%{i}"})
+        assert reg.lookup("%0") is None
+        assert reg.lookup("%4") is not None
+
+    def test_import_dir_removes_files(self, tmp_path):
+        fresh = tmp_path / "pane-1.json"
+        fresh.write_text(json.dumps({"tmux_pane": "%1", "cwd": "/x"}))
+        stale = tmp_path / "pane-2.json"
+        stale.write_text(json.dumps({"tmux_pane": "%2"}))
+        os.utime(stale, (0, 0))
+        (tmp_path / "pane-3.json").write_text("{broken")
+
+        reg = RegistrationRegistry()
+        assert reg.import_dir(str(tmp_path)) == 1
+        assert reg.lookup("%1")["cwd"] == "/x"
+        assert reg.lookup("%2") is None
+        assert not (tmp_path / "pane-1.json").exists()
+        assert not stale.exists()
+
+
+class TestApplyRegistration:
+
+    def test_agent_values_win(self):
+        args = apply_registration(
+            {"cwd": "/mine", "hostname": "", "metadata": {"k": 1}},
+            {"cwd": "/hook", "tmux_pane": "%3", "hostname": "box",
+             "tailscale_hostname": "box-ts", "ipv4": "10.0.0.2"})
+        assert args["cwd"] == "/mine"
+        assert args["tmux_pane"] == "%3"
+        assert args["hostname"] == "box-ts"
+        assert args["metadata"] == {"k": 1, "ipv4": "10.0.0.2", "tailscale_hostname": "box-ts"}
+
+
+class TestEnrichRegistration:
+
+    def test_first_registration_claims_newest(self):
+        reg = RegistrationRegistry()
+        reg.add({"tmux_pane": "%7", "cwd": "/proj"})
+        args = enrich_registration(reg, {"name": "agent", "hostname": "localhost"})
+        assert (args["tmux_pane"], args["cwd"]) == ("%7", "/proj")
+
+    def test_re_registration_keeps_its_pane(self):
+        reg = RegistrationRegistry()
+        reg.add({"tmux_pane": "%7", "cwd": "/proj"})
+        first = enrich_registration(reg, {"name": "agent"})
+        reg.add({"tmux_pane": "%8", "cwd": "/other"})
+        again = enrich_registration(reg, {"name": "agent"}, previous=first)
+        assert again["cwd"] == "/proj"
+
+    def test_re_registration_never_claims_another_agents_record(self):
+        reg = RegistrationRegistry()
+        first = enrich_registration(reg, {"name": "agent"})
+        assert "tmux_pane" not in first
+        reg.add({"tmux_pane": "%8", "cwd": "/other"})
+        again = enrich_registration(reg, {"name": "agent"}, previous=first)
+        assert "tmux_pane" not in again and "cwd" not in again
+        assert reg.stats()["unclaimed"] == 1
+
+
+class _Backend:
+    """A real backend that records every call's args."""
+
+    def __init__(self):
+        self.calls = []
+        self.port = _free_port()
+
+        def dispatch(tool, args, sid):
+            self.calls.append((tool, args))
+            return "ok"
+
+        self.server = start_backend_server(dispatch, host="127.0.0.1", port=self.port)
+        self.url = f"http://127.0.0.1:{self.port}"
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class TestProxyRegistrations:
+
+    def test_hook_posts_to_the_proxy(self):
+        from starlette.testclient import TestClient
+
+        reg = RegistrationRegistry()
+        client = TestClient(create_proxy_server(registrations=reg).streamable_http_app())
+        resp = client.post("/registrations", json={"tmux_pane": "%7", "cwd": "/proj"})
+        assert resp.status_code == 200 and resp.json()["status"] == "registered"
+        assert client.post("/registrations", content=b"[1]").status_code == 400
+        assert client.get("/proxy-stats").json()["registrations"]["registrations"] == 1
+
+    def test_failed_over_shard_gets_the_enriched_registration(self, monkeypatch):
+        class _FastRouter(BackendRouter):
+            def __init__(self, backends):
+                super().__init__(backends, failover_after=0, probe_interval=0)
+
+        monkeypatch.setattr(proxy, "BackendRouter", _FastRouter)
+        live = _Backend()
+        try:
+            reg = RegistrationRegistry()
+            reg.add({"tmux_pane": "%7", "cwd": "/proj", "hostname": "box"})
+            reg.add({"tmux_pane": "%8", "cwd": "/other", "hostname": "box"})
+            server = create_proxy_server(
+                backends=[("a", f"http://127.0.0.1:{_free_port()}"), ("b", live.url)],
+                registrations=reg)
+            asyncio.run(server.call_tool("register_session", {
+                "tmux_pane": "%7", "metadata": {"backend": "a"}}))
+            tool, args = live.calls[-1]
+            assert tool == "register_session"
+            assert (args["tmux_pane"], args["cwd"], args["hostname"]) == ("%7", "/proj", "box")
+            assert reg.stats()["unclaimed"] == 1  # %8 is left for its own agent
+        finally:
+            live.close()
@@ -0,0 +1,208 @@
+"""Tests for the per-session timeline index and the global EventStore."""
+
+import time
+
+from io_mcp.session import (
+    EventStore, FlushedMessage, HistoryEntry, InboxItem, Session, SessionManager,
+    SessionTimeline, SpeechEntry,
+)
+
+
+def _session() -> Session:
+    return Session(session_id="test-1", name="Agent 1")
+
+
+class TestSessionTimeline:
+
+    def test_empty(self):
+        s = _session()
+        assert len(s.events) == 0
+        assert s.events.cursor == 0
+        assert s.events.latest(10) == []
+
+    def test_merges_sources_in_timestamp_order(self):
+        s = _session()
+        now = time.time()
+        s.append_speech(SpeechEntry(text="a", timestamp=now - 30))
+        s.append_history(HistoryEntry(label="b", summary="", preamble="", timestamp=now - 20))
+        s.flushed_messages.append(FlushedMessage(text="c", flushed_at=now - 25))
+        s.log_activity("tool_x", "d")
+        kinds = [ev.kind for ev in s.events.latest(10)]
+        assert kinds == ["speech", "user_msg", "selection", "activity"]
+
+    def test_only_resolved_choices_indexed_from_inbox_done(self):
+        s = _session()
+        s.inbox_done.append(InboxItem(kind="speech", text="hi"))
+        s.inbox_done.append(InboxItem(kind="choices", preamble="pick"))
+        events = s.events.latest(10)
+        assert [ev.kind for ev in events] == ["choices"]
+        assert events[0].ref.preamble == "pick"
+
+    def test_incremental_sync_uses_cursor(self):
+        s = _session()
+        s.append_speech(SpeechEntry(text="one"))
+        cursor = s.events.cursor
+        s.append_speech(SpeechEntry(text="two"))
+        s.append_speech(SpeechEntry(text="three"))
+        new = s.events.since(cursor)
+        assert [ev.ref.text for ev in new] == ["two", "three"]
+        # Nothing new since the latest cursor
+        assert s.events.since(s.events.cursor) == []
+
+    def test_sync_is_noop_without_new_items(self):
+        s = _session()
+        s.append_speech(SpeechEntry(text="one"))
+        cursor = s.events.cursor
+        assert s.events.cursor == cursor
+
+    def test_out_of_order_insert(self):
+        s = _session()
+        now = time.time()
+        s.append_speech(SpeechEntry(text="late", timestamp=now))
+        s.append_history(HistoryEntry(label="early", summary="", preamble="", timestamp=now - 60))
+        texts = [getattr(ev.ref, "text", None) or ev.ref.label for ev in s.events.latest(10)]
+        assert texts == ["early", "late"]
+
+    def test_list_replacement_triggers_rebuild(self):
+        s = _session()
+        s.append_speech(SpeechEntry(text="old"))
+        assert len(s.events) == 1
+        s.speech_log = [SpeechEntry(text="new1"), SpeechEntry(text="new2")]
+        assert [ev.ref.text for ev in s.events.latest(10)] == ["new1", "new2"]
+
+    def test_cleared_list_drops_events(self):
+        s = _session()
+        s.log_activity("tool_x")
+        assert len(s.events) == 1
+        s.activity_log.clear()
+        assert len(s.events) == 0
+
+    def test_trim_keeps_list_identity(self):
+        s = _session()
+        s._speech_log_max = 3
+        log = s.speech_log
+        for i in range(5):
+            s.append_speech(SpeechEntry(text=f"m{i}"))
+        assert s.speech_log is log
+        assert [e.text for e in s.speech_log] == ["m2", "m3", "m4"]
+
+    def test_discard(self):
+        s = _session()
+        item = InboxItem(kind="choices", preamble="undo me")
+        s.inbox_done.append(item)
+        s.inbox_done.append(InboxItem(kind="choices", preamble="keep"))
+        assert len(s.events) == 2
+        s.inbox_done.remove(item)
+        s._timeline.discard(item)
+        assert [ev.ref.preamble for ev in s.events.latest(10)] == ["keep"]
+
+    def test_latest_filters_by_kind_and_predicate(self):
+        s = _session()
+        s.log_activity("a", kind="tool")
+        s.log_activity("b", kind="speech")
+        s.append_speech(SpeechEntry(text="x"))
+        events = s.events.latest(10, kinds=("activity",),
+                                 where=lambda ev: ev.ref["kind"] != "speech")
+        assert [ev.ref["tool"] for ev in events] == ["a"]
+
+    def test_between(self):
+        s = _session()
+        now = time.time()
+        for i in range(5):
+            s.append_speech(SpeechEntry(text=f"m{i}", timestamp=now - 50 + i * 10))
+        events = s.events.between(now - 35, now - 15)
+        assert [ev.ref.text for ev in events] == ["m2", "m3"]
+
+    def test_max_events_cap(self):
+        tl = SessionTimeline(max_events=3)
+        s = _session()
+        for i in range(5):
+            s.append_speech(SpeechEntry(text=f"m{i}"))
+        tl.sync(s)
+        assert [ev.ref.text for ev in tl.latest(10)] == ["m2", "m3", "m4"]
+
+
+class TestEventStore:
+
+    def _manager(self):
+        m = SessionManager()
+        s1, _ = m.get_or_create("s1")
+        s2, _ = m.get_or_create("s2")
+        return m, s1, s2
+
+    def test_global_seq_across_sessions(self):
+        m, s1, s2 = self._manager()
+        # seq is ingest order, so sync after each append
+        for s, text in ((s1, "a"), (s2, "b"), (s1, "c")):
+            s.append_speech(SpeechEntry(text=text))
+            m.sync_events()
+        events = m.events_since(0)
+        assert [ev.ref.text for ev in events] == ["a", "b", "c"]
+        assert [ev.session_id for ev in events] == ["s1", "s2", "s1"]
+        assert [ev.seq for ev in events] == sorted(ev.seq for ev in events)
+
+    def test_since_cursor_returns_only_new(self):
+        m, s1, s2 = self._manager()
+        s1.append_speech(SpeechEntry(text="a"))
+        cursor = m.sync_events().cursor
+        s2.log_activity("tool_x")
+        s1.append_speech(SpeechEntry(text="b"))
+        kinds = [ev.kind for ev in m.events_since(cursor)]
+        assert sorted(kinds) == ["activity", "speech"]
+        assert m.events_since(m.events.cursor) == []
+
+    def test_session_filter_and_limit(self):
+        m, s1, s2 = self._manager()
+        for i in range(3):
+            s1.append_speech(SpeechEntry(text=f"a{i}"))
+            s2.append_speech(SpeechEntry(text=f"b{i}"))
+        m.sync_events()
+        assert [ev.ref.text for ev in m.events.since(0, session_id="s2")] == ["b0", "b1", "b2"]
+        assert len(m.events.since(0, limit=2)) == 2
+        assert [ev.ref.text for ev in m.events.latest(2, session_id="s1")] == ["a1", "a2"]
+
+    def test_session_timeline_shares_store_seq(self):
+        m, s1, _ = self._manager()
+        s1.append_speech(SpeechEntry(text="a"))
+        assert s1.events.cursor == m.events.cursor
+
+    def test_remove_forgets_events_and_bumps_epoch(self):
+        m, s1, s2 = self._manager()
+        s1.append_speech(SpeechEntry(text="a"))
+        s2.append_speech(SpeechEntry(text="b"))
+        m.sync_events()
+        epoch = m.events.epoch
+        m.remove("s1")
+        assert [ev.session_id for ev in m.events_since(0)] == ["s2"]
+        assert m.events.epoch > epoch
+
+    def test_list_replacement_reindexes_store(self):
+        m, s1, _ = self._manager()
+        s1.append_speech(SpeechEntry(text="old"))
+        m.sync_events()
+        s1.speech_log = [SpeechEntry(text="new")]
+        assert [ev.ref.text for ev in m.events_since(0)] == ["new"]
+
+    def test_injected_session_is_attached_on_sync(self):
+        m = SessionManager()
+        s = Session(session_id="x", name="X")
+        s.append_speech(SpeechEntry(text="hi"))
+        m.sessions["x"] = s
+        m.session_order.append("x")
+        assert [ev.ref.text for ev in m.events_since(0)] == ["hi"]
+
+    def test_max_events_trims_oldest(self):
+        store = EventStore(max_events=10)
+        for i in range(25):
+            store.add("s", "speech", float(i), i)
+        assert len(store) <= 10
+        assert store.since(0)[-1].ref == 24
+        assert all(ev.ref >= 15 for ev in store.since(0, session_id="s"))
+
+    def test_to_dict(self):
+        m, s1, _ = self._manager()
+        s1.append_speech(SpeechEntry(text="hello"))
+        d = m.events_since(0)[0].to_dict()
+        assert d["kind"] == "speech"
+        assert d["text"] == "hello"
+        assert d["session_id"] == "s1"
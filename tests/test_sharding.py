@@ -0,0 +1,184 @@
+"""Tests for sharding proxy sessions across several backends."""
+
+import json
+import socket
+
+import pytest
+
+from io_mcp.backend import start_backend_server
+from io_mcp.proxy import (
+    BackendRouter,
+    _aggregate_sessions,
+    _forward_to_backend,
+    _shard_cursors,
+    parse_backends,
+)
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+class _Shard:
+    """A real backend server whose tools just record their calls."""
+
+    def __init__(self, name, sessions=(), events=()):
+        self.name = name
+        self.calls = []
+        self.sessions = list(sessions)
+        self.events = list(events)
+        self.port = _free_port()
+
+        def dispatch(tool, args, sid):
+            self.calls.append((tool, sid))
+            if tool == "get_sessions":
+                return json.dumps(self.listing(sid, args.get("since")))
+            return f"{name}:{tool}"
+
+        dispatch.list_sessions = self.listing
+        self.server = start_backend_server(dispatch, host="127.0.0.1", port=self.port)
+
+    def listing(self, sid, since=None):
+        result = {"sessions": [{"session_id": s} for s in self.sessions],
+                  "count": len(self.sessions), "agent_blocked_seconds": 1.0}
+        if since is not None:
+            result["events"] = [e for e in self.events if e["seq"] > since]
+        return result
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.port}"
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def shards():
+    made = []
+
+    def make(*args, **kwargs):
+        shard = _Shard(*args, **kwargs)
+        made.append(shard)
+        return shard
+
+    yield make
+    for shard in made:
+        shard.close()
+
+
+class TestParseBackends:
+
+    def test_plain_and_named(self):
+        assert parse_backends("localhost:8446") == [("localhost:8446", "http://localhost:8446")]
+        assert parse_backends("phone=10.0.0.2:8446, http://b:9000") == [
+            ("phone", "http://10.0.0.2:8446"), ("b:9000", "http://b:9000")]
+
+    def test_empty_entries_skipped(self):
+        assert parse_backends(" , ") == []
+
+
+class TestShardCursors:
+
+    def test_int_applies_everywhere(self):
+        assert _shard_cursors(5, ["a", "b"]) == {"a": 5, "b": 5}
+
+    def test_composite(self):
+        assert _shard_cursors("a=3,b:1=7,zz=9", ["a", "b:1"]) == {"a": 3, "b:1": 7}
+
+    def test_none(self):
+        assert _shard_cursors(None, ["a"]) is None
+
+
+class TestBackendRouter:
+
+    def test_single_backend_always_primary(self):
+        router = BackendRouter([("only", "http://x:1")])
+        router.mark_down("only")
+        assert router.route("s") == "only"
+        assert not router.sharded
+
+    def test_affinity_is_sticky_and_spread(self):
+        router = BackendRouter([("a", "http://a:1"), ("b", "http://b:1")])
+        placed = {sid: router.route(sid) for sid in (f"s{i}" for i in range(40))}
+        assert set(placed.values()) == {"a", "b"}
+        assert all(router.route(sid) == name for sid, name in placed.items())
+
+    def test_pin_from_registration_metadata(self):
+        router = BackendRouter([("a", "http://a:1"), ("b", "http://b:1")])
+        router.pin("s", {"group": "b"})
+        assert router.route("s") == "b"
+        router.pin("t", {"backend": "nope"})
+        assert router.home("t") == "a"  # unknown names are ignored
+
+    def test_pin_does_not_move_a_placed_session(self):
+        router = BackendRouter([("a", "http://a:1"), ("b", "http://b:1")])
+        router.pin("s", {"backend": "a"})
+        router.pin("s", {"backend": "b"})
+        assert router.route("s") == "a"
+
+    def test_short_outage_keeps_session(self):
+        router = BackendRouter([("a", "http://a:1"), ("b", "http://b:1")], failover_after=60)
+        router.pin("s", {"backend": "a"})
+        router.mark_down("a")
+        assert router.route("s") == "a"
+        assert router.failovers == 0
+
+    def test_failover_replays_registration_once(self):
+        dead = f"http://127.0.0.1:{_free_port()}"
+        router = BackendRouter([("a", dead), ("b", "http://b:1")],
+                               failover_after=0, probe_interval=0)
+        router.pin("s", {"backend": "a"})
+        router.remember_registration("s", {"name": "agent"})
+        router.mark_down("a")
+        assert router.route("s") == "b"
+        assert router.failovers == 1
+        assert router.take_replay("s") == {"name": "agent"}
+        assert router.take_replay("s") is None
+        assert router.stats()["backends"]["a"]["healthy"] is False
+
+
+class TestShardedForwarding:
+
+    def test_retry_fails_over_to_live_shard(self, shards):
+        live = shards("b")
+        dead = f"http://127.0.0.1:{_free_port()}"
+        router = BackendRouter([("a", dead), ("b", live.url)],
+                               failover_after=0, probe_interval=0)
+        router.pin("s", {"backend": "a"})
+        router.remember_registration("s", {"name": "agent"})
+        result = _forward_to_backend(dead, "speak_async", {}, "s", initial_backoff=0.01,
+                                     max_retries=5, router=router)
+        assert result == "b:speak_async"
+        assert live.calls == [("register_session", "s"), ("speak_async", "s")]
+
+    def test_aggregated_sessions(self, shards):
+        a = shards("a", sessions=["s1"], events=[{"seq": 1, "time": 1.0}, {"seq": 2, "time": 3.0}])
+        b = shards("b", sessions=["s2", "s3"], events=[{"seq": 9, "time": 2.0}])
+        router = BackendRouter([("a", a.url), ("b", b.url)])
+        router.pin("s1", {"backend": "a"})
+
+        result = json.loads(_aggregate_sessions(router, "s1", since=0))
+        assert result["count"] == 3
+        assert {(s["session_id"], s["backend"]) for s in result["sessions"]} == {
+            ("s1", "a"), ("s2", "b"), ("s3", "b")}
+        assert [e["seq"] for e in result["events"]] == [1, 9, 2]
+        assert result["cursor"] == "a=2,b=9"
+        assert result["agent_blocked_seconds"] == 2.0
+        # Only the home shard ran the tool; b was read without a session
+        assert a.calls == [("get_sessions", "s1")]
+        assert b.calls == []
+
+        again = json.loads(_aggregate_sessions(router, "s1", since=result["cursor"]))
+        assert again["events"] == []
+
+    def test_unreachable_shard_is_reported(self, shards):
+        a = shards("a", sessions=["s1"])
+        router = BackendRouter([("a", a.url), ("b", f"http://127.0.0.1:{_free_port()}")])
+        router.pin("s1", {"backend": "a"})
+        result = json.loads(_aggregate_sessions(router, "s1"))
+        assert result["count"] == 1
+        assert result["unreachable_backends"] == ["b"]
@@ -0,0 +1,112 @@
+"""Tests for the shared SSH master connection pool.
+
+Uses a fake ``ssh`` that emulates OpenSSH's master/control-socket
+behaviour: ``-M -N`` creates the socket and waits, ``-O check`` /
+``-O exit`` answer through it, and a client just echoes its argv.
+"""
+
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from io_mcp import ssh_mux
+from io_mcp.ssh_mux import SSHMultiplexer
+
+_FAKE_SSH = textwrap.dedent("""\
+    #!{python}
+    import os, signal, sys, time
+    args = sys.argv[1:]
+    opts = dict(a.split("=", 1) for a in args if "=" in a)
+    path = opts.get("ControlPath")
+    if "-M" in args:
+        if args[-1] == "unreachable":
+            sys.exit(255)
+        with open(path, "w") as f:
+            f.write(str(os.getpid()))
+        signal.signal(signal.SIGTERM, lambda *a: sys.exit(0))
+        while os.path.exists(path):
+            time.sleep(0.02)
+        sys.exit(0)
+    if "-O" in args:
+        op = args[args.index("-O") + 1]
+        if not os.path.exists(path):
+            sys.exit(255)
+        if op == "exit":
+            os.unlink(path)
+        sys.exit(0)
+    print(" ".join(args))
+""")
+
+
+@pytest.fixture
+def mux(tmp_path):
+    ssh = tmp_path / "ssh"
+    ssh.write_text(_FAKE_SSH.format(python=sys.executable))
+    ssh.chmod(0o755)
+    mux = SSHMultiplexer(control_dir=str(tmp_path / "ctl"), ssh=str(ssh))
+    yield mux
+    mux.close()
+
+
+def test_commands_share_one_lazily_started_master(mux):
+    assert mux.stats()["masters"] == {}
+    first = mux.command("box", "tmux list-panes -a", "-T")
+    second = mux.command("box", "tmux kill-pane -t %1", connect_timeout=2)
+    assert mux.stats()["masters"] == {"box": {"alive": True, "starts": 1}}
+    path = mux.control_path("box")
+    assert f"ControlPath={path}" in first and "ControlMaster=no" in second
+    assert first[1] == "-T" and first[-2:] == ["box", "tmux list-panes -a"]
+    out = subprocess.run(second, capture_output=True, text=True).stdout
+    assert out.strip().endswith("box tmux kill-pane -t %1")
+
+
+def test_dead_master_is_restarted(mux):
+    mux.ensure("box")
+    master = mux._masters["box"]
+    master.proc.kill()
+    master.proc.wait()
+    assert mux.check() == {"box": False}
+    assert mux.ensure("box")
+    assert mux.stats()["masters"]["box"]["starts"] == 2
+
+
+def test_unreachable_host_falls_back_to_direct_ssh(mux, monkeypatch):
+    cmd = mux.command("unreachable", "true")
+    assert not any(a.startswith("ControlPath=") for a in cmd)
+    assert mux.stats()["direct"] == 1
+    # Not retried until the back-off expires
+    starts = mux._masters["unreachable"].starts
+    mux.command("unreachable", "true")
+    assert mux._masters["unreachable"].starts == starts
+    monkeypatch.setattr(ssh_mux, "MASTER_RETRY_SECS", 0)
+    mux._masters["unreachable"].retry_at = 0
+    mux.command("unreachable", "true")
+    assert mux._masters["unreachable"].starts == starts + 1
+
+
+def test_close_exits_every_master(mux):
+    mux.ensure("a")
+    mux.ensure("b")
+    procs = [m.proc for m in mux._masters.values()]
+    assert mux.check() == {"a": True, "b": True}
+    mux.close()
+    assert all(p.poll() is not None for p in procs)
+    assert not os.path.exists(mux.control_path("a"))
+    assert mux.stats()["masters"] == {}
+
+
+def test_kill_session_runs_ssh_off_the_ui_thread(monkeypatch):
+    from unittest.mock import MagicMock
+    from io_mcp.tui.app import IoMcpApp
+
+    monkeypatch.setattr(ssh_mux.SSH_MUX, "command",
+                        lambda *a, **kw: pytest.fail("ssh on the calling thread"))
+    stub = MagicMock()
+    session = MagicMock(session_id="s1", tmux_pane="%3", hostname="box")
+    session.name = "Agent 1"
+    IoMcpApp._kill_session(stub, session)
+    stub._kill_pane_worker.assert_called_once_with("%3", "box")
+    stub.on_session_removed.assert_called_once_with("s1")
@@ -0,0 +1,72 @@
+"""Tests for fast-start CLI entry points (lazy imports, startup profiling)."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from io_mcp.__main__ import _PROFILE_ENV, _parse_importtime
+
+# Generous: cold caches on CI are several times slower than a dev laptop.
+IMPORT_BUDGET_MS = 1500
+
+HEAVY = ("textual", "mcp", "starlette", "uvicorn", "io_mcp.tui")
+
+
+def _startup_modules(*argv: str, tmp_path) -> tuple[list, str]:
+    """Run ``io-mcp argv`` up to its startup checkpoint; return import rows."""
+    env = dict(os.environ, **{_PROFILE_ENV: "1"}, HOME=str(tmp_path))
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-m", "io_mcp", *argv],
+                          env=env, capture_output=True, text=True, timeout=120)
+    assert proc.returncode == 0, proc.stderr[-2000:]
+    return _parse_importtime(proc.stderr), proc.stdout
+
+
+class TestParseImporttime:
+
+    def test_rows_and_depth(self):
+        stderr = ("import time: self [us] | cumulative | imported package\n"
+                  "import time:       120 |        120 |   _io\n"
+                  "import time:        40 |        300 | io_mcp\n"
+                  "some other warning\n")
+        assert _parse_importtime(stderr) == [(120, 120, 1, "_io"), (40, 300, 0, "io_mcp")]
+
+
+class TestLightCommands:
+
+    @pytest.mark.parametrize("argv", [("status",), ("cache", "status"), ("restart-proxy",)])
+    def test_no_heavy_imports(self, argv, tmp_path):
+        rows, stdout = _startup_modules(*argv, tmp_path=tmp_path)
+        names = {name for *_, name in rows}
+        loaded = sorted(n for n in names for heavy in HEAVY
+                        if n == heavy or n.startswith(heavy + "."))
+        assert loaded == []
+        assert sum(r[0] for r in rows) / 1000 < IMPORT_BUDGET_MS
+        assert stdout == ""  # exited at the checkpoint, before doing any work
+
+    def test_status_skips_config_and_tts(self, tmp_path):
+        rows, _ = _startup_modules("status", tmp_path=tmp_path)
+        names = {name for *_, name in rows}
+        assert not names & {"yaml", "io_mcp.config", "io_mcp.tts"}
+
+
+class TestConfigImport:
+
+    def test_config_does_not_pull_in_sessions(self):
+        proc = subprocess.run(
+            [sys.executable, "-c",
+             "import sys, io_mcp.config; print('io_mcp.session' in sys.modules)"],
+            capture_output=True, text=True, timeout=60)
+        assert proc.stdout.strip() == "False", proc.stderr[-2000:]
+
+
+class TestLazyClasses:
+
+    def test_module_attribute_imports_on_demand(self):
+        import io_mcp.__main__ as main_module
+        from io_mcp.config import IoMcpConfig
+
+        assert main_module.IoMcpConfig is IoMcpConfig
+        with pytest.raises(AttributeError):
+            main_module.NoSuchThing
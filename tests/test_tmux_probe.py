@@ -0,0 +1,112 @@
+"""Tests for batched per-host tmux pane liveness probing."""
+
+import subprocess
+import threading
+import time
+from unittest.mock import MagicMock
+
+from io_mcp.session import SessionManager
+from io_mcp.ssh_mux import SSH_MUX
+from io_mcp.tmux_probe import PaneLiveness, probe_host
+from io_mcp.tui.app import IoMcpApp
+
+
+def _sessions(manager, specs):
+    sessions = []
+    for i, (hostname, pane) in enumerate(specs):
+        s, _ = manager.get_or_create(f"s{i}")
+        s.hostname, s.tmux_pane = hostname, pane
+        sessions.append(s)
+    return sessions
+
+
+class _Probe:
+    """Fake probe_host: records calls, answers from a per-host pane list."""
+
+    def __init__(self, hosts, delay=0.0):
+        self.hosts = hosts
+        self.delay = delay
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def __call__(self, hostname):
+        with self._lock:
+            self.calls.append(hostname)
+        time.sleep(self.delay)
+        return self.hosts.get(hostname)
+
+
+class TestPaneLiveness:
+
+    def test_one_probe_per_host(self):
+        sessions = _sessions(SessionManager(), [
+            ("a", "%1"), ("a", "%2"), ("b", "%1"), ("", "%5"), ("localhost", "%6"), ("c", "")])
+        probe = _Probe({"a": [("%1", False, "w"), ("%2", True, "w")],
+                        "b": [], "": [("%5", False, "x")]})
+        live = PaneLiveness(sessions, probe=probe)
+        assert sorted(probe.calls) == ["", "a", "b"]
+        assert [live.is_dead(s) for s in sessions] == [False, True, True, False, True, False]
+
+    def test_hosts_probe_in_parallel(self):
+        sessions = _sessions(SessionManager(), [(h, "%1") for h in "abcde" for _ in range(3)])
+        probe = _Probe({h: [("%1", False, "w")] for h in "abcde"}, delay=0.2)
+        start = time.perf_counter()
+        PaneLiveness(sessions, probe=probe)
+        assert len(probe.calls) == 5
+        assert time.perf_counter() - start < 0.6  # serially: 15 x 0.2s
+
+    def test_unreachable_host_is_not_dead(self):
+        s, = _sessions(SessionManager(), [("gone", "%1")])
+        assert PaneLiveness([s], probe=_Probe({"gone": None})).is_dead(s) is False
+
+    def test_session_name_target(self):
+        manager = SessionManager()
+        alive, dead = _sessions(manager, [("", ""), ("", "")])
+        alive.tmux_session, dead.tmux_session = "work", "old"
+        probe = _Probe({"": [("%1", True, "work"), ("%2", False, "work"), ("%3", True, "old")]})
+        live = PaneLiveness([alive, dead], probe=probe)
+        assert (live.is_dead(alive), live.is_dead(dead)) == (False, True)
+
+
+class TestProbeHost:
+
+    def test_parses_list_panes(self, monkeypatch):
+        seen = []
+
+        def run(cmd, **kw):
+            seen.append(cmd)
+            return subprocess.CompletedProcess(cmd, 0, "%1 0 work\n%2 1 my session\n", "")
+        monkeypatch.setattr(subprocess, "run", run)
+        monkeypatch.setattr(SSH_MUX, "ensure", lambda host: False)
+        assert probe_host("box") == [("%1", False, "work"), ("%2", True, "my session")]
+        assert seen[0][0] == "ssh" and "list-panes -a" in seen[0][-1]
+
+    def test_failures(self, monkeypatch):
+        codes = iter([255, 1, 1])
+        monkeypatch.setattr(subprocess, "run", lambda cmd, **kw: subprocess.CompletedProcess(
+            cmd, next(codes), "", ""))
+        monkeypatch.setattr(SSH_MUX, "ensure", lambda host: False)
+        assert probe_host("box") is None  # ssh couldn't connect
+        assert probe_host("box") == []    # no tmux server there
+        assert probe_host("") == []
+
+
+def test_health_pass_probes_each_host_once():
+    stub = MagicMock()
+    stub._config = None
+    stub.manager = SessionManager()
+    sessions = _sessions(stub.manager, [("a", "%1"), ("a", "%2"), ("b", "%1"), ("b", "%2")])
+    for s in sessions:
+        s.last_tool_call = time.time() - 400
+    stub.manager.focus("s0")
+    probe = _Probe({"a": [("%1", False, "w")], "b": [("%1", False, "w"), ("%2", False, "w")]})
+    stub._probe_pane_liveness = lambda: PaneLiveness(stub.manager.all_sessions(), probe=probe)
+    stub._is_tmux_pane_dead = lambda s: IoMcpApp._is_tmux_pane_dead(stub, s)
+
+    IoMcpApp._check_agent_health_inner(stub)
+
+    assert sorted(probe.calls) == ["a", "b"]  # health + prune share the snapshot
+    assert [s.pane_dead for s in sessions] == [False, True, False, False]
+    cleaned = [c[0][0].session_id for c in stub._auto_cleanup_dead_session.call_args_list]
+    assert cleaned == ["s1"]
+    assert stub._pane_liveness is None
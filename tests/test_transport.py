@@ -0,0 +1,126 @@
+"""Tests for the Unix-domain-socket transport (io_mcp.transport)."""
+
+import json
+import socket
+import threading
+
+import pytest
+
+from io_mcp.api import FrontendAPIServer
+from io_mcp.backend import start_backend_server
+from io_mcp.proxy import BackendPool
+from io_mcp.transport import (
+    UNIX_PREFIX,
+    bind_unix_socket,
+    local_base,
+    socket_live,
+    unix_request,
+)
+
+from tests.test_frontend_api import _free_port, _make_frontend, _wait_for_port
+
+
+@pytest.fixture()
+def sock_path(tmp_path):
+    return str(tmp_path / "io.sock")
+
+
+class TestBindUnixSocket:
+
+    def test_replaces_stale_file(self, sock_path):
+        stale = socket.socket(socket.AF_UNIX)
+        stale.bind(sock_path)
+        stale.close()  # file left behind, nobody listening
+        assert not socket_live(sock_path)
+        sock = bind_unix_socket(sock_path)
+        assert sock is not None
+        assert socket_live(sock_path)
+        sock.close()
+
+    def test_refuses_live_socket(self, sock_path):
+        owner = bind_unix_socket(sock_path)
+        assert bind_unix_socket(sock_path) is None
+        owner.close()
+
+    def test_not_a_socket(self, tmp_path):
+        path = tmp_path / "plain"
+        path.write_text("x")
+        assert not socket_live(str(path))
+
+
+class TestLocalBase:
+
+    def test_prefers_live_socket_for_local_host(self, sock_path):
+        sock = bind_unix_socket(sock_path)
+        assert local_base("127.0.0.1", 8445, sock_path) == UNIX_PREFIX + sock_path
+        assert local_base("192.168.1.5", 8445, sock_path) == "http://192.168.1.5:8445"
+        assert local_base("127.0.0.1", 8445, None) == "http://127.0.0.1:8445"
+        sock.close()
+
+    def test_missing_socket_uses_tcp(self, sock_path):
+        assert local_base("localhost", 8446, sock_path) == "http://localhost:8446"
+
+
+class TestServersOnUnixSocket:
+
+    def test_backend_serves_socket(self, sock_path):
+        start_backend_server(lambda tool, args, sid: f"{tool}:{sid}", host="127.0.0.1",
+                             port=_free_port(), unix_socket=sock_path)
+        body = json.dumps({"tool": "check_inbox", "args": {}, "session_id": "s"}).encode()
+        status, raw = unix_request(UNIX_PREFIX + sock_path, "/handle-mcp", "POST", body)
+        assert status == 200
+        assert raw == b"check_inbox:s"
+
+    def test_backend_pool_uses_socket_then_falls_back(self, sock_path):
+        port = _free_port()
+        start_backend_server(lambda tool, args, sid: tool, host="127.0.0.1", port=port,
+                             unix_socket=sock_path)
+        pool = BackendPool(f"http://127.0.0.1:{port}", unix_socket=sock_path)
+        payload = json.dumps({"tool": "t", "args": {}, "session_id": "s"}).encode()
+        assert pool.post("/handle-mcp", payload, 5) == (200, b"t")
+        assert pool.stats()["fast"]["transport"] == "unix"
+
+        missing = BackendPool(f"http://127.0.0.1:{port}", unix_socket=sock_path + ".gone")
+        assert missing.post("/handle-mcp", payload, 5) == (200, b"t")
+        assert missing.stats()["fast"]["transport"] == "tcp"
+
+    def test_frontend_api_serves_socket(self, sock_path):
+        srv = FrontendAPIServer(("127.0.0.1", _free_port()), _make_frontend([]),
+                                unix_socket=sock_path)
+        threading.Thread(target=srv.serve_forever, daemon=True).start()
+        assert _wait_for_port("127.0.0.1", srv.server_address[1])
+        try:
+            status, raw = unix_request(UNIX_PREFIX + sock_path, "/api/health")
+            assert status == 200
+            assert json.loads(raw)["status"] == "ok"
+        finally:
+            srv.shutdown()
+            srv.server_close()
+        assert not socket_live(sock_path)
+
+
+class TestCliOverSocket:
+
+    def test_cli_get_over_socket(self, sock_path):
+        from io_mcp.cli import _api_get
+        srv = FrontendAPIServer(("127.0.0.1", _free_port()), _make_frontend([]),
+                                unix_socket=sock_path)
+        threading.Thread(target=srv.serve_forever, daemon=True).start()
+        assert _wait_for_port("127.0.0.1", srv.server_address[1])
+        try:
+            assert _api_get(UNIX_PREFIX + sock_path, "/api/health")["status"] == "ok"
+        finally:
+            srv.shutdown()
+            srv.server_close()
+
+    def test_cli_dead_socket_exits(self, sock_path):
+        from io_mcp.cli import _api_post
+        with pytest.raises(SystemExit):
+            _api_post(UNIX_PREFIX + sock_path, "/api/message", {"text": "hi"})
+
+    def test_send_over_socket(self, sock_path):
+        from io_mcp.send import _post
+        start_backend_server(lambda tool, args, sid: json.dumps({"tool": tool, "args": args}),
+                             host="127.0.0.1", port=_free_port(), unix_socket=sock_path)
+        result = json.loads(_post(UNIX_PREFIX + sock_path, "/speak-async", {"text": "hi"}))
+        assert result == {"tool": "speak_async", "args": {"text": "hi"}}
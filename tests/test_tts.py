@@ -1791,3 +1791,73 @@ class TestCacheKeyConsistency:
         scroll_key = engine._cache_key("Record response", speed_override=ui_speed)
 
         assert pregen_key == scroll_key
+
+
+# ─── Remote audio (clips served to frontends) ────────────────────────
+
+
+class TestRemoteAudio:
+    """Tests for audio_key, cached_audio and skipping local playback."""
+
+    def test_audio_key_matches_cache_key(self):
+        engine = _make_engine()
+        assert engine.audio_key("hi", speed_override=1.5) == \
+            engine._cache_key("hi", speed_override=1.5)
+
+    def test_cached_audio_wav(self, tmp_path):
+        engine = _make_engine()
+        path = str(tmp_path / "clip.wav")
+        _make_wav(path)
+        engine._cache["a" * 32] = path
+        assert engine.cached_audio("a" * 32) == path
+        assert engine.cached_audio("b" * 32) is None
+        assert engine.cached_audio("a" * 32, "flac") is None
+
+    def test_compressed_variant_needs_ffmpeg(self, tmp_path):
+        engine = _make_engine()
+        path = str(tmp_path / "clip.wav")
+        _make_wav(path)
+        engine._cache["a" * 32] = path
+        engine._ffmpeg = None
+        assert engine.cached_audio("a" * 32, "ogg") is None
+
+    def test_generation_announces_key(self):
+        engine = _make_engine()
+        seen = []
+        engine.on_audio_cached = seen.append
+        engine._cached("k" * 32, "/tmp/x.wav")
+        assert seen == ["k" * 32]
+        assert engine._cache["k" * 32] == "/tmp/x.wav"
+
+    def test_remote_playback_requires_config_and_client(self):
+        config = FakeConfig()
+        config.tts_local_playback = "always"
+        engine = _make_engine(config=config)
+        assert not engine._remote_playback()  # no hook
+        engine.remote_audio = lambda: True
+        assert not engine._remote_playback()  # config says always
+        config.tts_local_playback = "unless-remote"
+        assert engine._remote_playback()
+        engine.remote_audio = lambda: False
+        assert not engine._remote_playback()
+
+    def test_speak_generates_without_playing_when_remote(self):
+        config = FakeConfig()
+        config.tts_local_playback = "unless-remote"
+        engine = _make_engine(config=config)
+        engine.remote_audio = lambda: True
+        with mock.patch.object(engine, "_generate_to_file") as gen, \
+                mock.patch.object(engine, "play_cached") as play:
+            engine.speak("hello")
+        gen.assert_called_once()
+        play.assert_not_called()
+
+    def test_start_playback_skipped_when_remote(self):
+        config = FakeConfig()
+        config.tts_local_playback = "unless-remote"
+        engine = _make_engine(config=config)
+        engine._paplay = "/usr/bin/paplay"
+        engine.remote_audio = lambda: True
+        with mock.patch.object(engine._mgr, "start") as start:
+            assert engine._start_playback("/tmp/test.wav") is True
+        start.assert_not_called()